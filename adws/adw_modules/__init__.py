@@ -1,5 +1,6 @@
 # ADWS Greenfield - Core Modules Package
 
+from .port_leases import PortLeaseTable, PortRange
 from .provider_clients import (
     ClaudeClient,
     GeminiClient,
@@ -17,7 +18,9 @@ from .worktree_ops import (
     create_worktree,
     generate_adw_id,
     get_ports_for_adw,
+    lease_ports_for_adw,
     list_active_worktrees,
+    release_ports_for_adw,
     remove_worktree,
 )
 
@@ -29,9 +32,14 @@ __all__ = [
     # Worktree operations
     "generate_adw_id",
     "get_ports_for_adw",
+    "lease_ports_for_adw",
+    "release_ports_for_adw",
     "create_worktree",
     "remove_worktree",
     "list_active_worktrees",
+    # Port leases
+    "PortRange",
+    "PortLeaseTable",
     # Provider clients
     "LLMResponse",
     "ClaudeClient",
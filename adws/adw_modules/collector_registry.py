@@ -0,0 +1,204 @@
+"""Registry of metrics collectors and their scheduling metadata.
+
+Each collector registers itself with ``@register_collector`` next to its
+implementation, declaring its source id, SourceConfig (timeouts, retries,
+breaker and concurrency policy), the validate_credentials() keys it needs
+and the shared clients it uses. collect_all(), the failure manifest and the
+report section order all read from here, so adding a source is one
+decorated function.
+
+Usage:
+    @register_collector(
+        "clarity",
+        config=SourceConfig(source_id="clarity", timeout_s=30.0, max_retries=0),
+        credentials=("clarity",),
+        clients=("http",),
+    )
+    async def collect_clarity() -> CollectorResult:
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import weakref
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from .fault_tolerant import CONFIGS, SourceConfig
+
+if TYPE_CHECKING:
+    from .metrics_collectors import CollectorResult
+    from .metrics_warehouse import MetricsWarehouse
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    """A registered collector and what it needs to run."""
+
+    source_id: str
+    collect: Callable[..., Awaitable[CollectorResult]]
+    config: SourceConfig
+    credentials: tuple[str, ...] = ()   # validate_credentials() keys that must be True
+    clients: tuple[str, ...] = ()       # shared clients; sharers are scheduled together
+
+    def factory(
+        self,
+        days: int,
+        warehouse: MetricsWarehouse | None = None,
+    ) -> Callable[[], Awaitable[CollectorResult]]:
+        """Zero-argument coroutine factory passing only the arguments ``collect`` accepts."""
+        params = inspect.signature(self.collect).parameters
+        kwargs: dict[str, Any] = {}
+        if "days" in params:
+            kwargs["days"] = days
+        if "warehouse" in params:
+            kwargs["warehouse"] = warehouse
+        return lambda: self.collect(**kwargs)
+
+
+_REGISTRY: dict[str, CollectorSpec] = {}
+
+
+def register_collector(
+    source_id: str,
+    *,
+    config: SourceConfig | None = None,
+    credentials: Iterable[str] = (),
+    clients: Iterable[str] = (),
+) -> Callable[[Callable[..., Awaitable[CollectorResult]]], Callable[..., Awaitable[CollectorResult]]]:
+    """
+    Register a collector coroutine function under ``source_id``.
+
+    The collector may accept ``days`` and/or ``warehouse`` keyword arguments;
+    collect_all() passes only those it declares. Registration order is the
+    run and report order. The config is also published in
+    fault_tolerant.CONFIGS for the failure manifest.
+
+    Raises:
+        ValueError: If ``source_id`` is already registered or the config's
+                    source_id does not match
+    """
+    spec_config = config or SourceConfig(source_id=source_id)
+    if spec_config.source_id != source_id:
+        raise ValueError(
+            f"SourceConfig.source_id '{spec_config.source_id}' does not match '{source_id}'"
+        )
+
+    def decorator(
+        fn: Callable[..., Awaitable[CollectorResult]],
+    ) -> Callable[..., Awaitable[CollectorResult]]:
+        if source_id in _REGISTRY:
+            raise ValueError(f"Collector '{source_id}' is already registered")
+        _REGISTRY[source_id] = CollectorSpec(
+            source_id=source_id,
+            collect=fn,
+            config=spec_config,
+            credentials=tuple(credentials),
+            clients=tuple(clients),
+        )
+        CONFIGS[source_id] = spec_config
+        return fn
+
+    return decorator
+
+
+def registered_collectors() -> list[CollectorSpec]:
+    """All registered collectors in registration order."""
+    return list(_REGISTRY.values())
+
+
+def get_collector(source_id: str) -> CollectorSpec:
+    try:
+        return _REGISTRY[source_id]
+    except KeyError:
+        raise ValueError(
+            f"Unknown collector '{source_id}'. Registered: {', '.join(_REGISTRY)}"
+        ) from None
+
+
+@contextmanager
+def override_collectors(
+    overrides: Mapping[str, Callable[..., Awaitable[CollectorResult]]],
+) -> Iterator[None]:
+    """
+    Temporarily swap the collect function of registered sources.
+
+    Config, credentials and clients are kept, so collect_all() still applies
+    the real retry, breaker and scheduling policy to the stand-ins.
+
+    Raises:
+        ValueError: On unknown source ids
+    """
+    originals = {source_id: get_collector(source_id) for source_id in overrides}
+    for source_id, collect in overrides.items():
+        _REGISTRY[source_id] = replace(originals[source_id], collect=collect)
+    try:
+        yield
+    finally:
+        _REGISTRY.update(originals)
+
+
+def resolve_collectors(sources: Iterable[str] | None = None) -> list[CollectorSpec]:
+    """
+    Specs for ``sources`` in registration order (all collectors when None).
+
+    Raises:
+        ValueError: On unknown source ids
+    """
+    if sources is None:
+        return registered_collectors()
+    wanted = {get_collector(s).source_id for s in sources}
+    return [spec for spec in _REGISTRY.values() if spec.source_id in wanted]
+
+
+def missing_credentials(
+    spec: CollectorSpec,
+    available: dict[str, bool],
+) -> list[str]:
+    """Credential keys ``spec`` needs that validate_credentials() reported as missing."""
+    return [key for key in spec.credentials if not available.get(key, False)]
+
+
+def schedule_groups(specs: Iterable[CollectorSpec]) -> list[list[CollectorSpec]]:
+    """
+    Partition specs into groups that share a client (transitively).
+
+    Members of a group are started together, so collectors coalescing one
+    upstream call (the GA4 batch) still share it under a parallelism limit.
+    Groups keep registration order.
+    """
+    groups: list[list[CollectorSpec]] = []
+    group_clients: list[set[str]] = []
+    for spec in specs:
+        clients = set(spec.clients)
+        merged = [i for i, seen in enumerate(group_clients) if clients & seen]
+        if not merged:
+            groups.append([spec])
+            group_clients.append(clients)
+            continue
+        target = merged[0]
+        groups[target].append(spec)
+        group_clients[target] |= clients
+        for i in reversed(merged[1:]):
+            groups[target].extend(groups.pop(i))
+            group_clients[target] |= group_clients.pop(i)
+    return groups
+
+
+# Per-source concurrency limits, one semaphore per (event loop, source)
+_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def source_semaphore(spec: CollectorSpec) -> asyncio.Semaphore:
+    """Semaphore bounding concurrent runs of one source (``config.max_concurrency``)."""
+    per_loop = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(spec.source_id)
+    if semaphore is None:
+        semaphore = per_loop[spec.source_id] = asyncio.Semaphore(spec.config.max_concurrency)
+    return semaphore
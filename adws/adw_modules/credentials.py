@@ -2,12 +2,23 @@
 
 Single responsibility: load and validate credentials for each data source.
 No collection logic here.
+
+Authenticated clients are cached per process: the first call for a source
+loads .env, parses the service-account key or keychain payload and builds the
+client; later calls reuse it and only refresh the access token when it is
+within TOKEN_REFRESH_MARGIN of expiry.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +31,8 @@ except ImportError:  # pragma: no cover - guarded at runtime for operator errors
     keyring = None
     keyring_errors = None
 
+logger = logging.getLogger(__name__)
+
 _ENV_PATH = Path(__file__).parent.parent / ".env"
 CWS_SCOPES = ["https://www.googleapis.com/auth/analytics.readonly"]
 CWS_KEYCHAIN_SERVICE = "themegpt.adws.cws-ga4"
@@ -32,6 +45,10 @@ _SA_SETUP_HINT = (
     "Set GOOGLE_APPLICATION_CREDENTIALS=credentials/ga4-sa.json in adws/.env"
 )
 
+# Refresh cached tokens this long before they expire (google-auth itself
+# treats tokens as invalid 3m45s before expiry).
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
 
 def _load_env() -> None:
     if _ENV_PATH.exists():
@@ -141,13 +158,208 @@ def _load_cws_authorized_user_info() -> dict[str, Any]:
     )
 
 
-def ga4_client(ClientClass: Any) -> Any:
-    """Return a GA4 client authenticated via service account JSON key.
+# ---------------------------------------------------------------------------
+# Client cache
+# ---------------------------------------------------------------------------
 
-    Reads GOOGLE_APPLICATION_CREDENTIALS from the environment (set in adws/.env).
-    Falls back to Application Default Credentials if the env var is absent (local dev).
-    Raises PermissionError with actionable instructions on scope or auth failure.
+@dataclass
+class _CachedClient:
+    client: Any
+    credentials: Any
+    on_refresh: Callable[[Any], None] | None = None
+
+
+class ClientCache:
+    """Process-wide cache of authenticated API clients.
+
+    Clients are keyed by caller-chosen keys (e.g. ``("ga4", ClientClass)``) and
+    built at most once. On each hit the client's credentials are refreshed in
+    place if they expire within ``refresh_margin``; the client keeps using the
+    same credentials object, so no new channel is opened.
+
+    Loaded credentials are cached separately per source so that asyncio
+    clients, whose gRPC channels are bound to one event loop, can be rebuilt
+    for a new loop without reloading credentials.
     """
+
+    def __init__(self, refresh_margin: timedelta = TOKEN_REFRESH_MARGIN) -> None:
+        self.refresh_margin = refresh_margin
+        self._entries: dict[Hashable, _CachedClient] = {}
+        self._credentials: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get(
+        self,
+        key: Hashable,
+        build: Callable[[], tuple[Any, Any, Callable[[Any], None] | None]],
+    ) -> Any:
+        """Return the cached client for ``key``, building it on first use.
+
+        Args:
+            key: Cache key identifying the source and client class
+            build: Zero-argument callable returning
+                   ``(client, credentials, on_refresh)``; ``on_refresh`` is
+                   called with the credentials after each proactive refresh
+
+        Returns:
+            The cached (or newly built) client
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                client, creds, on_refresh = build()
+                self._entries[key] = _CachedClient(client, creds, on_refresh)
+                return client
+
+            self.hits += 1
+            if self._needs_refresh(entry.credentials):
+                self._refresh(key, entry)
+            return entry.client
+
+    def credentials(self, source: str, load: Callable[[], Any]) -> Any:
+        """Return the loaded credentials for ``source``, loading them once."""
+        with self._lock:
+            if source not in self._credentials:
+                self._credentials[source] = load()
+            return self._credentials[source]
+
+    def evict_closed_loops(self) -> None:
+        """Drop loop-bound clients whose event loop has been closed."""
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if isinstance(key, tuple)
+                and key
+                and isinstance(key[-1], asyncio.AbstractEventLoop)
+                and key[-1].is_closed()
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def _needs_refresh(self, creds: Any) -> bool:
+        if creds is None or not getattr(creds, "token", None):
+            # Never-used credentials are fetched lazily by the client itself
+            return False
+        expiry = getattr(creds, "expiry", None)
+        if expiry is None:
+            return bool(getattr(creds, "expired", False))
+        now = datetime.now(UTC)
+        if expiry.tzinfo is None:
+            now = now.replace(tzinfo=None)  # google-auth stores naive UTC
+        return expiry - now <= self.refresh_margin
+
+    def _refresh(self, key: Hashable, entry: _CachedClient) -> None:
+        if getattr(entry.credentials, "refresh_token", True) is None:
+            return  # cannot refresh; let the API surface the auth error
+        from google.auth.transport.requests import Request
+
+        entry.credentials.refresh(Request())
+        self.refreshes += 1
+        logger.debug("Refreshed cached credentials for %s", key)
+        if entry.on_refresh is not None:
+            entry.on_refresh(entry.credentials)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one cached client (e.g. after an auth error)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_source(self, source: str) -> None:
+        """Drop every client and the loaded credentials for ``source``."""
+        with self._lock:
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[:1] == (source,)]:
+                del self._entries[key]
+            self._credentials.pop(source, None)
+
+    def clear(self) -> None:
+        """Drop every cached client and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._credentials.clear()
+            self.hits = self.misses = self.refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_client_cache = ClientCache()
+
+
+def get_client_cache() -> ClientCache:
+    """Return the process-wide client cache shared by all collectors."""
+    return _client_cache
+
+
+def clear_client_cache() -> None:
+    """Forget all cached clients so the next call reloads credentials."""
+    _client_cache.clear()
+
+
+_AUTH_HTTP_STATUSES = (401, 403)
+_AUTH_GRPC_STATUSES = ("UNAUTHENTICATED", "PERMISSION_DENIED")
+
+
+def is_auth_error(exc: BaseException) -> bool:
+    """True if ``exc`` is an authentication or permission failure.
+
+    Decided by exception type and status code, never by digits in the
+    message: google-auth RefreshError (e.g. invalid_grant), google-api-core
+    Unauthenticated/PermissionDenied, HTTP 401/403 responses, and gRPC
+    UNAUTHENTICATED/PERMISSION_DENIED calls (including the RpcError wrapped
+    by GoogleAdsException).
+    """
+    try:
+        from google.api_core.exceptions import PermissionDenied, Unauthenticated
+        from google.auth.exceptions import RefreshError
+    except ImportError:
+        pass
+    else:
+        if isinstance(exc, (RefreshError, Unauthenticated, PermissionDenied)):
+            return True
+
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) in _AUTH_HTTP_STATUSES:
+        return True
+
+    # grpc.RpcError exposes code() -> grpc.StatusCode
+    code = getattr(exc, "code", None)
+    if callable(code):
+        try:
+            code = code()
+        except Exception:
+            code = None
+    if getattr(code, "name", None) in _AUTH_GRPC_STATUSES:
+        return True
+
+    inner = getattr(exc, "error", None)
+    return isinstance(inner, BaseException) and inner is not exc and is_auth_error(inner)
+
+
+def invalidate_on_auth_error(source: str, exc: Exception) -> bool:
+    """Drop a source's cached clients and credentials when ``exc`` is an auth failure.
+
+    Lets a long-lived process recover from revoked or rotated credentials on
+    the next run instead of reusing a broken client forever.
+
+    Returns:
+        True if the cached clients were dropped
+    """
+    if not is_auth_error(exc):
+        return False
+    _client_cache.invalidate_source(source)
+    logger.info("Dropped cached %s clients after auth error", source)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Client factories
+# ---------------------------------------------------------------------------
+
+def _build_ga4_credentials() -> Any:
     _load_env()
 
     sa_path_raw = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
@@ -163,10 +375,9 @@ def ga4_client(ClientClass: Any) -> Any:
         try:
             from google.oauth2 import service_account
             scopes = CWS_SCOPES
-            creds = service_account.Credentials.from_service_account_file(
+            return service_account.Credentials.from_service_account_file(
                 str(sa_path), scopes=scopes
             )
-            return ClientClass(credentials=creds)
         except Exception as exc:
             raise PermissionError(
                 f"Failed to load service account credentials from {sa_path}: {exc}. "
@@ -180,7 +391,7 @@ def ga4_client(ClientClass: Any) -> Any:
             scopes = CWS_SCOPES
             creds, _ = google.auth.default(scopes=scopes)
             creds.refresh(Request())
-            return ClientClass(credentials=creds)
+            return creds
         except Exception as exc:
             raise PermissionError(
                 f"GA4 authentication failed (no service account configured). "
@@ -188,8 +399,50 @@ def ga4_client(ClientClass: Any) -> Any:
             ) from exc
 
 
-def cws_ga4_client(ClientClass: Any) -> Any:
-    """Return a GA4 client for the CWS property using the system-keychain OAuth token."""
+def ga4_client(ClientClass: Any) -> Any:
+    """Return a GA4 client authenticated via service account JSON key.
+
+    Reads GOOGLE_APPLICATION_CREDENTIALS from the environment (set in adws/.env).
+    Falls back to Application Default Credentials if the env var is absent (local dev).
+    Raises PermissionError with actionable instructions on scope or auth failure.
+
+    The client is built once per process and ClientClass; later calls return
+    the cached client, refreshing its token only when it nears expiry.
+    """
+    def build() -> tuple[Any, Any, None]:
+        creds = _client_cache.credentials("ga4", _build_ga4_credentials)
+        return ClientClass(credentials=creds), creds, None
+
+    return _client_cache.get(("ga4", ClientClass), build)
+
+
+def _loop_bound_client(
+    source: str,
+    ClientClass: Any,
+    load: Callable[[], Any],
+    on_refresh: Callable[[Any], None] | None = None,
+) -> Any:
+    loop = asyncio.get_running_loop()
+    _client_cache.evict_closed_loops()
+
+    def build() -> tuple[Any, Any, Callable[[Any], None] | None]:
+        creds = _client_cache.credentials(source, load)
+        return ClientClass(credentials=creds), creds, on_refresh
+
+    return _client_cache.get((source, ClientClass, loop), build)
+
+
+def ga4_async_client(ClientClass: Any) -> Any:
+    """Return an asyncio GA4 client (e.g. BetaAnalyticsDataAsyncClient).
+
+    Shares credentials with ga4_client() but caches one client per running
+    event loop, since asyncio gRPC channels cannot cross loops. Must be
+    called from a coroutine.
+    """
+    return _loop_bound_client("ga4", ClientClass, _build_ga4_credentials)
+
+
+def _build_cws_credentials() -> Any:
     _load_env()
 
     from google.auth.transport.requests import Request
@@ -205,8 +458,49 @@ def cws_ga4_client(ClientClass: Any) -> Any:
             "Stored CWS GA4 credentials are expired and do not include a refresh token. "
             f"{_CWS_SETUP_HINT}"
         )
+    return creds
+
+
+def _persist_cws_credentials(creds: Any) -> None:
+    store_cws_authorized_user_info(build_cws_authorized_user_info(creds))
+
+
+def cws_ga4_client(ClientClass: Any) -> Any:
+    """Return a GA4 client for the CWS property using the system-keychain OAuth token.
+
+    Cached like ga4_client(); tokens refreshed by the cache are written back
+    to the keychain.
+    """
+    def build() -> tuple[Any, Any, Callable[[Any], None]]:
+        creds = _client_cache.credentials("cws", _build_cws_credentials)
+        return ClientClass(credentials=creds), creds, _persist_cws_credentials
 
-    return ClientClass(credentials=creds)
+    return _client_cache.get(("cws", ClientClass), build)
+
+
+def cws_ga4_async_client(ClientClass: Any) -> Any:
+    """Return an asyncio GA4 client for the CWS property, cached per event loop."""
+    return _loop_bound_client(
+        "cws", ClientClass, _build_cws_credentials, _persist_cws_credentials
+    )
+
+
+def google_ads_client(ClientClass: Any) -> Any:
+    """Return a cached Google Ads client.
+
+    Loads from GOOGLE_ADS_CREDENTIALS_PATH (google-ads.yaml) when it exists,
+    otherwise from GOOGLE_ADS_* environment variables. The library refreshes
+    its own OAuth token, so the cache only avoids re-reading configuration
+    and rebuilding the client.
+    """
+    def build() -> tuple[Any, None, None]:
+        _load_env()
+        creds_path = os.getenv("GOOGLE_ADS_CREDENTIALS_PATH", "")
+        if creds_path and Path(creds_path).exists():
+            return ClientClass.load_from_storage(creds_path), None, None
+        return ClientClass.load_from_env(), None, None
+
+    return _client_cache.get(("google_ads", ClientClass), build)
 
 
 def validate_credentials() -> dict[str, bool]:
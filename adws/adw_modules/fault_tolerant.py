@@ -1,15 +1,19 @@
-"""Per-collector timeout, retry policy, structured error logging, and failure manifest."""
+"""Per-collector timeout, retry policy, circuit breaker, structured error logging,
+and failure manifest."""
 
 from __future__ import annotations
 
 import asyncio
 import json
 import logging
+import math
+import random
 import time
 import traceback
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
@@ -26,47 +30,17 @@ class SourceConfig:
     dashboard_url: str | None = None
     timeout_s: float = 45.0
     max_retries: int = 1
-    retryable_status_codes: tuple[int, ...] = (502, 503, 504)
-
-
-CONFIGS: dict[str, SourceConfig] = {
-    "ga4_traffic": SourceConfig(
-        source_id="ga4_traffic",
-        dashboard_url="https://analytics.google.com/analytics/web/#/p516189580",
-        timeout_s=60.0,
-        max_retries=1,
-    ),
-    "ga4_funnel": SourceConfig(
-        source_id="ga4_funnel",
-        dashboard_url="https://analytics.google.com/analytics/web/#/p516189580",
-        timeout_s=60.0,
-        max_retries=1,
-    ),
-    "google_ads": SourceConfig(
-        source_id="google_ads",
-        dashboard_url="https://ads.google.com/aw/campaigns?__e=1702899815",
-        timeout_s=30.0,
-        max_retries=0,
-    ),
-    "clarity": SourceConfig(
-        source_id="clarity",
-        dashboard_url="https://clarity.microsoft.com/projects/vky4a128au",
-        timeout_s=30.0,
-        max_retries=0,
-    ),
-    "cws": SourceConfig(
-        source_id="cws",
-        dashboard_url="https://chrome.google.com/webstore/devconsole",
-        timeout_s=60.0,
-        max_retries=1,
-    ),
-    "monetization": SourceConfig(
-        source_id="monetization",
-        dashboard_url=None,  # dynamic: set via MONETIZATION_ENDPOINT env var
-        timeout_s=30.0,
-        max_retries=1,
-    ),
-}
+    retryable_status_codes: tuple[int, ...] = (429, 502, 503, 504)
+    backoff_base_s: float = 1.0        # full-jitter backoff: uniform(0, base * 2**attempt)
+    backoff_max_s: float = 30.0        # cap on any single wait, including Retry-After
+    min_timeout_s: float = 10.0        # floor for the adaptive (p95-based) timeout
+    failure_threshold: int = 3         # consecutive failed runs that open the breaker
+    cooldown_s: float = 1800.0         # open breaker allows one trial run after this
+    max_concurrency: int = 1           # overlapping runs allowed (e.g. daemon refresh + schedule)
+
+
+# Filled by collector_registry.register_collector as metrics_collectors is imported
+CONFIGS: dict[str, SourceConfig] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -106,11 +80,196 @@ def _is_retryable(exc: Exception, config: SourceConfig) -> bool:
         import httpx
         if isinstance(exc, httpx.HTTPStatusError):
             return exc.response.status_code in config.retryable_status_codes
+        if isinstance(exc, httpx.TransportError):
+            return True
     except Exception:
         pass
     return False
 
 
+def is_transient_http_error(exc: Exception) -> bool:
+    """True for HTTP errors a collector should re-raise so run_with_resilience retries them.
+
+    Covers 429 and 502/503/504 responses and connection-level failures.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (429, 502, 503, 504)
+    return isinstance(exc, httpx.TransportError)
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """Seconds requested by a 429/503 ``Retry-After`` header, if any.
+
+    Accepts both delay-seconds and HTTP-date forms.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def backoff_delay(config: SourceConfig, attempt: int, exc: Exception) -> float | None:
+    """Delay before retry ``attempt + 1``, or None if the server asked to wait too long.
+
+    Honors Retry-After; otherwise uses full-jitter exponential backoff.
+    """
+    retry_after = retry_after_seconds(exc)
+    if retry_after is not None:
+        return retry_after if retry_after <= config.backoff_max_s else None
+    cap = min(config.backoff_max_s, config.backoff_base_s * 2 ** attempt)
+    return random.uniform(0, cap)
+
+
+# ---------------------------------------------------------------------------
+# Circuit Breaker
+# ---------------------------------------------------------------------------
+
+LATENCY_WINDOW = 20        # successful durations kept per source and collection window
+MIN_LATENCY_SAMPLES = 5    # needed before the timeout adapts
+TIMEOUT_P95_HEADROOM = 3.0
+
+
+def _window_key(days: int | None) -> str:
+    return "default" if days is None else f"{days}d"
+
+
+@dataclass
+class BreakerState:
+    """Failure and latency history for one source, persisted across runs.
+
+    Latencies are kept per collection window (``"7d"``, ``"90d"``, ...) so
+    short runs never set the timeout for wide windows or backfills.
+    """
+
+    source_id: str
+    consecutive_failures: int = 0
+    opened_at: str | None = None       # ISO timestamp; None while closed
+    last_error: str | None = None
+    latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # State saved before latencies were split by window can't be attributed
+        if not isinstance(self.latencies_ms, dict):
+            self.latencies_ms = {}
+
+    def is_open(self, config: SourceConfig, now: datetime | None = None) -> bool:
+        """True while open and cooling down; False once a trial run is allowed."""
+        if self.opened_at is None:
+            return False
+        opened = datetime.fromisoformat(self.opened_at)
+        return (now or datetime.now(UTC)) - opened < timedelta(seconds=config.cooldown_s)
+
+    @property
+    def half_open(self) -> bool:
+        return self.opened_at is not None
+
+    def p95_ms(self, days: int | None = None) -> float | None:
+        latencies = self.latencies_ms.get(_window_key(days), [])
+        if len(latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def timeout_s(self, config: SourceConfig, days: int | None = None) -> float:
+        """Per-attempt timeout: p95 latency for ``days`` with headroom, within [min_timeout_s, timeout_s]."""
+        p95 = self.p95_ms(days)
+        if p95 is None:
+            return config.timeout_s
+        adaptive = p95 / 1000 * TIMEOUT_P95_HEADROOM
+        return min(config.timeout_s, max(config.min_timeout_s, adaptive))
+
+    def record_success(self, duration_ms: float, days: int | None = None) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_error = None
+        key = _window_key(days)
+        latencies = [*self.latencies_ms.get(key, []), round(duration_ms, 1)]
+        self.latencies_ms[key] = latencies[-LATENCY_WINDOW:]
+
+    def record_failure(self, config: SourceConfig, error: str | None) -> None:
+        was_half_open = self.half_open
+        self.consecutive_failures += 1
+        self.last_error = error
+        if was_half_open or self.consecutive_failures >= config.failure_threshold:
+            self.opened_at = datetime.now(UTC).isoformat()
+
+
+class BreakerStore:
+    """
+    JSON-backed circuit breaker state plus last known good result per source.
+
+    Layout (under e.g. doc/dev/failures/, git-ignored):
+        breakers.json                    source_id -> BreakerState
+        last_good/<source>-<days>d.json  most recent successful CollectorResult
+                                         for that collection window
+
+    Usage:
+        breakers = BreakerStore(Path("doc/dev/failures"))
+        result = await run_with_resilience(config, factory, breakers)
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.path = directory / "breakers.json"
+        self._states: dict[str, BreakerState] = {}
+        if self.path.exists():
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                self._states = {
+                    sid: BreakerState(**state) for sid, state in raw.get("sources", {}).items()
+                }
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning("Ignoring unreadable breaker state %s: %s", self.path, e)
+
+    def get(self, source_id: str) -> BreakerState:
+        return self._states.setdefault(source_id, BreakerState(source_id=source_id))
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {"sources": {sid: asdict(state) for sid, state in self._states.items()}}
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def _last_good_path(self, source_id: str, days: int | None) -> Path:
+        name = source_id if days is None else f"{source_id}-{days}d"
+        return self.directory / "last_good" / f"{name}.json"
+
+    def last_good(self, source_id: str, days: int | None = None) -> Any:
+        """Most recent successful CollectorResult for ``source_id`` over ``days``, or None."""
+        from .metrics_collectors import CollectorResult
+
+        path = self._last_good_path(source_id, days)
+        if not path.exists():
+            return None
+        try:
+            return CollectorResult.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable last good result %s: %s", path, e)
+            return None
+
+    def store_last_good(self, result: Any, days: int | None = None) -> None:
+        path = self._last_good_path(result.source, days)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(result.model_dump_json(), encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Resilient Runner
 # ---------------------------------------------------------------------------
@@ -118,13 +277,33 @@ def _is_retryable(exc: Exception, config: SourceConfig) -> bool:
 async def run_with_resilience(
     config: SourceConfig,
     coro_factory: Callable[[], Coroutine[Any, Any, Any]],
+    breakers: BreakerStore | None = None,
+    days: int | None = None,
 ) -> Any:
     """Run a collector coroutine factory with per-collector timeout and retry.
 
+    Retries transient errors (timeouts, 429/502/503/504, connection errors)
+    with full-jitter exponential backoff, waiting exactly as long as a
+    ``Retry-After`` header asks (or failing fast if that exceeds
+    ``backoff_max_s``).
+
+    With ``breakers``, the source's failure history is persisted across runs:
+    the per-attempt timeout adapts to the p95 latency observed for the same
+    ``days`` window, and after ``failure_threshold`` consecutive failed runs
+    the breaker opens. While open, the collector is not called and the last
+    known good result is returned immediately with ``circuit_open=True``.
+    Latencies and last known good results are kept per ``days`` window, so
+    7-day runs never set the timeout for, or serve data to, a 90-day run.
+    After ``cooldown_s`` one trial run (no retries) decides whether it
+    closes again.
+
     Args:
         config: SourceConfig for this source (timeout, retry policy, etc.)
         coro_factory: Zero-argument callable that returns a fresh coroutine each
                       call. Use ``lambda: collect_foo(args)`` at the call site.
+        breakers: Optional persistent breaker store (e.g. doc/dev/failures/)
+        days: Collection window the result covers, keying the latency
+              history and the last known good result
 
     Returns:
         The CollectorResult from the coroutine, or a failed CollectorResult with
@@ -132,46 +311,110 @@ async def run_with_resilience(
     """
     from .metrics_collectors import CollectorResult
 
+    breaker = breakers.get(config.source_id) if breakers is not None else None
+    timeout_s = config.timeout_s
+    max_retries = config.max_retries
+    if breaker is not None:
+        if breaker.is_open(config):
+            return _circuit_open_result(config, breaker, breakers, days)
+        timeout_s = breaker.timeout_s(config, days)
+        if breaker.half_open:
+            logger.info("Circuit for %s half-open, making one trial run", config.source_id)
+            max_retries = 0
+
     last_exc: Exception | None = None
     tb_str: str | None = None
     duration_ms: float = 0.0
+    result: Any = None
 
-    for attempt in range(config.max_retries + 1):
+    for attempt in range(max_retries + 1):
         t0 = time.perf_counter()
         try:
-            result = await asyncio.wait_for(coro_factory(), timeout=config.timeout_s)
+            result = await asyncio.wait_for(coro_factory(), timeout=timeout_s)
             duration_ms = (time.perf_counter() - t0) * 1000
             # Stamp timing/attempts onto the successful result
-            return result.model_copy(update={
+            result = result.model_copy(update={
                 "duration_ms": round(duration_ms, 1),
                 "attempts": attempt + 1,
             })
+            break
         except Exception as exc:
             last_exc = exc
             tb_str = traceback.format_exc()
             duration_ms = (time.perf_counter() - t0) * 1000
 
-            if attempt < config.max_retries and _is_retryable(exc, config):
-                delay = 2 ** attempt
+            if attempt < max_retries and _is_retryable(exc, config):
+                delay = backoff_delay(config, attempt, exc)
+                if delay is not None:
+                    logger.warning(
+                        "Collector %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                        config.source_id, attempt + 1, max_retries + 1, delay, exc,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
                 logger.warning(
-                    "Collector %s failed (attempt %d/%d), retrying in %ds: %s",
-                    config.source_id, attempt + 1, config.max_retries + 1, delay, exc,
+                    "Collector %s asked to retry after more than %.0fs, giving up",
+                    config.source_id, config.backoff_max_s,
                 )
-                await asyncio.sleep(delay)
-                continue
             break
 
-    msg = clean_error_message(last_exc)
-    logger.error("Collector %s permanently failed: %s", config.source_id, msg)
+    if result is None:
+        msg = clean_error_message(last_exc)
+        logger.error("Collector %s permanently failed: %s", config.source_id, msg)
+        result = CollectorResult(
+            source=config.source_id,
+            success=False,
+            error=msg,
+            traceback=tb_str,
+            attempts=attempt + 1,
+            duration_ms=round(duration_ms, 1),
+        )
+
+    if breaker is not None:
+        if result.success:
+            breaker.record_success(duration_ms, days)
+            breakers.store_last_good(result, days)
+        else:
+            breaker.record_failure(config, result.error)
+            if breaker.opened_at is not None:
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failure(s)",
+                    config.source_id, breaker.consecutive_failures,
+                )
+        breakers.save()
+
+    return result
 
-    return CollectorResult(
-        source=config.source_id,
-        success=False,
-        error=msg,
-        traceback=tb_str,
-        attempts=attempt + 1,
-        duration_ms=round(duration_ms, 1),
+
+def _circuit_open_result(
+    config: SourceConfig,
+    breaker: BreakerState,
+    breakers: BreakerStore,
+    days: int | None,
+) -> Any:
+    """Last known good result (or a fast failure) for a source whose breaker is open."""
+    from .metrics_collectors import CollectorResult
+
+    last_good = breakers.last_good(config.source_id, days)
+    logger.warning(
+        "Circuit for %s open (%d consecutive failures), %s",
+        config.source_id, breaker.consecutive_failures,
+        "serving last known good data" if last_good else "no last known good data",
     )
+    if last_good is None:
+        return CollectorResult(
+            source=config.source_id,
+            success=False,
+            error=f"Circuit open after {breaker.consecutive_failures} failures: {breaker.last_error}",
+            attempts=0,
+            duration_ms=0.0,
+        )
+    return last_good.model_copy(update={
+        "circuit_open": True,
+        "error": breaker.last_error,
+        "attempts": 0,
+        "duration_ms": 0.0,
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +428,9 @@ def write_failure_manifest(
 ) -> Path | None:
     """Write a JSON manifest listing all failed sources.
 
+    Sources served from last known good data because their circuit breaker
+    is open are listed too, with ``circuit_open: true``.
+
     Args:
         results: Dict of source_id -> CollectorResult from collect_all().
         date_str: YYYY-MM-DD string for the manifest filename.
@@ -198,7 +444,7 @@ def write_failure_manifest(
 
     failures = []
     for source_id, result in results.items():
-        if isinstance(result, CollectorResult) and not result.success:
+        if isinstance(result, CollectorResult) and (not result.success or result.circuit_open):
             config = CONFIGS.get(source_id)
             failures.append({
                 "source": source_id,
@@ -207,6 +453,7 @@ def write_failure_manifest(
                 "dashboard_url": config.dashboard_url if config else None,
                 "timestamp": result.collected_at.isoformat(),
                 "attempts": result.attempts,
+                "circuit_open": result.circuit_open,
             })
 
     if not failures:
@@ -0,0 +1,188 @@
+"""
+ADWS Async Git Module
+
+Non-blocking git helpers for the phase scripts. Commands run through
+asyncio.create_subprocess_exec so the event loop keeps servicing parallel
+LLM calls while git works, every command has a timeout, and each run is
+recorded with its duration in command_log. Phase scripts clear command_log
+when they start and write its summary into their phase log, so it only
+ever holds the current phase's commands.
+
+Failures raise the same subprocess exceptions as subprocess.run(check=True)
+(CalledProcessError, TimeoutExpired) so existing error handling in the
+phase scripts keeps working.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger("adws-git")
+
+DEFAULT_GIT_TIMEOUT = 60.0
+PUSH_TIMEOUT = 300.0
+
+_COMMIT_LINE_RE = re.compile(r"^\[[^\]]*?\b([0-9a-f]{7,40})\]", re.MULTILINE)
+
+
+@dataclass
+class GitResult:
+    """Outcome of a single git invocation."""
+
+    args: list[str]
+    returncode: int
+    stdout: str
+    stderr: str
+    duration_ms: float
+    cwd: str | None = None
+
+    def check(self) -> GitResult:
+        """Raise CalledProcessError if the command failed."""
+        if self.returncode != 0:
+            raise subprocess.CalledProcessError(
+                self.returncode, self.args, output=self.stdout, stderr=self.stderr
+            )
+        return self
+
+
+@dataclass
+class GitCommandLog:
+    """Record of git command durations for the current phase."""
+
+    results: list[GitResult] = field(default_factory=list)
+
+    def record(self, result: GitResult) -> None:
+        self.results.append(result)
+
+    def clear(self) -> None:
+        self.results.clear()
+
+    def total_ms(self) -> float:
+        return sum(r.duration_ms for r in self.results)
+
+    def summary(self) -> list[dict[str, object]]:
+        """Command/duration/returncode rows suitable for JSON logs."""
+        return [
+            {
+                "command": " ".join(r.args),
+                "duration_ms": round(r.duration_ms, 1),
+                "returncode": r.returncode,
+            }
+            for r in self.results
+        ]
+
+
+command_log = GitCommandLog()
+
+
+async def run_git(
+    *args: str,
+    cwd: Path | None = None,
+    timeout: float = DEFAULT_GIT_TIMEOUT,
+    check: bool = False,
+) -> GitResult:
+    """
+    Run a git command without blocking the event loop.
+
+    Args:
+        *args: Arguments after `git` (e.g. "status", "--porcelain")
+        cwd: Working directory (defaults to current directory)
+        timeout: Seconds before the process is killed
+        check: If True, raise CalledProcessError on a non-zero exit
+
+    Returns:
+        GitResult with decoded output and duration
+
+    Raises:
+        subprocess.CalledProcessError: If check is True and git fails
+        subprocess.TimeoutExpired: If the command exceeds timeout
+    """
+    cmd = ["git", *args]
+    start = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(cwd) if cwd is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # Untranslated output so messages like "nothing to commit" can be matched
+        env={**os.environ, "LC_ALL": "C"},
+    )
+    try:
+        stdout_b, stderr_b = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        duration_ms = (time.perf_counter() - start) * 1000
+        command_log.record(
+            GitResult(cmd, -9, "", "timed out", duration_ms, str(cwd) if cwd else None)
+        )
+        logger.warning(f"git {' '.join(args)} timed out after {timeout:.0f}s")
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+
+    result = GitResult(
+        args=cmd,
+        returncode=proc.returncode if proc.returncode is not None else -1,
+        stdout=stdout_b.decode("utf-8", errors="replace"),
+        stderr=stderr_b.decode("utf-8", errors="replace"),
+        duration_ms=(time.perf_counter() - start) * 1000,
+        cwd=str(cwd) if cwd is not None else None,
+    )
+    command_log.record(result)
+    logger.debug(f"git {' '.join(args)} -> {result.returncode} in {result.duration_ms:.0f}ms")
+
+    if check:
+        result.check()
+    return result
+
+
+async def commit_all(
+    worktree_path: Path,
+    message: str,
+    paths: list[str] | None = None,
+    timeout: float = DEFAULT_GIT_TIMEOUT,
+) -> str | None:
+    """
+    Stage changes and commit them, returning the short SHA.
+
+    Uses two git processes (add, commit) instead of the add/status/commit/
+    rev-parse sequence: "nothing to commit" is detected from the commit
+    output and the SHA is parsed from git's "[branch sha] subject" line.
+
+    Args:
+        worktree_path: Path to the git worktree
+        message: Commit message
+        paths: Paths to stage (defaults to all changes, `git add -A`)
+        timeout: Per-command timeout in seconds
+
+    Returns:
+        Short commit SHA, or None if there was nothing to commit
+
+    Raises:
+        subprocess.CalledProcessError: If git add or commit fails
+        subprocess.TimeoutExpired: If a command exceeds timeout
+    """
+    add_args = ["add", "--", *paths] if paths else ["add", "-A"]
+    await run_git(*add_args, cwd=worktree_path, timeout=timeout, check=True)
+
+    result = await run_git("commit", "-m", message, cwd=worktree_path, timeout=timeout)
+    if result.returncode != 0:
+        if "nothing to commit" in result.stdout or "nothing added to commit" in result.stdout:
+            return None
+        result.check()
+
+    match = _COMMIT_LINE_RE.search(result.stdout)
+    if match:
+        return match.group(1)
+
+    # Unusual commit output (e.g. hooks printing first); ask git directly
+    sha = await run_git(
+        "rev-parse", "--short", "HEAD", cwd=worktree_path, timeout=timeout, check=True
+    )
+    return sha.stdout.strip()
@@ -3,16 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import os
-from datetime import UTC, datetime, timedelta
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+from .collector_registry import (
+    missing_credentials,
+    register_collector,
+    registered_collectors,
+    resolve_collectors,
+    schedule_groups,
+    source_semaphore,
+)
+from .fault_tolerant import SourceConfig
+
+if TYPE_CHECKING:
+    from .collector_registry import CollectorSpec
+    from .fault_tolerant import BreakerStore
+    from .metrics_warehouse import Aggregate, Fact, MetricsWarehouse
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +47,33 @@ def _load_env() -> None:
         load_dotenv(override=True)
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP Client
+# ---------------------------------------------------------------------------
+
+# One pooled client per event loop, reused by the HTTP collectors (Clarity,
+# monetization) so a long-lived process keeps its connections warm.
+_http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    for stale in [lp for lp in _http_clients if lp.is_closed()]:
+        del _http_clients[stale]
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=30)
+        _http_clients[loop] = client
+    return client
+
+
+async def aclose_http_clients() -> None:
+    """Close the pooled HTTP client bound to the running event loop."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 # ---------------------------------------------------------------------------
 # Pydantic Models
 # ---------------------------------------------------------------------------
@@ -42,6 +88,9 @@ class CollectorResult(BaseModel):
     duration_ms: float | None = None   # wall-clock collection time
     attempts: int = 1                  # how many tries were made
     artifacts: list[str] = Field(default_factory=list)  # Kapture diagnostic file paths
+    circuit_open: bool = False         # last known good data served while breaker is open
+    timed_out: bool = False            # still running when collect_all's deadline expired
+    skipped: bool = False              # not run: required credentials not configured
 
 
 class TrafficData(BaseModel):
@@ -159,41 +208,76 @@ def _ga4_dim(row: Any, idx: int) -> str:
         return ""
 
 
-# ---------------------------------------------------------------------------
-# 1) GA4 Traffic Collector
-# ---------------------------------------------------------------------------
+def _ga4_date(row: Any) -> str:
+    """ISO date from the leading GA4 `date` dimension (YYYYMMDD)."""
+    raw = _ga4_dim(row, 0)
+    return f"{raw[:4]}-{raw[4:6]}-{raw[6:8]}"
 
-async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
-    """Collect traffic overview, channels, devices, countries from GA4."""
-    _load_env()
-    property_id = os.getenv("GA4_PROPERTY_ID", "516189580")
 
-    try:
-        from google.analytics.data_v1beta import BetaAnalyticsDataClient
-        from google.analytics.data_v1beta.types import (
-            DateRange,
-            Dimension,
-            Metric,
-            RunReportRequest,
-        )
-    except ImportError:
-        return CollectorResult(
-            source="ga4_traffic",
-            success=False,
-            error="google-analytics-data package not installed",
-        )
+def _ga4_window(days: int) -> tuple[date, date]:
+    end = datetime.now(UTC).date()
+    return end - timedelta(days=days), end
 
-    try:
-        from .credentials import ga4_client
-        client = ga4_client(BetaAnalyticsDataClient)
-        prop = f"properties/{property_id}"
-        end = datetime.now(UTC).date()
-        start = end - timedelta(days=days)
-        date_range = DateRange(start_date=str(start), end_date=str(end))
 
+def _warehouse_info(
+    warehouse: MetricsWarehouse,
+    source: str,
+    window: tuple[date, date],
+    fetched: tuple[date, date] | None,
+) -> dict[str, Any]:
+    """Summary of what a warehouse-backed collector fetched vs. read locally."""
+    return {
+        "fetched_start": str(fetched[0]) if fetched else None,
+        "fetched_end": str(fetched[1]) if fetched else None,
+        "fetched_days": (fetched[1] - fetched[0]).days + 1 if fetched else 0,
+        "stored_days": warehouse.stored_days(source, *window),
+    }
+
+
+# ---------------------------------------------------------------------------
+# GA4 batch fetch (shared by the traffic and funnel collectors)
+# ---------------------------------------------------------------------------
+
+GA4_FUNNEL_EVENTS = [
+    "pricing_view", "theme_preview", "checkout_start",
+    "checkout_abandon", "purchase_success", "trial_start",
+    "mobile_landing", "mobile_email_capture",
+]
+
+# In-flight batch fetches keyed by (property, start, end, event loop)
+_GA4_BATCHES: dict[tuple[Any, ...], asyncio.Future[dict[str, Any]]] = {}
+
+
+# Row limit for per-date reports (GA4 defaults to 10,000 rows)
+GA4_DAILY_ROW_LIMIT = 250_000
+
+
+def _ga4_report_requests(date_range: Any, kind: str = "window") -> dict[str, Any]:
+    """Build the GA4 report requests for one batch.
+
+    ``kind`` is one of:
+
+    - ``"window"``: the five reports (four traffic views plus the funnel)
+      totalled over the date range
+    - ``"daily"``: the additive reports with a leading ``date`` dimension
+      (shifting the other dimensions by one) for storage in the metrics
+      warehouse; user counts are left out because they are distinct over
+      the range and cannot be summed across days
+    - ``"users"``: only the user counts (overview and per country),
+      totalled over the range, for warehouse-backed runs
+    """
+    from google.analytics.data_v1beta.types import (
+        Dimension,
+        Filter,
+        FilterExpression,
+        FilterExpressionList,
+        Metric,
+        RunReportRequest,
+    )
+
+    requests = {
         # --- Traffic overview ---
-        overview_req = RunReportRequest(
-            property=prop,
+        "overview": RunReportRequest(
             date_ranges=[date_range],
             metrics=[
                 Metric(name="sessions"),
@@ -204,11 +288,9 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
                 Metric(name="screenPageViews"),
                 Metric(name="bounceRate"),
             ],
-        )
-
+        ),
         # --- Channel breakdown ---
-        channel_req = RunReportRequest(
-            property=prop,
+        "channel": RunReportRequest(
             date_ranges=[date_range],
             dimensions=[Dimension(name="sessionDefaultChannelGroup")],
             metrics=[
@@ -217,11 +299,9 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
                 Metric(name="bounceRate"),
                 Metric(name="averageSessionDuration"),
             ],
-        )
-
+        ),
         # --- Device split ---
-        device_req = RunReportRequest(
-            property=prop,
+        "device": RunReportRequest(
             date_ranges=[date_range],
             dimensions=[Dimension(name="deviceCategory")],
             metrics=[
@@ -229,24 +309,328 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
                 Metric(name="bounceRate"),
                 Metric(name="averageSessionDuration"),
             ],
-        )
-
+        ),
         # --- Country split ---
-        country_req = RunReportRequest(
-            property=prop,
+        "country": RunReportRequest(
             date_ranges=[date_range],
             dimensions=[Dimension(name="country")],
             metrics=[Metric(name="totalUsers")],
+        ),
+        # --- Funnel events ---
+        "funnel": RunReportRequest(
+            date_ranges=[date_range],
+            dimensions=[Dimension(name="eventName")],
+            metrics=[Metric(name="eventCount")],
+            dimension_filter=FilterExpression(
+                or_group=FilterExpressionList(
+                    expressions=[
+                        FilterExpression(
+                            filter=Filter(
+                                field_name="eventName",
+                                string_filter=Filter.StringFilter(
+                                    value=evt,
+                                    match_type=Filter.StringFilter.MatchType.EXACT,
+                                ),
+                            )
+                        )
+                        for evt in GA4_FUNNEL_EVENTS
+                    ]
+                )
+            ),
+        ),
+    }
+    if kind == "users":
+        return {
+            "overview": RunReportRequest(
+                date_ranges=[date_range],
+                metrics=[Metric(name="totalUsers"), Metric(name="newUsers")],
+            ),
+            "country": requests["country"],
+        }
+    if kind == "daily":
+        del requests["country"]
+        for req in requests.values():
+            req.dimensions.insert(0, Dimension(name="date"))
+            req.limit = GA4_DAILY_ROW_LIMIT
+    return requests
+
+
+async def _run_ga4_batch(
+    property_id: str, start: str, end: str, kind: str
+) -> dict[str, Any]:
+    from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
+    from google.analytics.data_v1beta.types import BatchRunReportsRequest, DateRange
+
+    from .credentials import ga4_async_client
+
+    client = ga4_async_client(BetaAnalyticsDataAsyncClient)
+    requests = _ga4_report_requests(DateRange(start_date=start, end_date=end), kind)
+    t0 = time.perf_counter()
+    resp = await client.batch_run_reports(
+        request=BatchRunReportsRequest(
+            property=f"properties/{property_id}",
+            requests=list(requests.values()),
+        )
+    )
+    logger.debug(
+        "GA4 batchRunReports (%d reports) took %.0fms",
+        len(requests), (time.perf_counter() - t0) * 1000,
+    )
+    return dict(zip(requests, resp.reports))
+
+
+async def fetch_ga4_reports(days: int = 1) -> dict[str, Any]:
+    """Fetch all GA4 reports for the window in one batchRunReports call.
+
+    The traffic and funnel collectors both await this; concurrent callers for
+    the same property and window share a single in-flight request, so a
+    ``collect_all`` run makes one GA4 round-trip instead of five.
+
+    Returns:
+        Mapping of report name (overview, channel, device, country, funnel)
+        to its RunReportResponse
+    """
+    return await _shared_ga4_batch(*_ga4_window(days), kind="window")
+
+
+async def fetch_ga4_daily_reports(start: date, end: date) -> dict[str, Any]:
+    """Like fetch_ga4_reports, but for [start, end] with a per-date breakdown."""
+    return await _shared_ga4_batch(start, end, kind="daily")
+
+
+async def fetch_ga4_user_reports(days: int = 1) -> dict[str, Any]:
+    """Distinct user counts (overview and country reports) for the window."""
+    return await _shared_ga4_batch(*_ga4_window(days), kind="users")
+
+
+async def _shared_ga4_batch(start: date, end: date, kind: str) -> dict[str, Any]:
+    _load_env()
+    property_id = os.getenv("GA4_PROPERTY_ID", "516189580")
+    loop = asyncio.get_running_loop()
+    key = (property_id, str(start), str(end), kind, loop)
+
+    future = _GA4_BATCHES.get(key)
+    if future is None:
+        future = loop.create_task(
+            _run_ga4_batch(property_id, str(start), str(end), kind)
         )
+        _GA4_BATCHES[key] = future
+
+        def _forget(done: asyncio.Future[dict[str, Any]]) -> None:
+            if _GA4_BATCHES.get(key) is done:
+                del _GA4_BATCHES[key]
+            if not done.cancelled():
+                done.exception()  # mark retrieved if every waiter timed out
+
+        future.add_done_callback(_forget)
+
+    # shield: one collector timing out must not cancel the other's fetch
+    return await asyncio.shield(future)
+
+
+# ---------------------------------------------------------------------------
+# GA4 warehouse facts (per-date reports -> additive facts -> report data)
+# ---------------------------------------------------------------------------
 
-        loop = asyncio.get_event_loop()
-        overview_resp, channel_resp, device_resp, country_resp = await asyncio.gather(
-            loop.run_in_executor(None, client.run_report, overview_req),
-            loop.run_in_executor(None, client.run_report, channel_req),
-            loop.run_in_executor(None, client.run_report, device_req),
-            loop.run_in_executor(None, client.run_report, country_req),
+# Both GA4 collectors read one batch, so they agree on the range to fetch
+_GA4_SOURCES = ("ga4_traffic", "ga4_funnel")
+
+
+def _ga4_traffic_facts(reports: dict[str, Any]) -> list[Fact]:
+    """Per-date traffic facts; ratios are stored multiplied by sessions.
+
+    User counts are not stored: see fetch_ga4_user_reports().
+    """
+    facts: list[Fact] = []
+    for r in reports["overview"].rows:
+        d, sessions = _ga4_date(r), _ga4_metric_int(r, 0)
+        facts += [
+            (d, "traffic", "", "sessions", sessions),
+            (d, "traffic", "", "engaged_sessions", _ga4_metric_int(r, 3)),
+            (d, "traffic", "", "duration_x_sessions", _ga4_metric_float(r, 4) * sessions),
+            (d, "traffic", "", "page_views", _ga4_metric_int(r, 5)),
+            (d, "traffic", "", "bounce_x_sessions", _ga4_metric_float(r, 6) * sessions),
+        ]
+    for r in reports["channel"].rows:
+        d, key, sessions = _ga4_date(r), _ga4_dim(r, 1), _ga4_metric_int(r, 0)
+        facts += [
+            (d, "channels", key, "sessions", sessions),
+            (d, "channels", key, "engaged_sessions", _ga4_metric_int(r, 1)),
+            (d, "channels", key, "bounce_x_sessions", _ga4_metric_float(r, 2) * sessions),
+            (d, "channels", key, "duration_x_sessions", _ga4_metric_float(r, 3) * sessions),
+        ]
+    for r in reports["device"].rows:
+        d, key, sessions = _ga4_date(r), _ga4_dim(r, 1), _ga4_metric_int(r, 0)
+        facts += [
+            (d, "devices", key, "sessions", sessions),
+            (d, "devices", key, "bounce_x_sessions", _ga4_metric_float(r, 1) * sessions),
+            (d, "devices", key, "duration_x_sessions", _ga4_metric_float(r, 2) * sessions),
+        ]
+    return facts
+
+
+def _per_session(metrics: dict[str, float], name: str) -> float:
+    sessions = metrics.get("sessions", 0)
+    return metrics.get(name, 0.0) / sessions if sessions else 0.0
+
+
+def _ga4_countries(country_resp: Any) -> list[CountryRow]:
+    """Country rows of a window-level country report, most users first."""
+    total_users = sum(_ga4_metric_int(r, 0) for r in country_resp.rows)
+    countries = []
+    for r in country_resp.rows:
+        u = _ga4_metric_int(r, 0)
+        countries.append(CountryRow(
+            country=_ga4_dim(r, 0),
+            users=u,
+            user_share_pct=round(u / total_users * 100, 1) if total_users else 0,
+        ))
+    countries.sort(key=lambda c: c.users, reverse=True)
+    return countries
+
+
+def _ga4_user_data(reports: dict[str, Any]) -> dict[str, Any]:
+    """Users, new users and countries from fetch_ga4_user_reports()."""
+    overview = reports["overview"].rows
+    return {
+        "users": _ga4_metric_int(overview[0], 0) if overview else 0,
+        "new_users": _ga4_metric_int(overview[0], 1) if overview else 0,
+        "countries": [c.model_dump() for c in _ga4_countries(reports["country"])[:10]],
+    }
+
+
+def _ga4_traffic_data(agg: Aggregate) -> dict[str, Any]:
+    """Rebuild the ga4_traffic result data (without users) from aggregated facts."""
+    t = agg.get("traffic", {}).get("", {})
+    traffic = TrafficData(
+        sessions=int(t.get("sessions", 0)),
+        engaged_sessions=int(t.get("engaged_sessions", 0)),
+        avg_session_duration_seconds=_per_session(t, "duration_x_sessions"),
+        page_views=int(t.get("page_views", 0)),
+        bounce_rate=_per_session(t, "bounce_x_sessions"),
+    )
+    channels = sorted(
+        (
+            ChannelRow(
+                channel=name,
+                sessions=int(m.get("sessions", 0)),
+                engaged_sessions=int(m.get("engaged_sessions", 0)),
+                bounce_rate=_per_session(m, "bounce_x_sessions"),
+                avg_duration_seconds=_per_session(m, "duration_x_sessions"),
+            )
+            for name, m in agg.get("channels", {}).items()
+        ),
+        key=lambda c: c.sessions, reverse=True,
+    )
+    devices = sorted(
+        (
+            DeviceRow(
+                device=name,
+                sessions=int(m.get("sessions", 0)),
+                bounce_rate=_per_session(m, "bounce_x_sessions"),
+                avg_duration_seconds=_per_session(m, "duration_x_sessions"),
+            )
+            for name, m in agg.get("devices", {}).items()
+        ),
+        key=lambda d: d.sessions, reverse=True,
+    )
+    return {
+        "traffic": traffic.model_dump(),
+        "channels": [c.model_dump() for c in channels],
+        "devices": [d.model_dump() for d in devices],
+    }
+
+
+def _ga4_funnel_facts(reports: dict[str, Any]) -> list[Fact]:
+    return [
+        (_ga4_date(r), "events", _ga4_dim(r, 1), "count", _ga4_metric_int(r, 0))
+        for r in reports["funnel"].rows
+    ]
+
+
+def _ga4_funnel_data(agg: Aggregate) -> dict[str, Any]:
+    counts = agg.get("events", {})
+    events = [
+        FunnelEvent(event_name=evt, count=int(counts.get(evt, {}).get("count", 0)))
+        for evt in GA4_FUNNEL_EVENTS
+    ]
+    return {"events": [e.model_dump() for e in events]}
+
+
+_GA4_STORED = {
+    "ga4_traffic": (_ga4_traffic_facts, _ga4_traffic_data),
+    "ga4_funnel": (_ga4_funnel_facts, _ga4_funnel_data),
+}
+
+
+async def _collect_ga4_stored(
+    source: str, days: int, warehouse: MetricsWarehouse
+) -> CollectorResult:
+    """Fetch only missing/restated GA4 days, store them, and aggregate locally."""
+    to_facts, to_data = _GA4_STORED[source]
+    window = _ga4_window(days)
+    fetch = warehouse.fetch_range(_GA4_SOURCES, *window)
+    if fetch:
+        reports = await fetch_ga4_daily_reports(*fetch)
+        warehouse.replace(source, *fetch, to_facts(reports))
+    data = to_data(warehouse.aggregate(source, *window))
+    data["warehouse"] = _warehouse_info(warehouse, source, window, fetch)
+    return CollectorResult(source=source, data=data)
+
+
+# ---------------------------------------------------------------------------
+# 1) GA4 Traffic Collector
+# ---------------------------------------------------------------------------
+
+@register_collector(
+    "ga4_traffic",
+    config=SourceConfig(
+        source_id="ga4_traffic",
+        dashboard_url="https://analytics.google.com/analytics/web/#/p516189580",
+        timeout_s=60.0,
+        max_retries=1,
+    ),
+    credentials=("ga4",),
+    clients=("ga4",),
+)
+async def collect_ga4_traffic(
+    days: int = 1,
+    warehouse: MetricsWarehouse | None = None,
+) -> CollectorResult:
+    """Collect traffic overview, channels, devices, countries from GA4.
+
+    With a warehouse, only days not yet stored (plus the restatement window)
+    are fetched and the report is aggregated from stored daily facts.
+    """
+    try:
+        import google.analytics.data_v1beta  # noqa: F401
+    except ImportError:
+        return CollectorResult(
+            source="ga4_traffic",
+            success=False,
+            error="google-analytics-data package not installed",
         )
 
+    try:
+        if warehouse is not None:
+            # Users are distinct over the window, not additive across days, so
+            # they are fetched for the whole window on every run
+            result, user_reports = await asyncio.gather(
+                _collect_ga4_stored("ga4_traffic", days, warehouse),
+                fetch_ga4_user_reports(days),
+            )
+            users = _ga4_user_data(user_reports)
+            result.data["traffic"]["users"] = users["users"]
+            result.data["traffic"]["new_users"] = users["new_users"]
+            result.data["countries"] = users["countries"]
+            return result
+
+        reports = await fetch_ga4_reports(days)
+        overview_resp = reports["overview"]
+        channel_resp = reports["channel"]
+        device_resp = reports["device"]
+        country_resp = reports["country"]
+
         # Parse overview
         traffic = TrafficData()
         if overview_resp.rows:
@@ -282,17 +666,7 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
                 avg_duration_seconds=_ga4_metric_float(r, 2),
             ))
 
-        # Parse countries
-        total_users = sum(_ga4_metric_int(r, 0) for r in country_resp.rows)
-        countries = []
-        for r in country_resp.rows:
-            u = _ga4_metric_int(r, 0)
-            countries.append(CountryRow(
-                country=_ga4_dim(r, 0),
-                users=u,
-                user_share_pct=round(u / total_users * 100, 1) if total_users else 0,
-            ))
-        countries.sort(key=lambda c: c.users, reverse=True)
+        countries = _ga4_countries(country_resp)
 
         return CollectorResult(
             source="ga4_traffic",
@@ -305,6 +679,8 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
         )
     except Exception as e:
         logger.exception("GA4 traffic collection failed")
+        from .credentials import invalidate_on_auth_error
+        invalidate_on_auth_error("ga4", e)
         return CollectorResult(source="ga4_traffic", success=False, error=str(e))
 
 
@@ -312,22 +688,24 @@ async def collect_ga4_traffic(days: int = 1) -> CollectorResult:
 # 2) GA4 Funnel Collector
 # ---------------------------------------------------------------------------
 
-async def collect_ga4_funnel(days: int = 1) -> CollectorResult:
-    """Collect funnel event counts from GA4."""
-    _load_env()
-    property_id = os.getenv("GA4_PROPERTY_ID", "516189580")
-    target_events = [
-        "pricing_view", "theme_preview", "checkout_start",
-        "checkout_abandon", "purchase_success", "trial_start",
-        "mobile_landing", "mobile_email_capture",
-    ]
-
+@register_collector(
+    "ga4_funnel",
+    config=SourceConfig(
+        source_id="ga4_funnel",
+        dashboard_url="https://analytics.google.com/analytics/web/#/p516189580",
+        timeout_s=60.0,
+        max_retries=1,
+    ),
+    credentials=("ga4",),
+    clients=("ga4",),
+)
+async def collect_ga4_funnel(
+    days: int = 1,
+    warehouse: MetricsWarehouse | None = None,
+) -> CollectorResult:
+    """Collect funnel event counts from GA4 (incrementally with a warehouse)."""
     try:
-        from google.analytics.data_v1beta import BetaAnalyticsDataClient
-        from google.analytics.data_v1beta.types import (
-            DateRange, Dimension, Filter, FilterExpression,
-            FilterExpressionList, Metric, RunReportRequest,
-        )
+        import google.analytics.data_v1beta  # noqa: F401
     except ImportError:
         return CollectorResult(
             source="ga4_funnel", success=False,
@@ -335,39 +713,12 @@ async def collect_ga4_funnel(days: int = 1) -> CollectorResult:
         )
 
     try:
-        from .credentials import ga4_client
-        client = ga4_client(BetaAnalyticsDataClient)
-        prop = f"properties/{property_id}"
-        end = datetime.now(UTC).date()
-        start = end - timedelta(days=days)
-
-        req = RunReportRequest(
-            property=prop,
-            date_ranges=[DateRange(start_date=str(start), end_date=str(end))],
-            dimensions=[Dimension(name="eventName")],
-            metrics=[Metric(name="eventCount")],
-            dimension_filter=FilterExpression(
-                or_group=FilterExpressionList(
-                    expressions=[
-                        FilterExpression(
-                            filter=Filter(
-                                field_name="eventName",
-                                string_filter=Filter.StringFilter(
-                                    value=evt,
-                                    match_type=Filter.StringFilter.MatchType.EXACT,
-                                ),
-                            )
-                        )
-                        for evt in target_events
-                    ]
-                )
-            ),
-        )
+        if warehouse is not None:
+            return await _collect_ga4_stored("ga4_funnel", days, warehouse)
 
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(None, client.run_report, req)
+        resp = (await fetch_ga4_reports(days))["funnel"]
 
-        event_counts = {evt: 0 for evt in target_events}
+        event_counts = {evt: 0 for evt in GA4_FUNNEL_EVENTS}
         for r in resp.rows:
             name = _ga4_dim(r, 0)
             if name in event_counts:
@@ -380,6 +731,8 @@ async def collect_ga4_funnel(days: int = 1) -> CollectorResult:
         )
     except Exception as e:
         logger.exception("GA4 funnel collection failed")
+        from .credentials import invalidate_on_auth_error
+        invalidate_on_auth_error("ga4", e)
         return CollectorResult(source="ga4_funnel", success=False, error=str(e))
 
 
@@ -393,11 +746,191 @@ _ADS_PENDING_MSG = (
 )
 
 
-async def collect_google_ads(days: int = 7) -> CollectorResult:
-    """Collect campaign performance from Google Ads."""
+def _ads_query(start_date: date, end_date: date) -> str:
+    return f"""
+            SELECT
+                campaign.id,
+                campaign.name,
+                segments.date,
+                metrics.impressions,
+                metrics.clicks,
+                metrics.ctr,
+                metrics.average_cpc,
+                metrics.cost_micros,
+                metrics.conversions
+            FROM campaign
+            WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
+              AND campaign.status = 'ENABLED'
+            ORDER BY segments.date DESC
+        """
+
+
+# (date, campaign) -> [clicks, impressions, spend_usd, conversions]
+AdsTotals = dict[tuple[str, str], list[float]]
+
+ADS_QUEUE_BATCHES = 8   # stream batches buffered ahead of the event loop
+_ADS_DONE = object()
+
+
+def _ads_accumulate(rows: Iterable[Any], totals: AdsTotals | None = None) -> AdsTotals:
+    """Sum Google Ads rows per (date, campaign) into plain lists."""
+    totals = {} if totals is None else totals
+    for row in rows:
+        metrics = row.metrics
+        key = (row.segments.date, row.campaign.name)
+        acc = totals.get(key)
+        if acc is None:
+            acc = totals[key] = [0, 0, 0.0, 0.0]
+        acc[0] += metrics.clicks
+        acc[1] += metrics.impressions
+        acc[2] += metrics.cost_micros / 1_000_000
+        acc[3] += metrics.conversions
+    return totals
+
+
+async def stream_ads_totals(
+    open_stream: Callable[[], Iterable[Any]],
+    queue_batches: int = ADS_QUEUE_BATCHES,
+) -> AdsTotals:
+    """
+    Consume a Google Ads search stream in a worker thread.
+
+    The worker performs the blocking gRPC reads and sums each batch into a
+    partial (date, campaign) accumulator; partials come back to the event
+    loop through a queue holding at most ``queue_batches`` items, so a slow
+    consumer applies backpressure instead of buffering the whole stream.
+    The event loop only merges the small partials.
+
+    Args:
+        open_stream: Returns the stream (an iterable of batches with
+                     ``.results`` rows); called in the worker thread
+        queue_batches: Maximum partials in flight
+
+    Raises:
+        Whatever the stream raises, re-raised on the event loop
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    slots = threading.Semaphore(queue_batches)
+    cancelled = threading.Event()
+    stream_ref: list[Any] = []
+
+    def send(item: Any) -> bool:
+        while not slots.acquire(timeout=0.1):
+            if cancelled.is_set():
+                return False
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:  # event loop already closed
+            return False
+        return True
+
+    def produce() -> None:
+        try:
+            stream = open_stream()
+            stream_ref.append(stream)
+            for batch in stream:
+                if cancelled.is_set() or not send(_ads_accumulate(batch.results)):
+                    return
+            send(_ADS_DONE)
+        except Exception as e:
+            if not cancelled.is_set():
+                send(e)
+
+    worker = loop.run_in_executor(None, produce)
+    totals: AdsTotals = {}
+    try:
+        while (item := await queue.get()) is not _ADS_DONE:
+            slots.release()
+            if isinstance(item, Exception):
+                raise item
+            for key, (clicks, impressions, spend, conversions) in item.items():
+                acc = totals.get(key)
+                if acc is None:
+                    totals[key] = [clicks, impressions, spend, conversions]
+                else:
+                    acc[0] += clicks
+                    acc[1] += impressions
+                    acc[2] += spend
+                    acc[3] += conversions
+        await worker
+    except BaseException:
+        # Timeout/cancellation: stop the worker and abort the gRPC call
+        cancelled.set()
+        cancel = getattr(stream_ref[0], "cancel", None) if stream_ref else None
+        if callable(cancel):
+            cancel()
+        raise
+    return totals
+
+
+def _ads_facts(totals: AdsTotals) -> list[Fact]:
+    facts: list[Fact] = []
+    for (day, name), (clicks, impressions, spend, conversions) in totals.items():
+        facts += [
+            (day, "campaigns", name, "clicks", clicks),
+            (day, "campaigns", name, "impressions", impressions),
+            (day, "campaigns", name, "spend_usd", spend),
+            (day, "campaigns", name, "conversions", conversions),
+        ]
+    return facts
+
+
+def _ads_data(agg: Aggregate, daily_spend: dict[str, float]) -> dict[str, Any]:
+    """Build campaign rows and totals from aggregated campaign facts."""
+    campaigns: list[CampaignRow] = []
+    for name, m in sorted(
+        agg.get("campaigns", {}).items(),
+        key=lambda item: item[1].get("spend_usd", 0.0),
+        reverse=True,
+    ):
+        clicks = int(m.get("clicks", 0))
+        impressions = int(m.get("impressions", 0))
+        spend = m.get("spend_usd", 0.0)
+        campaigns.append(CampaignRow(
+            campaign=name,
+            clicks=clicks,
+            impressions=impressions,
+            ctr=round(clicks / impressions * 100, 2) if impressions > 0 else 0.0,
+            avg_cpc_usd=round(spend / clicks, 2) if clicks > 0 else 0.0,
+            spend_usd=spend,
+            conversions=m.get("conversions", 0.0),
+        ))
+
+    return {
+        "campaigns": [c.model_dump() for c in campaigns],
+        "daily_spend": daily_spend,
+        "total_spend_usd": round(sum(daily_spend.values()), 2),
+        "total_clicks": sum(c.clicks for c in campaigns),
+        "total_impressions": sum(c.impressions for c in campaigns),
+        "total_conversions": sum(c.conversions for c in campaigns),
+    }
+
+
+@register_collector(
+    "google_ads",
+    config=SourceConfig(
+        source_id="google_ads",
+        dashboard_url="https://ads.google.com/aw/campaigns?__e=1702899815",
+        timeout_s=30.0,
+        max_retries=0,
+    ),
+    credentials=("google_ads",),
+    clients=("google_ads",),
+)
+async def collect_google_ads(
+    days: int = 7,
+    warehouse: MetricsWarehouse | None = None,
+) -> CollectorResult:
+    """Collect campaign performance from Google Ads.
+
+    With a warehouse, only days not yet stored (plus the restatement window)
+    are queried; totals are aggregated from stored daily campaign facts. The
+    search stream is read and summed in a worker thread (stream_ads_totals),
+    so the other collectors keep running while large accounts stream in.
+    """
     _load_env()
     customer_id = os.getenv("GOOGLE_ADS_CUSTOMER_ID", "")
-    creds_path = os.getenv("GOOGLE_ADS_CREDENTIALS_PATH", "")
 
     if not customer_id:
         return CollectorResult(
@@ -414,77 +947,44 @@ async def collect_google_ads(days: int = 7) -> CollectorResult:
         )
 
     try:
-        if creds_path and Path(creds_path).exists():
-            ads_client = GoogleAdsClient.load_from_storage(creds_path)
-        else:
-            ads_client = GoogleAdsClient.load_from_env()
+        from .metrics_warehouse import aggregate_facts, daily_totals
 
-        ga_service = ads_client.get_service("GoogleAdsService")
         end_date = datetime.now(UTC).date()
         start_date = end_date - timedelta(days=max(days - 1, 0))
+        window = (start_date, end_date)
+        fetch: tuple[date, date] | None = window
+        if warehouse is not None:
+            fetch = warehouse.fetch_range(["google_ads"], *window)
+
+        facts: list[Fact] = []
+        if fetch:
+            from .credentials import google_ads_client
+            ads_client = google_ads_client(GoogleAdsClient)
+            ga_service = ads_client.get_service("GoogleAdsService")
+            query = _ads_query(*fetch)
+
+            totals = await stream_ads_totals(
+                lambda: ga_service.search_stream(
+                    customer_id=customer_id.replace("-", ""),
+                    query=query,
+                )
+            )
+            facts = _ads_facts(totals)
 
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                segments.date,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM campaign
-            WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-              AND campaign.status = 'ENABLED'
-            ORDER BY segments.date DESC
-        """
-
-        loop = asyncio.get_event_loop()
-        stream = await loop.run_in_executor(
-            None,
-            lambda: ga_service.search_stream(
-                customer_id=customer_id.replace("-", ""),
-                query=query,
-            ),
-        )
-
-        campaigns: dict[str, CampaignRow] = {}
-        daily_spend: dict[str, float] = {}
-
-        for batch in stream:
-            for row in batch.results:
-                name = row.campaign.name
-                date_str = row.segments.date
-                cost_usd = row.metrics.cost_micros / 1_000_000
-
-                daily_spend[date_str] = daily_spend.get(date_str, 0) + cost_usd
-
-                if name not in campaigns:
-                    campaigns[name] = CampaignRow(campaign=name)
-                c = campaigns[name]
-                c.clicks += row.metrics.clicks
-                c.impressions += row.metrics.impressions
-                c.spend_usd += cost_usd
-                c.conversions += row.metrics.conversions
-
-        for c in campaigns.values():
-            if c.impressions > 0:
-                c.ctr = round(c.clicks / c.impressions * 100, 2)
-            if c.clicks > 0:
-                c.avg_cpc_usd = round(c.spend_usd / c.clicks, 2)
+        if warehouse is None:
+            data = _ads_data(
+                aggregate_facts(facts), daily_totals(facts, "campaigns", "spend_usd")
+            )
+        else:
+            if fetch:
+                warehouse.replace("google_ads", *fetch, facts)
+            data = _ads_data(
+                warehouse.aggregate("google_ads", *window),
+                warehouse.daily("google_ads", "campaigns", "spend_usd", *window),
+            )
+            data["warehouse"] = _warehouse_info(warehouse, "google_ads", window, fetch)
 
-        return CollectorResult(
-            source="google_ads",
-            data={
-                "campaigns": [c.model_dump() for c in campaigns.values()],
-                "daily_spend": daily_spend,
-                "total_spend_usd": round(sum(daily_spend.values()), 2),
-                "total_clicks": sum(c.clicks for c in campaigns.values()),
-                "total_impressions": sum(c.impressions for c in campaigns.values()),
-                "total_conversions": sum(c.conversions for c in campaigns.values()),
-            },
-        )
+        return CollectorResult(source="google_ads", data=data)
     except Exception as e:
         # Known blocker: Test-level developer token rejected by production accounts.
         # Return a stable, human-readable message instead of a gRPC stack trace.
@@ -496,6 +996,8 @@ async def collect_google_ads(days: int = 7) -> CollectorResult:
             )
 
         logger.exception("Google Ads collection failed")
+        from .credentials import invalidate_on_auth_error
+        invalidate_on_auth_error("google_ads", e)
         from .fault_tolerant import clean_error_message
         return CollectorResult(source="google_ads", success=False, error=clean_error_message(e))
 
@@ -504,6 +1006,17 @@ async def collect_google_ads(days: int = 7) -> CollectorResult:
 # 4) Microsoft Clarity Collector
 # ---------------------------------------------------------------------------
 
+@register_collector(
+    "clarity",
+    config=SourceConfig(
+        source_id="clarity",
+        dashboard_url="https://clarity.microsoft.com/projects/vky4a128au",
+        timeout_s=30.0,
+        max_retries=0,
+    ),
+    credentials=("clarity",),
+    clients=("http",),
+)
 async def collect_clarity() -> CollectorResult:
     """Collect Core Web Vitals and UX metrics from Clarity."""
     _load_env()
@@ -524,10 +1037,9 @@ async def collect_clarity() -> CollectorResult:
         }
         params = {"numOfDays": "1"}
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url, headers=headers, params=params)
-            resp.raise_for_status()
-            raw = resp.json()
+        resp = await _http_client().get(url, headers=headers, params=params)
+        resp.raise_for_status()
+        raw = resp.json()
 
         vitals = WebVitalsData()
         devices: list[ClarityDeviceRow] = []
@@ -576,6 +1088,9 @@ async def collect_clarity() -> CollectorResult:
             },
         )
     except Exception as e:
+        from .fault_tolerant import is_transient_http_error
+        if is_transient_http_error(e):
+            raise  # retried with backoff by run_with_resilience
         logger.exception("Clarity collection failed")
         return CollectorResult(source="clarity", success=False, error=str(e))
 
@@ -584,13 +1099,54 @@ async def collect_clarity() -> CollectorResult:
 # 5) Chrome Web Store Collector (via CWS GA4 property)
 # ---------------------------------------------------------------------------
 
-async def collect_cws(days: int = 7) -> CollectorResult:
-    """Collect CWS stats from the CWS GA4 property."""
+def _cws_data(events: dict[str, int]) -> dict[str, Any]:
+    """Derive install/uninstall/view counts from CWS GA4 event totals."""
+    cws = CWSData()
+    install_key = next((k for k in events if "install" in k.lower() and "un" not in k.lower()), None)
+    uninstall_key = next((k for k in events if "uninstall" in k.lower()), None)
+    view_key = next((k for k in events if "view" in k.lower() or "page_view" in k.lower()), None)
+
+    if install_key:
+        cws.installs = events[install_key]
+    if uninstall_key:
+        cws.uninstalls = events[uninstall_key]
+    if view_key:
+        cws.listing_views = events[view_key]
+
+    if cws.installs is None and cws.uninstalls is None:
+        cws.manual_pull_required = True
+        cws.note = (
+            "CWS GA4 property did not return install/uninstall events. "
+            "Pull these from the Chrome Web Store Developer Dashboard manually."
+        )
+
+    return {
+        "cws": cws.model_dump(),
+        "raw_events": events,
+    }
+
+
+@register_collector(
+    "cws",
+    config=SourceConfig(
+        source_id="cws",
+        dashboard_url="https://chrome.google.com/webstore/devconsole",
+        timeout_s=60.0,
+        max_retries=1,
+    ),
+    credentials=("cws",),
+    clients=("cws_ga4",),
+)
+async def collect_cws(
+    days: int = 7,
+    warehouse: MetricsWarehouse | None = None,
+) -> CollectorResult:
+    """Collect CWS stats from the CWS GA4 property (incrementally with a warehouse)."""
     _load_env()
     property_id = os.getenv("GA4_CWS_PROPERTY_ID", "521095252")
 
     try:
-        from google.analytics.data_v1beta import BetaAnalyticsDataClient
+        from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
         from google.analytics.data_v1beta.types import (
             DateRange, Dimension, Metric, RunReportRequest,
         )
@@ -601,54 +1157,48 @@ async def collect_cws(days: int = 7) -> CollectorResult:
         )
 
     try:
-        from .credentials import cws_ga4_client
-        client = cws_ga4_client(BetaAnalyticsDataClient)
+        from .credentials import cws_ga4_async_client
+        client = cws_ga4_async_client(BetaAnalyticsDataAsyncClient)
         prop = f"properties/{property_id}"
-        end = datetime.now(UTC).date()
-        start = end - timedelta(days=days)
-
-        req = RunReportRequest(
-            property=prop,
-            date_ranges=[DateRange(start_date=str(start), end_date=str(end))],
-            dimensions=[Dimension(name="eventName")],
-            metrics=[Metric(name="eventCount")],
-        )
-
-        loop = asyncio.get_event_loop()
-        resp = await loop.run_in_executor(None, client.run_report, req)
-
-        events: dict[str, int] = {}
-        for r in resp.rows:
-            events[_ga4_dim(r, 0)] = _ga4_metric_int(r, 0)
-
-        cws = CWSData()
-        install_key = next((k for k in events if "install" in k.lower() and "un" not in k.lower()), None)
-        uninstall_key = next((k for k in events if "uninstall" in k.lower()), None)
-        view_key = next((k for k in events if "view" in k.lower() or "page_view" in k.lower()), None)
-
-        if install_key:
-            cws.installs = events[install_key]
-        if uninstall_key:
-            cws.uninstalls = events[uninstall_key]
-        if view_key:
-            cws.listing_views = events[view_key]
-
-        if cws.installs is None and cws.uninstalls is None:
-            cws.manual_pull_required = True
-            cws.note = (
-                "CWS GA4 property did not return install/uninstall events. "
-                "Pull these from the Chrome Web Store Developer Dashboard manually."
+        window = _ga4_window(days)
+
+        if warehouse is None:
+            req = RunReportRequest(
+                property=prop,
+                date_ranges=[DateRange(start_date=str(window[0]), end_date=str(window[1]))],
+                dimensions=[Dimension(name="eventName")],
+                metrics=[Metric(name="eventCount")],
             )
-
-        return CollectorResult(
-            source="cws",
-            data={
-                "cws": cws.model_dump(),
-                "raw_events": events,
-            },
-        )
+            resp = await client.run_report(request=req)
+
+            events: dict[str, int] = {}
+            for r in resp.rows:
+                events[_ga4_dim(r, 0)] = _ga4_metric_int(r, 0)
+            return CollectorResult(source="cws", data=_cws_data(events))
+
+        fetch = warehouse.fetch_range(["cws"], *window)
+        if fetch:
+            req = RunReportRequest(
+                property=prop,
+                date_ranges=[DateRange(start_date=str(fetch[0]), end_date=str(fetch[1]))],
+                dimensions=[Dimension(name="date"), Dimension(name="eventName")],
+                metrics=[Metric(name="eventCount")],
+                limit=GA4_DAILY_ROW_LIMIT,
+            )
+            resp = await client.run_report(request=req)
+            warehouse.replace("cws", *fetch, [
+                (_ga4_date(r), "events", _ga4_dim(r, 1), "count", _ga4_metric_int(r, 0))
+                for r in resp.rows
+            ])
+
+        stored = warehouse.aggregate("cws", *window).get("events", {})
+        data = _cws_data({name: int(m.get("count", 0)) for name, m in stored.items()})
+        data["warehouse"] = _warehouse_info(warehouse, "cws", window, fetch)
+        return CollectorResult(source="cws", data=data)
     except Exception as e:
         logger.exception("CWS collection failed")
+        from .credentials import invalidate_on_auth_error
+        invalidate_on_auth_error("cws", e)
         return CollectorResult(source="cws", success=False, error=str(e))
 
 
@@ -656,6 +1206,16 @@ async def collect_cws(days: int = 7) -> CollectorResult:
 # 6) Server-Side Monetization Collector
 # ---------------------------------------------------------------------------
 
+@register_collector(
+    "monetization",
+    config=SourceConfig(
+        source_id="monetization",
+        dashboard_url=None,  # dynamic: set via MONETIZATION_ENDPOINT env var
+        timeout_s=30.0,
+        max_retries=1,
+    ),
+    clients=("http",),  # session cookie is optional, so no credential gate
+)
 async def collect_monetization(days: int = 7) -> CollectorResult:
     """Collect monetization KPIs from the server-side endpoint."""
     _load_env()
@@ -667,18 +1227,13 @@ async def collect_monetization(days: int = 7) -> CollectorResult:
 
     try:
         headers: dict[str, str] = {"Accept": "application/json"}
-        cookies: dict[str, str] = {}
         if session_cookie:
-            cookies["__session"] = session_cookie
+            # Sent as a header: per-request cookies are deprecated on shared clients
+            headers["Cookie"] = f"__session={session_cookie}"
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(
-                f"{endpoint}?days={days}",
-                headers=headers,
-                cookies=cookies,
-            )
-            resp.raise_for_status()
-            raw = resp.json()
+        resp = await _http_client().get(f"{endpoint}?days={days}", headers=headers)
+        resp.raise_for_status()
+        raw = resp.json()
 
         if not raw.get("success"):
             return CollectorResult(
@@ -719,6 +1274,9 @@ async def collect_monetization(days: int = 7) -> CollectorResult:
             },
         )
     except Exception as e:
+        from .fault_tolerant import is_transient_http_error
+        if is_transient_http_error(e):
+            raise  # retried with backoff by run_with_resilience
         logger.exception("Monetization collection failed")
         return CollectorResult(source="monetization", success=False, error=str(e))
 
@@ -727,26 +1285,194 @@ async def collect_monetization(days: int = 7) -> CollectorResult:
 # Orchestrator: collect from all sources in parallel
 # ---------------------------------------------------------------------------
 
-async def collect_all(days: int = 1) -> dict[str, CollectorResult]:
-    """Run all 6 collectors in parallel with per-collector timeout and retry."""
-    from .fault_tolerant import CONFIGS, run_with_resilience
-
-    raw = await asyncio.gather(
-        run_with_resilience(CONFIGS["ga4_traffic"], lambda: collect_ga4_traffic(days)),
-        run_with_resilience(CONFIGS["ga4_funnel"], lambda: collect_ga4_funnel(days)),
-        run_with_resilience(CONFIGS["google_ads"], lambda: collect_google_ads(days)),
-        run_with_resilience(CONFIGS["clarity"], lambda: collect_clarity()),
-        run_with_resilience(CONFIGS["cws"], lambda: collect_cws(days)),
-        run_with_resilience(CONFIGS["monetization"], lambda: collect_monetization(days)),
-        return_exceptions=True,
-    )
-
-    sources = ["ga4_traffic", "ga4_funnel", "google_ads", "clarity", "cws", "monetization"]
+# Registered source ids in run and report order
+COLLECTOR_SOURCES = tuple(spec.source_id for spec in registered_collectors())
+
+
+# Late collectors still being back-filled after collect_all's deadline
+_stragglers: set[asyncio.Task[None]] = set()
+
+
+async def collect_all(
+    days: int = 1,
+    warehouse: MetricsWarehouse | None = None,
+    breakers: BreakerStore | None = None,
+    deadline_s: float | None = None,
+    on_late: Callable[[CollectorResult], Any] | None = None,
+    sources: Iterable[str] | None = None,
+    skip_missing_credentials: bool = False,
+    max_parallel: int | None = None,
+) -> dict[str, CollectorResult]:
+    """Run the registered collectors in parallel with per-collector timeout and retry.
+
+    With a warehouse, GA4, Google Ads and CWS fetch only days not yet stored
+    (plus the restatement window); Clarity and monetization have no per-day
+    history upstream and are always fetched live.
+
+    GA4, CWS and Google Ads clients come from the process-wide client cache in
+    credentials.py, so repeated runs in a long-lived process skip credential
+    loading entirely. Both GA4 collectors share one batchRunReports call.
+
+    With a BreakerStore, sources whose circuit breaker is open return their
+    last known good result for the same ``days`` window immediately instead
+    of being collected.
+
+    Each source runs under its SourceConfig.max_concurrency semaphore, so
+    overlapping collect_all calls (daemon refresh during a scheduled run)
+    don't stack requests against one API.
+
+    Args:
+        deadline_s: Overall deadline. Sources still running when it expires
+                    are returned as failed results with ``timed_out=True``.
+        on_late: Without it, stragglers are cancelled at the deadline. With
+                 it, they keep running and ``on_late(result)`` (sync or
+                 async) is called as each finishes; use
+                 wait_for_stragglers() before shutting down.
+        sources: Source ids to collect (default: all registered). Results
+                 keep registration order.
+        skip_missing_credentials: Don't run sources whose credentials fail
+                 validate_credentials(); they are returned as failed results
+                 with ``skipped=True``. Off by default because GA4 may still
+                 work through application default credentials.
+        max_parallel: Limit on collector groups running at once. Sources
+                 sharing a client (both GA4 collectors) form one group and
+                 start together.
+
+    Raises:
+        ValueError: On unknown source ids
+    """
+    from .fault_tolerant import run_with_resilience
+
+    specs = resolve_collectors(sources)
     out: dict[str, CollectorResult] = {}
-    for name, result in zip(sources, raw):
-        if isinstance(result, Exception):
-            out[name] = CollectorResult(source=name, success=False, error=str(result))
+    if skip_missing_credentials and any(spec.credentials for spec in specs):
+        from .credentials import validate_credentials
+
+        available = validate_credentials()
+        runnable = []
+        for spec in specs:
+            missing = missing_credentials(spec, available)
+            if missing:
+                out[spec.source_id] = CollectorResult(
+                    source=spec.source_id, success=False, skipped=True,
+                    error=f"Skipped: credentials not configured ({', '.join(missing)})",
+                )
+            else:
+                runnable.append(spec)
+        specs = runnable
+
+    slots = asyncio.Semaphore(max_parallel) if max_parallel else None
+
+    async def run(spec: CollectorSpec, group: _GroupSlot) -> CollectorResult:
+        try:
+            if slots is not None:
+                await group.enter(slots)
+            async with source_semaphore(spec):
+                return await run_with_resilience(
+                    spec.config, spec.factory(days, warehouse), breakers, days,
+                )
+        finally:
+            if slots is not None:
+                group.leave(slots)
+
+    tasks: dict[str, asyncio.Task[CollectorResult]] = {}
+    for group in schedule_groups(specs):
+        slot = _GroupSlot(len(group))
+        for spec in group:
+            tasks[spec.source_id] = asyncio.create_task(
+                run(spec, slot), name=f"collect-{spec.source_id}",
+            )
+    pending: set[asyncio.Task[Any]] = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline_s)
+
+    for name, task in tasks.items():
+        if task not in pending:
+            out[name] = _task_result(name, task)
+            continue
+        out[name] = CollectorResult(
+            source=name, success=False, timed_out=True,
+            error=f"Still running when the {deadline_s:g}s collection deadline expired",
+        )
+        if on_late is None:
+            task.cancel()
         else:
-            out[name] = result
+            _track_straggler(name, task, on_late)
 
-    return out
+    if pending and on_late is None:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning(
+            "Collection deadline of %gs expired; cancelled: %s",
+            deadline_s, ", ".join(t.get_name() for t in pending),
+        )
+    return {spec.source_id: out[spec.source_id] for spec in resolve_collectors(out)}
+
+
+class _GroupSlot:
+    """One max_parallel slot shared by a schedule group, held until its last member ends."""
+
+    def __init__(self, members: int) -> None:
+        self.remaining = members
+        self.admitted = False
+        self._lock = asyncio.Lock()
+
+    async def enter(self, slots: asyncio.Semaphore) -> None:
+        async with self._lock:
+            if not self.admitted:
+                await slots.acquire()
+                self.admitted = True
+
+    def leave(self, slots: asyncio.Semaphore) -> None:
+        self.remaining -= 1
+        if self.remaining == 0 and self.admitted:
+            slots.release()
+
+
+def _task_result(name: str, task: asyncio.Task[Any]) -> CollectorResult:
+    if task.cancelled():
+        return CollectorResult(source=name, success=False, error="cancelled")
+    exc = task.exception()
+    if exc is not None:
+        return CollectorResult(source=name, success=False, error=str(exc))
+    return task.result()
+
+
+def _track_straggler(
+    name: str,
+    task: asyncio.Task[Any],
+    on_late: Callable[[CollectorResult], Any],
+) -> None:
+    async def deliver() -> None:
+        try:
+            await asyncio.wait([task])
+            outcome = on_late(_task_result(name, task))
+            if inspect.isawaitable(outcome):
+                await outcome
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        except Exception:
+            logger.exception("Back-filling late %s result failed", name)
+
+    late = asyncio.create_task(deliver(), name=f"backfill-{name}")
+    _stragglers.add(late)
+    late.add_done_callback(_stragglers.discard)
+
+
+async def wait_for_stragglers(timeout: float | None = None) -> int:
+    """
+    Wait for late collectors started by collect_all(on_late=...) to be delivered.
+
+    Stragglers still running after ``timeout`` are cancelled.
+
+    Returns:
+        Number of late results delivered
+    """
+    pending = [t for t in _stragglers if t.get_loop() is asyncio.get_running_loop()]
+    if not pending:
+        return 0
+    done, still_running = await asyncio.wait(pending, timeout=timeout)
+    for task in still_running:
+        task.cancel()
+    await asyncio.gather(*still_running, return_exceptions=True)
+    return len(done)
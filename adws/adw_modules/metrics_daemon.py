@@ -0,0 +1,404 @@
+"""Long-running metrics report daemon.
+
+Keeps one process alive so collector clients, credentials, the shared HTTP
+pool and the warehouse connection stay warm between runs. The daemon:
+
+- runs the period reports on a fixed daily schedule (e.g. 07:00 morning,
+  13:00 afternoon, 19:00 evening, local time)
+- caches the latest CollectorResult per source and re-collects only the
+  sources whose result is older than the freshness TTL
+- serves the cached results and rendered reports on a small local HTTP
+  endpoint, without triggering a collection per request
+
+Usage:
+    daemon = MetricsDaemon(days=1, output_dir=Path("doc/dev"))
+    asyncio.run(daemon.serve("127.0.0.1", 8765))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .metrics_collectors import COLLECTOR_SOURCES, CollectorResult, resolve_collectors
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from .fault_tolerant import BreakerStore
+    from .metrics_warehouse import MetricsWarehouse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEDULE = "07:00=morning,13:00=afternoon,19:00=evening"
+DEFAULT_TTL = timedelta(minutes=30)
+DEFAULT_PORT = 8765
+
+PERIODS = ("morning", "afternoon", "evening")
+
+
+# ---------------------------------------------------------------------------
+# Result Cache
+# ---------------------------------------------------------------------------
+
+class ResultCache:
+    """Latest CollectorResult per source with a freshness TTL.
+
+    Failed results are cached too, so a source that is down is not retried
+    on every request; like any other source, it is re-collected on its own
+    once stale, while fresh sources keep their cached results. Age
+    counts from when a result was cached, not from ``collected_at``, so
+    last known good data served by an open circuit breaker stays fresh for
+    one TTL like any other result.
+    """
+
+    def __init__(self, ttl: timedelta = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._results: dict[str, CollectorResult] = {}
+        self._cached_at: dict[str, datetime] = {}
+
+    def put(self, result: CollectorResult, at: datetime | None = None) -> None:
+        self._results[result.source] = result
+        self._cached_at[result.source] = at or datetime.now(UTC)
+
+    def get(self, source: str) -> CollectorResult | None:
+        return self._results.get(source)
+
+    def age(self, source: str, now: datetime | None = None) -> timedelta | None:
+        """Time since ``source`` was cached, or None if never collected."""
+        cached_at = self._cached_at.get(source)
+        if cached_at is None:
+            return None
+        return (now or datetime.now(UTC)) - cached_at
+
+    def is_fresh(self, source: str, now: datetime | None = None) -> bool:
+        age = self.age(source, now)
+        return age is not None and age < self.ttl
+
+    def stale_sources(
+        self,
+        sources: tuple[str, ...] = COLLECTOR_SOURCES,
+        now: datetime | None = None,
+    ) -> list[str]:
+        return [s for s in sources if not self.is_fresh(s, now)]
+
+    def snapshot(self) -> dict[str, CollectorResult]:
+        """Cached results in collector order."""
+        return {s: self._results[s] for s in COLLECTOR_SOURCES if s in self._results}
+
+
+# ---------------------------------------------------------------------------
+# Schedule
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    """One daily report run: local wall-clock time and period label."""
+
+    at: time
+    period: str
+
+
+def parse_schedule(spec: str) -> list[ScheduleEntry]:
+    """
+    Parse a schedule such as ``"07:00=morning,13:00=afternoon"``.
+
+    Returns:
+        Entries sorted by time of day
+
+    Raises:
+        ValueError: On malformed entries, unknown periods or duplicate times
+    """
+    entries: list[ScheduleEntry] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        clock, sep, period = item.partition("=")
+        period = period.strip().lower()
+        if not sep or period not in PERIODS:
+            raise ValueError(
+                f"Invalid schedule entry '{item}'. Use HH:MM=<{'|'.join(PERIODS)}>"
+            )
+        try:
+            at = time.fromisoformat(clock.strip())
+        except ValueError as e:
+            raise ValueError(f"Invalid time in schedule entry '{item}'") from e
+        entries.append(ScheduleEntry(at=at.replace(second=0, microsecond=0), period=period))
+
+    if not entries:
+        raise ValueError("Schedule is empty")
+    entries.sort(key=lambda e: e.at)
+    times = [e.at for e in entries]
+    if len(set(times)) != len(times):
+        raise ValueError(f"Duplicate times in schedule '{spec}'")
+    return entries
+
+
+def next_run(entries: list[ScheduleEntry], now: datetime) -> tuple[datetime, ScheduleEntry]:
+    """Return the next scheduled run strictly after ``now`` (same timezone as ``now``)."""
+    for day_offset in (0, 1):
+        day = now.date() + timedelta(days=day_offset)
+        for entry in entries:
+            at = datetime.combine(day, entry.at, tzinfo=now.tzinfo)
+            if at > now:
+                return at, entry
+    raise AssertionError("unreachable: schedule has at least one entry")
+
+
+def current_period(entries: list[ScheduleEntry], now: datetime) -> str:
+    """Period of the most recent scheduled run at or before ``now``."""
+    past = [e for e in entries if e.at <= now.time()]
+    return (past or entries)[-1].period
+
+
+# ---------------------------------------------------------------------------
+# Daemon
+# ---------------------------------------------------------------------------
+
+class MetricsDaemon:
+    """
+    Scheduler, result cache and local HTTP endpoint around collect_all().
+
+    Usage:
+        daemon = MetricsDaemon(days=1, output_dir=Path("doc/dev"))
+        results = await daemon.collect()          # reuses fresh results
+        md_path, html_path = await daemon.run_report("morning")
+    """
+
+    def __init__(
+        self,
+        days: int,
+        output_dir: Path,
+        warehouse: MetricsWarehouse | None = None,
+        schedule: list[ScheduleEntry] | None = None,
+        ttl: timedelta = DEFAULT_TTL,
+        breakers: BreakerStore | None = None,
+        deadline_s: float | None = None,
+        sources: Iterable[str] | None = None,
+        skip_missing_credentials: bool = False,
+        max_parallel: int | None = None,
+        pdf: bool = False,
+    ) -> None:
+        """
+        Args:
+            days: Lookback window passed to the collectors
+            output_dir: Report output directory (e.g. doc/dev/)
+            warehouse: Optional warehouse shared by every run; closed by serve()
+            schedule: Daily report runs (default: DEFAULT_SCHEDULE)
+            ttl: How long a collected result is served before re-collecting
+            breakers: Optional circuit breaker store shared by every run
+            deadline_s: Optional collection deadline; late sources replace
+                        their timed-out placeholders in the cache on arrival
+            sources: Source ids to collect (default: all registered)
+            skip_missing_credentials: Passed to collect_all()
+            max_parallel: Passed to collect_all()
+            pdf: Also render each scheduled Markdown report to PDF
+
+        Raises:
+            ValueError: On unknown source ids
+        """
+        self.days = days
+        self.output_dir = output_dir
+        self.warehouse = warehouse
+        self.breakers = breakers
+        self.deadline_s = deadline_s
+        self.sources = tuple(spec.source_id for spec in resolve_collectors(sources))
+        self.skip_missing_credentials = skip_missing_credentials
+        self.max_parallel = max_parallel
+        self.pdf = pdf
+        self.schedule = schedule or parse_schedule(DEFAULT_SCHEDULE)
+        self.cache = ResultCache(ttl)
+        self.collections = 0
+        self.last_reports: dict[str, str] = {}
+        self._lock: asyncio.Lock | None = None
+
+    async def collect(self, force: bool = False) -> dict[str, CollectorResult]:
+        """
+        Return the latest results, re-collecting only the stale sources.
+
+        ``force`` re-collects every source. Concurrent callers wait for a
+        single in-flight collection.
+        """
+        from .metrics_collectors import collect_all
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            stale = self.cache.stale_sources(self.sources)
+            if force or stale:
+                logger.info(
+                    "Collecting metrics (%s)",
+                    "forced" if force else f"stale: {', '.join(stale)}",
+                )
+                results = await collect_all(
+                    self.days, self.warehouse, self.breakers,
+                    self.deadline_s, self.cache.put,
+                    sources=self.sources if force else stale,
+                    skip_missing_credentials=self.skip_missing_credentials,
+                    max_parallel=self.max_parallel,
+                )
+                for result in results.values():
+                    self.cache.put(result)
+                self.collections += 1
+            return self.cache.snapshot()
+
+    async def run_report(self, period: str) -> tuple[Path, Path] | None:
+        """
+        Write the failure manifest and the Markdown/HTML reports for ``period``.
+
+        Returns:
+            (markdown_path, html_path), or None if every source failed
+        """
+        from .fault_tolerant import write_failure_manifest
+        from .report_generator import write_pdf_report, write_reports
+
+        results = await self.collect()
+        timestamp = datetime.now(UTC)
+        write_failure_manifest(results, timestamp.strftime("%Y-%m-%d"), self.output_dir)
+        if not any(r.success for r in results.values()):
+            logger.error("All data sources failed. No %s report generated.", period)
+            return None
+
+        md_path, html_path = write_reports(
+            results, timestamp, period, self.days, self.output_dir
+        )
+        if self.pdf:
+            write_pdf_report(md_path)
+        self.last_reports[period] = str(md_path)
+        logger.info("Wrote %s report: %s", period, md_path)
+        return md_path, html_path
+
+    async def run_schedule(self, stop: asyncio.Event) -> None:
+        """Run the scheduled reports until ``stop`` is set."""
+        while not stop.is_set():
+            now = datetime.now().astimezone()
+            at, entry = next_run(self.schedule, now)
+            logger.info("Next %s report at %s", entry.period, at.isoformat(timespec="minutes"))
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=(at - now).total_seconds())
+                return
+            except TimeoutError:
+                pass
+            try:
+                await self.run_report(entry.period)
+            except Exception:
+                logger.exception("Scheduled %s report failed", entry.period)
+
+    def status(self) -> dict[str, Any]:
+        """Cache freshness per source plus the next scheduled run."""
+        now = datetime.now(UTC)
+        sources: dict[str, Any] = {}
+        for name in self.sources:
+            result = self.cache.get(name)
+            age = self.cache.age(name, now)
+            sources[name] = {
+                "success": result.success if result else None,
+                "collected_at": result.collected_at.isoformat() if result else None,
+                "age_seconds": round(age.total_seconds(), 1) if age is not None else None,
+                "fresh": self.cache.is_fresh(name, now),
+            }
+        at, entry = next_run(self.schedule, datetime.now().astimezone())
+        return {
+            "status": "ok",
+            "days": self.days,
+            "ttl_seconds": self.cache.ttl.total_seconds(),
+            "collections": self.collections,
+            "next_run": {"at": at.isoformat(), "period": entry.period},
+            "last_reports": self.last_reports,
+            "sources": sources,
+        }
+
+    def create_app(self) -> FastAPI:
+        """Build the local HTTP API serving cached results and reports."""
+        from fastapi import FastAPI, HTTPException, Query, status
+        from fastapi.responses import HTMLResponse, PlainTextResponse
+
+        from .report_generator import generate_html_report, generate_markdown_report
+
+        app = FastAPI(title="ADWS Metrics Daemon")
+
+        def cached_results() -> dict[str, CollectorResult]:
+            results = self.cache.snapshot()
+            if not results:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="No metrics collected yet",
+                )
+            return results
+
+        def resolve_period(period: str | None) -> str:
+            if period is None:
+                return current_period(self.schedule, datetime.now().astimezone())
+            period = period.lower().strip()
+            if period not in PERIODS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid period '{period}'. Use: {', '.join(PERIODS)}",
+                )
+            return period
+
+        @app.get("/health")
+        async def health() -> dict[str, Any]:
+            return self.status()
+
+        @app.get("/results")
+        async def results() -> dict[str, Any]:
+            return {
+                name: result.model_dump(mode="json")
+                for name, result in cached_results().items()
+            }
+
+        @app.get("/report.md", response_class=PlainTextResponse)
+        async def report_markdown(period: str | None = Query(None)) -> str:
+            resolved = resolve_period(period)
+            return generate_markdown_report(
+                cached_results(), datetime.now(UTC), resolved, self.days
+            )
+
+        @app.get("/report.html", response_class=HTMLResponse)
+        async def report_html(period: str | None = Query(None)) -> str:
+            resolved = resolve_period(period)
+            return generate_html_report(
+                cached_results(), datetime.now(UTC), resolved, self.days
+            )
+
+        @app.post("/refresh")
+        async def refresh() -> dict[str, Any]:
+            await self.collect(force=True)
+            return self.status()
+
+        return app
+
+    async def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> None:
+        """
+        Warm the cache, then run the scheduler and HTTP server until interrupted.
+
+        Closes the shared HTTP client and the warehouse on exit.
+        """
+        import uvicorn
+
+        from .metrics_collectors import aclose_http_clients, wait_for_stragglers
+
+        server = uvicorn.Server(
+            uvicorn.Config(self.create_app(), host=host, port=port, log_level="warning")
+        )
+        stop = asyncio.Event()
+        try:
+            await self.collect()
+            scheduler = asyncio.create_task(self.run_schedule(stop))
+            try:
+                await server.serve()
+            finally:
+                stop.set()
+                await scheduler
+        finally:
+            await wait_for_stragglers(timeout=0)
+            await aclose_http_clients()
+            if self.warehouse is not None:
+                self.warehouse.close()
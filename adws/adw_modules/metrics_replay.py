@@ -0,0 +1,339 @@
+"""Offline record/replay of metrics collectors.
+
+Recording saves each source's CollectorResult from a live run as a
+sanitized JSON fixture (tracebacks, artifact paths and configured secrets
+removed). Replaying swaps every registered collector for a local stand-in
+that returns its fixture after an injected latency, or fails with an
+injected HTTP error or timeout, so collect_all() still exercises the real
+retry, circuit breaker, deadline and scheduling paths without credentials.
+
+synthetic_fixtures() builds fixtures of any size for benchmarks.
+
+Usage:
+    record_fixtures(await collect_all(7), Path("fixtures/metrics"))
+
+    profile = ReplayProfile(default=SourceBehavior(latency_ms=120, failure_rate=0.1))
+    with replay_collectors(load_fixtures(Path("fixtures/metrics")), profile) as stats:
+        results = await collect_all(7)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .collector_registry import override_collectors
+from .metrics_collectors import COLLECTOR_SOURCES, CollectorResult
+
+FIXTURE_VERSION = 1
+
+# Environment variables whose values must never reach a fixture file
+SECRET_ENV_VARS = (
+    "CLARITY_API_TOKEN",
+    "MONETIZATION_SESSION_COOKIE",
+    "CWS_GOOGLE_CREDENTIALS",
+    "GOOGLE_ADS_DEVELOPER_TOKEN",
+    "GOOGLE_ADS_REFRESH_TOKEN",
+    "GOOGLE_ADS_CLIENT_SECRET",
+)
+
+FAILURE_MODES = ("http_503", "http_401", "timeout", "error")
+
+REDACTED = "[REDACTED]"
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def _secret_values() -> list[str]:
+    return [v for v in (os.getenv(name, "") for name in SECRET_ENV_VARS) if len(v) >= 4]
+
+
+def _redact(value: Any, secrets: list[str]) -> Any:
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, REDACTED)
+        return value
+    if isinstance(value, dict):
+        return {k: _redact(v, secrets) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact(v, secrets) for v in value]
+    return value
+
+
+def sanitize_result(result: CollectorResult, secrets: list[str] | None = None) -> CollectorResult:
+    """Copy of ``result`` without traceback or artifacts and with secrets redacted."""
+    secrets = _secret_values() if secrets is None else secrets
+    return result.model_copy(update={
+        "traceback": None,
+        "artifacts": [],
+        "error": _redact(result.error, secrets),
+        "data": _redact(result.data, secrets),
+    })
+
+
+def record_fixtures(results: dict[str, CollectorResult], directory: Path) -> list[Path]:
+    """
+    Write one sanitized ``<source>.json`` fixture per result.
+
+    Returns:
+        Paths of the written fixture files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    secrets = _secret_values()
+    paths = []
+    for source, result in results.items():
+        path = directory / f"{source}.json"
+        payload = {
+            "version": FIXTURE_VERSION,
+            "result": sanitize_result(result, secrets).model_dump(mode="json"),
+        }
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def load_fixtures(directory: Path) -> dict[str, CollectorResult]:
+    """
+    Load every ``<source>.json`` fixture in ``directory``.
+
+    Raises:
+        ValueError: If a fixture has an unsupported version
+    """
+    fixtures: dict[str, CollectorResult] = {}
+    for path in sorted(directory.glob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported fixture version in {path}: {payload.get('version')}")
+        fixtures[path.stem] = CollectorResult.model_validate(payload["result"])
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SourceBehavior:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0             # uniform extra latency in [0, jitter_ms]
+    failure_rate: float = 0.0          # probability each call fails
+    failure: str = "http_503"          # one of FAILURE_MODES
+
+    def __post_init__(self) -> None:
+        if self.failure not in FAILURE_MODES:
+            raise ValueError(
+                f"Unknown failure mode '{self.failure}'. Use: {', '.join(FAILURE_MODES)}"
+            )
+
+
+@dataclass
+class ReplayProfile:
+    default: SourceBehavior = field(default_factory=SourceBehavior)
+    sources: dict[str, SourceBehavior] = field(default_factory=dict)
+    seed: int | None = None
+
+    def behavior(self, source: str) -> SourceBehavior:
+        return self.sources.get(source, self.default)
+
+
+@dataclass
+class ReplayStats:
+    calls: dict[str, int] = field(default_factory=dict)
+    failures: dict[str, int] = field(default_factory=dict)
+
+
+def _injected_failure(source: str, mode: str) -> CollectorResult:
+    """Raise (or return) the failure a real collector would produce for ``mode``."""
+    import httpx
+
+    if mode == "timeout":
+        raise asyncio.TimeoutError(f"replayed timeout for {source}")
+    if mode == "error":
+        return CollectorResult(source=source, success=False, error=f"replayed error for {source}")
+    status = int(mode.removeprefix("http_"))
+    request = httpx.Request("GET", f"https://replay.invalid/{source}")
+    response = httpx.Response(status, request=request)
+    raise httpx.HTTPStatusError(f"HTTP {status} (replayed)", request=request, response=response)
+
+
+@contextmanager
+def replay_collectors(
+    fixtures: dict[str, CollectorResult],
+    profile: ReplayProfile | None = None,
+) -> Iterator[ReplayStats]:
+    """
+    Replace every registered collector with a fixture-backed stand-in.
+
+    Sources without a fixture return a failed result rather than reaching
+    the live API. Injected ``http_503`` and ``timeout`` failures are retried
+    per the source's SourceConfig like real ones.
+
+    Yields:
+        ReplayStats counting calls and injected failures per source
+    """
+    profile = profile or ReplayProfile()
+    rng = random.Random(profile.seed)
+    stats = ReplayStats()
+
+    def stand_in(source: str) -> Any:
+        async def collect() -> CollectorResult:
+            stats.calls[source] = stats.calls.get(source, 0) + 1
+            behavior = profile.behavior(source)
+            delay_ms = behavior.latency_ms + rng.uniform(0, behavior.jitter_ms)
+            if delay_ms > 0:
+                await asyncio.sleep(delay_ms / 1000)
+            if behavior.failure_rate and rng.random() < behavior.failure_rate:
+                stats.failures[source] = stats.failures.get(source, 0) + 1
+                return _injected_failure(source, behavior.failure)
+            fixture = fixtures.get(source)
+            if fixture is None:
+                return CollectorResult(
+                    source=source, success=False, error=f"No replay fixture for {source}",
+                )
+            # Shallow copy: replayed results share the fixture's data, treat as read-only
+            return fixture.model_copy(update={"collected_at": datetime.now(UTC)})
+
+        return collect
+
+    with override_collectors({source: stand_in(source) for source in COLLECTOR_SOURCES}):
+        yield stats
+
+
+# ---------------------------------------------------------------------------
+# Synthetic Fixtures
+# ---------------------------------------------------------------------------
+
+def synthetic_fixtures(days: int, rows: int, seed: int = 0) -> dict[str, CollectorResult]:
+    """
+    Plausible results for every source with ``rows`` channels, campaigns,
+    countries, events and attribution rows and ``days`` of daily spend.
+    """
+    rng = random.Random(seed)
+    end = date(2026, 3, 1)
+
+    channels = [
+        {
+            "channel": f"Channel {i}",
+            "sessions": (sessions := rng.randint(1, 50) * days),
+            "engaged_sessions": sessions // 2,
+            "bounce_rate": round(rng.random(), 4),
+            "avg_duration_seconds": round(rng.uniform(5, 300), 1),
+        }
+        for i in range(rows)
+    ]
+    total_sessions = sum(c["sessions"] for c in channels)
+    countries = [
+        {"country": f"Country {i}", "users": rng.randint(1, 40) * days, "user_share_pct": 0.0}
+        for i in range(rows)
+    ]
+    total_users = sum(c["users"] for c in countries)
+    for country in countries:
+        country["user_share_pct"] = round(country["users"] / total_users * 100, 2)
+    countries.sort(key=lambda c: -c["users"])
+
+    campaigns = []
+    for i in range(rows):
+        clicks = rng.randint(0, 30) * days
+        impressions = clicks * rng.randint(10, 40) + 1
+        spend = round(clicks * rng.uniform(0.2, 2.0), 2)
+        campaigns.append({
+            "campaign": f"Campaign {i}",
+            "clicks": clicks,
+            "impressions": impressions,
+            "ctr": round(clicks / impressions * 100, 2),
+            "avg_cpc_usd": round(spend / clicks, 2) if clicks else 0.0,
+            "spend_usd": spend,
+            "conversions": float(rng.randint(0, 3)),
+        })
+    campaigns.sort(key=lambda c: -c["spend_usd"])
+    total_spend = round(sum(c["spend_usd"] for c in campaigns), 2)
+    daily_spend = {
+        str(end - timedelta(days=d)): round(total_spend / days, 2) for d in range(days)
+    }
+
+    attribution = [
+        {
+            "source": f"source{i % 17}", "medium": "cpc", "campaign": f"Campaign {i}",
+            "checkout_created": (created := rng.randint(0, 5)),
+            "checkout_completed": (completed := rng.randint(0, created)),
+            "revenue_usd": completed * 4.99,
+            "paid_events": completed,
+        }
+        for i in range(rows)
+    ]
+    completed_total = sum(c["checkout_completed"] for c in attribution)
+    revenue_total = round(sum(c["revenue_usd"] for c in attribution), 2)
+
+    data = {
+        "ga4_traffic": {
+            "traffic": {
+                "sessions": total_sessions, "users": total_users,
+                "new_users": total_users // 2, "engaged_sessions": total_sessions // 2,
+                "avg_session_duration_seconds": 62.5, "page_views": total_sessions * 3,
+                "bounce_rate": 0.41,
+            },
+            "channels": channels,
+            "devices": [
+                {"device": d, "sessions": total_sessions // 3, "bounce_rate": 0.4,
+                 "avg_duration_seconds": 60.0}
+                for d in ("desktop", "mobile", "tablet")
+            ],
+            "countries": countries,
+        },
+        "ga4_funnel": {
+            "events": [
+                {"event_name": f"event_{i}", "count": rng.randint(1, 100) * days}
+                for i in range(rows)
+            ],
+        },
+        "google_ads": {
+            "campaigns": campaigns,
+            "daily_spend": daily_spend,
+            "total_spend_usd": total_spend,
+            "total_clicks": sum(c["clicks"] for c in campaigns),
+            "total_impressions": sum(c["impressions"] for c in campaigns),
+            "total_conversions": sum(c["conversions"] for c in campaigns),
+        },
+        "clarity": {
+            "vitals": {
+                "lcp_ms": 2100.0, "inp_ms": 180.0, "cls_score": 0.05,
+                "total_sessions": total_sessions, "scroll_depth_pct": 55.0,
+                "rage_clicks": days, "dead_clicks": days * 2,
+            },
+            "devices": [
+                {"device": "PC", "sessions": total_sessions // 2, "share_pct": 50.0},
+                {"device": "Mobile", "sessions": total_sessions // 2, "share_pct": 50.0},
+            ],
+        },
+        "cws": {
+            "cws": {
+                "installs": 3 * days, "uninstalls": days, "listing_views": 40 * days,
+                "manual_pull_required": False, "note": "",
+            },
+            "raw_events": {f"cws_event_{i}": rng.randint(1, 50) * days for i in range(rows)},
+        },
+        "monetization": {
+            "totals": {
+                "checkout_created": sum(c["checkout_created"] for c in attribution),
+                "checkout_completed": completed_total,
+                "checkout_expired": 0,
+                "one_time_revenue_usd": revenue_total,
+                "subscription_revenue_usd": 0.0,
+                "total_revenue_usd": revenue_total,
+                "paid_events": completed_total,
+            },
+            "channels": attribution,
+            "generated_at": f"{end}T00:00:00Z",
+        },
+    }
+    return {source: CollectorResult(source=source, data=data[source]) for source in data}
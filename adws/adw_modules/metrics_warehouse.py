@@ -0,0 +1,244 @@
+"""Local SQLite time-series warehouse for collected metrics.
+
+Collectors that can break their data down by date (GA4 traffic and funnel,
+Google Ads, CWS) store one row per (source, date, dataset, key, metric) here.
+Later runs only fetch the dates not yet stored plus a short restatement
+window (recent days the upstream APIs may still revise) and assemble long
+lookbacks from local rows with a single GROUP BY.
+
+Facts are additive: ratios are stored as weighted sums (e.g. bounce rate
+times sessions) so that any date range can be re-aggregated exactly.
+Counts that are distinct over a range upstream (GA4 users) are not
+additive, so they are not stored; collectors fetch them for the whole
+window on every run.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESTATEMENT_DAYS = 3
+
+# (date "YYYY-MM-DD", dataset, key, metric, value)
+Fact = tuple[str, str, str, str, float]
+
+# dataset -> key -> metric -> value
+Aggregate = dict[str, dict[str, dict[str, float]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (
+    source  TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    metric  TEXT NOT NULL,
+    value   REAL NOT NULL,
+    PRIMARY KEY (source, date, dataset, key, metric)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS fetches (
+    source     TEXT NOT NULL,
+    date       TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (source, date)
+) WITHOUT ROWID;
+"""
+
+
+def default_warehouse_path(output_dir: Path) -> Path:
+    """Default warehouse location inside the report output directory."""
+    return output_dir / "warehouse" / "metrics.sqlite"
+
+
+def _date_range(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def aggregate_facts(facts: Iterable[Fact]) -> Aggregate:
+    """Sum facts across dates in memory (same shape as MetricsWarehouse.aggregate)."""
+    out: Aggregate = {}
+    for _day, dataset, key, metric, value in facts:
+        metrics = out.setdefault(dataset, {}).setdefault(key, {})
+        metrics[metric] = metrics.get(metric, 0.0) + value
+    return out
+
+
+def daily_totals(facts: Iterable[Fact], dataset: str, metric: str) -> dict[str, float]:
+    """Sum one metric per date in memory (same shape as MetricsWarehouse.daily)."""
+    out: dict[str, float] = {}
+    for day, fact_dataset, _key, fact_metric, value in facts:
+        if fact_dataset == dataset and fact_metric == metric:
+            out[day] = out.get(day, 0.0) + value
+    return out
+
+
+class MetricsWarehouse:
+    """
+    SQLite store of daily metric facts with per-date fetch tracking.
+
+    Usage:
+        warehouse = MetricsWarehouse(Path("doc/dev/warehouse/metrics.sqlite"))
+        window = warehouse.fetch_range(["google_ads"], start, end)
+        if window:
+            warehouse.replace("google_ads", *window, facts)
+        totals = warehouse.aggregate("google_ads", start, end)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        restatement_days: int = DEFAULT_RESTATEMENT_DAYS,
+    ) -> None:
+        """
+        Open (or create) the warehouse.
+
+        Args:
+            path: SQLite database file
+            restatement_days: Most recent days that are always re-fetched,
+                              since upstream APIs keep revising them; at
+                              least 1, because today's data is partial
+        """
+        if restatement_days < 1:
+            raise ValueError(f"restatement_days must be >= 1, got {restatement_days}")
+        self.path = path
+        self.restatement_days = restatement_days
+        self._lock = threading.Lock()
+
+        new_dir = not path.parent.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if new_dir:
+            # Keep the local database out of version control
+            (path.parent / ".gitignore").write_text("*\n", encoding="utf-8")
+
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def covered_dates(self, source: str, start: date, end: date) -> set[date]:
+        """Dates in [start, end] already fetched for ``source``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date FROM fetches WHERE source = ? AND date BETWEEN ? AND ?",
+                (source, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(r[0]) for r in rows}
+
+    def fetch_range(
+        self,
+        sources: Sequence[str],
+        start: date,
+        end: date,
+    ) -> tuple[date, date]:
+        """
+        Return the contiguous date range that still has to be fetched.
+
+        The range starts at the earliest date in [start, end] missing for any
+        of ``sources`` (or at the restatement window if nothing is missing)
+        and always runs to ``end``, so one API request covers both gaps and
+        restatements. Sources sharing one upstream request (the two GA4
+        collectors) pass all their names to get the same range.
+
+        Returns:
+            (fetch_start, end); the restatement window, which always
+            includes ``end``, is fetched even when every date is stored
+        """
+        restate_from = end - timedelta(days=self.restatement_days - 1)
+        stable_end = min(end, restate_from - timedelta(days=1))
+
+        fetch_start: date | None = None
+        if stable_end >= start:
+            covered = None
+            for source in sources:
+                dates = self.covered_dates(source, start, stable_end)
+                covered = dates if covered is None else covered & dates
+            missing = [d for d in _date_range(start, stable_end) if d not in (covered or set())]
+            if missing:
+                fetch_start = missing[0]
+        if fetch_start is None:
+            fetch_start = max(start, restate_from)
+        return (fetch_start, end)
+
+    def replace(
+        self,
+        source: str,
+        start: date,
+        end: date,
+        facts: Iterable[Fact],
+    ) -> int:
+        """
+        Replace all facts for ``source`` in [start, end] and mark those dates fetched.
+
+        Dates in the range with no facts are still marked fetched, so days
+        with zero activity are not requested again. Duplicate facts (e.g.
+        two campaigns sharing a name) are summed.
+
+        Returns:
+            Number of fact rows written
+        """
+        start_s, end_s = start.isoformat(), end.isoformat()
+        fetched_at = datetime.now(UTC).isoformat()
+        rows = [(source, *fact) for fact in facts]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM facts WHERE source = ? AND date BETWEEN ? AND ?",
+                (source, start_s, end_s),
+            )
+            self._conn.executemany(
+                "INSERT INTO facts (source, date, dataset, key, metric, value) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, date, dataset, key, metric) "
+                "DO UPDATE SET value = value + excluded.value",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fetches (source, date, fetched_at) VALUES (?, ?, ?)",
+                [(source, d.isoformat(), fetched_at) for d in _date_range(start, end)],
+            )
+        logger.debug("Stored %d facts for %s %s..%s", len(rows), source, start_s, end_s)
+        return len(rows)
+
+    def aggregate(self, source: str, start: date, end: date) -> Aggregate:
+        """Sum every (dataset, key, metric) for ``source`` over [start, end]."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT dataset, key, metric, SUM(value) FROM facts "
+                "WHERE source = ? AND date BETWEEN ? AND ? "
+                "GROUP BY dataset, key, metric",
+                (source, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        out: Aggregate = {}
+        for dataset, key, metric, value in rows:
+            out.setdefault(dataset, {}).setdefault(key, {})[metric] = value
+        return out
+
+    def daily(
+        self,
+        source: str,
+        dataset: str,
+        metric: str,
+        start: date,
+        end: date,
+    ) -> dict[str, float]:
+        """Sum one metric per date for ``source`` over [start, end]."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, SUM(value) FROM facts "
+                "WHERE source = ? AND dataset = ? AND metric = ? AND date BETWEEN ? AND ? "
+                "GROUP BY date ORDER BY date DESC",
+                (source, dataset, metric, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return dict(rows)
+
+    def stored_days(self, source: str, start: date, end: date) -> int:
+        """Number of dates in [start, end] fetched for ``source``."""
+        return len(self.covered_dates(source, start, end))
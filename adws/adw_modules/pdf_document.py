@@ -0,0 +1,364 @@
+"""Shared PDF generation (ReportLab) for ADWS documents and metrics reports.
+
+Paragraph and table styles are compiled once per process and shared by
+every document and table. build_pdf() pulls flowables from an iterable as
+layout consumes them instead of taking one pre-built story list, and
+StreamingTable lays a long table out one page of rows at a time, so
+neither the whole story nor a whole table of cells is held in memory.
+markdown_flowables() turns the Markdown reports from report_generator.py
+into flowables.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    Flowable,
+    HRFlowable,
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Table,
+    TableStyle,
+)
+
+CHOCOLATE, PEACH, TEAL, CREAM, LIGHT_GRAY = map(
+    colors.HexColor, ["#4B2E1E", "#E8A87C", "#5BB5A2", "#FAF6F0", "#F5F5F5"]
+)
+
+PAGE_SIZE = letter
+MARGIN = inch
+FRAME_PADDING = 6  # SimpleDocTemplate's frame padding on each side
+CONTENT_WIDTH = PAGE_SIZE[0] - 2 * (MARGIN + FRAME_PADDING)
+
+TABLE_FONT_SIZE = 9
+TABLE_PADDING_X = 8
+TABLE_PADDING_Y = 5
+
+
+# ---------------------------------------------------------------------------
+# Shared Styles
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def paragraph_styles() -> dict[str, ParagraphStyle]:
+    """Brand paragraph styles, compiled once per process (shared; do not mutate)."""
+    sample = getSampleStyleSheet()
+
+    def style(
+        name: str, parent: str, color: colors.Color, size: float, after: float,
+        before: float = 0, font: str = "Helvetica", **kwargs: Any,
+    ) -> ParagraphStyle:
+        return ParagraphStyle(
+            name, parent=sample[parent], textColor=color, fontSize=size,
+            spaceAfter=after, spaceBefore=before, fontName=font, **kwargs,
+        )
+
+    return {
+        "h1": style("h1", "Heading1", CHOCOLATE, 20, 6, font="Helvetica-Bold"),
+        "h2": style("h2", "Heading2", CHOCOLATE, 13, 4, 16, font="Helvetica-Bold"),
+        "h3": style("h3", "Heading3", TEAL, 11, 2, 10, font="Helvetica-Bold"),
+        "body": style("body", "Normal", colors.black, 10, 6, leading=15),
+        "code": style(
+            "code", "Code", colors.black, 9, 4, 4, font="Courier", leading=13,
+            backColor=LIGHT_GRAY, leftIndent=12, rightIndent=12,
+        ),
+        "caption": style("caption", "Normal", colors.gray, 9, 0, font="Helvetica-Oblique"),
+        "cell": style("cell", "Normal", colors.black, TABLE_FONT_SIZE, 0, leading=11),
+        "cell_header": style(
+            "cell_header", "Normal", colors.white, TABLE_FONT_SIZE, 0,
+            font="Helvetica-Bold", leading=11,
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def table_style(header_bg: colors.Color = CHOCOLATE, extra_styles: tuple = ()) -> TableStyle:
+    """Brand table style with a ``header_bg`` header row, compiled once per combination."""
+    ts = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), header_bg),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), TABLE_FONT_SIZE),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ("LEFTPADDING", (0, 0), (-1, -1), TABLE_PADDING_X),
+        ("RIGHTPADDING", (0, 0), (-1, -1), TABLE_PADDING_X),
+        ("TOPPADDING", (0, 0), (-1, -1), TABLE_PADDING_Y),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), TABLE_PADDING_Y),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ])
+    for command in extra_styles:
+        ts.add(*command)
+    return ts
+
+
+def table(
+    data: Sequence[Sequence[Any]],
+    col_widths: Sequence[float],
+    header_bg: colors.Color = CHOCOLATE,
+    extra_styles: Iterable[tuple] = (),
+    **kwargs: Any,
+) -> Table:
+    """Table whose first row is the header, styled with the shared table_style()."""
+    t = Table(data, colWidths=col_widths, **kwargs)
+    t.setStyle(table_style(header_bg, tuple(extra_styles)))
+    return t
+
+
+# ---------------------------------------------------------------------------
+# Streaming Layout
+# ---------------------------------------------------------------------------
+
+class StreamingTable(Flowable):
+    """
+    A long table laid out one page at a time from a row iterator.
+
+    Each page gets a fresh Table of the header plus the rows that fit, so
+    only about a page of cells exists at once and the header repeats on
+    every page. ``min_row_height`` must be a lower bound on a row's height;
+    it decides how many rows are pulled from the iterator per page.
+    """
+
+    def __init__(
+        self,
+        header: Sequence[Any],
+        rows: Iterable[Sequence[Any]],
+        col_widths: Sequence[float],
+        header_bg: colors.Color = CHOCOLATE,
+        extra_styles: Iterable[tuple] = (),
+        min_row_height: float = TABLE_FONT_SIZE + 2 * TABLE_PADDING_Y,
+    ) -> None:
+        super().__init__()
+        self.header = list(header)
+        self.col_widths = list(col_widths)
+        self.header_bg = header_bg
+        self.extra_styles = tuple(extra_styles)
+        self.min_row_height = min_row_height
+        self._rows = iter(rows)
+        self._buffer: list[list[Any]] = []
+        self._exhausted = False
+        self._page: Table | None = None
+        self._page_rows = 0
+
+    def _fill(self, count: int) -> None:
+        while len(self._buffer) < count and not self._exhausted:
+            row = next(self._rows, None)
+            if row is None:
+                self._exhausted = True
+            else:
+                self._buffer.append(list(row))
+
+    def _candidate(self, avail_height: float) -> Table:
+        """Header plus at least as many buffered rows as can fit in ``avail_height``."""
+        count = int(avail_height // self.min_row_height) + 1
+        self._fill(count + 1)
+        self._page_rows = min(count, len(self._buffer))
+        return table(
+            [self.header, *self._buffer[:self._page_rows]], self.col_widths,
+            self.header_bg, self.extra_styles, repeatRows=1,
+        )
+
+    def _more_after_page(self) -> bool:
+        return len(self._buffer) > self._page_rows or not self._exhausted
+
+    def wrap(self, avail_width: float, avail_height: float) -> tuple[float, float]:
+        self._page = self._candidate(avail_height)
+        self.width, self.height = self._page.wrap(avail_width, avail_height)
+        if self.height <= avail_height and self._more_after_page():
+            # Rows were shorter than min_row_height: force a split so the
+            # rows after this page are not dropped
+            self.height = avail_height + 1
+        return self.width, self.height
+
+    def split(self, avail_width: float, avail_height: float) -> list[Flowable]:
+        page = self._candidate(avail_height)
+        _, height = page.wrap(avail_width, avail_height)
+        parts = [page] if height <= avail_height else page.split(avail_width, avail_height)
+        if not parts:
+            return []
+        used = len(parts[0]._cellvalues) - 1
+        if used <= 0:
+            return []
+        del self._buffer[:used]
+        self._fill(1)
+        return [parts[0], self._rest()] if self._buffer else [parts[0]]
+
+    def _rest(self) -> StreamingTable:
+        """A new flowable for the remaining rows, as ReportLab expects from split()."""
+        rest = StreamingTable(
+            self.header, self._rows, self.col_widths, self.header_bg, self.extra_styles,
+            self.min_row_height,
+        )
+        rest._buffer = self._buffer
+        rest._exhausted = self._exhausted
+        return rest
+
+    def drawOn(self, canvas: Any, x: float, y: float, _sW: float = 0) -> None:
+        self._page.drawOn(canvas, x, y, _sW)
+        del self._buffer[:self._page_rows]
+
+
+class _FlowableStream(list):
+    """
+    The story list handed to DocTemplate.build(), topped up from an iterator.
+
+    build() calls len() before handling each flowable, so refilling there
+    keeps only LOOKAHEAD flowables (enough for keepWithNext groups) in the
+    list instead of the whole story.
+    """
+
+    LOOKAHEAD = 16
+
+    def __init__(self, flowables: Iterable[Flowable]) -> None:
+        super().__init__()
+        self._source: Iterator[Flowable] | None = iter(flowables)
+
+    def __len__(self) -> int:
+        missing = self.LOOKAHEAD - super().__len__()
+        if missing > 0 and self._source is not None:
+            chunk = list(islice(self._source, missing))
+            if len(chunk) < missing:
+                self._source = None
+            self.extend(chunk)
+        return super().__len__()
+
+
+def build_pdf(path: Path | str, flowables: Iterable[Flowable]) -> int:
+    """
+    Render ``flowables`` (any iterable, e.g. a generator) to a PDF at ``path``.
+
+    Flowables are pulled only as layout reaches them.
+
+    Returns:
+        Number of pages written
+    """
+    doc = SimpleDocTemplate(
+        str(path), pagesize=PAGE_SIZE,
+        rightMargin=MARGIN, leftMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN,
+    )
+    doc.build(_FlowableStream(flowables))
+    return doc.page
+
+
+# ---------------------------------------------------------------------------
+# Markdown Reports
+# ---------------------------------------------------------------------------
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])")
+_CODE = re.compile(r"`([^`]+)`")
+_TABLE_SEPARATOR = re.compile(r"^\|[\s:|-]+\|$")
+_HTML_TAG_LINE = re.compile(r"^</?(details|summary)\b.*>$")
+_HEADINGS = {"# ": "h1", "## ": "h2", "### ": "h3"}
+
+
+def inline_markup(text: str) -> str:
+    """Markdown bold, italic and code spans in ``text`` as ReportLab paragraph markup."""
+    text = _CODE.sub(r'<font face="Courier">\1</font>', escape(text))
+    text = _BOLD.sub(r"<b>\1</b>", text)
+    return _ITALIC.sub(r"<i>\1</i>", text)
+
+
+def _cells(line: str) -> list[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _markdown_table(lines: Iterable[str], width: float) -> StreamingTable:
+    styles = paragraph_styles()
+    rows = (_cells(line) for line in lines if not _TABLE_SEPARATOR.match(line.strip()))
+    header = next(rows)
+    columns = len(header)
+
+    def body() -> Iterator[list[Paragraph]]:
+        for row in rows:
+            row = (row + [""] * columns)[:columns]
+            yield [Paragraph(inline_markup(cell), styles["cell"]) for cell in row]
+
+    return StreamingTable(
+        [Paragraph(inline_markup(cell), styles["cell_header"]) for cell in header],
+        body(),
+        [width / columns] * columns,
+        min_row_height=styles["cell"].fontSize + 2 * TABLE_PADDING_Y,
+    )
+
+
+def _markdown_text(lines: Iterable[str]) -> Iterator[Flowable]:
+    styles = paragraph_styles()
+    paragraph: list[str] = []
+
+    def flush() -> Iterator[Flowable]:
+        if paragraph:
+            yield Paragraph("".join(paragraph), styles["body"])
+            paragraph.clear()
+
+    for line in lines:
+        stripped = line.strip()
+        heading = next((style for prefix, style in _HEADINGS.items() if stripped.startswith(prefix)), None)
+        if heading:
+            yield from flush()
+            yield Paragraph(inline_markup(stripped.split(" ", 1)[1]), styles[heading])
+        elif stripped == "---":
+            yield from flush()
+            yield HRFlowable(width="100%", thickness=0.5, color=colors.lightgrey, spaceBefore=6, spaceAfter=6)
+        elif stripped.startswith("- "):
+            yield from flush()
+            yield Paragraph(f"• {inline_markup(stripped[2:])}", styles["body"])
+        elif not stripped or _HTML_TAG_LINE.match(stripped):
+            yield from flush()
+        else:
+            # Two trailing spaces are a Markdown line break
+            paragraph.append(inline_markup(stripped) + ("<br/>" if line.endswith("  ") else " "))
+    yield from flush()
+
+
+def _line_kind() -> Any:
+    """groupby() key: "code" inside ``` fences, "table" for pipe rows, else "text"."""
+    in_code = False
+
+    def kind(line: str) -> str:
+        nonlocal in_code
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+            return "code"
+        if in_code:
+            return "code"
+        return "table" if line.lstrip().startswith("|") else "text"
+
+    return kind
+
+
+def markdown_flowables(lines: Iterable[str], width: float = CONTENT_WIDTH) -> Iterator[Flowable]:
+    """
+    Flowables for a Markdown report (the subset report_generator.py writes).
+
+    Headings, paragraphs, bullets, rules, code blocks and pipe tables are
+    supported; tables become StreamingTable. ``lines`` may be an open file,
+    which is read as the document is laid out.
+    """
+    styles = paragraph_styles()
+    for kind, group in groupby((line.rstrip("\n") for line in lines), key=_line_kind()):
+        if kind == "table":
+            yield _markdown_table(list(group), width)
+        elif kind == "code":
+            code = "\n".join(line for line in group if not line.lstrip().startswith("```"))
+            if code.strip():
+                yield Preformatted(code, styles["code"], maxLineLength=90)
+        else:
+            yield from _markdown_text(group)
+
+
+def markdown_to_pdf(lines: Iterable[str], path: Path | str) -> int:
+    """Render a Markdown report to a PDF at ``path``; returns the page count."""
+    return build_pdf(path, markdown_flowables(lines))
@@ -0,0 +1,284 @@
+"""
+ADWS Port Lease Module
+
+Provides collision-free backend/frontend port allocation for concurrent
+workflows. Leases are recorded in a JSON lease table at
+agents/.port_leases.json, guarded by an exclusive file lock so that
+parallel plan phases never hand out the same slot twice.
+
+The port range is configurable through the environment:
+- ADWS_PORT_SLOTS: number of slots (default 15)
+- ADWS_BACKEND_PORT_BASE: first backend port (default 9100)
+- ADWS_FRONTEND_PORT_BASE: first frontend port (default 9200)
+
+Leases are released when a worktree is removed or its state is archived,
+and leases whose worktree directory has disappeared are reclaimed when
+the table runs out of free slots. Ports are leased before the worktree is
+created, so a lease is only reclaimed once it is older than a grace period
+(ORPHAN_GRACE_PERIOD); a missing directory on a fresh lease just means
+the worktree is still being set up.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("adws-ports")
+
+DEFAULT_PORT_SLOTS = 15
+DEFAULT_BACKEND_PORT_BASE = 9100
+DEFAULT_FRONTEND_PORT_BASE = 9200
+
+# Leases younger than this are never reclaimed as orphans
+ORPHAN_GRACE_PERIOD = timedelta(minutes=15)
+
+
+@dataclass(frozen=True)
+class PortRange:
+    """Backend/frontend port range shared by all workflows."""
+
+    backend_base: int = DEFAULT_BACKEND_PORT_BASE
+    frontend_base: int = DEFAULT_FRONTEND_PORT_BASE
+    slots: int = DEFAULT_PORT_SLOTS
+
+    def __post_init__(self) -> None:
+        if self.slots < 1:
+            raise ValueError(f"Port range needs at least one slot, got {self.slots}")
+        low, high = sorted((self.backend_base, self.frontend_base))
+        if low + self.slots > high:
+            raise ValueError(
+                f"Backend ({self.backend_base}) and frontend ({self.frontend_base}) "
+                f"ranges overlap with {self.slots} slots"
+            )
+        if high + self.slots - 1 > 65535:
+            raise ValueError(f"Port range exceeds 65535 with {self.slots} slots")
+
+    @classmethod
+    def from_env(cls) -> PortRange:
+        """Build the range from ADWS_* environment variables."""
+        return cls(
+            backend_base=int(
+                os.getenv("ADWS_BACKEND_PORT_BASE", str(DEFAULT_BACKEND_PORT_BASE))
+            ),
+            frontend_base=int(
+                os.getenv("ADWS_FRONTEND_PORT_BASE", str(DEFAULT_FRONTEND_PORT_BASE))
+            ),
+            slots=int(os.getenv("ADWS_PORT_SLOTS", str(DEFAULT_PORT_SLOTS))),
+        )
+
+    @property
+    def backend_max(self) -> int:
+        return self.backend_base + self.slots - 1
+
+    @property
+    def frontend_max(self) -> int:
+        return self.frontend_base + self.slots - 1
+
+    def ports_for_slot(self, slot: int) -> tuple[int, int]:
+        """Return (backend_port, frontend_port) for a slot index."""
+        if not 0 <= slot < self.slots:
+            raise ValueError(f"Slot {slot} outside range 0-{self.slots - 1}")
+        return (self.backend_base + slot, self.frontend_base + slot)
+
+    def preferred_slot(self, adw_id: str) -> int:
+        """Deterministic starting slot for an ADW ID (base-36 hash)."""
+        return int(adw_id[:8], 36) % self.slots
+
+
+def _leased_before(lease: dict[str, Any], cutoff: datetime) -> bool:
+    """True if the lease was taken before ``cutoff`` (or has no valid timestamp)."""
+    try:
+        return datetime.fromisoformat(lease["leased_at"]) < cutoff
+    except (KeyError, TypeError, ValueError):
+        return True
+
+
+class PortLeaseTable:
+    """
+    File-backed lease table mapping ADW IDs to port slots.
+
+    Usage:
+        table = PortLeaseTable()
+        backend, frontend = table.lease("a1b2c3d4", worktree_path="trees/a1b2c3d4")
+        ...
+        table.release("a1b2c3d4")
+    """
+
+    def __init__(
+        self,
+        lease_file: Path | None = None,
+        port_range: PortRange | None = None,
+        orphan_grace: timedelta = ORPHAN_GRACE_PERIOD,
+    ) -> None:
+        """
+        Initialize the lease table.
+
+        Args:
+            lease_file: Path to the JSON lease table
+                        (defaults to agents/.port_leases.json)
+            port_range: Port range to allocate from (defaults to PortRange.from_env())
+            orphan_grace: Minimum lease age before a lease whose worktree
+                          directory is missing may be reclaimed
+        """
+        self.lease_file = (
+            lease_file if lease_file is not None else Path("agents") / ".port_leases.json"
+        )
+        self.lock_file = self.lease_file.with_name(self.lease_file.name + ".lock")
+        self.port_range = port_range if port_range is not None else PortRange.from_env()
+        self.orphan_grace = orphan_grace
+
+    @contextmanager
+    def _locked(self) -> Iterator[dict[str, dict[str, Any]]]:
+        """Hold the exclusive lock while reading and rewriting the table."""
+        self.lease_file.parent.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(str(self.lock_file), os.O_CREAT | os.O_RDWR)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            leases = self._read()
+            before = json.dumps(leases, sort_keys=True)
+            yield leases
+            if json.dumps(leases, sort_keys=True) != before:
+                self._write(leases)
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self.lease_file.exists():
+            return {}
+        try:
+            with open(self.lease_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable lease table {self.lease_file}: {e}")
+            return {}
+        return data.get("leases", {}) if isinstance(data, dict) else {}
+
+    def _write(self, leases: dict[str, dict[str, Any]]) -> None:
+        payload = json.dumps({"leases": leases}, indent=2, sort_keys=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.lease_file.parent, prefix=".port_leases_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            shutil.move(temp_path, self.lease_file)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def lease(
+        self,
+        adw_id: str,
+        worktree_path: str | Path | None = None,
+    ) -> tuple[int, int]:
+        """
+        Lease a free port slot for a workflow.
+
+        Re-leasing an ID that already holds a slot returns the same ports.
+        Probing starts at the ID's preferred slot so that allocation stays
+        stable when the table is sparse.
+
+        Args:
+            adw_id: Workflow identifier
+            worktree_path: Worktree directory; leases whose directory does
+                           not exist are reclaimed when the table is full and
+                           the lease is older than the orphan grace period
+
+        Returns:
+            Tuple of (backend_port, frontend_port)
+
+        Raises:
+            RuntimeError: If every slot in the range is leased
+        """
+        with self._locked() as leases:
+            existing = leases.get(adw_id)
+            if existing is not None and 0 <= existing.get("slot", -1) < self.port_range.slots:
+                return self.port_range.ports_for_slot(existing["slot"])
+
+            slot = self._find_free_slot(adw_id, leases)
+            if slot is None:
+                reclaimed = self._reclaim_orphans(leases)
+                if reclaimed:
+                    logger.info(f"Reclaimed orphaned port leases: {reclaimed}")
+                slot = self._find_free_slot(adw_id, leases)
+            if slot is None:
+                raise RuntimeError(
+                    f"No free port slots: all {self.port_range.slots} slots "
+                    f"({self.port_range.backend_base}-{self.port_range.backend_max}) "
+                    f"are leased. Clean up finished worktrees or raise ADWS_PORT_SLOTS."
+                )
+
+            backend_port, frontend_port = self.port_range.ports_for_slot(slot)
+            leases[adw_id] = {
+                "slot": slot,
+                "backend_port": backend_port,
+                "frontend_port": frontend_port,
+                "worktree_path": str(worktree_path) if worktree_path is not None else None,
+                "leased_at": datetime.now(UTC).isoformat(),
+            }
+            return backend_port, frontend_port
+
+    def _find_free_slot(
+        self, adw_id: str, leases: dict[str, dict[str, Any]]
+    ) -> int | None:
+        taken = {lease.get("slot") for lease in leases.values()}
+        start = self.port_range.preferred_slot(adw_id)
+        for offset in range(self.port_range.slots):
+            slot = (start + offset) % self.port_range.slots
+            if slot not in taken:
+                return slot
+        return None
+
+    def _reclaim_orphans(self, leases: dict[str, dict[str, Any]]) -> list[str]:
+        cutoff = datetime.now(UTC) - self.orphan_grace
+        orphans = [
+            adw_id
+            for adw_id, lease in leases.items()
+            if lease.get("worktree_path")
+            and not Path(lease["worktree_path"]).exists()
+            and _leased_before(lease, cutoff)
+        ]
+        for adw_id in orphans:
+            del leases[adw_id]
+        return orphans
+
+    def release(self, adw_id: str) -> bool:
+        """
+        Release a workflow's lease.
+
+        Does nothing (and creates no files) when the table does not exist.
+
+        Args:
+            adw_id: Workflow identifier
+
+        Returns:
+            True if a lease was released, False if none was held
+        """
+        if not self.lease_file.exists():
+            return False
+        with self._locked() as leases:
+            return leases.pop(adw_id, None) is not None
+
+    def get(self, adw_id: str) -> tuple[int, int] | None:
+        """Return the leased (backend_port, frontend_port) for an ID, if any."""
+        lease = self._read().get(adw_id)
+        if lease is None:
+            return None
+        return (lease["backend_port"], lease["frontend_port"])
+
+    def active_leases(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of all current leases keyed by ADW ID."""
+        return self._read()
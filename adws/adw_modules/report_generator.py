@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
 
 from .metrics_collectors import CollectorResult
 
@@ -37,7 +43,16 @@ def _fmt_pct(value: float) -> str:
 def _source_status_line(results: dict[str, CollectorResult]) -> str:
     lines = []
     for name, r in results.items():
-        status = "OK" if r.success else f"FAILED ({r.error})"
+        if r.circuit_open:
+            status = (
+                f"CACHED (circuit open, data from {r.collected_at:%Y-%m-%d %H:%M} UTC; {r.error})"
+            )
+        elif r.timed_out:
+            status = f"TIMED OUT ({r.error})"
+        elif r.skipped:
+            status = f"SKIPPED ({r.error})"
+        else:
+            status = "OK" if r.success else f"FAILED ({r.error})"
         lines.append(f"- **{name}**: {status}")
     return "\n".join(lines)
 
@@ -57,323 +72,8 @@ def _failure_detail(r: CollectorResult | None, label: str) -> str:
     return "\n".join(parts)
 
 
-def _get(data: dict, *keys: str, default: Any = None) -> Any:
-    """Safely traverse nested dict keys."""
-    current = data
-    for k in keys:
-        if isinstance(current, dict):
-            current = current.get(k, default)
-        else:
-            return default
-    return current
-
-
-# ---------------------------------------------------------------------------
-# Markdown Report
-# ---------------------------------------------------------------------------
-
-def generate_markdown_report(
-    results: dict[str, CollectorResult],
-    timestamp: datetime,
-    period: str,
-    days: int,
-) -> str:
-    """Generate a full Markdown metrics report."""
-    date_str = timestamp.strftime("%Y-%m-%d")
-    time_str = timestamp.strftime("%H:%M %Z")
-    sections: list[str] = []
-
-    # --- Header ---
-    sections.append(f"# Daily Metrics Report: {date_str} ({period.title()})")
-    sections.append("")
-    sections.append(f"**Generated:** {time_str}  ")
-    sections.append(f"**Period:** {period.title()}  ")
-    sections.append(f"**Lookback:** {days} day(s)  ")
-    sections.append("")
-    ok_count = sum(1 for r in results.values() if r.success)
-    total = len(results)
-    sections.append(f"**Data Sources:** {ok_count}/{total} succeeded")
-    sections.append("")
-    sections.append(_source_status_line(results))
-    sections.append("\n---\n")
-
-    # --- 1) Traffic Overview (GA4) ---
-    sections.append("## 1) Traffic Overview (GA4)\n")
-    ga4 = results.get("ga4_traffic")
-    if ga4 and ga4.success:
-        t = ga4.data.get("traffic", {})
-        sections.append("| Metric | Value |")
-        sections.append("|--------|-------|")
-        sections.append(f"| Sessions | {t.get('sessions', 0)} |")
-        sections.append(f"| Users | {t.get('users', 0)} |")
-        sections.append(f"| New Users | {t.get('new_users', 0)} |")
-        sections.append(f"| Engaged Sessions | {t.get('engaged_sessions', 0)} |")
-        sections.append(f"| Avg Session Duration | {t.get('avg_session_duration_seconds', 0):.1f}s |")
-        sections.append(f"| Page Views | {t.get('page_views', 0)} |")
-        sections.append(f"| Bounce Rate | {_fmt_pct(t.get('bounce_rate', 0) * 100)} |")
-        sections.append("")
-
-        # Channels
-        channels = ga4.data.get("channels", [])
-        if channels:
-            sections.append("### Channel Breakdown\n")
-            sections.append("| Channel | Sessions | Engaged | Bounce Rate | Avg Duration |")
-            sections.append("|---------|----------|---------|-------------|-------------|")
-            for ch in channels:
-                sections.append(
-                    f"| {ch['channel']} | {ch['sessions']} | {ch['engaged_sessions']} "
-                    f"| {_fmt_pct(ch['bounce_rate'] * 100)} | {ch['avg_duration_seconds']:.1f}s |"
-                )
-            sections.append("")
-
-        # Devices
-        devices = ga4.data.get("devices", [])
-        if devices:
-            sections.append("### Device Split\n")
-            sections.append("| Device | Sessions | Bounce Rate | Avg Duration |")
-            sections.append("|--------|----------|-------------|-------------|")
-            for d in devices:
-                sections.append(
-                    f"| {d['device']} | {d['sessions']} "
-                    f"| {_fmt_pct(d['bounce_rate'] * 100)} | {d['avg_duration_seconds']:.1f}s |"
-                )
-            sections.append("")
-
-        # Countries
-        countries = ga4.data.get("countries", [])
-        if countries:
-            sections.append("### Country Split (Top 10)\n")
-            sections.append("| Country | Users | Share |")
-            sections.append("|---------|-------|-------|")
-            for c in countries[:10]:
-                sections.append(f"| {c['country']} | {c['users']} | {_fmt_pct(c['user_share_pct'])} |")
-            sections.append("")
-    else:
-        sections.append(_failure_detail(ga4, "GA4 traffic data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 2) Conversion Funnel (GA4 Events) ---
-    sections.append("## 2) Conversion Funnel (GA4 Events)\n")
-    funnel = results.get("ga4_funnel")
-    if funnel and funnel.success:
-        events = funnel.data.get("events", [])
-        sections.append("| Event | Count |")
-        sections.append("|-------|-------|")
-        for e in events:
-            sections.append(f"| `{e['event_name']}` | {e['count']} |")
-        sections.append("")
-    else:
-        sections.append(_failure_detail(funnel, "GA4 funnel data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 3) Core Web Vitals (Clarity) ---
-    sections.append("## 3) Core Web Vitals & UX (Clarity)\n")
-    clarity = results.get("clarity")
-    if clarity and clarity.success:
-        v = clarity.data.get("vitals", {})
-        sections.append("| Metric | Value | Threshold | Status |")
-        sections.append("|--------|-------|-----------|--------|")
-
-        lcp = v.get("lcp_ms")
-        inp = v.get("inp_ms")
-        cls_val = v.get("cls_score")
-
-        lcp_str = f"{lcp:.0f}ms" if lcp is not None else "—"
-        inp_str = f"{inp:.0f}ms" if inp is not None else "—"
-        cls_str = f"{cls_val:.2f}" if cls_val is not None else "—"
-
-        sections.append(f"| LCP | {lcp_str} | 2.5s good / 4.0s poor | {_cwv_status(lcp, 2500, 4000)} |")
-        sections.append(f"| INP | {inp_str} | 200ms good / 500ms poor | {_cwv_status(inp, 200, 500)} |")
-        sections.append(f"| CLS | {cls_str} | 0.1 good / 0.25 poor | {_cwv_status(cls_val, 0.1, 0.25)} |")
-        sections.append("")
-
-        sections.append("| UX Metric | Value |")
-        sections.append("|-----------|-------|")
-        sections.append(f"| Total Sessions | {v.get('total_sessions', 0)} |")
-        scroll = v.get("scroll_depth_pct")
-        sections.append(f"| Scroll Depth | {_fmt_pct(scroll) if scroll else '—'} |")
-        sections.append(f"| Rage Clicks | {v.get('rage_clicks', 0)} |")
-        sections.append(f"| Dead Clicks | {v.get('dead_clicks', 0)} |")
-        sections.append("")
-
-        devices = clarity.data.get("devices", [])
-        if devices:
-            sections.append("### Device Breakdown (Clarity)\n")
-            sections.append("| Device | Sessions | Share |")
-            sections.append("|--------|----------|-------|")
-            for d in devices:
-                sections.append(f"| {d['device']} | {d['sessions']} | {_fmt_pct(d['share_pct'])} |")
-            sections.append("")
-    else:
-        sections.append(_failure_detail(clarity, "Clarity data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 4) Google Ads Campaign ---
-    sections.append("## 4) Google Ads Campaign\n")
-    ads = results.get("google_ads")
-    if ads and ads.success:
-        sections.append("| Metric | Value |")
-        sections.append("|--------|-------|")
-        sections.append(f"| Total Clicks | {ads.data.get('total_clicks', 0)} |")
-        sections.append(f"| Total Impressions | {ads.data.get('total_impressions', 0):,} |")
-        total_clicks = ads.data.get("total_clicks", 0)
-        total_imp = ads.data.get("total_impressions", 0)
-        ctr = (total_clicks / total_imp * 100) if total_imp else 0
-        sections.append(f"| CTR | {_fmt_pct(ctr)} |")
-        spend = ads.data.get("total_spend_usd", 0)
-        cpc = spend / total_clicks if total_clicks else 0
-        sections.append(f"| Avg CPC | {_fmt_usd(cpc)} |")
-        sections.append(f"| Total Spend | {_fmt_usd(spend)} |")
-        sections.append(f"| Conversions | {ads.data.get('total_conversions', 0)} |")
-        sections.append("")
-
-        campaigns = ads.data.get("campaigns", [])
-        if campaigns:
-            sections.append("### Per-Campaign Breakdown\n")
-            sections.append("| Campaign | Clicks | Impressions | Spend | Conversions |")
-            sections.append("|----------|--------|-------------|-------|-------------|")
-            for c in campaigns:
-                sections.append(
-                    f"| {c['campaign']} | {c['clicks']} | {c['impressions']:,} "
-                    f"| {_fmt_usd(c['spend_usd'])} | {c['conversions']:.0f} |"
-                )
-            sections.append("")
-    else:
-        sections.append(_failure_detail(ads, "Google Ads data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 5) Chrome Web Store ---
-    sections.append("## 5) Chrome Web Store\n")
-    cws = results.get("cws")
-    if cws and cws.success:
-        cws_data = cws.data.get("cws", {})
-        if cws_data.get("manual_pull_required"):
-            sections.append(f"*{cws_data.get('note', 'Manual pull required from CWS dashboard.')}*\n")
-        else:
-            sections.append("| Metric | Value |")
-            sections.append("|--------|-------|")
-            if cws_data.get("installs") is not None:
-                sections.append(f"| Installs | {cws_data['installs']} |")
-            if cws_data.get("uninstalls") is not None:
-                sections.append(f"| Uninstalls | {cws_data['uninstalls']} |")
-            if cws_data.get("listing_views") is not None:
-                sections.append(f"| Listing Views | {cws_data['listing_views']} |")
-            sections.append("")
-
-        raw_events = cws.data.get("raw_events", {})
-        if raw_events:
-            sections.append("### Raw CWS GA4 Events\n")
-            sections.append("| Event | Count |")
-            sections.append("|-------|-------|")
-            for k, v in sorted(raw_events.items(), key=lambda x: -x[1]):
-                sections.append(f"| `{k}` | {v} |")
-            sections.append("")
-    else:
-        sections.append(_failure_detail(cws, "CWS data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 6) Server-Side Monetization ---
-    sections.append("## 6) Server-Side Monetization (Source of Truth)\n")
-    monet = results.get("monetization")
-    if monet and monet.success:
-        t = monet.data.get("totals", {})
-        sections.append("| Metric | Value |")
-        sections.append("|--------|-------|")
-        sections.append(f"| Checkout Created | {t.get('checkout_created', 0)} |")
-        sections.append(f"| Checkout Completed | {t.get('checkout_completed', 0)} |")
-        sections.append(f"| Checkout Expired | {t.get('checkout_expired', 0)} |")
-        sections.append(f"| One-Time Revenue | {_fmt_usd(t.get('one_time_revenue_usd', 0))} |")
-        sections.append(f"| Subscription Revenue | {_fmt_usd(t.get('subscription_revenue_usd', 0))} |")
-        sections.append(f"| **Total Revenue** | **{_fmt_usd(t.get('total_revenue_usd', 0))}** |")
-        sections.append(f"| Paid Events | {t.get('paid_events', 0)} |")
-        sections.append("")
-
-        channels = monet.data.get("channels", [])
-        if channels:
-            sections.append("### Channel Attribution\n")
-            sections.append("| Source / Medium / Campaign | Created | Completed | Revenue | Paid Events |")
-            sections.append("|---------------------------|---------|-----------|---------|-------------|")
-            for ch in channels:
-                label = f"{ch['source']} / {ch['medium']} / {ch['campaign']}"
-                sections.append(
-                    f"| {label} | {ch['checkout_created']} | {ch['checkout_completed']} "
-                    f"| {_fmt_usd(ch['revenue_usd'])} | {ch['paid_events']} |"
-                )
-            sections.append("")
-    else:
-        sections.append(_failure_detail(monet, "Monetization data unavailable"))
-
-    sections.append("---\n")
-
-    # --- 7) Guardrail Check ---
-    sections.append("## 7) Guardrail Check\n")
-    sections.append(_generate_guardrail_md(results))
-
-    return "\n".join(sections)
-
-
-def _generate_guardrail_md(results: dict[str, CollectorResult]) -> str:
-    """Compute guardrail status from Ads spend and monetization data."""
-    lines = []
-    lines.append("| Guardrail | Value | Threshold | Status |")
-    lines.append("|-----------|-------|-----------|--------|")
-
-    ads = results.get("google_ads")
-    monet = results.get("monetization")
-
-    total_spend = 0.0
-    total_checkouts = 0
-    daily_spend: dict[str, float] = {}
-
-    if ads and ads.success:
-        total_spend = ads.data.get("total_spend_usd", 0)
-        daily_spend = ads.data.get("daily_spend", {})
-    if monet and monet.success:
-        total_checkouts = monet.data.get("totals", {}).get("checkout_completed", 0)
-        total_revenue = monet.data.get("totals", {}).get("total_revenue_usd", 0)
-    else:
-        total_revenue = 0
-
-    # No-signal kill switch: >= $75 with 0 checkouts
-    no_signal_triggered = total_spend >= 75 and total_checkouts == 0
-    lines.append(
-        f"| No-signal kill | Spend: {_fmt_usd(total_spend)}, Checkouts: {total_checkouts} "
-        f"| >= $75 with 0 checkouts | {'WARN' if no_signal_triggered else 'OK'} |"
-    )
-
-    # CAC check: > $45
-    if total_checkouts > 0:
-        cac = total_spend / total_checkouts
-        cac_bad = cac > 45
-        lines.append(
-            f"| CAC | {_fmt_usd(cac)} | > $45 | {'WARN' if cac_bad else 'OK'} |"
-        )
-    else:
-        lines.append("| CAC | N/A (0 conversions) | > $45 | — |")
-
-    # Max daily spend
-    if daily_spend:
-        max_day = max(daily_spend.values())
-        lines.append(
-            f"| Max daily spend | {_fmt_usd(max_day)} | Budget cap | INFO |"
-        )
-
-    # Revenue vs spend
-    if total_spend > 0:
-        roas = total_revenue / total_spend if total_spend else 0
-        lines.append(f"| ROAS | {roas:.2f}x | > 1.0x | {'OK' if roas >= 1 else 'WARN'} |")
-
-    lines.append("")
-    return "\n".join(lines)
-
-
 # ---------------------------------------------------------------------------
-# HTML Report
+# HTML
 # ---------------------------------------------------------------------------
 
 _HTML_HEAD = """<!doctype html>
@@ -422,242 +122,744 @@ _HTML_FOOT = """
 </html>"""
 
 
-def generate_html_report(
-    results: dict[str, CollectorResult],
-    timestamp: datetime,
-    period: str,
-    days: int,
-) -> str:
-    """Generate a self-contained HTML metrics report."""
-    date_str = timestamp.strftime("%Y-%m-%d")
-    time_str = timestamp.strftime("%H:%M")
-    ok_count = sum(1 for r in results.values() if r.success)
-    total = len(results)
+def _html_section_start(title: str) -> str:
+    return f'<section class="panel"><h2>{title}</h2>'
 
-    parts: list[str] = []
-    parts.append(_HTML_HEAD.format(date=date_str, period=period.title()))
 
-    # Header
-    parts.append('<header class="panel">')
-    parts.append(f"<h1>Daily Metrics Report</h1>")
-    parts.append(f"<p>{date_str} &middot; {period.title()} &middot; {days}-day lookback &middot; {ok_count}/{total} sources OK</p>")
-    source_tags = []
-    for name, r in results.items():
-        cls = "ok" if r.success else "warn"
-        source_tags.append(f'<span class="{cls}">{name}: {"OK" if r.success else "FAIL"}</span>')
-    parts.append(f'<div class="meta">{"".join(source_tags)}</div>')
-    parts.append("</header>")
-
-    # --- Traffic Overview ---
-    parts.append(_html_section_start("Traffic Overview (GA4)"))
-    ga4 = results.get("ga4_traffic")
-    if ga4 and ga4.success:
-        t = ga4.data.get("traffic", {})
-        parts.append('<div class="grid">')
-        for label, key in [
-            ("Sessions", "sessions"), ("Users", "users"), ("New Users", "new_users"),
-            ("Engaged", "engaged_sessions"), ("Page Views", "page_views"),
-        ]:
-            parts.append(f'<div class="stat"><div class="label">{label}</div><div class="value">{t.get(key, 0)}</div></div>')
-        br = t.get("bounce_rate", 0) * 100
-        parts.append(f'<div class="stat"><div class="label">Bounce Rate</div><div class="value">{br:.1f}%</div></div>')
-        dur = t.get("avg_session_duration_seconds", 0)
-        parts.append(f'<div class="stat"><div class="label">Avg Duration</div><div class="value">{dur:.1f}s</div></div>')
-        parts.append("</div>")
-
-        # Channel table
-        channels = ga4.data.get("channels", [])
-        if channels:
-            parts.append("<h3>Channel Breakdown</h3>")
-            parts.append(_html_table(
-                ["Channel", "Sessions", "Engaged", "Bounce Rate", "Avg Duration"],
-                [[ch["channel"], ch["sessions"], ch["engaged_sessions"],
-                  f'{ch["bounce_rate"]*100:.1f}%', f'{ch["avg_duration_seconds"]:.1f}s'] for ch in channels],
-            ))
-    else:
-        parts.append(f'<p>GA4 traffic data unavailable: {ga4.error if ga4 else "not collected"}</p>')
-    parts.append(_html_section_end())
-
-    # --- Funnel ---
-    parts.append(_html_section_start("Conversion Funnel (GA4 Events)"))
-    funnel = results.get("ga4_funnel")
-    if funnel and funnel.success:
-        events = funnel.data.get("events", [])
-        parts.append(_html_table(
-            ["Event", "Count"],
-            [[f'<span class="mono">{e["event_name"]}</span>', e["count"]] for e in events],
-        ))
-    else:
-        parts.append(f'<p>Funnel data unavailable: {funnel.error if funnel else "not collected"}</p>')
-    parts.append(_html_section_end())
-
-    # --- Clarity ---
-    parts.append(_html_section_start("Core Web Vitals &amp; UX (Clarity)"))
-    clarity = results.get("clarity")
-    if clarity and clarity.success:
-        v = clarity.data.get("vitals", {})
-        lcp = v.get("lcp_ms")
-        inp = v.get("inp_ms")
-        cls_val = v.get("cls_score")
-
-        parts.append(_html_table(
-            ["Metric", "Value", "Threshold", "Status"],
-            [
-                ["LCP", f"{lcp:.0f}ms" if lcp else "—", "2.5s / 4.0s", _cwv_status(lcp, 2500, 4000)],
-                ["INP", f"{inp:.0f}ms" if inp else "—", "200ms / 500ms", _cwv_status(inp, 200, 500)],
-                ["CLS", f"{cls_val:.2f}" if cls_val is not None else "—", "0.1 / 0.25", _cwv_status(cls_val, 0.1, 0.25)],
-            ],
-        ))
-        parts.append('<div class="grid">')
-        parts.append(f'<div class="stat"><div class="label">Sessions</div><div class="value">{v.get("total_sessions", 0)}</div></div>')
-        scroll = v.get("scroll_depth_pct")
-        parts.append(f'<div class="stat"><div class="label">Scroll Depth</div><div class="value">{f"{scroll:.1f}%" if scroll else "—"}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Rage Clicks</div><div class="value">{v.get("rage_clicks", 0)}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Dead Clicks</div><div class="value">{v.get("dead_clicks", 0)}</div></div>')
-        parts.append("</div>")
-    else:
-        parts.append(f'<p>Clarity data unavailable: {clarity.error if clarity else "not collected"}</p>')
-    parts.append(_html_section_end())
+def _html_section_end() -> str:
+    return "</section>"
 
-    # --- Google Ads ---
-    parts.append(_html_section_start("Google Ads Campaign"))
-    ads = results.get("google_ads")
-    if ads and ads.success:
-        tc = ads.data.get("total_clicks", 0)
-        ti = ads.data.get("total_impressions", 0)
-        ts = ads.data.get("total_spend_usd", 0)
-        ctr = (tc / ti * 100) if ti else 0
-        cpc = ts / tc if tc else 0
-        parts.append('<div class="grid">')
-        parts.append(f'<div class="stat"><div class="label">Clicks</div><div class="value">{tc}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Impressions</div><div class="value">{ti:,}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">CTR</div><div class="value">{ctr:.1f}%</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Avg CPC</div><div class="value">${cpc:.2f}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Total Spend</div><div class="value">${ts:,.2f}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Conversions</div><div class="value">{ads.data.get("total_conversions", 0):.0f}</div></div>')
-        parts.append("</div>")
-    else:
-        parts.append(f'<p>Google Ads data unavailable: {ads.error if ads else "not collected"}</p>')
-    parts.append(_html_section_end())
-
-    # --- CWS ---
-    parts.append(_html_section_start("Chrome Web Store"))
-    cws = results.get("cws")
-    if cws and cws.success:
-        cws_data = cws.data.get("cws", {})
-        if cws_data.get("manual_pull_required"):
-            parts.append(f'<p>{cws_data.get("note", "Manual pull required.")}</p>')
-        else:
-            parts.append('<div class="grid">')
-            if cws_data.get("installs") is not None:
-                parts.append(f'<div class="stat ok"><div class="label">Installs</div><div class="value">{cws_data["installs"]}</div></div>')
-            if cws_data.get("uninstalls") is not None:
-                parts.append(f'<div class="stat warn"><div class="label">Uninstalls</div><div class="value">{cws_data["uninstalls"]}</div></div>')
-            if cws_data.get("listing_views") is not None:
-                parts.append(f'<div class="stat"><div class="label">Listing Views</div><div class="value">{cws_data["listing_views"]}</div></div>')
-            parts.append("</div>")
-    else:
-        parts.append(f'<p>CWS data unavailable: {cws.error if cws else "not collected"}</p>')
-    parts.append(_html_section_end())
 
-    # --- Monetization ---
-    parts.append(_html_section_start("Server-Side Monetization (Source of Truth)"))
-    monet = results.get("monetization")
-    if monet and monet.success:
-        t = monet.data.get("totals", {})
-        parts.append('<div class="grid">')
-        parts.append(f'<div class="stat"><div class="label">Checkout Created</div><div class="value">{t.get("checkout_created", 0)}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Checkout Completed</div><div class="value">{t.get("checkout_completed", 0)}</div></div>')
-        parts.append(f'<div class="stat"><div class="label">Checkout Expired</div><div class="value">{t.get("checkout_expired", 0)}</div></div>')
-        rev = t.get("total_revenue_usd", 0)
-        cls_name = "ok" if rev > 0 else ""
-        parts.append(f'<div class="stat {cls_name}"><div class="label">Total Revenue</div><div class="value">${rev:,.2f}</div></div>')
-        parts.append("</div>")
-
-        channels = monet.data.get("channels", [])
-        if channels:
-            parts.append("<h3>Channel Attribution</h3>")
-            parts.append(_html_table(
-                ["Source / Medium / Campaign", "Created", "Completed", "Revenue", "Paid Events"],
-                [[f'{ch["source"]} / {ch["medium"]} / {ch["campaign"]}',
-                  ch["checkout_created"], ch["checkout_completed"],
-                  f'${ch["revenue_usd"]:.2f}', ch["paid_events"]] for ch in channels],
-            ))
-    else:
-        parts.append(f'<p>Monetization data unavailable: {monet.error if monet else "not collected"}</p>')
-    parts.append(_html_section_end())
+# ---------------------------------------------------------------------------
+# Streaming Output
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _html_row_template(columns: int) -> Callable[..., str]:
+    """Compiled ``<tr><td>{}</td>...</tr>`` formatter for ``columns`` cells."""
+    return ("<tr>" + "<td>{}</td>" * columns + "</tr>").format
+
+
+@lru_cache(maxsize=None)
+def _md_row_template(columns: int) -> Callable[..., str]:
+    """Compiled ``| {} | ... |`` formatter for ``columns`` cells."""
+    return ("| " + " | ".join(["{}"] * columns) + " |").format
+
+
+class ReportWriter:
+    """
+    Paired Markdown and HTML outputs filled in one pass over the results.
+
+    Markdown items are lines (joined with newlines) and HTML parts are
+    concatenated as-is. Both are buffered in bounded chunks and written to
+    the handles every FLUSH_EVERY items, so large tables stream without the
+    report being held in memory. Either output may be None to render only
+    the other; row templates only run for enabled outputs.
+    """
+
+    FLUSH_EVERY = 2048
+
+    def __init__(self, md_out: TextIO | None, html_out: TextIO | None) -> None:
+        self._md = md_out
+        self._html = html_out
+        self._md_lines: list[str] = []
+        self._html_parts: list[str] = []
+        self._md_started = False
+
+    def md(self, *items: str) -> None:
+        if self._md is not None:
+            self._md_lines.extend(items)
+            if len(self._md_lines) >= self.FLUSH_EVERY:
+                self._flush_md()
+
+    def md_lines(self, lines: Iterable[str]) -> None:
+        """Like md(), but ``lines`` (e.g. a generator) is only consumed when Markdown is on."""
+        if self._md is None:
+            return
+        it = iter(lines)
+        while chunk := list(islice(it, self.FLUSH_EVERY)):
+            self._md_lines.extend(chunk)
+            if len(self._md_lines) >= self.FLUSH_EVERY:
+                self._flush_md()
+
+    def html(self, *parts: str) -> None:
+        if self._html is not None:
+            self._html_parts.extend(parts)
+            if len(self._html_parts) >= self.FLUSH_EVERY:
+                self._flush_html()
+
+    def html_table_start(self, headers: list[str]) -> None:
+        self.html("<table><thead><tr>", *(f"<th>{h}</th>" for h in headers), "</tr></thead><tbody>")
+
+    def html_row(self, *cells: Any) -> None:
+        if self._html is not None:
+            self.html(_html_row_template(len(cells))(*cells))
+
+    def table_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        md_row: str | None = None,
+        html_row: str | None = None,
+    ) -> None:
+        """
+        Stream table body rows to both outputs from one pass over ``rows``.
+
+        Each normalized row is formatted with the ``md_row``/``html_row``
+        templates (one str.format field per cell), defaulting to plain pipe
+        and ``<td>`` rows.
+        """
+        md_lines = self._md_lines if self._md is not None else None
+        html_parts = self._html_parts if self._html is not None else None
+        md_fmt = html_fmt = None
+        flush_every = self.FLUSH_EVERY
+        for row in rows:
+            if md_fmt is None:
+                md_fmt = md_row.format if md_row else _md_row_template(len(row))
+                html_fmt = html_row.format if html_row else _html_row_template(len(row))
+            if md_lines is not None:
+                md_lines.append(md_fmt(*row))
+                if len(md_lines) >= flush_every:
+                    self._flush_md()
+            if html_parts is not None:
+                html_parts.append(html_fmt(*row))
+                if len(html_parts) >= flush_every:
+                    self._flush_html()
+
+    def html_table_end(self) -> None:
+        self.html("</tbody></table>")
+
+    def html_table(self, headers: list[str], rows: Iterable[list[Any]]) -> None:
+        self.html_table_start(headers)
+        for row in rows:
+            self.html_row(*row)
+        self.html_table_end()
+
+    def html_stat(self, label: str, value: Any, cls: str = "") -> None:
+        self.html(
+            f'<div class="stat{" " + cls if cls else ""}"><div class="label">{label}</div>'
+            f'<div class="value">{value}</div></div>'
+        )
 
-    # --- Guardrails ---
-    parts.append(_html_section_start("Guardrail Check"))
-    parts.append(_generate_guardrail_html(results))
-    parts.append(_html_section_end())
+    def unavailable(self, r: CollectorResult | None, md_label: str, html_label: str) -> None:
+        self.md(_failure_detail(r, md_label))
+        self.html(f'<p>{html_label}: {r.error if r else "not collected"}</p>')
 
-    parts.append(_HTML_FOOT.format(date=date_str, time=time_str, period=period.title()))
-    return "".join(parts)
+    def flush(self) -> None:
+        """Write any buffered output to the handles."""
+        self._flush_md()
+        self._flush_html()
+
+    def _flush_md(self) -> None:
+        if self._md is None or not self._md_lines:
+            return
+        self._md.write(("\n" if self._md_started else "") + "\n".join(self._md_lines))
+        self._md_lines.clear()
+        self._md_started = True
+
+    def _flush_html(self) -> None:
+        if self._html is not None and self._html_parts:
+            self._html.write("".join(self._html_parts))
+            self._html_parts.clear()
 
 
 # ---------------------------------------------------------------------------
-# HTML helpers
+# Source Sections
 # ---------------------------------------------------------------------------
 
-def _html_section_start(title: str) -> str:
-    return f'<section class="panel"><h2>{title}</h2>'
+def _render_ga4_traffic(ga4: CollectorResult | None, out: ReportWriter) -> None:
+    if not (ga4 and ga4.success):
+        out.unavailable(ga4, "GA4 traffic data unavailable", "GA4 traffic data unavailable")
+        return
+    t = ga4.data.get("traffic", {})
+    bounce_pct = t.get("bounce_rate", 0) * 100
+    duration = t.get("avg_session_duration_seconds", 0)
+    out.md(
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Sessions | {t.get('sessions', 0)} |",
+        f"| Users | {t.get('users', 0)} |",
+        f"| New Users | {t.get('new_users', 0)} |",
+        f"| Engaged Sessions | {t.get('engaged_sessions', 0)} |",
+        f"| Avg Session Duration | {duration:.1f}s |",
+        f"| Page Views | {t.get('page_views', 0)} |",
+        f"| Bounce Rate | {_fmt_pct(bounce_pct)} |",
+        "",
+    )
+    out.html('<div class="grid">')
+    for label, key in [
+        ("Sessions", "sessions"), ("Users", "users"), ("New Users", "new_users"),
+        ("Engaged", "engaged_sessions"), ("Page Views", "page_views"),
+    ]:
+        out.html_stat(label, t.get(key, 0))
+    out.html_stat("Bounce Rate", f"{bounce_pct:.1f}%")
+    out.html_stat("Avg Duration", f"{duration:.1f}s")
+    out.html("</div>")
+
+    channels = ga4.data.get("channels", [])
+    if channels:
+        out.md(
+            "### Channel Breakdown\n",
+            "| Channel | Sessions | Engaged | Bounce Rate | Avg Duration |",
+            "|---------|----------|---------|-------------|-------------|",
+        )
+        out.html("<h3>Channel Breakdown</h3>")
+        out.html_table_start(["Channel", "Sessions", "Engaged", "Bounce Rate", "Avg Duration"])
+        out.table_rows(
+            (
+                ch["channel"], ch["sessions"], ch["engaged_sessions"],
+                _fmt_pct(ch["bounce_rate"] * 100), f"{ch['avg_duration_seconds']:.1f}s",
+            )
+            for ch in channels
+        )
+        out.html_table_end()
+        out.md("")
+
+    # Devices and countries are Markdown-only
+    devices = ga4.data.get("devices", [])
+    if devices:
+        out.md(
+            "### Device Split\n",
+            "| Device | Sessions | Bounce Rate | Avg Duration |",
+            "|--------|----------|-------------|-------------|",
+        )
+        out.md_lines(
+            f"| {d['device']} | {d['sessions']} "
+            f"| {_fmt_pct(d['bounce_rate'] * 100)} | {d['avg_duration_seconds']:.1f}s |"
+            for d in devices
+        )
+        out.md("")
+
+    countries = ga4.data.get("countries", [])
+    if countries:
+        out.md(
+            "### Country Split (Top 10)\n",
+            "| Country | Users | Share |",
+            "|---------|-------|-------|",
+        )
+        out.md_lines(
+            f"| {c['country']} | {c['users']} | {_fmt_pct(c['user_share_pct'])} |"
+            for c in countries[:10]
+        )
+        out.md("")
+
+
+def _render_ga4_funnel(funnel: CollectorResult | None, out: ReportWriter) -> None:
+    if not (funnel and funnel.success):
+        out.unavailable(funnel, "GA4 funnel data unavailable", "Funnel data unavailable")
+        return
+    out.md("| Event | Count |", "|-------|-------|")
+    out.html_table_start(["Event", "Count"])
+    out.table_rows(
+        ((e["event_name"], e["count"]) for e in funnel.data.get("events", [])),
+        md_row="| `{}` | {} |",
+        html_row='<tr><td><span class="mono">{}</span></td><td>{}</td></tr>',
+    )
+    out.html_table_end()
+    out.md("")
+
+
+def _render_clarity(clarity: CollectorResult | None, out: ReportWriter) -> None:
+    if not (clarity and clarity.success):
+        out.unavailable(clarity, "Clarity data unavailable", "Clarity data unavailable")
+        return
+    v = clarity.data.get("vitals", {})
+    lcp = v.get("lcp_ms")
+    inp = v.get("inp_ms")
+    cls_val = v.get("cls_score")
+    lcp_status = _cwv_status(lcp, 2500, 4000)
+    inp_status = _cwv_status(inp, 200, 500)
+    cls_status = _cwv_status(cls_val, 0.1, 0.25)
+    cls_str = f"{cls_val:.2f}" if cls_val is not None else "—"
+    scroll = v.get("scroll_depth_pct")
+
+    # Markdown shows zero LCP/INP values; the HTML cards treat them as missing
+    out.md(
+        "| Metric | Value | Threshold | Status |",
+        "|--------|-------|-----------|--------|",
+        f"| LCP | {f'{lcp:.0f}ms' if lcp is not None else '—'} | 2.5s good / 4.0s poor | {lcp_status} |",
+        f"| INP | {f'{inp:.0f}ms' if inp is not None else '—'} | 200ms good / 500ms poor | {inp_status} |",
+        f"| CLS | {cls_str} | 0.1 good / 0.25 poor | {cls_status} |",
+        "",
+        "| UX Metric | Value |",
+        "|-----------|-------|",
+        f"| Total Sessions | {v.get('total_sessions', 0)} |",
+        f"| Scroll Depth | {_fmt_pct(scroll) if scroll else '—'} |",
+        f"| Rage Clicks | {v.get('rage_clicks', 0)} |",
+        f"| Dead Clicks | {v.get('dead_clicks', 0)} |",
+        "",
+    )
+    out.html_table(
+        ["Metric", "Value", "Threshold", "Status"],
+        [
+            ["LCP", f"{lcp:.0f}ms" if lcp else "—", "2.5s / 4.0s", lcp_status],
+            ["INP", f"{inp:.0f}ms" if inp else "—", "200ms / 500ms", inp_status],
+            ["CLS", cls_str, "0.1 / 0.25", cls_status],
+        ],
+    )
+    out.html('<div class="grid">')
+    out.html_stat("Sessions", v.get("total_sessions", 0))
+    out.html_stat("Scroll Depth", f"{scroll:.1f}%" if scroll else "—")
+    out.html_stat("Rage Clicks", v.get("rage_clicks", 0))
+    out.html_stat("Dead Clicks", v.get("dead_clicks", 0))
+    out.html("</div>")
+
+    devices = clarity.data.get("devices", [])
+    if devices:
+        out.md(
+            "### Device Breakdown (Clarity)\n",
+            "| Device | Sessions | Share |",
+            "|--------|----------|-------|",
+        )
+        out.md_lines(
+            f"| {d['device']} | {d['sessions']} | {_fmt_pct(d['share_pct'])} |" for d in devices
+        )
+        out.md("")
+
+
+def _render_google_ads(ads: CollectorResult | None, out: ReportWriter) -> None:
+    if not (ads and ads.success):
+        out.unavailable(ads, "Google Ads data unavailable", "Google Ads data unavailable")
+        return
+    clicks = ads.data.get("total_clicks", 0)
+    impressions = ads.data.get("total_impressions", 0)
+    spend = ads.data.get("total_spend_usd", 0)
+    conversions = ads.data.get("total_conversions", 0)
+    ctr = (clicks / impressions * 100) if impressions else 0
+    cpc = spend / clicks if clicks else 0
+    out.md(
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Total Clicks | {clicks} |",
+        f"| Total Impressions | {impressions:,} |",
+        f"| CTR | {_fmt_pct(ctr)} |",
+        f"| Avg CPC | {_fmt_usd(cpc)} |",
+        f"| Total Spend | {_fmt_usd(spend)} |",
+        f"| Conversions | {conversions} |",
+        "",
+    )
+    out.html('<div class="grid">')
+    out.html_stat("Clicks", clicks)
+    out.html_stat("Impressions", f"{impressions:,}")
+    out.html_stat("CTR", f"{ctr:.1f}%")
+    out.html_stat("Avg CPC", f"${cpc:.2f}")
+    out.html_stat("Total Spend", f"${spend:,.2f}")
+    out.html_stat("Conversions", f"{conversions:.0f}")
+    out.html("</div>")
+
+    # The per-campaign table is Markdown-only
+    campaigns = ads.data.get("campaigns", [])
+    if campaigns:
+        out.md(
+            "### Per-Campaign Breakdown\n",
+            "| Campaign | Clicks | Impressions | Spend | Conversions |",
+            "|----------|--------|-------------|-------|-------------|",
+        )
+        out.md_lines(
+            f"| {c['campaign']} | {c['clicks']} | {c['impressions']:,} "
+            f"| {_fmt_usd(c['spend_usd'])} | {c['conversions']:.0f} |"
+            for c in campaigns
+        )
+        out.md("")
 
 
-def _html_section_end() -> str:
-    return "</section>"
+def _render_cws(cws: CollectorResult | None, out: ReportWriter) -> None:
+    if not (cws and cws.success):
+        out.unavailable(cws, "CWS data unavailable", "CWS data unavailable")
+        return
+    cws_data = cws.data.get("cws", {})
+    if cws_data.get("manual_pull_required"):
+        out.md(f"*{cws_data.get('note', 'Manual pull required from CWS dashboard.')}*\n")
+        out.html(f'<p>{cws_data.get("note", "Manual pull required.")}</p>')
+    else:
+        out.md("| Metric | Value |", "|--------|-------|")
+        out.html('<div class="grid">')
+        for label, key, cls in (
+            ("Installs", "installs", "ok"),
+            ("Uninstalls", "uninstalls", "warn"),
+            ("Listing Views", "listing_views", ""),
+        ):
+            if cws_data.get(key) is not None:
+                out.md(f"| {label} | {cws_data[key]} |")
+                out.html_stat(label, cws_data[key], cls)
+        out.md("")
+        out.html("</div>")
+
+    # Raw events are Markdown-only
+    raw_events = cws.data.get("raw_events", {})
+    if raw_events:
+        out.md(
+            "### Raw CWS GA4 Events\n",
+            "| Event | Count |",
+            "|-------|-------|",
+        )
+        out.md_lines(
+            f"| `{k}` | {v} |" for k, v in sorted(raw_events.items(), key=lambda x: -x[1])
+        )
+        out.md("")
+
+
+def _render_monetization(monet: CollectorResult | None, out: ReportWriter) -> None:
+    if not (monet and monet.success):
+        out.unavailable(monet, "Monetization data unavailable", "Monetization data unavailable")
+        return
+    t = monet.data.get("totals", {})
+    revenue = t.get("total_revenue_usd", 0)
+    out.md(
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Checkout Created | {t.get('checkout_created', 0)} |",
+        f"| Checkout Completed | {t.get('checkout_completed', 0)} |",
+        f"| Checkout Expired | {t.get('checkout_expired', 0)} |",
+        f"| One-Time Revenue | {_fmt_usd(t.get('one_time_revenue_usd', 0))} |",
+        f"| Subscription Revenue | {_fmt_usd(t.get('subscription_revenue_usd', 0))} |",
+        f"| **Total Revenue** | **{_fmt_usd(revenue)}** |",
+        f"| Paid Events | {t.get('paid_events', 0)} |",
+        "",
+    )
+    out.html('<div class="grid">')
+    out.html_stat("Checkout Created", t.get("checkout_created", 0))
+    out.html_stat("Checkout Completed", t.get("checkout_completed", 0))
+    out.html_stat("Checkout Expired", t.get("checkout_expired", 0))
+    # Keeps the historical trailing space in class="stat " when revenue is zero
+    out.html(
+        f'<div class="stat {"ok" if revenue > 0 else ""}"><div class="label">Total Revenue</div>'
+        f'<div class="value">${revenue:,.2f}</div></div>'
+    )
+    out.html("</div>")
+
+    channels = monet.data.get("channels", [])
+    if channels:
+        out.md(
+            "### Channel Attribution\n",
+            "| Source / Medium / Campaign | Created | Completed | Revenue | Paid Events |",
+            "|---------------------------|---------|-----------|---------|-------------|",
+        )
+        out.html("<h3>Channel Attribution</h3>")
+        out.html_table_start(
+            ["Source / Medium / Campaign", "Created", "Completed", "Revenue", "Paid Events"]
+        )
+        # Markdown revenue gets thousands separators, HTML does not
+        out.table_rows(
+            (
+                (
+                    ch["source"], ch["medium"], ch["campaign"], ch["checkout_created"],
+                    ch["checkout_completed"], ch["revenue_usd"], ch["paid_events"],
+                )
+                for ch in channels
+            ),
+            md_row="| {} / {} / {} | {} | {} | ${:,.2f} | {} |",
+            html_row="<tr><td>{} / {} / {}</td><td>{}</td><td>{}</td><td>${:.2f}</td><td>{}</td></tr>",
+        )
+        out.html_table_end()
+        out.md("")
+
+
+def _render_generic(r: CollectorResult | None, out: ReportWriter, label: str) -> None:
+    if not (r and r.success):
+        out.unavailable(r, f"{label} data unavailable", f"{label} data unavailable")
+        return
+    scalars = [(k, v) for k, v in r.data.items() if not isinstance(v, (dict, list))]
+    out.md("| Metric | Value |", "|--------|-------|")
+    out.md_lines(f"| {k} | {v} |" for k, v in scalars)
+    out.md("")
+    out.html_table(["Metric", "Value"], ([k, v] for k, v in scalars))
+
+
+@dataclass(frozen=True)
+class ReportSection:
+    title: str                                            # Markdown heading (numbered)
+    html_title: str
+    render: Callable[[CollectorResult | None, ReportWriter], None]
+
+
+# Report layout for known sources, in display order. Registered collectors
+# without an entry get a generic key/value section after these.
+REPORT_SECTIONS: dict[str, ReportSection] = {
+    "ga4_traffic": ReportSection(
+        title="Traffic Overview (GA4)",
+        html_title="Traffic Overview (GA4)",
+        render=_render_ga4_traffic,
+    ),
+    "ga4_funnel": ReportSection(
+        title="Conversion Funnel (GA4 Events)",
+        html_title="Conversion Funnel (GA4 Events)",
+        render=_render_ga4_funnel,
+    ),
+    "clarity": ReportSection(
+        title="Core Web Vitals & UX (Clarity)",
+        html_title="Core Web Vitals &amp; UX (Clarity)",
+        render=_render_clarity,
+    ),
+    "google_ads": ReportSection(
+        title="Google Ads Campaign",
+        html_title="Google Ads Campaign",
+        render=_render_google_ads,
+    ),
+    "cws": ReportSection(
+        title="Chrome Web Store",
+        html_title="Chrome Web Store",
+        render=_render_cws,
+    ),
+    "monetization": ReportSection(
+        title="Server-Side Monetization (Source of Truth)",
+        html_title="Server-Side Monetization (Source of Truth)",
+        render=_render_monetization,
+    ),
+}
+
+
+def _generic_section(source_id: str) -> ReportSection:
+    return ReportSection(
+        title=source_id,
+        html_title=source_id,
+        render=lambda r, out: _render_generic(r, out, source_id),
+    )
+
 
+def _section_order(results: dict[str, CollectorResult]) -> list[str]:
+    """Sources present in ``results``: known sections first, then the rest in result order."""
+    known = [source_id for source_id in REPORT_SECTIONS if source_id in results]
+    return known + [source_id for source_id in results if source_id not in REPORT_SECTIONS]
 
-def _html_table(headers: list[str], rows: list[list]) -> str:
-    parts = ["<table><thead><tr>"]
-    for h in headers:
-        parts.append(f"<th>{h}</th>")
-    parts.append("</tr></thead><tbody>")
-    for row in rows:
-        parts.append("<tr>")
-        for cell in row:
-            parts.append(f"<td>{cell}</td>")
-        parts.append("</tr>")
-    parts.append("</tbody></table>")
-    return "".join(parts)
 
+def _has_guardrail_inputs(results: dict[str, CollectorResult]) -> bool:
+    return "google_ads" in results or "monetization" in results
 
-def _generate_guardrail_html(results: dict[str, CollectorResult]) -> str:
+
+# ---------------------------------------------------------------------------
+# Guardrails
+# ---------------------------------------------------------------------------
+
+def _render_guardrails(results: dict[str, CollectorResult], out: ReportWriter) -> None:
+    """Guardrail status from Ads spend and monetization data."""
     ads = results.get("google_ads")
     monet = results.get("monetization")
 
-    total_spend = ads.data.get("total_spend_usd", 0) if ads and ads.success else 0
+    total_spend = 0.0
+    daily_spend: dict[str, float] = {}
+    if ads and ads.success:
+        total_spend = ads.data.get("total_spend_usd", 0)
+        daily_spend = ads.data.get("daily_spend", {})
     total_checkouts = 0
     total_revenue = 0.0
     if monet and monet.success:
         total_checkouts = monet.data.get("totals", {}).get("checkout_completed", 0)
         total_revenue = monet.data.get("totals", {}).get("total_revenue_usd", 0)
 
-    rows = []
+    out.md("| Guardrail | Value | Threshold | Status |", "|-----------|-------|-----------|--------|")
+    out.html_table_start(["Guardrail", "Value", "Threshold", "Status"])
 
-    # No-signal
+    # No-signal kill switch: >= $75 with 0 checkouts
     no_signal = total_spend >= 75 and total_checkouts == 0
-    cls = "warn" if no_signal else "ok"
-    rows.append([
+    status = "WARN" if no_signal else "OK"
+    out.md(
+        f"| No-signal kill | Spend: {_fmt_usd(total_spend)}, Checkouts: {total_checkouts} "
+        f"| >= $75 with 0 checkouts | {status} |"
+    )
+    out.html_row(
         "No-signal kill",
         f"Spend: ${total_spend:,.2f}, Checkouts: {total_checkouts}",
         "&ge; $75 with 0 checkouts",
-        f'<span class="{cls}">{"WARN" if no_signal else "OK"}</span>',
-    ])
+        f'<span class="{status.lower()}">{status}</span>',
+    )
 
-    # CAC
+    # CAC check: > $45
     if total_checkouts > 0:
         cac = total_spend / total_checkouts
-        cac_bad = cac > 45
-        cls = "warn" if cac_bad else "ok"
-        rows.append(["CAC", f"${cac:,.2f}", "&gt; $45", f'<span class="{cls}">{"WARN" if cac_bad else "OK"}</span>'])
+        status = "WARN" if cac > 45 else "OK"
+        out.md(f"| CAC | {_fmt_usd(cac)} | > $45 | {status} |")
+        out.html_row("CAC", f"${cac:,.2f}", "&gt; $45", f'<span class="{status.lower()}">{status}</span>')
     else:
-        rows.append(["CAC", "N/A (0 conversions)", "&gt; $45", "—"])
+        out.md("| CAC | N/A (0 conversions) | > $45 | — |")
+        out.html_row("CAC", "N/A (0 conversions)", "&gt; $45", "—")
+
+    # Max daily spend (Markdown-only)
+    if daily_spend:
+        out.md(f"| Max daily spend | {_fmt_usd(max(daily_spend.values()))} | Budget cap | INFO |")
 
-    # ROAS
+    # Revenue vs spend
     if total_spend > 0:
         roas = total_revenue / total_spend
-        cls = "ok" if roas >= 1 else "warn"
-        rows.append(["ROAS", f"{roas:.2f}x", "&gt; 1.0x", f'<span class="{cls}">{"OK" if roas >= 1 else "WARN"}</span>'])
+        status = "OK" if roas >= 1 else "WARN"
+        out.md(f"| ROAS | {roas:.2f}x | > 1.0x | {status} |")
+        out.html_row("ROAS", f"{roas:.2f}x", "&gt; 1.0x", f'<span class="{status.lower()}">{status}</span>')
+
+    out.md("")
+    out.html_table_end()
+
+
+# ---------------------------------------------------------------------------
+# Report Rendering
+# ---------------------------------------------------------------------------
+
+def _status_label(r: CollectorResult) -> str:
+    if r.circuit_open:
+        return "CACHED"
+    if r.timed_out:
+        return "TIMED OUT"
+    if r.skipped:
+        return "SKIPPED"
+    return "OK" if r.success else "FAIL"
+
+
+def render_report(
+    results: dict[str, CollectorResult],
+    timestamp: datetime,
+    period: str,
+    days: int,
+    md_out: TextIO | None,
+    html_out: TextIO | None,
+) -> None:
+    """
+    Render the Markdown and HTML reports to file handles in one pass.
+
+    Each section normalizes its result once and writes both formats as it
+    goes; large tables are streamed row by row. Pass None for an output
+    that is not needed.
+    """
+    out = ReportWriter(md_out, html_out)
+    date_str = timestamp.strftime("%Y-%m-%d")
+    title_period = period.title()
+    ok_count = sum(1 for r in results.values() if r.success)
+    total = len(results)
 
-    return _html_table(["Guardrail", "Value", "Threshold", "Status"], rows)
+    # --- Header ---
+    out.md(
+        f"# Daily Metrics Report: {date_str} ({title_period})",
+        "",
+        f"**Generated:** {timestamp.strftime('%H:%M %Z')}  ",
+        f"**Period:** {title_period}  ",
+        f"**Lookback:** {days} day(s)  ",
+        "",
+        f"**Data Sources:** {ok_count}/{total} succeeded",
+        "",
+        _source_status_line(results),
+        "\n---\n",
+    )
+    out.html(
+        _HTML_HEAD.format(date=date_str, period=title_period),
+        '<header class="panel">',
+        "<h1>Daily Metrics Report</h1>",
+        f"<p>{date_str} &middot; {title_period} &middot; {days}-day lookback "
+        f"&middot; {ok_count}/{total} sources OK</p>",
+        '<div class="meta">',
+        *(
+            f'<span class="{"ok" if r.success and not r.circuit_open else "warn"}">'
+            f"{name}: {_status_label(r)}</span>"
+            for name, r in results.items()
+        ),
+        "</div>",
+        "</header>",
+    )
+
+    # --- Source sections ---
+    order = _section_order(results)
+    for number, source_id in enumerate(order, 1):
+        section = REPORT_SECTIONS.get(source_id) or _generic_section(source_id)
+        out.md(f"## {number}) {section.title}\n")
+        out.html(_html_section_start(section.html_title))
+        section.render(results.get(source_id), out)
+        out.md("---\n")
+        out.html(_html_section_end())
+
+    # --- Guardrail Check ---
+    if _has_guardrail_inputs(results):
+        out.md(f"## {len(order) + 1}) Guardrail Check\n")
+        out.html(_html_section_start("Guardrail Check"))
+        _render_guardrails(results, out)
+        out.html(_html_section_end())
+
+    out.html(_HTML_FOOT.format(
+        date=date_str, time=timestamp.strftime("%H:%M"), period=title_period,
+    ))
+    out.flush()
+
+
+def generate_markdown_report(
+    results: dict[str, CollectorResult],
+    timestamp: datetime,
+    period: str,
+    days: int,
+) -> str:
+    """Generate a full Markdown metrics report."""
+    buffer = io.StringIO()
+    render_report(results, timestamp, period, days, buffer, None)
+    return buffer.getvalue()
+
+
+def generate_html_report(
+    results: dict[str, CollectorResult],
+    timestamp: datetime,
+    period: str,
+    days: int,
+) -> str:
+    """Generate a self-contained HTML metrics report."""
+    buffer = io.StringIO()
+    render_report(results, timestamp, period, days, None, buffer)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Report Files
+# ---------------------------------------------------------------------------
+
+def write_reports(
+    results: dict[str, CollectorResult],
+    timestamp: datetime,
+    period: str,
+    days: int,
+    output_dir: Path,
+) -> tuple[Path, Path]:
+    """Write the Markdown and HTML reports for one period.
+
+    Files are named daily-metrics-YYYY-MM-DD-<period>.{md,html}. Both are
+    streamed in a single render_report() pass to temporary files that
+    replace the old reports only once complete, so a back-fill rewrite
+    never exposes a half-written report.
+
+    Returns:
+        Tuple of (markdown_path, html_path)
+    """
+    date_str = timestamp.strftime("%Y-%m-%d")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    md_path = output_dir / f"daily-metrics-{date_str}-{period}.md"
+    html_path = output_dir / f"daily-metrics-{date_str}-{period}.html"
+    md_tmp = md_path.with_name(md_path.name + ".tmp")
+    html_tmp = html_path.with_name(html_path.name + ".tmp")
+
+    try:
+        with (
+            md_tmp.open("w", encoding="utf-8") as md_out,
+            html_tmp.open("w", encoding="utf-8") as html_out,
+        ):
+            render_report(results, timestamp, period, days, md_out, html_out)
+        md_tmp.replace(md_path)
+        html_tmp.replace(html_path)
+    finally:
+        md_tmp.unlink(missing_ok=True)
+        html_tmp.unlink(missing_ok=True)
+    return md_path, html_path
+
+
+def write_pdf_report(md_path: Path, pdf_path: Path | None = None) -> Path:
+    """Render a Markdown report written by write_reports() to PDF.
+
+    The Markdown file is read as the PDF is laid out and long tables are
+    paginated a page of rows at a time (see pdf_document), so memory stays
+    flat for long lookbacks. Like write_reports(), the PDF replaces an old
+    one only once complete.
+
+    Returns:
+        Path of the PDF (``md_path`` with a .pdf suffix by default)
+    """
+    from .pdf_document import markdown_to_pdf
+
+    pdf_path = pdf_path or md_path.with_suffix(".pdf")
+    pdf_tmp = pdf_path.with_name(pdf_path.name + ".tmp")
+    try:
+        with md_path.open(encoding="utf-8") as md_in:
+            markdown_to_pdf(md_in, pdf_tmp)
+        pdf_tmp.replace(pdf_path)
+    finally:
+        pdf_tmp.unlink(missing_ok=True)
+    return pdf_path
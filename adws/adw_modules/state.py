@@ -44,11 +44,13 @@ class ADWState(BaseModel):
     adw_id: str = Field(..., description="Unique workflow identifier (8-char hex)")
     issue_number: int = Field(..., description="GitHub issue being resolved")
     worktree_path: str = Field(..., description="Path to git worktree")
+    # The configured PortRange is enforced when ports are leased; saved states
+    # stay loadable after ADWS_*_PORT_BASE or ADWS_PORT_SLOTS change
     backend_port: int = Field(
-        ..., ge=9100, le=9114, description="Allocated backend port"
+        ..., ge=1, le=65535, description="Allocated backend port (leased from the PortRange)"
     )
     frontend_port: int = Field(
-        ..., ge=9200, le=9214, description="Allocated frontend port"
+        ..., ge=1, le=65535, description="Allocated frontend port (leased from the PortRange)"
     )
     branch_name: str = Field(..., description="Git branch name")
     plan_file: str | None = Field(None, description="Path to plan.md")
@@ -127,8 +129,8 @@ class StateManager:
         Args:
             issue_number: GitHub issue number
             worktree_path: Path to the git worktree
-            backend_port: Allocated backend port (9100-9114)
-            frontend_port: Allocated frontend port (9200-9214)
+            backend_port: Leased backend port (9100-9114 by default)
+            frontend_port: Leased frontend port (9200-9214 by default)
             branch_name: Git branch name
             repo_url: Optional repository URL
             plan_file: Optional path to plan.md
@@ -1,23 +1,34 @@
 """
 ADWS Worktree Operations Module
 
-Provides git worktree management with deterministic port allocation.
+Provides git worktree management with leased port allocation.
 Each workflow runs in an isolated worktree at trees/{adw_id}/ with
-allocated backend/frontend ports.
+backend/frontend ports leased from agents/.port_leases.json (see
+port_leases.py), so concurrent workflows never share a slot.
 
 Includes TTL-based auto-cleanup to remove stale worktrees older than
-a configurable threshold (default 72 hours).
+a configurable threshold (default 72 hours). Cleanup is batched: stale
+directories are removed in parallel, followed by one `git worktree prune`
+and one multi-branch `git branch -D`.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import re
 import secrets
+import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+
+from pydantic import BaseModel, Field
+
+from .port_leases import PortLeaseTable, PortRange
 
 logger = logging.getLogger("adws-worktree")
 
@@ -34,26 +45,166 @@ def generate_adw_id() -> str:
 
 def get_ports_for_adw(adw_id: str) -> tuple[int, int]:
     """
-    Deterministically assign ports based on ADW ID.
+    Deterministically compute the preferred ports for an ADW ID.
 
     Uses base-36 conversion of the first 8 characters to compute
-    a slot index, ensuring consistent port allocation for the same
-    ADW ID across restarts.
+    a slot index within the configured port range. This is only the
+    starting point for leasing — use lease_ports_for_adw() to reserve
+    ports, since two IDs can hash to the same slot.
 
     Args:
         adw_id: 8-character hexadecimal identifier
 
     Returns:
         Tuple of (backend_port, frontend_port)
-        - Backend: 9100-9114 (15 slots)
-        - Frontend: 9200-9214 (15 slots)
+        - Backend: 9100-9114 (15 slots by default, see ADWS_PORT_SLOTS)
+        - Frontend: 9200-9214 (15 slots by default)
 
     Example:
         >>> get_ports_for_adw("a1b2c3d4")
         (9103, 9203)
     """
-    index = int(adw_id[:8], 36) % 15
-    return (9100 + index, 9200 + index)
+    port_range = PortRange.from_env()
+    return port_range.ports_for_slot(port_range.preferred_slot(adw_id))
+
+
+def lease_ports_for_adw(
+    adw_id: str,
+    agents_base: Path | None = None,
+    trees_base: Path | None = None,
+) -> tuple[int, int]:
+    """
+    Lease a collision-free port pair for a workflow.
+
+    Starts probing at the slot from get_ports_for_adw() and takes the
+    first slot not leased by another workflow. Repeated calls for the
+    same ADW ID return the same ports until the lease is released.
+
+    Args:
+        adw_id: Workflow identifier
+        agents_base: Base directory holding the lease table (defaults to "agents")
+        trees_base: Base directory for worktrees (defaults to "trees")
+
+    Returns:
+        Tuple of (backend_port, frontend_port)
+
+    Raises:
+        RuntimeError: If every slot in the configured range is leased
+    """
+    if agents_base is None:
+        agents_base = Path("agents")
+    if trees_base is None:
+        trees_base = Path("trees")
+
+    table = PortLeaseTable(lease_file=agents_base / ".port_leases.json")
+    return table.lease(adw_id, worktree_path=trees_base / adw_id)
+
+
+def release_ports_for_adw(adw_id: str, agents_base: Path | None = None) -> bool:
+    """
+    Release a workflow's port lease so the slot can be reused.
+
+    Args:
+        adw_id: Workflow identifier
+        agents_base: Base directory holding the lease table (defaults to "agents")
+
+    Returns:
+        True if a lease was released, False if none was held
+    """
+    if agents_base is None:
+        agents_base = Path("agents")
+
+    table = PortLeaseTable(lease_file=agents_base / ".port_leases.json")
+    released = table.release(adw_id)
+    if released:
+        logger.info(f"Released port lease for {adw_id}")
+    return released
+
+
+def sparse_paths_for_plan(
+    files_to_create: list[str],
+    files_to_modify: list[str],
+) -> list[str]:
+    """
+    Compute cone-mode sparse-checkout directories for a plan.
+
+    Each planned file contributes its parent directory; root-level files
+    need no entry because cone mode always includes the repository root.
+    Absolute paths and paths escaping the repository are ignored.
+
+    Args:
+        files_to_create: Plan's files_to_create list
+        files_to_modify: Plan's files_to_modify list
+
+    Returns:
+        Sorted, de-duplicated list of directories (outermost only)
+    """
+    dirs: set[str] = set()
+    for raw in [*files_to_create, *files_to_modify]:
+        path = PurePosixPath(raw.strip().removeprefix("./"))
+        if not raw.strip() or path.is_absolute() or ".." in path.parts:
+            continue
+        parent = path.parent
+        if str(parent) not in ("", "."):
+            dirs.add(str(parent))
+
+    # Cone mode includes everything below a listed directory
+    return sorted(
+        d for d in dirs
+        if not any(d.startswith(f"{other}/") for other in dirs if other != d)
+    )
+
+
+def add_sparse_paths(worktree_path: Path, paths: list[str]) -> None:
+    """
+    Widen a sparse worktree to include additional directories.
+
+    Args:
+        worktree_path: Path to a worktree created with sparse=True
+        paths: Directories to add to the cone-mode sparse checkout
+
+    Raises:
+        subprocess.CalledProcessError: If git sparse-checkout fails
+    """
+    if not paths:
+        return
+    subprocess.run(
+        ["git", "sparse-checkout", "add", *paths],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _checkout_sparse(worktree_path: Path, sparse_paths: list[str]) -> None:
+    """Enable cone-mode sparse checkout in a --no-checkout worktree and populate it."""
+    subprocess.run(
+        ["git", "sparse-checkout", "set", "--cone", *sparse_paths],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    subprocess.run(
+        ["git", "checkout", "--quiet"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _is_sparse(worktree_path: Path) -> bool:
+    """True if the worktree has sparse checkout enabled."""
+    result = subprocess.run(
+        ["git", "config", "--bool", "core.sparseCheckout"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() == "true"
 
 
 def create_worktree(
@@ -61,6 +212,8 @@ def create_worktree(
     issue_number: int,
     repo_path: Path | None = None,
     trees_base: Path | None = None,
+    sparse: bool = False,
+    sparse_paths: list[str] | None = None,
 ) -> tuple[Path, str]:
     """
     Create an isolated git worktree for the workflow.
@@ -69,11 +222,18 @@ def create_worktree(
     repository for isolated development. The worktree contains all files
     from the current HEAD.
 
+    In sparse mode the worktree shares the main repository's object store
+    as usual but only checks out root-level files plus sparse_paths
+    (cone mode). Directories can be added later with add_sparse_paths(),
+    e.g. once the plan's files_to_create/files_to_modify are known.
+
     Args:
         adw_id: Unique workflow identifier
         issue_number: GitHub issue number
         repo_path: Path to the main repository (defaults to current directory)
         trees_base: Base directory for worktrees (defaults to "trees")
+        sparse: If True, create a cone-mode sparse worktree
+        sparse_paths: Directories to check out in sparse mode
 
     Returns:
         Tuple of (worktree_path, branch_name)
@@ -98,6 +258,31 @@ def create_worktree(
         )
 
     # Check if branch already exists
+    _ensure_branch_available(branch_name, repo_path)
+
+    # Ensure trees base directory exists
+    trees_base.mkdir(parents=True, exist_ok=True)
+
+    # Create worktree with new branch
+    add_cmd = ["git", "worktree", "add", str(worktree_path), "-b", branch_name]
+    if sparse:
+        add_cmd.insert(3, "--no-checkout")
+    subprocess.run(
+        add_cmd,
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    if sparse:
+        _checkout_sparse(worktree_path, sparse_paths or [])
+
+    return worktree_path, branch_name
+
+
+def _ensure_branch_available(branch_name: str, repo_path: Path) -> None:
+    """Raise FileExistsError if branch_name already exists in the repository."""
     result = subprocess.run(
         ["git", "rev-parse", "--verify", f"refs/heads/{branch_name}"],
         cwd=repo_path,
@@ -110,26 +295,249 @@ def create_worktree(
             f"Choose a different adw_id or delete the branch first."
         )
 
-    # Ensure trees base directory exists
-    trees_base.mkdir(parents=True, exist_ok=True)
 
-    # Create worktree with new branch
-    subprocess.run(
-        [
-            "git",
-            "worktree",
-            "add",
-            str(worktree_path),
-            "-b",
-            branch_name,
-        ],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+class WorktreePool:
+    """
+    Pool of pre-created idle worktrees at trees/.pool/.
+
+    Idle worktrees are detached checkouts created ahead of time. acquire()
+    moves one into trees/{adw_id}/ and resets it onto a fresh branch at the
+    repository's current HEAD, which is much cheaper than a full
+    `git worktree add` checkout. recycle() returns a finished worktree to
+    the pool instead of deleting it.
+
+    Full and sparse idle worktrees share trees/.pool/ but are named by
+    mode (idle-full-*, idle-sparse-*), and a pool only sees and hands out
+    worktrees of its own mode. The pool is filled and recycled into by
+    `scripts/adw_pool.py` and `adw_ship_iso --recycle`.
+
+    Usage:
+        pool = WorktreePool()
+        pool.fill(4)
+        worktree_path, branch_name = pool.acquire(adw_id, issue_number=42)
+        ...
+        pool.recycle(adw_id)
+    """
 
-    return worktree_path, branch_name
+    POOL_DIRNAME = ".pool"
+
+    def __init__(
+        self,
+        repo_path: Path | None = None,
+        trees_base: Path | None = None,
+        sparse: bool = False,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            repo_path: Path to the main repository (defaults to current directory)
+            trees_base: Base directory for worktrees (defaults to "trees")
+            sparse: If True, idle worktrees are root-only sparse checkouts
+        """
+        self.repo_path = repo_path if repo_path is not None else Path(".")
+        self.trees_base = trees_base if trees_base is not None else Path("trees")
+        self.pool_dir = self.trees_base / self.POOL_DIRNAME
+        self.sparse = sparse
+
+    @staticmethod
+    def _slot_prefix(sparse: bool) -> str:
+        return "idle-sparse-" if sparse else "idle-full-"
+
+    def _new_slot(self, sparse: bool) -> Path:
+        return self.pool_dir / f"{self._slot_prefix(sparse)}{secrets.token_hex(4)}"
+
+    def idle(self) -> list[Path]:
+        """Return idle worktree paths of this pool's mode (full or sparse)."""
+        if not self.pool_dir.exists():
+            return []
+        prefix = self._slot_prefix(self.sparse)
+        return sorted(
+            p for p in self.pool_dir.iterdir() if p.is_dir() and p.name.startswith(prefix)
+        )
+
+    def fill(self, size: int) -> int:
+        """
+        Top the pool up to `size` idle worktrees.
+
+        Returns:
+            Number of worktrees created
+        """
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        created: list[Path] = []
+        for _ in range(size - len(self.idle())):
+            slot = self._new_slot(self.sparse)
+            add_cmd = ["git", "worktree", "add", "--detach", str(slot), "HEAD"]
+            if self.sparse:
+                add_cmd.insert(3, "--no-checkout")
+            subprocess.run(
+                add_cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            if self.sparse:
+                _checkout_sparse(slot, [])
+            created.append(slot)
+
+        if created:
+            # Files written in the same second as the index are "racily clean"
+            # and would be re-hashed on the first reset in acquire(). Refresh
+            # the index once timestamps have settled so hand-out stays cheap.
+            time.sleep(1.0)
+            for slot in created:
+                subprocess.run(
+                    ["git", "update-index", "-q", "--refresh"],
+                    cwd=slot,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+        return len(created)
+
+    def acquire(
+        self,
+        adw_id: str,
+        issue_number: int,
+        sparse_paths: list[str] | None = None,
+    ) -> tuple[Path, str]:
+        """
+        Hand out an idle worktree, falling back to create_worktree().
+
+        Only idle worktrees of the pool's mode are handed out. The worktree
+        is moved to trees/{adw_id}/, force-checked-out onto a new branch at
+        the repository's HEAD and cleaned of untracked files.
+
+        Args:
+            adw_id: Unique workflow identifier
+            issue_number: GitHub issue number
+            sparse_paths: Extra directories to check out (sparse pools only)
+
+        Returns:
+            Tuple of (worktree_path, branch_name)
+
+        Raises:
+            FileExistsError: If worktree or branch already exists
+        """
+        worktree_path = self.trees_base / adw_id
+        branch_name = f"feat/issue-{issue_number}-{adw_id}"
+
+        idle = self.idle()
+        if not idle:
+            return create_worktree(
+                adw_id,
+                issue_number,
+                repo_path=self.repo_path,
+                trees_base=self.trees_base,
+                sparse=self.sparse,
+                sparse_paths=sparse_paths,
+            )
+
+        if worktree_path.exists():
+            raise FileExistsError(
+                f"Worktree already exists at {worktree_path}. "
+                f"Use remove_worktree() first or choose a different adw_id."
+            )
+        _ensure_branch_available(branch_name, self.repo_path)
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        subprocess.run(
+            ["git", "worktree", "move", str(idle[0]), str(worktree_path)],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self._reset(worktree_path, ["-B", branch_name, head])
+        if self.sparse and sparse_paths:
+            add_sparse_paths(worktree_path, sparse_paths)
+
+        return worktree_path, branch_name
+
+    def recycle(
+        self,
+        adw_id: str,
+        delete_branch: bool = True,
+        agents_base: Path | None = None,
+    ) -> Path:
+        """
+        Return a finished worktree to the pool instead of removing it.
+
+        The worktree keeps its own mode: a sparse worktree is narrowed back
+        to root-level files and joins the sparse idle worktrees, whatever
+        this pool's mode. The workflow's port lease is released.
+
+        Args:
+            adw_id: Workflow identifier whose worktree should be recycled
+            delete_branch: If True, delete the workflow branch afterwards
+            agents_base: Base directory holding the port lease table
+                         (defaults to "agents")
+
+        Returns:
+            Path of the worktree inside the pool
+        """
+        worktree_path = self.trees_base / adw_id
+        branch_name = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=worktree_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+
+        sparse = _is_sparse(worktree_path)
+        self._reset(worktree_path, ["--detach"])
+        if sparse:
+            _checkout_sparse(worktree_path, [])
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        slot = self._new_slot(sparse)
+        subprocess.run(
+            ["git", "worktree", "move", str(worktree_path), str(slot)],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        if delete_branch and branch_name:
+            subprocess.run(
+                ["git", "branch", "-D", branch_name],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        release_ports_for_adw(adw_id, agents_base=agents_base)
+        return slot
+
+    @staticmethod
+    def _reset(worktree_path: Path, checkout_args: list[str]) -> None:
+        """
+        Discard local changes and untracked files, then switch HEAD.
+
+        `reset --hard` and a plain checkout only rewrite files that differ,
+        unlike `checkout --force`, which rewrites the whole tree.
+        """
+        for cmd in (
+            ["git", "reset", "--hard", "--quiet"],
+            ["git", "clean", "-fdxq"],
+            ["git", "checkout", "--quiet", *checkout_args],
+        ):
+            subprocess.run(
+                cmd,
+                cwd=worktree_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
 
 
 def remove_worktree(
@@ -137,18 +545,21 @@ def remove_worktree(
     trees_base: Path | None = None,
     repo_path: Path | None = None,
     delete_branch: bool = False,
+    agents_base: Path | None = None,
 ) -> None:
     """
     Remove a worktree after workflow completion.
 
-    Prunes the worktree from git's tracking and optionally deletes
-    the associated branch.
+    Prunes the worktree from git's tracking, releases its port lease,
+    and optionally deletes the associated branch.
 
     Args:
         adw_id: Workflow identifier
         trees_base: Base directory for worktrees (defaults to "trees")
         repo_path: Path to the main repository (defaults to current directory)
         delete_branch: If True, also delete the associated branch
+        agents_base: Base directory holding the port lease table
+                     (defaults to "agents")
     """
     if trees_base is None:
         trees_base = Path("trees")
@@ -200,6 +611,231 @@ def remove_worktree(
             check=False,  # Don't raise if branch doesn't exist
         )
 
+    release_ports_for_adw(adw_id, agents_base=agents_base)
+
+
+def _parse_worktree_porcelain(output: str) -> list[dict[str, str]]:
+    """
+    Parse `git worktree list --porcelain` output into one dict per worktree.
+
+    Keys: worktree, HEAD, branch (short name, without refs/heads/), plus
+    flag keys such as bare, detached, locked and prunable when present.
+    """
+    entries: list[dict[str, str]] = []
+    current: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if current:
+                entries.append(current)
+                current = {}
+            continue
+        key, _, value = line.partition(" ")
+        if key == "branch":
+            value = value.removeprefix("refs/heads/")
+        current[key] = value
+    if current:
+        entries.append(current)
+    return entries
+
+
+def _find_common_git_dir(path: Path) -> Path | None:
+    """
+    Locate the repository's common .git directory without running git.
+
+    Walks up from path to the first `.git` entry. A `.git` directory is the
+    common dir; a `.git` file (linked worktree) points at
+    <common>/worktrees/<name>, whose `commondir` file leads back to it.
+    """
+    try:
+        current = path.resolve()
+    except (OSError, ValueError):
+        return None
+    for candidate in (current, *current.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            gitdir = Path(content[len("gitdir:"):].strip())
+            if not gitdir.is_absolute():
+                gitdir = (candidate / gitdir).resolve()
+            commondir_file = gitdir / "commondir"
+            if commondir_file.exists():
+                try:
+                    return (gitdir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+                except OSError:
+                    return None
+            return gitdir.parent.parent
+    return None
+
+
+class WorktreeRecord(BaseModel):
+    """One entry from `git worktree list --porcelain`."""
+
+    path: str
+    head: str | None = None
+    branch: str | None = None
+    detached: bool = False
+    locked: bool = False
+    prunable: bool = False
+    mtime: float | None = None
+
+    @property
+    def commit(self) -> str:
+        """Short commit hash, or "unknown" for worktrees without a HEAD."""
+        return self.head[:7] if self.head else "unknown"
+
+    def age_hours(self, now: float | None = None) -> float | None:
+        """Hours since the worktree directory was last modified."""
+        if self.mtime is None:
+            return None
+        return ((now if now is not None else time.time()) - self.mtime) / 3600
+
+
+class WorktreeInventory:
+    """
+    Cached view of every worktree in a repository.
+
+    The inventory is built from a single `git worktree list --porcelain`
+    call and reused until git's worktree metadata changes. The cache key
+    is the mtime of `.git/worktrees` (add/remove) plus the HEAD, HEAD-reflog
+    and gitdir mtimes of each worktree, so commits, branch switches and
+    `git worktree move` invalidate it too. Checking the key costs a few
+    stat() calls.
+
+    Usage:
+        inventory = get_worktree_inventory(repo_path)
+        inventory.adw_ids(trees_base)
+        inventory.get(trees_base / adw_id).branch
+    """
+
+    def __init__(self, repo_path: Path | None = None) -> None:
+        """
+        Initialize the inventory.
+
+        Args:
+            repo_path: Any path inside the repository or one of its worktrees
+                       (defaults to current directory)
+        """
+        self.repo_path = repo_path if repo_path is not None else Path(".")
+        self.common_dir = _find_common_git_dir(self.repo_path)
+        self.git_calls = 0
+        self._signature: tuple[int, ...] | None = None
+        self._records: dict[Path, WorktreeRecord] = {}
+
+    def _current_signature(self) -> tuple[int, ...]:
+        """Stat-based fingerprint of the repository's worktree metadata."""
+        if self.common_dir is None:
+            return ()
+        admin_dir = self.common_dir / "worktrees"
+        paths = [admin_dir, self.common_dir / "HEAD", self.common_dir / "logs" / "HEAD"]
+        try:
+            for entry in sorted(admin_dir.iterdir()):
+                paths.extend(
+                    (entry / "HEAD", entry / "logs" / "HEAD", entry / "gitdir", entry / "locked")
+                )
+        except OSError:
+            pass
+        signature: list[int] = []
+        for path in paths:
+            try:
+                signature.append(path.stat().st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return tuple(signature)
+
+    def invalidate(self) -> None:
+        """Drop cached records so the next query re-reads git."""
+        self._signature = None
+
+    def refresh(self, force: bool = False) -> dict[Path, WorktreeRecord]:
+        """
+        Return records keyed by resolved worktree path, re-reading git if stale.
+
+        Args:
+            force: Re-run `git worktree list` even if the cache looks current
+        """
+        signature = self._current_signature()
+        if not force and self._signature is not None and signature == self._signature:
+            return self._records
+
+        self.git_calls += 1
+        result = subprocess.run(
+            ["git", "worktree", "list", "--porcelain"],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        records: dict[Path, WorktreeRecord] = {}
+        if result.returncode == 0:
+            for entry in _parse_worktree_porcelain(result.stdout):
+                try:
+                    path = Path(entry["worktree"]).resolve()
+                except (KeyError, OSError, ValueError):
+                    continue
+                try:
+                    mtime: float | None = path.stat().st_mtime
+                except OSError:
+                    mtime = None
+                records[path] = WorktreeRecord(
+                    path=str(path),
+                    head=entry.get("HEAD"),
+                    branch=entry.get("branch"),
+                    detached="detached" in entry,
+                    locked="locked" in entry,
+                    prunable="prunable" in entry,
+                    mtime=mtime,
+                )
+
+        self._records = records
+        self._signature = signature
+        return records
+
+    def get(self, worktree_path: Path) -> WorktreeRecord | None:
+        """Return the record for a worktree directory, if git tracks it."""
+        try:
+            return self.refresh().get(worktree_path.resolve())
+        except (OSError, ValueError):
+            return None
+
+    def adw_ids(self, trees_base: Path) -> list[str]:
+        """ADW IDs of worktrees directly under trees_base (pool excluded)."""
+        trees_base_abs = trees_base.resolve()
+        return [
+            path.name for path in self.refresh() if path.parent == trees_base_abs
+        ]
+
+
+_INVENTORIES: dict[Path, WorktreeInventory] = {}
+
+
+def get_worktree_inventory(repo_path: Path | None = None) -> WorktreeInventory:
+    """
+    Return the process-wide cached inventory for a repository.
+
+    Inventories are shared per common .git directory, so a lookup from the
+    main checkout and from any of its worktrees hits the same cache.
+
+    Args:
+        repo_path: Any path inside the repository (defaults to current directory)
+    """
+    if repo_path is None:
+        repo_path = Path(".")
+    common_dir = _find_common_git_dir(repo_path)
+    if common_dir is None:
+        return WorktreeInventory(repo_path)
+    inventory = _INVENTORIES.get(common_dir)
+    if inventory is None:
+        inventory = WorktreeInventory(repo_path)
+        _INVENTORIES[common_dir] = inventory
+    return inventory
+
 
 def list_active_worktrees(
     trees_base: Path | None = None,
@@ -208,8 +844,8 @@ def list_active_worktrees(
     """
     List all active ADW worktrees.
 
-    Queries git for all worktrees and filters to those in the trees_base
-    directory.
+    Queries the cached worktree inventory and filters to worktrees directly
+    in the trees_base directory.
 
     Args:
         trees_base: Base directory for worktrees (defaults to "trees")
@@ -223,47 +859,31 @@ def list_active_worktrees(
     if repo_path is None:
         repo_path = Path(".")
 
-    result = subprocess.run(
-        ["git", "worktree", "list", "--porcelain"],
-        cwd=repo_path,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
+    try:
+        return get_worktree_inventory(repo_path).adw_ids(trees_base)
+    except (OSError, ValueError):
         return []
 
-    adw_ids: list[str] = []
-    trees_base_abs = trees_base.resolve()
-
-    for line in result.stdout.strip().split("\n"):
-        if line.startswith("worktree "):
-            path = Path(line[9:])  # Remove "worktree " prefix
-            try:
-                path_abs = path.resolve()
-                if trees_base_abs in path_abs.parents or path_abs.parent == trees_base_abs:
-                    adw_ids.append(path_abs.name)
-            except (OSError, ValueError):
-                continue
-
-    return adw_ids
-
 
 def get_worktree_info(
     adw_id: str,
     trees_base: Path | None = None,
+    repo_path: Path | None = None,
 ) -> dict[str, str] | None:
     """
     Get information about a specific worktree.
 
+    Answered from the cached worktree inventory, so repeated calls for any
+    number of worktrees cost one git subprocess until the metadata changes.
+
     Args:
         adw_id: Workflow identifier
         trees_base: Base directory for worktrees (defaults to "trees")
+        repo_path: Path inside the repository (defaults to the worktree itself)
 
     Returns:
         Dictionary with worktree info or None if not found.
-        Keys: path, branch, commit
+        Keys: path, branch, commit, age_hours
     """
     if trees_base is None:
         trees_base = Path("trees")
@@ -275,81 +895,109 @@ def get_worktree_info(
 
     info: dict[str, str] = {"path": str(worktree_path)}
 
-    # Get current branch
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=worktree_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        info["branch"] = result.stdout.strip()
-    except subprocess.CalledProcessError:
+    inventory = get_worktree_inventory(repo_path if repo_path is not None else worktree_path)
+    record = inventory.get(worktree_path)
+    if record is None:
         info["branch"] = "unknown"
-
-    # Get current commit
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=worktree_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        info["commit"] = result.stdout.strip()
-    except subprocess.CalledProcessError:
         info["commit"] = "unknown"
+        return info
 
+    info["branch"] = record.branch or "unknown"
+    info["commit"] = record.commit
+    age = record.age_hours()
+    if age is not None:
+        info["age_hours"] = f"{age:.1f}"
     return info
 
 
-def cleanup_old_worktrees(
+class StaleWorktree(BaseModel):
+    """A worktree selected for TTL cleanup."""
+
+    adw_id: str
+    path: str
+    branch: str | None = None
+    age_hours: float
+
+
+class WorktreeCleanupReport(BaseModel):
+    """Outcome and per-stage timing of a batched worktree cleanup."""
+
+    dry_run: bool
+    max_age_hours: float
+    candidates: list[StaleWorktree] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    failed: dict[str, str] = Field(default_factory=dict)
+    deleted_branches: list[str] = Field(default_factory=list)
+    failed_branches: dict[str, str] = Field(default_factory=dict)
+    timings_ms: dict[str, float] = Field(default_factory=dict)
+
+    def summary(self) -> str:
+        """Render a human-readable report of the cleanup."""
+        verb = "Would remove" if self.dry_run else "Removed"
+        count = len(self.candidates) if self.dry_run else len(self.removed)
+        lines = [
+            f"{verb} {count} worktree(s) older than {self.max_age_hours:.1f}h"
+        ]
+        for candidate in self.candidates:
+            status = ""
+            if candidate.adw_id in self.failed:
+                status = f"  FAILED: {self.failed[candidate.adw_id]}"
+            lines.append(
+                f"  {candidate.adw_id}  {candidate.age_hours:7.1f}h  "
+                f"{candidate.branch or '-'}{status}"
+            )
+        for branch, error in self.failed_branches.items():
+            lines.append(f"  Branch {branch} not deleted: {error}")
+        timing = ", ".join(f"{stage}={ms:.1f}ms" for stage, ms in self.timings_ms.items())
+        lines.append(f"Timing: {timing}")
+        return "\n".join(lines)
+
+
+def find_stale_worktrees(
     max_age_hours: float = 72.0,
     trees_base: Path | None = None,
     repo_path: Path | None = None,
-    agents_base: Path | None = None,
-) -> list[str]:
+) -> list[StaleWorktree]:
     """
-    Remove worktrees older than max_age_hours.
+    Select worktrees under trees_base older than max_age_hours.
 
-    Scans the trees_base directory for worktree directories whose last
-    modification time exceeds the threshold. Removes both the git worktree
-    and the associated branch. Optionally archives the agent state directory
-    before cleanup.
+    Branch names for every worktree come from the cached worktree
+    inventory (a single `git worktree list --porcelain` call); directories
+    git no longer tracks are still selected (without a branch) so they get
+    removed.
 
     Args:
-        max_age_hours: Maximum age in hours before a worktree is cleaned up.
-                       Defaults to 72 hours (3 days).
+        max_age_hours: Maximum age in hours before a worktree is stale
         trees_base: Base directory for worktrees (defaults to "trees")
         repo_path: Path to the main repository (defaults to current directory)
-        agents_base: Base directory for agent state (defaults to "agents").
-                     State directories are NOT deleted — only worktrees.
 
     Returns:
-        List of ADW IDs that were cleaned up
+        Stale worktrees, oldest first
     """
     if trees_base is None:
         trees_base = Path("trees")
     if repo_path is None:
         repo_path = Path(".")
-    if agents_base is None:
-        agents_base = Path("agents")
 
     if not trees_base.exists():
         return []
 
+    try:
+        branches = {
+            Path(record.path): record.branch
+            for record in get_worktree_inventory(repo_path).refresh().values()
+        }
+    except (OSError, ValueError):
+        branches = {}
+
     max_age_seconds = max_age_hours * 3600
     now = time.time()
-    cleaned: list[str] = []
+    stale: list[StaleWorktree] = []
 
     for entry in trees_base.iterdir():
-        if not entry.is_dir():
+        if not entry.is_dir() or entry.name == WorktreePool.POOL_DIRNAME:
             continue
 
-        adw_id = entry.name
-
-        # Check modification time of the worktree directory
         try:
             mtime = entry.stat().st_mtime
         except OSError:
@@ -360,38 +1008,208 @@ def cleanup_old_worktrees(
         if age_seconds < max_age_seconds:
             continue
 
-        age_hours = age_seconds / 3600
-        logger.info(
-            f"Worktree {adw_id} is {age_hours:.1f} hours old "
-            f"(threshold: {max_age_hours:.1f}h). Cleaning up."
+        stale.append(
+            StaleWorktree(
+                adw_id=entry.name,
+                path=str(entry),
+                branch=branches.get(entry.resolve()),
+                age_hours=age_seconds / 3600,
+            )
         )
 
-        # Check if there's a state file — mark it as cleaned
-        state_file = agents_base / adw_id / "adw_state.json"
-        if state_file.exists():
+    stale.sort(key=lambda wt: wt.age_hours, reverse=True)
+    return stale
+
+
+def _annotate_cleanup(state_file: Path, adw_id: str) -> None:
+    """Mark a workflow's state file as cleaned up by TTL expiry."""
+    if not state_file.exists():
+        return
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            state_data = json.load(f)
+        state_data["cleanup_reason"] = "ttl_expired"
+        state_data["cleanup_at"] = datetime.now(UTC).isoformat()
+        with open(state_file, "w", encoding="utf-8") as f:
+            json.dump(state_data, f, indent=2, default=str)
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Could not update state for {adw_id}: {e}")
+
+
+def _remove_stale_worktree(candidate: StaleWorktree, agents_base: Path) -> None:
+    """Annotate state and delete one worktree directory (runs in a worker)."""
+    _annotate_cleanup(agents_base / candidate.adw_id / "adw_state.json", candidate.adw_id)
+    shutil.rmtree(candidate.path)
+
+
+_DELETED_BRANCH_RE = re.compile(r"^Deleted branch (\S+) \(was ", re.MULTILINE)
+
+
+def _delete_branches(
+    branches: list[str], repo_path: Path
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Delete branches with one `git branch -D`, reporting per-branch failures.
+
+    git deletes what it can and exits non-zero if any branch failed, so on
+    failure the deleted branches are read from its output and the rest are
+    matched to their error lines.
+
+    Returns:
+        Tuple of (deleted branches, branch -> error for failed ones)
+    """
+    result = subprocess.run(
+        ["git", "branch", "-D", *branches],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False,
+        # Untranslated output so "Deleted branch" lines can be matched
+        env={**os.environ, "LC_ALL": "C"},
+    )
+    if result.returncode == 0:
+        return list(branches), {}
+
+    deleted = set(_DELETED_BRANCH_RE.findall(result.stdout))
+    error_lines = [line.strip() for line in result.stderr.splitlines() if line.strip()]
+    failed: dict[str, str] = {}
+    for branch in branches:
+        if branch in deleted:
+            continue
+        failed[branch] = next(
+            (line for line in error_lines if f"'{branch}'" in line),
+            result.stderr.strip() or f"git branch -D exited {result.returncode}",
+        )
+        logger.warning(f"Failed to delete branch {branch}: {failed[branch]}")
+    return [b for b in branches if b in deleted], failed
+
+
+def batch_cleanup_worktrees(
+    max_age_hours: float = 72.0,
+    trees_base: Path | None = None,
+    repo_path: Path | None = None,
+    agents_base: Path | None = None,
+    dry_run: bool = False,
+    max_workers: int = 8,
+) -> WorktreeCleanupReport:
+    """
+    Remove stale worktrees in one batch.
+
+    Candidates are computed once, directories are deleted in parallel on
+    a thread pool, then git metadata is cleaned with a single
+    `git worktree prune` and a single multi-branch `git branch -D`.
+    Branches git refuses to delete are listed in failed_branches.
+
+    Args:
+        max_age_hours: Maximum age in hours before a worktree is cleaned up
+        trees_base: Base directory for worktrees (defaults to "trees")
+        repo_path: Path to the main repository (defaults to current directory)
+        agents_base: Base directory for agent state (defaults to "agents").
+                     State files are annotated, not deleted.
+        dry_run: If True, only report what would be removed
+        max_workers: Thread pool size for directory removal
+
+    Returns:
+        WorktreeCleanupReport with candidates, outcomes and stage timings
+    """
+    if trees_base is None:
+        trees_base = Path("trees")
+    if repo_path is None:
+        repo_path = Path(".")
+    if agents_base is None:
+        agents_base = Path("agents")
+
+    report = WorktreeCleanupReport(dry_run=dry_run, max_age_hours=max_age_hours)
+    total_start = time.perf_counter()
+
+    stage_start = time.perf_counter()
+    report.candidates = find_stale_worktrees(max_age_hours, trees_base, repo_path)
+    report.timings_ms["discover"] = (time.perf_counter() - stage_start) * 1000
+
+    if dry_run or not report.candidates:
+        report.timings_ms["total"] = (time.perf_counter() - total_start) * 1000
+        return report
+
+    stage_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            pool.submit(_remove_stale_worktree, candidate, agents_base): candidate
+            for candidate in report.candidates
+        }
+        for future in as_completed(futures):
+            candidate = futures[future]
             try:
-                with open(state_file, encoding="utf-8") as f:
-                    state_data = json.load(f)
-                state_data["cleanup_reason"] = "ttl_expired"
-                state_data["cleanup_at"] = datetime.now(UTC).isoformat()
-                with open(state_file, "w", encoding="utf-8") as f:
-                    json.dump(state_data, f, indent=2, default=str)
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning(f"Could not update state for {adw_id}: {e}")
-
-        # Remove the git worktree and branch
-        remove_worktree(
-            adw_id=adw_id,
-            trees_base=trees_base,
-            repo_path=repo_path,
-            delete_branch=True,
+                future.result()
+                report.removed.append(candidate.adw_id)
+            except OSError as e:
+                report.failed[candidate.adw_id] = str(e)
+                logger.warning(f"Failed to remove worktree {candidate.adw_id}: {e}")
+    report.timings_ms["remove"] = (time.perf_counter() - stage_start) * 1000
+
+    stage_start = time.perf_counter()
+    subprocess.run(
+        ["git", "worktree", "prune"],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    report.timings_ms["prune"] = (time.perf_counter() - stage_start) * 1000
+
+    removed = set(report.removed)
+    branches = [c.branch for c in report.candidates if c.branch and c.adw_id in removed]
+    if branches:
+        stage_start = time.perf_counter()
+        report.deleted_branches, report.failed_branches = _delete_branches(
+            branches, repo_path
         )
+        report.timings_ms["branch_delete"] = (time.perf_counter() - stage_start) * 1000
+
+    for adw_id in report.removed:
+        release_ports_for_adw(adw_id, agents_base=agents_base)
+
+    report.timings_ms["total"] = (time.perf_counter() - total_start) * 1000
+    return report
 
-        cleaned.append(adw_id)
-        logger.info(f"Cleaned up worktree {adw_id}")
 
+def cleanup_old_worktrees(
+    max_age_hours: float = 72.0,
+    trees_base: Path | None = None,
+    repo_path: Path | None = None,
+    agents_base: Path | None = None,
+    dry_run: bool = False,
+) -> list[str]:
+    """
+    Remove worktrees older than max_age_hours.
+
+    Scans the trees_base directory for worktree directories whose last
+    modification time exceeds the threshold. Removes both the git worktree
+    and the associated branch, annotating the agent state file before
+    cleanup. See batch_cleanup_worktrees() for the full timing report.
+
+    Args:
+        max_age_hours: Maximum age in hours before a worktree is cleaned up.
+                       Defaults to 72 hours (3 days).
+        trees_base: Base directory for worktrees (defaults to "trees")
+        repo_path: Path to the main repository (defaults to current directory)
+        agents_base: Base directory for agent state (defaults to "agents").
+                     State directories are NOT deleted — only worktrees.
+        dry_run: If True, return the stale IDs without removing anything
+
+    Returns:
+        List of ADW IDs that were cleaned up (or would be, on a dry run)
+    """
+    report = batch_cleanup_worktrees(
+        max_age_hours=max_age_hours,
+        trees_base=trees_base,
+        repo_path=repo_path,
+        agents_base=agents_base,
+        dry_run=dry_run,
+    )
+
+    cleaned = [c.adw_id for c in report.candidates] if dry_run else report.removed
     if cleaned:
-        logger.info(f"Cleaned up {len(cleaned)} stale worktrees: {cleaned}")
+        logger.info(report.summary())
     else:
         logger.info("No stale worktrees found")
 
@@ -424,12 +1242,13 @@ def cleanup_worktree_and_state(
     if agents_base is None:
         agents_base = Path("agents")
 
-    # Remove git worktree and branch
+    # Remove git worktree and branch (also releases the port lease)
     remove_worktree(
         adw_id=adw_id,
         trees_base=trees_base,
         repo_path=repo_path,
         delete_branch=True,
+        agents_base=agents_base,
     )
 
     # Clean up lock file before archiving
@@ -46,6 +46,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from adws.adw_modules.git_async import command_log, commit_all
 from adws.adw_modules.provider_clients import ClaudeClient
 from adws.adw_modules.state import StateManager
 from adws.adw_modules.trinity_protocol import TrinityPlan
@@ -83,6 +84,7 @@ class BuildLog(BaseModel):
     total_latency_ms: float = 0.0
     commit_sha: str | None = None
     success: bool = False
+    git_commands: list[dict[str, object]] = Field(default_factory=list)
     error_message: str | None = None
 
 
@@ -206,10 +208,10 @@ Include appropriate docstrings, type hints, and comments where needed."""
     return content, response.tokens_used, response.latency_ms
 
 
-def git_add_commit(
+async def git_add_commit(
     worktree_path: Path,
     message: str,
-) -> str:
+) -> str | None:
     """
     Add all changes and commit in the worktree.
 
@@ -218,39 +220,12 @@ def git_add_commit(
         message: Commit message
 
     Returns:
-        Commit SHA
+        Commit SHA or None if nothing to commit
 
     Raises:
         subprocess.CalledProcessError: If git commands fail
     """
-    # Add all changes
-    subprocess.run(
-        ["git", "add", "-A"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    # Commit
-    subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    # Get commit SHA
-    result = subprocess.run(
-        ["git", "rev-parse", "--short", "HEAD"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    return result.stdout.strip()
+    return await commit_all(worktree_path, message)
 
 
 def save_build_log(
@@ -274,6 +249,7 @@ def save_build_log(
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = log_dir / "build_log.json"
+    build_log.git_commands = command_log.summary()
     log_path.write_text(build_log.model_dump_json(indent=2), encoding="utf-8")
 
     return log_path
@@ -294,6 +270,7 @@ async def execute_build(
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
+    command_log.clear()
 
     build_log = BuildLog(adw_id=adw_id, issue_number=issue_number)
 
@@ -488,24 +465,23 @@ async def execute_build(
     # 9. Commit changes
     console.print("\n[bold yellow]Committing changes...[/]")
     try:
-        commit_sha = git_add_commit(
+        commit_sha = await git_add_commit(
             worktree_path=worktree_path,
             message=f"feat(#{issue_number}): implement plan {adw_id}\n\n"
             f"Files created: {len(build_log.files_created)}\n"
             f"Files modified: {len(build_log.files_modified)}\n\n"
             f"Generated via ADWS Build Phase",
         )
-        build_log.commit_sha = commit_sha
-        console.print(f"  [green]Committed:[/] {commit_sha}")
-    except subprocess.CalledProcessError as e:
-        # Check if it's "nothing to commit"
-        if "nothing to commit" in (e.stderr or ""):
+        if commit_sha:
+            build_log.commit_sha = commit_sha
+            console.print(f"  [green]Committed:[/] {commit_sha}")
+        else:
             console.print("  [yellow]Warning:[/] Nothing to commit")
             build_log.commit_sha = "no-changes"
-        else:
-            error_msg = f"Git commit failed: {e.stderr}"
-            console.print(f"  [red]Error:[/] {error_msg}")
-            build_log.error_message = error_msg
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        error_msg = f"Git commit failed: {getattr(e, 'stderr', None) or e}"
+        console.print(f"  [red]Error:[/] {error_msg}")
+        build_log.error_message = error_msg
 
     # 10. Finalize build log
     build_log.completed_at = datetime.now(UTC)
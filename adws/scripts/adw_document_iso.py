@@ -50,6 +50,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from adws.adw_modules.git_async import command_log, commit_all
 from adws.adw_modules.provider_clients import ClaudeClient
 from adws.adw_modules.state import StateManager
 from adws.adw_modules.trinity_protocol import TrinityPlan
@@ -86,6 +87,7 @@ class DocLog(BaseModel):
     total_latency_ms: float = 0.0
     commit_sha: str | None = None
     success: bool = False
+    git_commands: list[dict[str, object]] = Field(default_factory=list)
     error_message: str | None = None
 
 
@@ -418,7 +420,7 @@ Do NOT include markdown code fences in your response - output only the raw markd
     return content, response.tokens_used, response.latency_ms
 
 
-def git_add_commit(
+async def git_add_commit(
     worktree_path: Path,
     message: str,
 ) -> str | None:
@@ -432,46 +434,7 @@ def git_add_commit(
     Returns:
         Commit SHA or None if nothing to commit
     """
-    # Add all changes
-    subprocess.run(
-        ["git", "add", "-A"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    # Check if there are changes to commit
-    status_result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    if not status_result.stdout.strip():
-        return None
-
-    # Commit
-    subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    # Get commit SHA
-    result = subprocess.run(
-        ["git", "rev-parse", "--short", "HEAD"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-
-    return result.stdout.strip()
+    return await commit_all(worktree_path, message)
 
 
 def save_doc_log(
@@ -495,6 +458,7 @@ def save_doc_log(
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = log_dir / "doc_log.json"
+    doc_log.git_commands = command_log.summary()
     log_path.write_text(doc_log.model_dump_json(indent=2), encoding="utf-8")
 
     return log_path
@@ -515,6 +479,7 @@ async def execute_document_phase(
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
+    command_log.clear()
 
     doc_log = DocLog(adw_id=adw_id, issue_number=issue_number)
 
@@ -696,7 +661,7 @@ async def execute_document_phase(
     # 9. Commit documentation changes
     console.print("\n[bold yellow]Committing changes...[/]")
     try:
-        commit_sha = git_add_commit(
+        commit_sha = await git_add_commit(
             worktree_path=worktree_path,
             message=f"docs(#{issue_number}): update documentation\n\n"
             f"- Updated CHANGELOG.md\n"
@@ -709,8 +674,8 @@ async def execute_document_phase(
         else:
             console.print("  [yellow]No changes to commit[/]")
             doc_log.commit_sha = "no-changes"
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Git commit failed: {e.stderr}"
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        error_msg = f"Git commit failed: {getattr(e, 'stderr', None) or e}"
         console.print(f"  [red]Error:[/] {error_msg}")
         doc_log.error_message = error_msg
 
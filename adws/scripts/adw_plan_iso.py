@@ -3,7 +3,7 @@
 ADWS Planning Phase Entry Point
 
 Orchestrates the planning phase by:
-1. Generating unique ADW ID and allocating ports
+1. Generating unique ADW ID and leasing ports
 2. Creating isolated git worktree
 3. Initializing persistent workflow state
 4. Executing Trinity Protocol (Architect/Critic/Advocate)
@@ -25,6 +25,7 @@ Creates:
 from __future__ import annotations
 
 import asyncio
+import subprocess
 import sys
 import time
 from pathlib import Path
@@ -41,9 +42,13 @@ if str(REPO_ROOT) not in sys.path:
 from adws.adw_modules.state import StateManager
 from adws.adw_modules.trinity_protocol import TrinityProtocol
 from adws.adw_modules.worktree_ops import (
+    WorktreePool,
+    add_sparse_paths,
     create_worktree,
     generate_adw_id,
-    get_ports_for_adw,
+    lease_ports_for_adw,
+    release_ports_for_adw,
+    sparse_paths_for_plan,
 )
 
 # Initialize Typer app and Rich console
@@ -59,6 +64,8 @@ async def execute_planning(
     issue_title: str,
     issue_body: str,
     repo_url: str | None = None,
+    sparse: bool = False,
+    use_pool: bool = False,
 ) -> int:
     """
     Execute the complete planning phase.
@@ -68,15 +75,21 @@ async def execute_planning(
         issue_title: Issue title
         issue_body: Issue description/body
         repo_url: Optional source repository URL
+        sparse: Create a sparse worktree, widened to the plan's directories
+        use_pool: Take a pre-created idle worktree from trees/.pool/ if available
 
     Returns:
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
 
-    # 1. Generate ADW ID and allocate ports
+    # 1. Generate ADW ID and lease ports
     adw_id = generate_adw_id()
-    backend_port, frontend_port = get_ports_for_adw(adw_id)
+    try:
+        backend_port, frontend_port = lease_ports_for_adw(adw_id)
+    except RuntimeError as e:
+        console.print(f"[red]Error leasing ports:[/] {e}")
+        return 1
 
     console.print(
         Panel.fit(
@@ -92,14 +105,22 @@ async def execute_planning(
     # 2. Create worktree
     console.print("\n[bold yellow]Creating worktree...[/]")
     try:
-        worktree_path, branch_name = create_worktree(
-            adw_id=adw_id,
-            issue_number=issue_number,
-        )
+        if use_pool:
+            worktree_path, branch_name = WorktreePool(sparse=sparse).acquire(
+                adw_id=adw_id,
+                issue_number=issue_number,
+            )
+        else:
+            worktree_path, branch_name = create_worktree(
+                adw_id=adw_id,
+                issue_number=issue_number,
+                sparse=sparse,
+            )
         console.print(f"  [green]Created:[/] {worktree_path}")
         console.print(f"  [green]Branch:[/] {branch_name}")
-    except RuntimeError as e:
+    except (subprocess.CalledProcessError, FileExistsError, OSError) as e:
         console.print(f"  [red]Error creating worktree:[/] {e}")
+        release_ports_for_adw(adw_id)
         return 1
 
     # 3. Initialize state (model names added after Trinity client init)
@@ -161,6 +182,16 @@ async def execute_planning(
     console.print(f"  [green]Markdown:[/] {plan_md}")
     console.print(f"  [green]JSON:[/] {plan_json}")
 
+    if sparse:
+        sparse_paths = sparse_paths_for_plan(plan.files_to_create, plan.files_to_modify)
+        try:
+            add_sparse_paths(worktree_path, sparse_paths)
+            console.print(
+                f"  [green]Sparse paths:[/] {', '.join(sparse_paths) or '(root only)'}"
+            )
+        except subprocess.CalledProcessError as e:
+            console.print(f"  [yellow]Could not widen sparse checkout:[/] {e.stderr}")
+
     # 6. Update state with plan paths
     state_manager.update(
         plan_file=str(plan_md),
@@ -221,6 +252,16 @@ def main(
         "-r",
         help="Repository URL (optional)",
     ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Sparse worktree: check out only root files plus the plan's directories",
+    ),
+    pool: bool = typer.Option(
+        False,
+        "--pool",
+        help="Reuse a pre-created idle worktree from trees/.pool/ when available",
+    ),
 ) -> None:
     """
     Execute the ADWS Planning Phase.
@@ -239,6 +280,8 @@ def main(
             issue_title=title,
             issue_body=body,
             repo_url=repo_url,
+            sparse=sparse,
+            use_pool=pool,
         )
     )
     raise typer.Exit(code=exit_code)
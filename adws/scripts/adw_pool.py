@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+ADW Worktree Pool - Manage pre-created idle worktrees
+
+Commands:
+- fill:    top up trees/.pool/ to --size idle worktrees (full or --sparse)
+- status:  show idle worktree counts per mode
+- recycle: return a finished workflow's worktree to the pool and release
+           its port lease
+
+`adw_plan_iso --pool` hands these worktrees out; `adw_ship_iso --recycle`
+returns them after shipping.
+
+Usage:
+    uv run python -m scripts.adw_pool fill --size 4 --sparse
+    uv run python -m scripts.adw_pool status
+    uv run python -m scripts.adw_pool recycle abc12345
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Ensure `adws` package imports resolve when running from `cd adws`.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from adws.adw_modules.worktree_ops import WorktreePool
+
+app = typer.Typer(
+    name="adw-pool",
+    help="Manage the pool of pre-created idle worktrees",
+)
+console = Console()
+
+
+@app.command()
+def fill(
+    size: int = typer.Option(
+        4, "--size", "-n",
+        min=1,
+        help="Number of idle worktrees to keep in the pool",
+    ),
+    sparse: bool = typer.Option(
+        False, "--sparse",
+        help="Fill with root-only sparse checkouts instead of full ones",
+    ),
+) -> None:
+    """Top up the pool to SIZE idle worktrees of the chosen mode."""
+    pool = WorktreePool(sparse=sparse)
+    created = pool.fill(size)
+    mode = "sparse" if sparse else "full"
+    console.print(
+        f"[green]✓[/] Created {created} {mode} worktree(s); "
+        f"{len(pool.idle())} idle in {pool.pool_dir}"
+    )
+
+
+@app.command()
+def status() -> None:
+    """Show how many idle worktrees the pool holds per mode."""
+    table = Table(title="Worktree Pool")
+    table.add_column("Mode")
+    table.add_column("Idle", justify="right")
+    for sparse in (False, True):
+        pool = WorktreePool(sparse=sparse)
+        table.add_row("sparse" if sparse else "full", str(len(pool.idle())))
+    console.print(table)
+
+
+@app.command()
+def recycle(
+    adw_id: str = typer.Argument(..., help="ADW ID whose worktree to recycle"),
+    keep_branch: bool = typer.Option(
+        False, "--keep-branch",
+        help="Keep the workflow branch instead of deleting it",
+    ),
+) -> None:
+    """Return a workflow's worktree to the pool and release its port lease."""
+    pool = WorktreePool()
+    if not (pool.trees_base / adw_id).exists():
+        console.print(f"[red]Error:[/] No worktree for {adw_id} in {pool.trees_base}")
+        raise typer.Exit(1)
+    slot = pool.recycle(adw_id, delete_branch=not keep_branch)
+    console.print(f"[green]✓[/] Recycled {adw_id} into {slot}")
+
+
+if __name__ == "__main__":
+    app()
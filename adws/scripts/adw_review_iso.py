@@ -54,6 +54,7 @@ from adws.adw_modules.provider_clients import (
     GPTClient,
     LLMResponse,
 )
+from adws.adw_modules.git_async import command_log, run_git
 from adws.adw_modules.state import StateManager
 from adws.adw_modules.trinity_protocol import TrinityPlan
 
@@ -101,6 +102,7 @@ class ReviewReport(BaseModel):
     total_latency_ms: float = 0.0
     files_reviewed: list[str] = Field(default_factory=list)
     test_summary: str = ""
+    git_commands: list[dict[str, object]] = Field(default_factory=list)
     error_message: str | None = None
 
 
@@ -145,14 +147,12 @@ def load_test_summary(adw_id: str, agents_base: Path | None = None) -> str:
     )
 
 
-def get_git_diff(worktree_path: Path) -> str:
+async def get_git_diff(worktree_path: Path) -> str:
     """Get git diff for the worktree branch."""
-    result = subprocess.run(
-        ["git", "diff", "main...HEAD", "--stat"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-    )
+    try:
+        result = await run_git("diff", "main...HEAD", "--stat", cwd=worktree_path)
+    except subprocess.TimeoutExpired:
+        return "Diff not available"
     return result.stdout[:5000] if result.returncode == 0 else "Diff not available"
 
 
@@ -447,6 +447,7 @@ def save_review_artifacts(
     report_dir.mkdir(parents=True, exist_ok=True)
 
     report_path = report_dir / "review_report.json"
+    report.git_commands = command_log.summary()
     report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
 
     summary_path = report_dir / "review_summary.md"
@@ -470,6 +471,7 @@ async def execute_review_phase(
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
+    command_log.clear()
 
     report = ReviewReport(adw_id=adw_id, issue_number=issue_number)
 
@@ -541,7 +543,7 @@ async def execute_review_phase(
     console.print(f"  [dim]Test summary:[/] {test_summary}")
 
     # Get git diff
-    git_diff = get_git_diff(worktree_path)
+    git_diff = await get_git_diff(worktree_path)
     console.print(f"  [dim]Git diff:[/] {len(git_diff)} chars")
 
     # Get file contents
@@ -9,12 +9,12 @@ Orchestrates the ship phase by:
 4. Creating Pull Request via GitHub API
 5. Adding ADWS labels to PR
 6. Optionally enabling auto-merge
-7. Cleaning up worktree
+7. Cleaning up worktree (or returning it to the pool with --recycle)
 8. Archiving state and artifacts
 9. Recording ship_log.json
 
 Usage:
-    uv run python adws/scripts/adw_ship_iso.py <issue_number> <adw_id> [--auto-merge]
+    uv run python adws/scripts/adw_ship_iso.py <issue_number> <adw_id> [--auto-merge] [--recycle]
 
 Prerequisites:
     - State file at agents/{adw_id}/adw_state.json
@@ -53,8 +53,13 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from adws.adw_modules.git_async import PUSH_TIMEOUT, command_log, run_git
 from adws.adw_modules.state import StateManager
-from adws.adw_modules.worktree_ops import remove_worktree
+from adws.adw_modules.worktree_ops import (
+    WorktreePool,
+    release_ports_for_adw,
+    remove_worktree,
+)
 
 console = Console()
 app = typer.Typer(
@@ -102,6 +107,7 @@ class ShipLog(BaseModel):
     auto_merge_succeeded: bool = False
     worktree_removed: bool = False
     state_archived: bool = False
+    git_commands: list[dict[str, object]] = Field(default_factory=list)
     error_message: str | None = None
     duration_seconds: float = 0.0
     completed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -122,11 +128,7 @@ async def get_repo_info(github_token: str) -> tuple[str, str]:
     Raises:
         ValueError: If remote URL cannot be parsed
     """
-    result = subprocess.run(
-        ["git", "remote", "get-url", "origin"],
-        capture_output=True,
-        text=True,
-    )
+    result = await run_git("remote", "get-url", "origin")
 
     if result.returncode != 0:
         raise ValueError(f"Failed to get git remote: {result.stderr}")
@@ -153,12 +155,13 @@ async def push_branch(worktree_path: Path, branch_name: str) -> bool:
     Returns:
         True if push succeeded
     """
-    result = subprocess.run(
-        ["git", "push", "-u", "origin", branch_name],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-    )
+    try:
+        result = await run_git(
+            "push", "-u", "origin", branch_name, cwd=worktree_path, timeout=PUSH_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        console.print(f"  [dim]Push timed out after {PUSH_TIMEOUT:.0f}s[/]")
+        return False
 
     if result.returncode != 0:
         console.print(f"  [dim]Push stderr:[/] {result.stderr}")
@@ -366,7 +369,8 @@ def archive_state(adw_id: str, agents_base: Path | None = None) -> Path:
     Archive the workflow state and artifacts.
 
     Moves artifact files into agents/{adw_id}/archived/{timestamp}/
-    while keeping state.json at root level for reference.
+    while keeping state.json at root level for reference, and releases
+    the workflow's port lease.
 
     Returns:
         Path to archive directory
@@ -400,13 +404,24 @@ def archive_state(adw_id: str, agents_base: Path | None = None) -> Path:
         if artifact_path.exists():
             shutil.copy2(artifact_path, archive_dir / pattern)
 
+    release_ports_for_adw(adw_id, agents_base=agents_base)
+
     return archive_dir
 
 
-def cleanup_worktree(adw_id: str, trees_base: Path | None = None) -> bool:
+def cleanup_worktree(
+    adw_id: str,
+    trees_base: Path | None = None,
+    recycle: bool = False,
+) -> bool:
     """
     Remove the worktree after shipping.
 
+    Args:
+        adw_id: ADW workflow identifier
+        trees_base: Base directory for worktrees (defaults to "trees")
+        recycle: Return the worktree to the idle pool instead of removing it
+
     Returns:
         True if worktree was removed
     """
@@ -419,7 +434,10 @@ def cleanup_worktree(adw_id: str, trees_base: Path | None = None) -> bool:
         return True  # Already cleaned up
 
     try:
-        remove_worktree(adw_id, trees_base=trees_base, delete_branch=False)
+        if recycle:
+            WorktreePool(trees_base=trees_base).recycle(adw_id, delete_branch=False)
+        else:
+            remove_worktree(adw_id, trees_base=trees_base, delete_branch=False)
         return True
     except Exception:
         return False
@@ -614,6 +632,7 @@ async def execute_ship_phase(
     issue_number: int,
     adw_id: str,
     auto_merge: bool = False,
+    recycle: bool = False,
 ) -> int:
     """
     Execute the complete ship phase.
@@ -622,11 +641,13 @@ async def execute_ship_phase(
         issue_number: GitHub issue number
         adw_id: ADW workflow identifier
         auto_merge: Whether to enable auto-merge
+        recycle: Return the worktree to the idle pool instead of removing it
 
     Returns:
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
+    command_log.clear()
 
     ship_log = ShipLog(
         adw_id=adw_id,
@@ -759,9 +780,9 @@ async def execute_ship_phase(
 
     # 9. Cleanup worktree
     console.print("\n[bold yellow]Cleaning up worktree...[/]")
-    if cleanup_worktree(adw_id):
+    if cleanup_worktree(adw_id, recycle=recycle):
         ship_log.worktree_removed = True
-        console.print("  [green]Worktree removed[/]")
+        console.print(f"  [green]Worktree {'recycled' if recycle else 'removed'}[/]")
     else:
         console.print("  [yellow]Worktree cleanup skipped[/]")
 
@@ -812,6 +833,7 @@ def save_ship_log(ship_log: ShipLog, agents_base: Path | None = None) -> Path:
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = log_dir / "ship_log.json"
+    ship_log.git_commands = command_log.summary()
     log_path.write_text(ship_log.model_dump_json(indent=2), encoding="utf-8")
 
     return log_path
@@ -833,6 +855,11 @@ def main(
         "-a",
         help="Enable auto-merge on the PR",
     ),
+    recycle: bool = typer.Option(
+        False,
+        "--recycle",
+        help="Return the worktree to the idle pool instead of removing it",
+    ),
 ) -> None:
     """
     Execute the ADWS Ship Phase.
@@ -845,7 +872,7 @@ def main(
         uv run python adws/scripts/adw_ship_iso.py 42 abc12345 --auto-merge
     """
     exit_code = asyncio.run(
-        execute_ship_phase(issue_number, adw_id, auto_merge)
+        execute_ship_phase(issue_number, adw_id, auto_merge, recycle)
     )
     raise typer.Exit(code=exit_code)
 
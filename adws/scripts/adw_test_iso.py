@@ -46,6 +46,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from adws.adw_modules.git_async import command_log, commit_all
 from adws.adw_modules.provider_clients import ClaudeClient
 from adws.adw_modules.state import StateManager
 
@@ -92,6 +93,7 @@ class TestReport(BaseModel):
     final_failed: int = 0
     final_errors: int = 0
     success: bool = False
+    git_commands: list[dict[str, object]] = Field(default_factory=list)
     error_message: str | None = None
 
 
@@ -269,37 +271,22 @@ Ensure the fix addresses the test failure without breaking other functionality."
         console.print(f"    [green]Fixed:[/] {file_path}")
 
         # Commit fix
-        subprocess.run(
-            ["git", "add", file_path],
-            cwd=worktree_path,
-            capture_output=True,
-            check=True,
+        commit_sha = await commit_all(
+            worktree_path,
+            f"fix: resolve test failure (attempt {attempt_number})\n\n"
+            f"File: {file_path}\n"
+            f"Analysis: {analysis.get('analysis', 'automated fix')}",
+            paths=[file_path],
         )
 
-        subprocess.run(
-            [
-                "git", "commit", "-m",
-                f"fix: resolve test failure (attempt {attempt_number})\n\n"
-                f"File: {file_path}\n"
-                f"Analysis: {analysis.get('analysis', 'automated fix')}"
-            ],
-            cwd=worktree_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        sha_result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=worktree_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        return file_path, sha_result.stdout.strip()
+        return file_path, commit_sha
 
-    except (json.JSONDecodeError, KeyError, subprocess.CalledProcessError) as e:
+    except (
+        json.JSONDecodeError,
+        KeyError,
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+    ) as e:
         console.print(f"    [yellow]Warning:[/] Could not apply fix: {e}")
         return None, None
 
@@ -325,6 +312,7 @@ def save_test_report(
     report_dir.mkdir(parents=True, exist_ok=True)
 
     report_path = report_dir / "test_report.json"
+    report.git_commands = command_log.summary()
     report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
 
     return report_path
@@ -345,6 +333,7 @@ async def execute_test_phase(
         Exit code (0 = success, non-zero = failure)
     """
     start_time = time.perf_counter()
+    command_log.clear()
 
     report = TestReport(adw_id=adw_id, issue_number=issue_number)
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+ADWS Google Ads Stream Benchmark
+
+Aggregates a synthetic Google Ads search stream two ways:
+- inline: iterate the stream and sum rows on the event loop thread
+          (previous collect_google_ads behaviour)
+- worker: stream_ads_totals(), which reads and sums batches in a worker
+          thread and hands partials back through a bounded queue
+
+For each mode it reports total time, rows/s and the worst event-loop stall
+seen by a 1ms ticker task, which is what the other collectors in
+collect_all() experience while Ads data streams in.
+
+Usage:
+    uv run python -m scripts.benchmark_ads_stream --rows 100000 --read-ms 5
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Ensure `adws` package imports resolve when running from `cd adws`.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from adws.adw_modules.metrics_collectors import (
+    AdsTotals,
+    _ads_accumulate,
+    stream_ads_totals,
+)
+
+app = typer.Typer(
+    name="benchmark-ads-stream",
+    help="Benchmark inline vs worker-thread Google Ads stream aggregation",
+)
+console = Console()
+
+MODES = ("inline", "worker")
+
+
+def synthetic_rows(rows: int, campaigns: int, days: int) -> list[SimpleNamespace]:
+    """Rows shaped like GoogleAdsRow (campaign.name, segments.date, metrics.*)."""
+    names = [SimpleNamespace(name=f"Campaign {i}") for i in range(campaigns)]
+    dates = [SimpleNamespace(date=f"2026-03-{d % 28 + 1:02d}") for d in range(days)]
+    return [
+        SimpleNamespace(
+            campaign=names[i % campaigns],
+            segments=dates[(i // campaigns) % days],
+            metrics=SimpleNamespace(
+                clicks=i % 7, impressions=i % 70, cost_micros=(i % 11) * 250_000,
+                conversions=(i % 5) / 10,
+            ),
+        )
+        for i in range(rows)
+    ]
+
+
+def synthetic_stream(
+    rows: list[SimpleNamespace], batch_size: int, read_ms: float
+) -> Iterator[SimpleNamespace]:
+    """Yield batches, sleeping ``read_ms`` per batch like a blocking gRPC read."""
+    for i in range(0, len(rows), batch_size):
+        time.sleep(read_ms / 1000)
+        yield SimpleNamespace(results=rows[i:i + batch_size])
+
+
+async def _inline(stream: Iterator[SimpleNamespace]) -> AdsTotals:
+    totals: AdsTotals = {}
+    for batch in stream:
+        _ads_accumulate(batch.results, totals)
+    return totals
+
+
+async def run_mode(
+    mode: str, rows: list[SimpleNamespace], batch_size: int, read_ms: float
+) -> dict[str, float]:
+    """Aggregate once in ``mode`` while measuring event-loop stalls."""
+    max_lag = 0.0
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - before - 0.001)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    if mode == "inline":
+        totals = await _inline(synthetic_stream(rows, batch_size, read_ms))
+    else:
+        totals = await stream_ads_totals(lambda: synthetic_stream(rows, batch_size, read_ms))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.002)  # let the ticker record a stall that ran to the end
+    tick.cancel()
+
+    return {
+        "total_ms": elapsed * 1000,
+        "rows_per_s": len(rows) / elapsed if elapsed else 0.0,
+        "max_loop_stall_ms": max_lag * 1000,
+        "groups": len(totals),
+    }
+
+
+def run_benchmark(
+    rows: int, batch_size: int, read_ms: float, runs: int,
+    campaigns: int = 50, days: int = 30,
+) -> dict[str, dict[str, float]]:
+    """
+    Time each mode ``runs`` times over the same synthetic stream.
+
+    Returns:
+        Mapping of mode -> {total_ms, rows_per_s, max_loop_stall_ms, groups}
+        (median of runs; stall is the worst seen)
+    """
+    data = synthetic_rows(rows, campaigns, days)
+    results: dict[str, dict[str, float]] = {}
+    for mode in MODES:
+        samples = [
+            asyncio.run(run_mode(mode, data, batch_size, read_ms)) for _ in range(runs)
+        ]
+        results[mode] = {
+            "total_ms": statistics.median(s["total_ms"] for s in samples),
+            "rows_per_s": statistics.median(s["rows_per_s"] for s in samples),
+            "max_loop_stall_ms": max(s["max_loop_stall_ms"] for s in samples),
+            "groups": samples[0]["groups"],
+        }
+    return results
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(100_000, "--rows", "-r", min=1, help="Synthetic rows in the stream"),
+    batch_size: int = typer.Option(
+        10_000, "--batch-size", "-b", min=1,
+        help="Rows per stream batch (Google Ads sends up to 10k)",
+    ),
+    read_ms: float = typer.Option(
+        5.0, "--read-ms", min=0.0,
+        help="Simulated blocking read time per batch",
+    ),
+    runs: int = typer.Option(3, "--runs", "-n", min=1, help="Runs per mode"),
+    as_json: bool = typer.Option(False, "--json", help="Print raw results as JSON"),
+) -> None:
+    """Benchmark Google Ads stream aggregation on vs off the event loop."""
+    results = run_benchmark(rows, batch_size, read_ms, runs)
+
+    if as_json:
+        console.print_json(json.dumps(results))
+        return
+
+    table = Table(
+        title=f"Google Ads stream ({rows:,} rows, {batch_size:,}/batch, {read_ms}ms/read)"
+    )
+    for column in ("Mode", "Total", "Rows/s", "Max loop stall", "Groups"):
+        table.add_column(column, justify="left" if column == "Mode" else "right")
+    for mode, stats in results.items():
+        table.add_row(
+            mode,
+            f"{stats['total_ms']:.0f}ms",
+            f"{stats['rows_per_s']:,.0f}",
+            f"{stats['max_loop_stall_ms']:.1f}ms",
+            f"{stats['groups']:.0f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ADWS Metrics Pipeline Benchmark
+
+Runs the metrics pipeline offline at several data sizes:
+- collect_all(): every registered collector replayed from fixtures with
+                 injected latency/failures, through the real retry and
+                 scheduling path
+- generate_markdown_report() and generate_html_report() on the results
+- write_reports(): both formats streamed to files in one render pass
+
+Fixtures are synthetic (``--days`` x ``--rows`` grid, rows = channels,
+campaigns, countries, events and attribution rows per source) or recorded
+from a live run with ``metrics_report --record DIR`` and passed via
+``--fixtures DIR``.
+
+Usage:
+    uv run python -m scripts.benchmark_metrics_pipeline --days 1,30,90 --rows 100,5000
+    uv run python -m scripts.benchmark_metrics_pipeline --fixtures fixtures/metrics --latency-ms 150
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Ensure `adws` package imports resolve when running from `cd adws`.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from adws.adw_modules.metrics_collectors import CollectorResult, collect_all
+from adws.adw_modules.metrics_replay import (
+    ReplayProfile,
+    SourceBehavior,
+    load_fixtures,
+    replay_collectors,
+    synthetic_fixtures,
+)
+from adws.adw_modules.report_generator import (
+    generate_html_report,
+    generate_markdown_report,
+    write_reports,
+)
+
+app = typer.Typer(
+    name="benchmark-metrics-pipeline",
+    help="Benchmark collect_all and report generation on replayed fixtures",
+)
+console = Console()
+
+TIMESTAMP = datetime(2026, 3, 1, 7, 0, tzinfo=UTC)
+
+
+def _parse_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError as e:
+        raise typer.BadParameter(f"expected comma-separated integers, got '{value}'") from e
+    if not sizes or min(sizes) < 1:
+        raise typer.BadParameter("sizes must be positive integers")
+    return sizes
+
+
+async def _timed_collect(days: int) -> tuple[dict[str, CollectorResult], float]:
+    # Timed inside the loop so event loop setup/teardown is not counted
+    start = time.perf_counter()
+    results = await collect_all(days)
+    return results, (time.perf_counter() - start) * 1000
+
+
+def run_case(
+    fixtures: dict[str, CollectorResult],
+    days: int,
+    profile: ReplayProfile,
+    runs: int,
+) -> dict[str, float]:
+    """
+    Time collect_all, both report generators and write_reports ``runs`` times.
+
+    Returns:
+        Median ms per stage, report sizes in bytes and sources OK
+    """
+    collect_ms: list[float] = []
+    md_ms: list[float] = []
+    html_ms: list[float] = []
+    write_ms: list[float] = []
+    results: dict[str, CollectorResult] = {}
+    md = html = ""
+    for _ in range(runs):
+        with replay_collectors(fixtures, profile):
+            results, elapsed_ms = asyncio.run(_timed_collect(days))
+            collect_ms.append(elapsed_ms)
+
+        start = time.perf_counter()
+        md = generate_markdown_report(results, TIMESTAMP, "morning", days)
+        md_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        html = generate_html_report(results, TIMESTAMP, "morning", days)
+        html_ms.append((time.perf_counter() - start) * 1000)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            write_reports(results, TIMESTAMP, "morning", days, Path(tmp))
+            write_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "collect_ms": statistics.median(collect_ms),
+        "markdown_ms": statistics.median(md_ms),
+        "html_ms": statistics.median(html_ms),
+        "write_ms": statistics.median(write_ms),
+        "markdown_bytes": len(md.encode()),
+        "html_bytes": len(html.encode()),
+        "sources_ok": sum(1 for r in results.values() if r.success),
+    }
+
+
+def run_benchmark(
+    days: list[int],
+    rows: list[int],
+    profile: ReplayProfile,
+    runs: int,
+    fixtures_dir: Path | None = None,
+) -> list[dict[str, float]]:
+    """Run every (days, rows) case; recorded fixtures replace the rows axis."""
+    cases: list[dict[str, float]] = []
+    recorded = load_fixtures(fixtures_dir) if fixtures_dir else None
+    for d in days:
+        for r in ([0] if recorded is not None else rows):
+            fixtures = recorded if recorded is not None else synthetic_fixtures(d, r)
+            cases.append({"days": d, "rows": r, **run_case(fixtures, d, profile, runs)})
+    return cases
+
+
+@app.command()
+def main(
+    days: str = typer.Option("1,30,90", "--days", "-d", help="Comma-separated lookback days"),
+    rows: str = typer.Option(
+        "100,1000,5000", "--rows", "-r",
+        help="Comma-separated rows per table (ignored with --fixtures)",
+    ),
+    fixtures: str = typer.Option(
+        None, "--fixtures", "-f",
+        help="Replay recorded fixtures from this directory instead of synthetic data",
+    ),
+    latency_ms: float = typer.Option(
+        0.0, "--latency-ms", min=0.0, help="Injected latency per collector call",
+    ),
+    jitter_ms: float = typer.Option(
+        0.0, "--jitter-ms", min=0.0, help="Extra uniform random latency per call",
+    ),
+    failure_rate: float = typer.Option(
+        0.0, "--failure-rate", min=0.0, max=1.0,
+        help="Probability each collector call fails",
+    ),
+    failure: str = typer.Option(
+        "http_503", "--failure",
+        help="Injected failure: http_503 (retried), http_401, timeout (retried), error",
+    ),
+    seed: int = typer.Option(0, "--seed", help="Random seed for jitter and failures"),
+    runs: int = typer.Option(3, "--runs", "-n", min=1, help="Runs per case"),
+    as_json: bool = typer.Option(False, "--json", help="Print raw results as JSON"),
+) -> None:
+    """Benchmark the metrics pipeline end to end without live credentials."""
+    try:
+        behavior = SourceBehavior(latency_ms, jitter_ms, failure_rate, failure)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    profile = ReplayProfile(default=behavior, seed=seed)
+
+    cases = run_benchmark(
+        _parse_sizes(days), _parse_sizes(rows), profile, runs,
+        Path(fixtures) if fixtures else None,
+    )
+
+    if as_json:
+        console.print_json(json.dumps(cases))
+        return
+
+    source = f"fixtures from {fixtures}" if fixtures else "synthetic fixtures"
+    table = Table(title=f"Metrics pipeline ({source}, {latency_ms:g}ms latency, median of {runs})")
+    for column in ("Days", "Rows", "collect_all", "Markdown", "HTML", "Both to files", "MD size", "HTML size", "OK"):
+        table.add_column(column, justify="right")
+    for case in cases:
+        table.add_row(
+            f"{case['days']}",
+            f"{case['rows']:,}" if case["rows"] else "recorded",
+            f"{case['collect_ms']:.1f}ms",
+            f"{case['markdown_ms']:.1f}ms",
+            f"{case['html_ms']:.1f}ms",
+            f"{case['write_ms']:.1f}ms",
+            f"{case['markdown_bytes'] / 1024:,.0f} KiB",
+            f"{case['html_bytes'] / 1024:,.0f} KiB",
+            f"{case['sources_ok']}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+ADWS Worktree Creation Benchmark
+
+Compares the cost of provisioning a workflow worktree via:
+- full:        `git worktree add` (current default path)
+- sparse:      cone-mode sparse checkout of root files plus --path dirs
+- pool:        acquire a pre-created full idle worktree from the pool
+- pool-sparse: acquire a pre-created sparse idle worktree from the pool
+
+For each mode it reports mean/min create time and the checked-out disk
+usage (bytes and file count, excluding git metadata). Pool fill time is
+reported separately since it is paid ahead of time.
+
+Usage:
+    uv run python -m scripts.benchmark_worktrees --runs 3 --path adws
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# Ensure `adws` package imports resolve when running from `cd adws`.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from adws.adw_modules.worktree_ops import (
+    WorktreePool,
+    create_worktree,
+    generate_adw_id,
+    remove_worktree,
+)
+
+app = typer.Typer(
+    name="benchmark-worktrees",
+    help="Benchmark full vs sparse vs pooled worktree creation",
+)
+console = Console()
+
+MODES = ("full", "sparse", "pool", "pool-sparse")
+
+
+def checkout_usage(worktree_path: Path) -> tuple[int, int]:
+    """Return (bytes, files) of the checked-out tree, excluding .git."""
+    total_bytes = 0
+    total_files = 0
+    for root, dirs, files in os.walk(worktree_path):
+        if ".git" in dirs:
+            dirs.remove(".git")
+        for name in files:
+            if name == ".git":
+                continue
+            try:
+                total_bytes += (Path(root) / name).lstat().st_size
+                total_files += 1
+            except OSError:
+                continue
+    return total_bytes, total_files
+
+
+def run_benchmark(
+    repo_path: Path,
+    runs: int,
+    sparse_paths: list[str],
+    modes: tuple[str, ...] = MODES,
+) -> dict[str, dict[str, float]]:
+    """
+    Time each provisioning mode `runs` times in a scratch trees directory.
+
+    Returns:
+        Mapping of mode -> {mean_ms, min_ms, bytes, files[, fill_ms]}
+    """
+    results: dict[str, dict[str, float]] = {}
+    trees_base = Path(tempfile.mkdtemp(prefix="adws_wt_bench_"))
+    try:
+        for mode in modes:
+            timings: list[float] = []
+            usage = (0, 0)
+            sparse = mode in ("sparse", "pool-sparse")
+            pool = WorktreePool(repo_path=repo_path, trees_base=trees_base, sparse=sparse)
+            fill_ms = 0.0
+            if mode.startswith("pool"):
+                start = time.perf_counter()
+                pool.fill(runs)
+                fill_ms = (time.perf_counter() - start) * 1000
+
+            for run in range(runs):
+                adw_id = generate_adw_id()
+                start = time.perf_counter()
+                if mode.startswith("pool"):
+                    worktree_path, _ = pool.acquire(
+                        adw_id, issue_number=run, sparse_paths=sparse_paths
+                    )
+                else:
+                    worktree_path, _ = create_worktree(
+                        adw_id,
+                        issue_number=run,
+                        repo_path=repo_path,
+                        trees_base=trees_base,
+                        sparse=sparse,
+                        sparse_paths=sparse_paths,
+                    )
+                timings.append((time.perf_counter() - start) * 1000)
+                usage = checkout_usage(worktree_path)
+                remove_worktree(
+                    adw_id,
+                    trees_base=trees_base,
+                    repo_path=repo_path,
+                    delete_branch=True,
+                    agents_base=trees_base / ".agents",
+                )
+
+            results[mode] = {
+                "mean_ms": statistics.mean(timings),
+                "min_ms": min(timings),
+                "bytes": usage[0],
+                "files": usage[1],
+            }
+            if fill_ms:
+                results[mode]["fill_ms"] = fill_ms
+    finally:
+        for idle in WorktreePool(repo_path=repo_path, trees_base=trees_base).idle():
+            remove_worktree(idle.name, trees_base=idle.parent, repo_path=repo_path)
+        shutil.rmtree(trees_base, ignore_errors=True)
+    return results
+
+
+@app.command()
+def main(
+    runs: int = typer.Option(3, "--runs", "-n", min=1, help="Worktrees created per mode"),
+    path: list[str] = typer.Option(
+        ["adws"], "--path", "-p",
+        help="Directory to include in sparse modes (repeatable)",
+    ),
+    repo: str = typer.Option(
+        None, "--repo", "-r",
+        help="Repository to benchmark (default: this repo)",
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print raw results as JSON"),
+) -> None:
+    """Benchmark worktree create time and disk usage for each provisioning mode."""
+    repo_path = Path(repo) if repo else REPO_ROOT
+    results = run_benchmark(repo_path, runs, path)
+
+    if as_json:
+        console.print_json(json.dumps(results))
+        return
+
+    baseline = results["full"]
+    table = Table(title=f"Worktree creation ({runs} run(s), sparse paths: {', '.join(path)})")
+    for column in ("Mode", "Mean", "Min", "vs full", "Disk", "Files", "Pool fill"):
+        table.add_column(column, justify="left" if column == "Mode" else "right")
+    for mode, stats in results.items():
+        speedup = baseline["mean_ms"] / stats["mean_ms"] if stats["mean_ms"] else 0.0
+        table.add_row(
+            mode,
+            f"{stats['mean_ms']:.0f}ms",
+            f"{stats['min_ms']:.0f}ms",
+            f"{speedup:.1f}x",
+            f"{stats['bytes'] / 1_048_576:.1f} MB",
+            f"{stats['files']:.0f}",
+            f"{stats['fill_ms']:.0f}ms" if "fill_ms" in stats else "-",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
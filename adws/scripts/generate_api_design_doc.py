@@ -3,50 +3,38 @@ Generates the Google Ads API Basic Access application design document (PDF).
 Output: doc/dev/themegpt-adws-api-design-doc.pdf
 """
 
+from __future__ import annotations
+
+import sys
 from pathlib import Path
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
+from reportlab.lib.units import inch
+from reportlab.platypus import Flowable, HRFlowable, Paragraph, Spacer
 
-OUTPUT_PATH = Path(__file__).parent.parent.parent / "doc" / "dev" / "themegpt-adws-api-design-doc.pdf"
+# Ensure `adws` package imports resolve when running from `cd adws`.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
-CHOCOLATE, PEACH, TEAL, CREAM, LIGHT_GRAY = map(colors.HexColor, ["#4B2E1E", "#E8A87C", "#5BB5A2", "#FAF6F0", "#F5F5F5"])
+from adws.adw_modules.pdf_document import (  # noqa: E402
+    LIGHT_GRAY,
+    PEACH,
+    TEAL,
+    build_pdf,
+    paragraph_styles,
+    table,
+)
+
+OUTPUT_PATH = Path(__file__).parent.parent.parent / "doc" / "dev" / "themegpt-adws-api-design-doc.pdf"
 
-def _make_table(data, colWidths, header_bg=CHOCOLATE, extra_styles=None):
-    ts = TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), header_bg),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-    ])
-    if extra_styles:
-        for s in extra_styles: ts.add(*s)
-    t = Table(data, colWidths=colWidths)
-    t.setStyle(ts)
-    return t
 
-def build():
-    doc = SimpleDocTemplate(str(OUTPUT_PATH), pagesize=letter, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
-    styles = getSampleStyleSheet()
-    
-    ps = lambda n, p, c, sz, sa, sb=0, fn="Helvetica", **k: ParagraphStyle(n, parent=styles[p], textColor=c, fontSize=sz, spaceAfter=sa, spaceBefore=sb, fontName=fn, **k)
-    h1 = ps("h1", "Heading1", CHOCOLATE, 20, 6, fn="Helvetica-Bold")
-    h2 = ps("h2", "Heading2", CHOCOLATE, 13, 4, 16, fn="Helvetica-Bold")
-    h3 = ps("h3", "Heading3", TEAL, 11, 2, 10, fn="Helvetica-Bold")
-    body = ps("body", "Normal", colors.black, 10, 6, leading=15)
-    code = ps("code", "Code", colors.black, 9, 4, 4, fn="Courier", leading=13, backColor=LIGHT_GRAY, leftIndent=12, rightIndent=12)
-    caption = ps("caption", "Normal", colors.gray, 9, 0, fn="Helvetica-Oblique")
+def story() -> list[Flowable]:
+    styles = paragraph_styles()
+    h1, h2, h3 = styles["h1"], styles["h2"], styles["h3"]
+    body, code, caption = styles["body"], styles["code"], styles["caption"]
 
-    story = [
+    return [
         Paragraph("ThemeGPT ADWS", h1),
         Paragraph("Google Ads API Integration — Design Documentation", h2),
         Paragraph("Version 1.0 &nbsp;|&nbsp; February 2026 &nbsp;|&nbsp; EthereaLogic", caption),
@@ -55,7 +43,7 @@ def build():
         Paragraph("ThemeGPT is a privacy-first Chrome extension that lets users customize the ChatGPT interface. The <b>ADWS (Advertising Watch System)</b> is an internal Python command-line tool built by EthereaLogic to monitor and report on ThemeGPT's own Google Ads campaign performance.", body),
         Paragraph("ADWS is a <b>read-only reporting tool</b>. It queries the Google Ads API to pull campaign metrics, aggregates them alongside GA4, Microsoft Clarity, and Chrome Web Store analytics, and renders a daily Markdown/HTML report for internal review. It does not create, modify, or delete any Google Ads resources.", body),
         Paragraph("2. Scope and Access", h2),
-        _make_table([
+        table([
             ["Field", "Value"],
             ["Manager account (MCC)", "Themegpt — 799-632-8615"],
             ["Advertising account", "ThemeGPT — 170-289-9815"],
@@ -68,7 +56,7 @@ def build():
         Paragraph("ADWS is a single Python package (<i>adw_modules</i>) invoked via <i>scripts/metrics_report.py</i>. It collects data from six sources in parallel and writes a daily report to disk.", body),
         Paragraph("3.1 Component Diagram", h3),
         Paragraph("The following describes the data flow at a high level:", body),
-        _make_table([
+        table([
             ["Component", "Role"],
             ["scripts/metrics_report.py", "CLI entry point; orchestrates parallel collection"],
             ["adw_modules/metrics_collectors.py", "One async collector per data source"],
@@ -87,7 +75,7 @@ def build():
         Paragraph("No mutations (create, update, remove) are ever issued. The tool is stateless — it reads, aggregates, and exits.", body),
         Paragraph("4.3 Authentication Flow", h3),
         Paragraph("Authentication uses the <b>OAuth 2.0 installed application flow</b> (InstalledAppFlow). Credentials are stored in <i>~/.config/google-ads.yaml</i> on the developer's local machine and are never committed to version control, transmitted to a server, or shared outside the internal team.", body),
-        _make_table([
+        table([
             ["Step", "Description"],
             ["1", "Developer runs one-time OAuth flow to obtain a refresh token"],
             ["2", "Refresh token stored in ~/.config/google-ads.yaml (local only)"],
@@ -107,7 +95,7 @@ def build():
         Paragraph("6. Access Control", h2),
         Paragraph("Access to the tool and its credentials is restricted to the EthereaLogic engineering team (internal users only). There is no end-user-facing interface. The tool is invoked manually by a developer via CLI and is not deployed to any production server or automated pipeline.", body),
         Paragraph("7. API Call Summary", h2),
-        _make_table([
+        table([
             ["Attribute", "Value"],
             ["Service", "GoogleAdsService"],
             ["Method", "SearchStream"],
@@ -123,8 +111,12 @@ def build():
         Paragraph("EthereaLogic &nbsp;|&nbsp; anthony.johnsonii@etherealogic.ai &nbsp;|&nbsp; themegpt.ai", caption),
     ]
 
-    doc.build(story)
-    print(f"Saved: {OUTPUT_PATH}")
+
+def build(output_path: Path = OUTPUT_PATH) -> Path:
+    build_pdf(output_path, story())
+    print(f"Saved: {output_path}")
+    return output_path
+
 
 if __name__ == "__main__":
     build()
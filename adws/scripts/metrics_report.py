@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import sys
 import time
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -28,66 +30,137 @@ async def execute_metrics_report(
     days: int,
     period: str,
     output_dir: Path,
+    warehouse_path: Path | None = None,
+    restatement_days: int = 3,
+    circuit_breaker: bool = True,
+    deadline_s: float | None = None,
+    backfill: bool = False,
+    sources: list[str] | None = None,
+    skip_missing_credentials: bool = False,
+    max_parallel: int | None = None,
+    record_dir: Path | None = None,
+    replay_dir: Path | None = None,
+    pdf: bool = False,
 ) -> int:
-    """Orchestrate parallel data collection and report generation."""
-    from adws.adw_modules.fault_tolerant import write_failure_manifest
-    from adws.adw_modules.metrics_collectors import collect_all
-    from adws.adw_modules.report_generator import (
-        generate_html_report,
-        generate_markdown_report,
+    """Orchestrate parallel data collection and report generation.
+
+    With ``deadline_s``, the report is written from the sources that finished
+    in time; with ``backfill`` the stragglers keep running and the report
+    files are rewritten as each late result arrives. ``sources`` limits the
+    run (and the report sections) to those registered collectors.
+
+    ``record_dir`` saves sanitized fixtures of the successful sources;
+    ``replay_dir`` collects from such fixtures instead of the live APIs
+    (circuit breaker state is left untouched). ``pdf`` also renders the
+    Markdown report to PDF.
+    """
+    from adws.adw_modules.fault_tolerant import BreakerStore
+    from adws.adw_modules.metrics_collectors import (
+        COLLECTOR_SOURCES,
+        aclose_http_clients,
+        collect_all,
+        wait_for_stragglers,
     )
+    from adws.adw_modules.metrics_warehouse import MetricsWarehouse
 
     start = time.perf_counter()
     timestamp = datetime.now(UTC)
-    date_str = timestamp.strftime("%Y-%m-%d")
 
     console.print("[bold cyan]ADWS Daily Metrics Report[/]")
     console.print(f"  Lookback: {days} day(s)")
     console.print(f"  Period:   {period}")
     console.print(f"  Output:   {output_dir}")
+    if sources:
+        console.print(f"  Sources:  {', '.join(sources)}")
+    if replay_dir:
+        console.print(f"  Replay:   {replay_dir} (offline)")
+    if warehouse_path:
+        console.print(f"  Warehouse: {warehouse_path} (restating last {restatement_days} day(s))")
+    if deadline_s is not None:
+        console.print(
+            f"  Deadline: {deadline_s:g}s"
+            + (" (late sources back-filled)" if backfill else "")
+        )
     console.print()
 
-    # --- Collect from all 6 sources in parallel ---
-    console.print("[bold yellow]Collecting data from 6 sources...[/]")
-    results = await collect_all(days)
-
-    ok_count = 0
-    fail_count = 0
-    for name, result in results.items():
-        if result.success:
-            ok_count += 1
-            dur = f" ({result.duration_ms:.0f}ms)" if result.duration_ms else ""
-            console.print(f"  [green]OK[/]   {name}{dur}")
-        else:
-            fail_count += 1
-            console.print(f"  [red]FAIL[/] {name}: {result.error}")
-
-    manifest_path = write_failure_manifest(results, date_str, output_dir)
-    if manifest_path:
-        console.print(f"\n  [yellow]Failure manifest:[/] {manifest_path}")
+    warehouse = (
+        MetricsWarehouse(warehouse_path, restatement_days=restatement_days)
+        if warehouse_path
+        else None
+    )
 
-    console.print()
+    breakers = (
+        BreakerStore(output_dir / "failures") if circuit_breaker and not replay_dir else None
+    )
+    replay: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+    if replay_dir:
+        from adws.adw_modules.metrics_replay import load_fixtures, replay_collectors
+        replay = replay_collectors(load_fixtures(replay_dir))
+
+    results: dict[str, Any] = {}
+    written: tuple[Path, Path] | None = None
 
-    if ok_count == 0:
-        console.print("[bold red]All data sources failed. No report generated.[/]")
-        return 1
+    def on_late(result: Any) -> None:
+        nonlocal written
+        results[result.source] = result
+        console.print(f"  [cyan]LATE[/] {_source_line(result.source, result)}")
+        if written is not None:
+            written = _write_outputs(results, timestamp, period, days, output_dir, pdf=pdf)
+            console.print(f"  [green]Back-filled:[/] {written[0]}")
 
-    # --- Generate reports ---
-    console.print("[bold yellow]Generating reports...[/]")
+    # --- Collect from the registered sources in parallel ---
+    source_count = len(set(sources)) if sources else len(COLLECTOR_SOURCES)
+    console.print(f"[bold yellow]Collecting data from {source_count} sources...[/]")
+    try:
+        with replay:
+            results.update(await collect_all(
+                days, warehouse, breakers, deadline_s, on_late if backfill else None,
+                sources, skip_missing_credentials, max_parallel,
+            ))
+        if record_dir:
+            from adws.adw_modules.metrics_replay import record_fixtures
+            recorded = record_fixtures(
+                {name: r for name, r in results.items() if r.success and not r.circuit_open},
+                record_dir,
+            )
+            console.print(f"  [cyan]Recorded {len(recorded)} fixture(s) to {record_dir}[/]")
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    md_path = output_dir / f"daily-metrics-{date_str}-{period}.md"
-    html_path = output_dir / f"daily-metrics-{date_str}-{period}.html"
+        ok_count = 0
+        fail_count = 0
+        for name, result in results.items():
+            if result.success:
+                ok_count += 1
+            else:
+                fail_count += 1
+            console.print(f"  {_source_line(name, result)}")
 
-    md_content = generate_markdown_report(results, timestamp, period, days)
-    md_path.write_text(md_content, encoding="utf-8")
-    console.print(f"  [green]Saved:[/] {md_path}")
+        console.print()
 
-    html_content = generate_html_report(results, timestamp, period, days)
-    html_path.write_text(html_content, encoding="utf-8")
-    console.print(f"  [green]Saved:[/] {html_path}")
+        if ok_count == 0:
+            console.print("[bold red]All data sources failed. No report generated.[/]")
+            _write_outputs(results, timestamp, period, days, output_dir, reports=False)
+            return 1
+
+        # --- Generate reports ---
+        console.print("[bold yellow]Generating reports...[/]")
+
+        written = _write_outputs(results, timestamp, period, days, output_dir, pdf=pdf)
+        md_path, html_path = written
+        console.print(f"  [green]Saved:[/] {md_path}")
+        console.print(f"  [green]Saved:[/] {html_path}")
+
+        late = await wait_for_stragglers()
+        if late:
+            console.print(f"  [green]Back-filled {late} late source(s)[/]")
+    finally:
+        await wait_for_stragglers(timeout=0)
+        await aclose_http_clients()
+        if warehouse is not None:
+            warehouse.close()
 
     duration = time.perf_counter() - start
+    ok_count = sum(1 for r in results.values() if r.success)
+    fail_count = len(results) - ok_count
 
     console.print()
     console.print(
@@ -104,6 +177,107 @@ async def execute_metrics_report(
     return 0
 
 
+def _source_line(name: str, result: Any) -> str:
+    """One console status line for a collector result."""
+    if result.circuit_open:
+        return (
+            f"[yellow]CACHED[/] {name}: circuit open, last good data from "
+            f"{result.collected_at:%Y-%m-%d %H:%M} UTC ({result.error})"
+        )
+    if result.timed_out:
+        return f"[yellow]LATE[/] {name}: {result.error}"
+    if result.skipped:
+        return f"[dim]SKIP[/] {name}: {result.error}"
+    if result.success:
+        dur = f" ({result.duration_ms:.0f}ms)" if result.duration_ms else ""
+        stored = result.data.get("warehouse")
+        if stored:
+            dur += f" [dim]fetched {stored['fetched_days']}d, {stored['stored_days']}d stored[/]"
+        return f"[green]OK[/]   {name}{dur}"
+    return f"[red]FAIL[/] {name}: {result.error}"
+
+
+def _write_outputs(
+    results: dict[str, Any],
+    timestamp: datetime,
+    period: str,
+    days: int,
+    output_dir: Path,
+    reports: bool = True,
+    pdf: bool = False,
+) -> tuple[Path, Path] | None:
+    """(Re)write the failure manifest and, unless ``reports`` is False, both reports.
+
+    With ``pdf`` the Markdown report is also rendered to PDF next to it.
+    """
+    from adws.adw_modules.fault_tolerant import write_failure_manifest
+    from adws.adw_modules.report_generator import write_pdf_report, write_reports
+
+    manifest_path = write_failure_manifest(results, timestamp.strftime("%Y-%m-%d"), output_dir)
+    if manifest_path:
+        console.print(f"  [yellow]Failure manifest:[/] {manifest_path}")
+    if not reports:
+        return None
+    written = write_reports(results, timestamp, period, days, output_dir)
+    if pdf:
+        console.print(f"  [green]Saved:[/] {write_pdf_report(written[0])}")
+    return written
+
+
+def run_daemon(
+    days: int,
+    output_dir: Path,
+    warehouse_path: Path | None,
+    restatement_days: int,
+    circuit_breaker: bool,
+    deadline_s: float | None,
+    schedule: str,
+    host: str,
+    port: int,
+    ttl_minutes: int,
+    sources: list[str] | None = None,
+    skip_missing_credentials: bool = False,
+    max_parallel: int | None = None,
+    pdf: bool = False,
+) -> None:
+    """Run the scheduled report daemon with its local HTTP endpoint."""
+    from datetime import timedelta
+
+    from adws.adw_modules.fault_tolerant import BreakerStore
+    from adws.adw_modules.metrics_daemon import MetricsDaemon, parse_schedule
+    from adws.adw_modules.metrics_warehouse import MetricsWarehouse
+
+    try:
+        entries = parse_schedule(schedule)
+    except ValueError as e:
+        console.print(f"[red]{e}[/]")
+        raise typer.Exit(code=1) from e
+
+    console.print("[bold cyan]ADWS Metrics Daemon[/]")
+    console.print(f"  Lookback: {days} day(s)")
+    console.print(f"  Output:   {output_dir}")
+    if sources:
+        console.print(f"  Sources:  {', '.join(sources)}")
+    console.print(
+        "  Schedule: " + ", ".join(f"{e.at:%H:%M} {e.period}" for e in entries)
+    )
+    console.print(f"  Cache TTL: {ttl_minutes} min")
+    console.print(f"  Serving:  http://{host}:{port}/report.html")
+    console.print()
+
+    warehouse = (
+        MetricsWarehouse(warehouse_path, restatement_days=restatement_days)
+        if warehouse_path
+        else None
+    )
+    breakers = BreakerStore(output_dir / "failures") if circuit_breaker else None
+    daemon = MetricsDaemon(
+        days, output_dir, warehouse, entries, timedelta(minutes=ttl_minutes), breakers,
+        deadline_s, sources, skip_missing_credentials, max_parallel, pdf,
+    )
+    asyncio.run(daemon.serve(host, port))
+
+
 @app.command()
 def main(
     days: int = typer.Option(
@@ -119,13 +293,100 @@ def main(
         None, "--output-dir", "-o",
         help="Custom output directory (default: doc/dev/ in repo root)",
     ),
+    warehouse: bool = typer.Option(
+        True, "--warehouse/--no-warehouse",
+        help="Store daily metrics locally and fetch only missing days",
+    ),
+    warehouse_path: str = typer.Option(
+        None, "--warehouse-path",
+        help="SQLite warehouse file (default: <output-dir>/warehouse/metrics.sqlite)",
+    ),
+    restatement_days: int = typer.Option(
+        3, "--restatement-days",
+        help="Most recent days always re-fetched because sources may revise them",
+        min=1, max=30,
+    ),
+    circuit_breaker: bool = typer.Option(
+        True, "--circuit-breaker/--no-circuit-breaker",
+        help="Skip repeatedly failing sources and reuse their last good data",
+    ),
+    deadline: float = typer.Option(
+        None, "--deadline",
+        help="Overall collection deadline in seconds; report whatever finished by then",
+        min=1.0,
+    ),
+    backfill: bool = typer.Option(
+        False, "--backfill",
+        help="With --deadline: keep late sources running and rewrite the report when they finish",
+    ),
+    source: list[str] = typer.Option(
+        None, "--source", "-s",
+        help="Collect only this source (repeatable; default: all registered collectors)",
+    ),
+    skip_missing_credentials: bool = typer.Option(
+        False, "--skip-missing-credentials",
+        help="Skip sources whose credentials are not configured instead of letting them fail",
+    ),
+    max_parallel: int = typer.Option(
+        None, "--max-parallel",
+        help="Most collector groups running at once (sources sharing a client count as one)",
+        min=1,
+    ),
+    record: str = typer.Option(
+        None, "--record",
+        help="Save sanitized fixtures of successful sources to this directory",
+    ),
+    replay: str = typer.Option(
+        None, "--replay",
+        help="Collect offline from fixtures in this directory (see --record)",
+    ),
+    daemon: bool = typer.Option(
+        False, "--daemon",
+        help="Stay running: report on a schedule and serve cached reports over HTTP",
+    ),
+    schedule: str = typer.Option(
+        "07:00=morning,13:00=afternoon,19:00=evening", "--schedule",
+        help="Daemon report times (local) as HH:MM=period, comma-separated",
+    ),
+    host: str = typer.Option(
+        "127.0.0.1", "--host",
+        help="Daemon HTTP bind address",
+    ),
+    port: int = typer.Option(
+        8765, "--port",
+        help="Daemon HTTP port",
+    ),
+    ttl_minutes: int = typer.Option(
+        30, "--ttl-minutes",
+        help="Daemon: serve cached results for this long before re-collecting",
+        min=1,
+    ),
+    pdf: bool = typer.Option(
+        False, "--pdf",
+        help="Also render the Markdown report to PDF",
+    ),
 ) -> None:
-    """Collect metrics from GA4, Google Ads, Clarity, CWS, and monetization API."""
+    """Collect metrics from GA4, Google Ads, Clarity, CWS, and monetization API.
+
+    With --daemon, keeps running: writes the period reports on --schedule and
+    serves the latest cached results at /health, /results, /report.md and
+    /report.html.
+    """
     period = period.lower().strip()
     if period not in ("morning", "afternoon", "evening"):
         console.print(f"[red]Invalid period '{period}'. Use: morning, afternoon, evening[/]")
         raise typer.Exit(code=1)
 
+    if source:
+        # Imported via metrics_collectors so the collectors are registered
+        from adws.adw_modules.metrics_collectors import resolve_collectors
+
+        try:
+            resolve_collectors(source)
+        except ValueError as e:
+            console.print(f"[red]{e}[/]")
+            raise typer.Exit(code=1) from e
+
     if output_dir:
         out_path = Path(output_dir)
     else:
@@ -133,7 +394,31 @@ def main(
         repo_root = Path(__file__).parent.parent.parent
         out_path = repo_root / "doc" / "dev"
 
-    exit_code = asyncio.run(execute_metrics_report(days, period, out_path))
+    store_path: Path | None = None
+    if warehouse:
+        from adws.adw_modules.metrics_warehouse import default_warehouse_path
+        store_path = Path(warehouse_path) if warehouse_path else default_warehouse_path(out_path)
+
+    if daemon:
+        for flag, value in (("--backfill", backfill), ("--record", record), ("--replay", replay)):
+            if value:
+                raise typer.BadParameter(
+                    f"{flag} cannot be combined with --daemon", param_hint="--daemon"
+                )
+        run_daemon(
+            days, out_path, store_path, restatement_days, circuit_breaker, deadline,
+            schedule, host, port, ttl_minutes, source or None, skip_missing_credentials,
+            max_parallel, pdf,
+        )
+        return
+
+    exit_code = asyncio.run(
+        execute_metrics_report(
+            days, period, out_path, store_path, restatement_days, circuit_breaker,
+            deadline, backfill, source or None, skip_missing_credentials, max_parallel,
+            Path(record) if record else None, Path(replay) if replay else None, pdf,
+        )
+    )
     raise typer.Exit(code=exit_code)
 
 
@@ -18,6 +18,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from adws.adw_modules.git_async import GitResult, command_log
 from adws.adw_modules.state import StateManager
 from adws.adw_modules.trinity_protocol import TrinityPlan
 from adws.scripts.adw_build_iso import (
@@ -154,6 +155,19 @@ class TestSaveBuildLog:
         assert path.exists()
         assert (temp_workspace / "agents" / "newid123").is_dir()
 
+    def test_save_records_phase_git_commands(self, temp_workspace: Path) -> None:
+        """Test that the phase's git command durations land in the log."""
+        command_log.clear()
+        command_log.record(GitResult(["git", "add", "-A"], 0, "", "", 12.34))
+        log = BuildLog(adw_id="gitlog01", issue_number=7)
+        path = save_build_log(log, agents_base=temp_workspace / "agents")
+
+        data = json.loads(path.read_text())
+        assert data["git_commands"] == [
+            {"command": "git add -A", "duration_ms": 12.3, "returncode": 0}
+        ]
+        command_log.clear()
+
 
 class TestGenerateFileContent:
     """Tests for generate_file_content function (mocked provider)."""
@@ -237,7 +251,7 @@ class TestGenerateFileContent:
 class TestGitAddCommit:
     """Tests for git_add_commit function."""
 
-    def test_git_commit_in_worktree(self, temp_workspace: Path) -> None:
+    async def test_git_commit_in_worktree(self, temp_workspace: Path) -> None:
         """Test git add and commit in a worktree (requires git init)."""
         import subprocess
 
@@ -259,10 +273,13 @@ class TestGitAddCommit:
         # Create a file to commit
         (temp_workspace / "test.txt").write_text("test content")
 
-        sha = git_add_commit(temp_workspace, "test commit")
+        sha = await git_add_commit(temp_workspace, "test commit")
         assert sha is not None
         assert len(sha) >= 7  # Short SHA is at least 7 chars
 
+        # Second commit with no changes reports nothing to commit
+        assert await git_add_commit(temp_workspace, "empty commit") is None
+
 
 class TestPrerequisiteEnforcement:
     """Tests for build phase prerequisite enforcement."""
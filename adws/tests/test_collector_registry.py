@@ -0,0 +1,113 @@
+"""Tests for the pluggable collector registry and registry-driven reports."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from adws.adw_modules import collector_registry
+from adws.adw_modules.collector_registry import (
+    register_collector,
+    registered_collectors,
+    resolve_collectors,
+    schedule_groups,
+)
+from adws.adw_modules.fault_tolerant import SourceConfig
+from adws.adw_modules.metrics_collectors import COLLECTOR_SOURCES, CollectorResult
+from adws.adw_modules.report_generator import generate_html_report, generate_markdown_report
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> dict[str, SourceConfig]:
+    """Isolated copy of the registry; returns the CONFIGS dict it publishes to."""
+    configs: dict[str, SourceConfig] = {}
+    monkeypatch.setattr(collector_registry, "_REGISTRY", dict(collector_registry._REGISTRY))
+    monkeypatch.setattr(collector_registry, "CONFIGS", configs)
+    return configs
+
+
+class TestRegistration:
+    def test_builtin_collectors_registered_in_order(self) -> None:
+        specs = registered_collectors()
+        assert tuple(s.source_id for s in specs) == COLLECTOR_SOURCES
+        ga4 = collector_registry.get_collector("ga4_traffic")
+        assert ga4.credentials == ("ga4",) and ga4.config.timeout_s == 60.0
+
+    def test_decorator_registers_and_publishes_config(
+        self, registry: dict[str, SourceConfig]
+    ) -> None:
+        config = SourceConfig(source_id="stripe", timeout_s=5.0)
+
+        @register_collector("stripe", config=config, credentials=("stripe",), clients=("http",))
+        async def collect_stripe(days: int = 1) -> CollectorResult:
+            return CollectorResult(source="stripe", data={"days": days})
+
+        spec = collector_registry.get_collector("stripe")
+        assert spec.collect is collect_stripe
+        assert registered_collectors()[-1] is spec
+        assert registry == {"stripe": config}
+
+    def test_duplicate_and_mismatched_ids_rejected(
+        self, registry: dict[str, SourceConfig]
+    ) -> None:
+        async def collect() -> CollectorResult:
+            return CollectorResult(source="clarity")
+
+        with pytest.raises(ValueError, match="already registered"):
+            register_collector("clarity")(collect)
+        with pytest.raises(ValueError, match="does not match"):
+            register_collector("other", config=SourceConfig(source_id="clarity"))
+
+    async def test_factory_passes_only_accepted_arguments(
+        self, registry: dict[str, SourceConfig]
+    ) -> None:
+        seen: dict[str, Any] = {}
+
+        @register_collector("days_only")
+        async def collect(days: int = 1) -> CollectorResult:
+            seen["days"] = days
+            return CollectorResult(source="days_only")
+
+        await collector_registry.get_collector("days_only").factory(30, warehouse=object())()
+        assert seen == {"days": 30}
+
+    def test_resolve_rejects_unknown(self) -> None:
+        assert [s.source_id for s in resolve_collectors(["cws", "clarity"])] == ["clarity", "cws"]
+        with pytest.raises(ValueError, match="Registered: ga4_traffic"):
+            resolve_collectors(["nope"])
+
+    def test_sources_sharing_a_client_grouped(self) -> None:
+        groups = [[s.source_id for s in g] for g in schedule_groups(registered_collectors())]
+        assert ["ga4_traffic", "ga4_funnel"] in groups
+        assert ["clarity", "monetization"] in groups
+        assert sum(len(g) for g in groups) == len(COLLECTOR_SOURCES)
+
+
+class TestReportSections:
+    NOW = datetime(2026, 3, 2, 7, 0, tzinfo=UTC)
+
+    def test_report_covers_only_collected_sources(self) -> None:
+        results = {
+            "clarity": CollectorResult(source="clarity", data={"vitals": {"lcp_ms": 1800}}),
+            "cws": CollectorResult(source="cws", success=False, skipped=True, error="Skipped"),
+        }
+        md = generate_markdown_report(results, self.NOW, "morning", 1)
+
+        assert "## 1) Core Web Vitals & UX (Clarity)" in md
+        assert "## 2) Chrome Web Store" in md
+        assert "SKIPPED (Skipped)" in md
+        assert "Traffic Overview" not in md and "Guardrail Check" not in md
+
+    def test_unknown_source_gets_generic_section(self) -> None:
+        results = {
+            "monetization": CollectorResult(source="monetization", data={"totals": {}}),
+            "stripe": CollectorResult(source="stripe", data={"mrr_usd": 120.5, "raw": {}}),
+        }
+        md = generate_markdown_report(results, self.NOW, "evening", 1)
+        html = generate_html_report(results, self.NOW, "evening", 1)
+
+        assert "## 2) stripe" in md and "| mrr_usd | 120.5 |" in md
+        assert "## 3) Guardrail Check" in md
+        assert "<h2>stripe</h2>" in html and "<td>120.5</td>" in html
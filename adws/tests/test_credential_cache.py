@@ -0,0 +1,218 @@
+"""Tests for the process-wide collector client cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import grpc
+import httpx
+import pytest
+from google.api_core.exceptions import PermissionDenied, Unauthenticated
+from google.auth.exceptions import RefreshError
+
+from adw_modules import credentials
+
+
+class FakeCreds:
+    """google-auth style credentials with a controllable expiry."""
+
+    def __init__(self, expiry: datetime | None, token: str = "token") -> None:
+        self.token = token
+        self.expiry = expiry
+        self.refresh_token = "refresh-token"
+        self.refresh_calls = 0
+
+    @property
+    def expired(self) -> bool:
+        return self.expiry is not None and self.expiry <= datetime.now(UTC).replace(tzinfo=None)
+
+    def refresh(self, _request: object) -> None:
+        self.refresh_calls += 1
+        self.token = f"token-{self.refresh_calls}"
+        self.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+
+class FakeRpcError(grpc.RpcError):
+    """grpc.RpcError with a fixed status code."""
+
+    def __init__(self, status: grpc.StatusCode) -> None:
+        super().__init__(f"status {status.value[0]}")
+        self._status = status
+
+    def code(self) -> grpc.StatusCode:
+        return self._status
+
+
+class FakeAdsException(Exception):
+    """GoogleAdsException-style wrapper around the failed gRPC call."""
+
+    def __init__(self, error: grpc.RpcError) -> None:
+        super().__init__("Google Ads request failed")
+        self.error = error
+
+
+class CapturingClient:
+    def __init__(self, credentials: object) -> None:
+        self.credentials = credentials
+
+
+def naive_utc_in(delta: timedelta) -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None) + delta
+
+
+@pytest.fixture(autouse=True)
+def empty_client_cache() -> Iterator[None]:
+    credentials.clear_client_cache()
+    yield
+    credentials.clear_client_cache()
+
+
+class TestClientCache:
+    def test_builds_once_per_key(self) -> None:
+        cache = credentials.ClientCache()
+        builds: list[int] = []
+
+        def build() -> tuple[object, None, None]:
+            builds.append(1)
+            return object(), None, None
+
+        first = cache.get("a", build)
+        assert cache.get("a", build) is first
+        assert cache.get("b", build) is not first
+        assert len(builds) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_fresh_token_not_refreshed(self) -> None:
+        cache = credentials.ClientCache()
+        creds = FakeCreds(naive_utc_in(timedelta(hours=1)))
+        cache.get("k", lambda: (object(), creds, None))
+        cache.get("k", lambda: pytest.fail("rebuilt"))
+        assert creds.refresh_calls == 0
+
+    def test_token_near_expiry_refreshed_in_place(self) -> None:
+        cache = credentials.ClientCache(refresh_margin=timedelta(minutes=5))
+        creds = FakeCreds(naive_utc_in(timedelta(minutes=2)))
+        persisted: list[str] = []
+        client = cache.get("k", lambda: (object(), creds, lambda c: persisted.append(c.token)))
+
+        assert cache.get("k", lambda: pytest.fail("rebuilt")) is client
+        assert creds.refresh_calls == 1
+        assert persisted == ["token-1"]
+        assert cache.refreshes == 1
+
+        cache.get("k", lambda: pytest.fail("rebuilt"))
+        assert creds.refresh_calls == 1
+
+    def test_unused_credentials_left_to_client(self) -> None:
+        """Service-account creds have no token until the client's first request."""
+        cache = credentials.ClientCache()
+        creds = FakeCreds(None, token="")
+        cache.get("k", lambda: (object(), creds, None))
+        cache.get("k", lambda: pytest.fail("rebuilt"))
+        assert creds.refresh_calls == 0
+
+    def test_invalidate_forces_rebuild(self) -> None:
+        cache = credentials.ClientCache()
+        first = cache.get("k", lambda: (object(), None, None))
+        cache.invalidate("k")
+        assert cache.get("k", lambda: (object(), None, None)) is not first
+
+
+class TestGa4ClientCache:
+    def test_ga4_client_loads_credentials_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        loads: list[FakeCreds] = []
+
+        def fake_build() -> FakeCreds:
+            creds = FakeCreds(naive_utc_in(timedelta(hours=1)))
+            loads.append(creds)
+            return creds
+
+        monkeypatch.setattr(credentials, "_build_ga4_credentials", fake_build)
+
+        first = credentials.ga4_client(CapturingClient)
+        second = credentials.ga4_client(CapturingClient)
+
+        assert first is second
+        assert len(loads) == 1
+        assert first.credentials is loads[0]
+
+    def test_ga4_and_cws_clients_are_separate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(credentials, "_build_ga4_credentials", lambda: FakeCreds(None))
+        monkeypatch.setattr(credentials, "_build_cws_credentials", lambda: FakeCreds(None))
+        assert credentials.ga4_client(CapturingClient) is not credentials.cws_ga4_client(
+            CapturingClient
+        )
+
+    def test_auth_error_drops_cached_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(credentials, "_build_ga4_credentials", lambda: FakeCreds(None))
+        first = credentials.ga4_client(CapturingClient)
+
+        assert not credentials.invalidate_on_auth_error(
+            "ga4", RuntimeError("deadline exceeded")
+        )
+        assert credentials.ga4_client(CapturingClient) is first
+
+        assert credentials.invalidate_on_auth_error(
+            "ga4", PermissionDenied("caller does not have permission")
+        )
+        assert credentials.ga4_client(CapturingClient) is not first
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            Unauthenticated("request had invalid credentials"),
+            RefreshError("invalid_grant: Token has been expired or revoked."),
+            httpx.HTTPStatusError(
+                "unauthorized",
+                request=httpx.Request("GET", "https://example.com"),
+                response=httpx.Response(401),
+            ),
+            FakeRpcError(grpc.StatusCode.UNAUTHENTICATED),
+            FakeAdsException(FakeRpcError(grpc.StatusCode.PERMISSION_DENIED)),
+        ],
+    )
+    def test_auth_errors_detected_by_type_or_status(self, exc: Exception) -> None:
+        assert credentials.is_auth_error(exc)
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            RuntimeError("Report returned 401 rows for property 403123"),
+            ValueError("HTTP 403 in the message is not a status code"),
+            httpx.HTTPStatusError(
+                "server error",
+                request=httpx.Request("GET", "https://example.com"),
+                response=httpx.Response(503),
+            ),
+            FakeRpcError(grpc.StatusCode.UNAVAILABLE),
+        ],
+    )
+    def test_numbers_in_message_are_not_auth_errors(self, exc: Exception) -> None:
+        assert not credentials.is_auth_error(exc)
+
+    def test_async_client_cached_per_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        loads: list[FakeCreds] = []
+
+        def fake_build() -> FakeCreds:
+            loads.append(FakeCreds(None))
+            return loads[-1]
+
+        monkeypatch.setattr(credentials, "_build_ga4_credentials", fake_build)
+
+        async def get_twice() -> tuple[object, object]:
+            return (
+                credentials.ga4_async_client(CapturingClient),
+                credentials.ga4_async_client(CapturingClient),
+            )
+
+        first_a, first_b = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        assert first_a is first_b
+        assert second is not first_a
+        assert second.credentials is first_a.credentials
+        assert len(loads) == 1
+        # The client bound to the first (closed) loop was evicted
+        assert len(credentials.get_client_cache()) == 1
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -67,6 +68,14 @@ class CapturingClient:
         self.credentials = credentials
 
 
+@pytest.fixture(autouse=True)
+def empty_client_cache() -> Iterator[None]:
+    """Each test builds its clients from scratch."""
+    credentials.clear_client_cache()
+    yield
+    credentials.clear_client_cache()
+
+
 @pytest.fixture
 def fake_keyring(monkeypatch: pytest.MonkeyPatch) -> FakeKeyring:
     """Patch the credential module to use an in-memory keyring."""
@@ -0,0 +1,255 @@
+"""Tests for collector retry policy, circuit breaker and failure manifest."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from adws.adw_modules import fault_tolerant
+from adws.adw_modules.fault_tolerant import (
+    BreakerState,
+    BreakerStore,
+    SourceConfig,
+    backoff_delay,
+    retry_after_seconds,
+    run_with_resilience,
+    write_failure_manifest,
+)
+from adws.adw_modules.metrics_collectors import CollectorResult
+from adws.adw_modules.report_generator import generate_markdown_report
+
+
+def http_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.test/api")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+def config(**overrides: object) -> SourceConfig:
+    values: dict[str, object] = {
+        "source_id": "clarity", "timeout_s": 5.0, "max_retries": 2,
+        "failure_threshold": 2, "cooldown_s": 600.0,
+    }
+    values.update(overrides)
+    return SourceConfig(**values)
+
+
+class Collector:
+    """Scripted collector: each call pops the next outcome."""
+
+    def __init__(self, *outcomes: CollectorResult | Exception) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self) -> CollectorResult:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def ok(value: int = 1) -> CollectorResult:
+    return CollectorResult(source="clarity", data={"value": value})
+
+
+def failed() -> CollectorResult:
+    return CollectorResult(source="clarity", success=False, error="token revoked")
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(fault_tolerant.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def breakers(temp_workspace: Path) -> BreakerStore:
+    return BreakerStore(temp_workspace / "failures")
+
+
+class TestBackoff:
+    def test_retry_after_seconds_and_http_date(self) -> None:
+        assert retry_after_seconds(http_error(429, {"Retry-After": "7"})) == 7.0
+        future = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= retry_after_seconds(http_error(503, {"Retry-After": future})) <= 30
+        assert retry_after_seconds(http_error(429)) is None
+        assert retry_after_seconds(RuntimeError("no response")) is None
+
+    def test_full_jitter_is_capped(self) -> None:
+        cfg = config(backoff_base_s=1.0, backoff_max_s=3.0)
+        delays = [backoff_delay(cfg, attempt=5, exc=TimeoutError()) for _ in range(200)]
+        assert all(0 <= d <= 3.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_beyond_cap_gives_up(self) -> None:
+        cfg = config(backoff_max_s=10.0)
+        assert backoff_delay(cfg, 0, http_error(429, {"Retry-After": "5"})) == 5.0
+        assert backoff_delay(cfg, 0, http_error(429, {"Retry-After": "60"})) is None
+
+
+class TestRetries:
+    async def test_429_retried_after_requested_delay(self, sleeps: list[float]) -> None:
+        collector = Collector(http_error(429, {"Retry-After": "2"}), ok())
+        result = await run_with_resilience(config(), collector)
+
+        assert result.success and result.attempts == 2
+        assert sleeps == [2.0]
+
+    async def test_non_retryable_status_fails_immediately(self, sleeps: list[float]) -> None:
+        collector = Collector(http_error(401))
+        result = await run_with_resilience(config(), collector)
+
+        assert not result.success
+        assert result.error.startswith("HTTP 401")
+        assert collector.calls == 1 and sleeps == []
+
+    async def test_connection_errors_are_retried(self, sleeps: list[float]) -> None:
+        collector = Collector(httpx.ConnectError("refused"), ok())
+        result = await run_with_resilience(config(), collector)
+        assert result.success and collector.calls == 2
+
+
+class TestCircuitBreaker:
+    async def test_opens_after_threshold_and_serves_last_good(
+        self, breakers: BreakerStore
+    ) -> None:
+        cfg = config()
+        await run_with_resilience(cfg, Collector(ok(42)), breakers)
+        await run_with_resilience(cfg, Collector(failed()), breakers)
+        assert not breakers.get("clarity").is_open(cfg)
+        await run_with_resilience(cfg, Collector(failed()), breakers)
+        assert breakers.get("clarity").is_open(cfg)
+
+        skipped = Collector()
+        result = await run_with_resilience(cfg, skipped, breakers)
+
+        assert skipped.calls == 0
+        assert result.success and result.circuit_open
+        assert result.data == {"value": 42}
+        assert result.error == "token revoked"
+
+    async def test_open_without_last_good_fails_fast(self, breakers: BreakerStore) -> None:
+        cfg = config(failure_threshold=1)
+        await run_with_resilience(cfg, Collector(failed()), breakers)
+        result = await run_with_resilience(cfg, Collector(), breakers)
+        assert not result.success
+        assert "Circuit open" in result.error
+
+    async def test_last_good_only_served_for_same_window(self, breakers: BreakerStore) -> None:
+        cfg = config(failure_threshold=1)
+        await run_with_resilience(cfg, Collector(ok(7)), breakers, days=7)
+        await run_with_resilience(cfg, Collector(failed()), breakers, days=90)
+
+        result = await run_with_resilience(cfg, Collector(), breakers, days=90)
+        assert not result.success
+        assert "Circuit open" in result.error
+
+        result = await run_with_resilience(cfg, Collector(), breakers, days=7)
+        assert result.success and result.circuit_open
+        assert result.data == {"value": 7}
+
+    async def test_state_persists_across_runs(self, temp_workspace: Path) -> None:
+        cfg = config(failure_threshold=1)
+        directory = temp_workspace / "failures"
+        await run_with_resilience(cfg, Collector(ok()), BreakerStore(directory))
+        await run_with_resilience(cfg, Collector(failed()), BreakerStore(directory))
+
+        reloaded = BreakerStore(directory)
+        assert reloaded.get("clarity").is_open(cfg)
+        assert reloaded.last_good("clarity").data == {"value": 1}
+        saved = json.loads((directory / "breakers.json").read_text())
+        assert saved["sources"]["clarity"]["consecutive_failures"] == 1
+
+    async def test_half_open_trial_closes_or_reopens(
+        self, breakers: BreakerStore, sleeps: list[float]
+    ) -> None:
+        cfg = config(failure_threshold=1)
+        await run_with_resilience(cfg, Collector(failed()), breakers)
+        state = breakers.get("clarity")
+        state.opened_at = (datetime.now(UTC) - timedelta(seconds=601)).isoformat()
+
+        # One trial, no retries, failure re-opens immediately
+        trial = Collector(TimeoutError(), ok())
+        await run_with_resilience(cfg, trial, breakers)
+        assert trial.calls == 1 and sleeps == []
+        assert state.is_open(cfg)
+
+        state.opened_at = (datetime.now(UTC) - timedelta(seconds=601)).isoformat()
+        result = await run_with_resilience(cfg, Collector(ok()), breakers)
+        assert result.success and not result.circuit_open
+        assert state.opened_at is None and state.consecutive_failures == 0
+
+
+class TestAdaptiveTimeout:
+    def test_static_until_enough_samples(self) -> None:
+        state = BreakerState("clarity", latencies_ms={"default": [100.0] * 4})
+        assert state.timeout_s(config(timeout_s=30.0)) == 30.0
+
+    def test_p95_with_headroom_within_bounds(self) -> None:
+        cfg = config(timeout_s=30.0, min_timeout_s=2.0)
+        state = BreakerState("clarity", latencies_ms={"default": [1000.0] * 19 + [2000.0]})
+        assert state.p95_ms() == 1000.0
+        assert state.timeout_s(cfg) == 3.0
+
+        assert BreakerState("c", latencies_ms={"default": [10.0] * 10}).timeout_s(cfg) == 2.0
+        assert BreakerState("c", latencies_ms={"default": [60_000.0] * 10}).timeout_s(cfg) == 30.0
+
+    async def test_latency_window_recorded(self, breakers: BreakerStore) -> None:
+        for _ in range(25):
+            await run_with_resilience(config(), Collector(ok()), breakers)
+        assert (
+            len(breakers.get("clarity").latencies_ms["default"]) == fault_tolerant.LATENCY_WINDOW
+        )
+
+    async def test_short_window_latency_does_not_cap_long_window(
+        self, breakers: BreakerStore
+    ) -> None:
+        cfg = config(timeout_s=5.0, min_timeout_s=0.05, max_retries=0)
+        for _ in range(10):
+            await run_with_resilience(cfg, Collector(ok()), breakers, days=1)
+        state = breakers.get("clarity")
+        assert state.timeout_s(cfg, days=1) == 0.05
+        assert state.timeout_s(cfg, days=90) == 5.0
+
+        async def slow_collect() -> CollectorResult:
+            await asyncio.sleep(0.2)
+            return ok()
+
+        result = await run_with_resilience(cfg, slow_collect, breakers, days=90)
+        assert result.success
+        assert len(state.latencies_ms["1d"]) == 10
+        assert len(state.latencies_ms["90d"]) == 1
+
+    def test_state_saved_before_windowing_loads(self) -> None:
+        assert BreakerState("c", latencies_ms=[100.0] * 10).latencies_ms == {}
+
+
+class TestReporting:
+    def test_manifest_and_report_flag_cached_sources(self, temp_workspace: Path) -> None:
+        cached = CollectorResult(
+            source="monetization",
+            collected_at=datetime(2026, 3, 1, 7, 0, tzinfo=UTC),
+            data={"totals": {"total_revenue_usd": 5.0}, "channels": []},
+            circuit_open=True,
+            error="HTTP 503",
+        )
+        results = {"monetization": cached}
+
+        manifest = write_failure_manifest(results, "2026-03-02", temp_workspace)
+        entry = json.loads(manifest.read_text())["failures"][0]
+        assert entry["circuit_open"] is True
+
+        report = generate_markdown_report(results, datetime.now(UTC), "morning", 1)
+        assert "CACHED (circuit open, data from 2026-03-01 07:00 UTC" in report
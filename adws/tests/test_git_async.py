@@ -0,0 +1,118 @@
+"""
+Tests for ADWS Async Git Module.
+
+Tests cover:
+- run_git output capture, check semantics and timeouts
+- Per-command duration logging
+- commit_all SHA parsing, path staging and nothing-to-commit handling
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adws.adw_modules.git_async import command_log, commit_all, run_git
+
+
+@pytest.fixture
+def git_repo(temp_workspace: Path) -> Path:
+    """Initialize a git repository with one commit."""
+    repo = temp_workspace / "repo"
+    repo.mkdir()
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "config", "user.email", "test@example.com"],
+        ["git", "config", "user.name", "Test"],
+    ):
+        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+    (repo / "README.md").write_text("# test\n")
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-q", "-m", "initial"], cwd=repo, check=True, capture_output=True
+    )
+    return repo
+
+
+def head_sha(repo: Path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestRunGit:
+    """Tests for run_git."""
+
+    async def test_captures_output(self, git_repo: Path) -> None:
+        result = await run_git("rev-parse", "--short", "HEAD", cwd=git_repo)
+        assert result.returncode == 0
+        assert result.stdout.strip() == head_sha(git_repo)
+        assert result.duration_ms >= 0
+
+    async def test_failure_without_check_returns_result(self, git_repo: Path) -> None:
+        result = await run_git("rev-parse", "no-such-ref", cwd=git_repo)
+        assert result.returncode != 0
+        assert result.stderr
+
+    async def test_check_raises_called_process_error(self, git_repo: Path) -> None:
+        with pytest.raises(subprocess.CalledProcessError):
+            await run_git("rev-parse", "no-such-ref", cwd=git_repo, check=True)
+
+    async def test_timeout_raises_timeout_expired(
+        self, git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # An editor that never exits keeps `git commit` (no -m) hanging
+        monkeypatch.setenv("GIT_EDITOR", "sleep 30; true")
+        (git_repo / "new.txt").write_text("x")
+        await run_git("add", "-A", cwd=git_repo, check=True)
+        with pytest.raises(subprocess.TimeoutExpired):
+            await run_git("commit", cwd=git_repo, timeout=0.5)
+
+    async def test_commands_recorded_in_log(self, git_repo: Path) -> None:
+        command_log.clear()
+        await run_git("status", "--porcelain", cwd=git_repo)
+        await run_git("rev-parse", "HEAD", cwd=git_repo)
+        rows = command_log.summary()
+        assert [row["command"] for row in rows] == [
+            "git status --porcelain",
+            "git rev-parse HEAD",
+        ]
+        assert command_log.total_ms() > 0
+
+
+class TestCommitAll:
+    """Tests for commit_all."""
+
+    async def test_returns_sha_of_new_commit(self, git_repo: Path) -> None:
+        (git_repo / "feature.py").write_text("x = 1\n")
+        sha = await commit_all(git_repo, "feat: add feature")
+        assert sha is not None
+        assert head_sha(git_repo).startswith(sha) or sha.startswith(head_sha(git_repo))
+
+    async def test_uses_two_git_processes(self, git_repo: Path) -> None:
+        (git_repo / "feature.py").write_text("x = 1\n")
+        command_log.clear()
+        await commit_all(git_repo, "feat: add feature")
+        assert [r.args[1] for r in command_log.results] == ["add", "commit"]
+
+    async def test_nothing_to_commit_returns_none(self, git_repo: Path) -> None:
+        assert await commit_all(git_repo, "chore: nothing") is None
+
+    async def test_stages_only_given_paths(self, git_repo: Path) -> None:
+        (git_repo / "fixed.py").write_text("fixed\n")
+        (git_repo / "other.py").write_text("untracked\n")
+        sha = await commit_all(git_repo, "fix: one file", paths=["fixed.py"])
+        assert sha is not None
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "other.py" in status
+        assert "fixed.py" not in status
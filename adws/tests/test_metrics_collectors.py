@@ -0,0 +1,490 @@
+"""Tests for metrics collectors with fake API clients (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from google.analytics.data_v1beta.types import (
+    BatchRunReportsResponse,
+    DimensionValue,
+    MetricValue,
+    Row,
+    RunReportResponse,
+)
+
+from adws.adw_modules import collector_registry, credentials, metrics_collectors
+from adws.adw_modules.metrics_collectors import (
+    collect_ga4_funnel,
+    collect_ga4_traffic,
+    collect_google_ads,
+    fetch_ga4_reports,
+    stream_ads_totals,
+)
+from adws.adw_modules.metrics_warehouse import MetricsWarehouse
+
+
+def report(*rows: tuple[list[str], list[str]]) -> RunReportResponse:
+    return RunReportResponse(
+        rows=[
+            Row(
+                dimension_values=[DimensionValue(value=d) for d in dims],
+                metric_values=[MetricValue(value=m) for m in metrics],
+            )
+            for dims, metrics in rows
+        ]
+    )
+
+
+GA4_REPORTS = [
+    report(([], ["120", "80", "40", "90", "65.5", "300", "0.25"])),
+    report((["Organic Search"], ["70", "50", "0.2", "80.0"]), (["Direct"], ["50", "40", "0.3", "50.0"])),
+    report((["desktop"], ["100", "0.2", "70.0"]), (["mobile"], ["20", "0.5", "30.0"])),
+    report((["United States"], ["60"]), (["Germany"], ["20"])),
+    report((["pricing_view"], ["12"]), (["checkout_start"], ["3"])),
+]
+
+
+class FakeGa4AsyncClient:
+    """Records batch calls and answers with canned reports after a delay."""
+
+    def __init__(self, delay_s: float = 0.01) -> None:
+        self.delay_s = delay_s
+        self.batch_calls: list[Any] = []
+
+    async def batch_run_reports(self, request: Any) -> BatchRunReportsResponse:
+        self.batch_calls.append(request)
+        await asyncio.sleep(self.delay_s)
+        if request.requests[0].dimensions and request.requests[0].dimensions[0].name == "date":
+            return BatchRunReportsResponse(reports=daily_reports(request))
+        if len(request.requests) == 2:
+            return BatchRunReportsResponse(reports=GA4_USER_REPORTS)
+        return BatchRunReportsResponse(reports=GA4_REPORTS)
+
+
+# Distinct users over the whole window (fewer than the sum of daily users)
+GA4_USER_REPORTS = [
+    report(([], ["12", "4"])),
+    report((["United States"], ["9"]), (["Germany"], ["3"])),
+]
+
+
+def daily_reports(request: Any) -> list[RunReportResponse]:
+    """Same numbers every day: 10 sessions, 2 pricing views."""
+    date_range = request.requests[0].date_ranges[0]
+    start = date.fromisoformat(date_range.start_date)
+    end = date.fromisoformat(date_range.end_date)
+    days = [
+        (start + timedelta(days=i)).strftime("%Y%m%d")
+        for i in range((end - start).days + 1)
+    ]
+    return [
+        report(*(([d], ["10", "5", "1", "8", "60", "30", "0.5"]) for d in days)),
+        report(*(([d, "Direct"], ["10", "8", "0.5", "60"]) for d in days)),
+        report(*(([d, "desktop"], ["10", "0.5", "60"]) for d in days)),
+        report(*(([d, "pricing_view"], ["2"]) for d in days)),
+    ]
+
+
+@pytest.fixture
+def fake_ga4(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeGa4AsyncClient]:
+    client = FakeGa4AsyncClient()
+    monkeypatch.setattr(credentials, "ga4_async_client", lambda _cls: client)
+    monkeypatch.setattr(metrics_collectors, "_load_env", lambda: None)
+    monkeypatch.setenv("GA4_PROPERTY_ID", "123")
+    yield client
+    credentials.clear_client_cache()
+
+
+class TestGa4BatchFetch:
+    async def test_traffic_and_funnel_share_one_batch_call(
+        self, fake_ga4: FakeGa4AsyncClient
+    ) -> None:
+        traffic, funnel = await asyncio.gather(
+            collect_ga4_traffic(7), collect_ga4_funnel(7)
+        )
+
+        assert traffic.success and funnel.success
+        assert len(fake_ga4.batch_calls) == 1
+        request = fake_ga4.batch_calls[0]
+        assert request.property == "properties/123"
+        assert len(request.requests) == 5
+
+    async def test_reports_parsed(self, fake_ga4: FakeGa4AsyncClient) -> None:
+        traffic = await collect_ga4_traffic(1)
+        funnel = await collect_ga4_funnel(1)
+
+        assert traffic.data["traffic"]["sessions"] == 120
+        assert traffic.data["traffic"]["bounce_rate"] == 0.25
+        assert [c["channel"] for c in traffic.data["channels"]] == ["Organic Search", "Direct"]
+        assert traffic.data["countries"][0] == {
+            "country": "United States", "users": 60, "user_share_pct": 75.0,
+        }
+        counts = {e["event_name"]: e["count"] for e in funnel.data["events"]}
+        assert counts["pricing_view"] == 12
+        assert counts["trial_start"] == 0
+        # Sequential calls each make their own round-trip
+        assert len(fake_ga4.batch_calls) == 2
+
+    async def test_timed_out_waiter_does_not_cancel_shared_fetch(
+        self, fake_ga4: FakeGa4AsyncClient
+    ) -> None:
+        fake_ga4.delay_s = 0.05
+        impatient = asyncio.wait_for(fetch_ga4_reports(1), timeout=0.001)
+        patient = fetch_ga4_reports(1)
+        results = await asyncio.gather(impatient, patient, return_exceptions=True)
+
+        assert isinstance(results[0], TimeoutError)
+        assert set(results[1]) == {"overview", "channel", "device", "country", "funnel"}
+        assert len(fake_ga4.batch_calls) == 1
+
+    async def test_batch_failure_reported_by_both_collectors(
+        self, fake_ga4: FakeGa4AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def failing(request: Any) -> None:
+            raise RuntimeError("quota exhausted")
+
+        monkeypatch.setattr(fake_ga4, "batch_run_reports", failing)
+        traffic, funnel = await asyncio.gather(
+            collect_ga4_traffic(1), collect_ga4_funnel(1)
+        )
+        assert traffic.error == funnel.error == "quota exhausted"
+
+
+@pytest.fixture
+def warehouse(temp_workspace: Path) -> MetricsWarehouse:
+    store = MetricsWarehouse(temp_workspace / "metrics.sqlite", restatement_days=3)
+    yield store
+    store.close()
+
+
+def fetched_range(request: Any) -> tuple[str, str]:
+    date_range = request.requests[0].date_ranges[0]
+    return date_range.start_date, date_range.end_date
+
+
+def daily_calls(client: FakeGa4AsyncClient) -> list[Any]:
+    return [
+        r for r in client.batch_calls
+        if r.requests[0].dimensions and r.requests[0].dimensions[0].name == "date"
+    ]
+
+
+class TestGa4Warehouse:
+    async def test_first_run_fetches_window_then_only_restatement(
+        self, fake_ga4: FakeGa4AsyncClient, warehouse: MetricsWarehouse
+    ) -> None:
+        traffic, funnel = await asyncio.gather(
+            collect_ga4_traffic(7, warehouse), collect_ga4_funnel(7, warehouse)
+        )
+        # One per-date batch shared by both collectors, plus the window users
+        assert len(fake_ga4.batch_calls) == 2
+        assert len(daily_calls(fake_ga4)) == 1
+        assert traffic.data["warehouse"]["fetched_days"] == 8
+        assert traffic.data["traffic"]["sessions"] == 80
+        assert traffic.data["traffic"]["bounce_rate"] == pytest.approx(0.5)
+        assert traffic.data["channels"][0]["avg_duration_seconds"] == pytest.approx(60)
+        assert traffic.data["countries"][0]["user_share_pct"] == 75.0
+        counts = {e["event_name"]: e["count"] for e in funnel.data["events"]}
+        assert counts["pricing_view"] == 16
+
+        traffic, funnel = await asyncio.gather(
+            collect_ga4_traffic(7, warehouse), collect_ga4_funnel(7, warehouse)
+        )
+        assert len(daily_calls(fake_ga4)) == 2
+        start, end = fetched_range(daily_calls(fake_ga4)[1])
+        assert (date.fromisoformat(end) - date.fromisoformat(start)).days == 2
+        assert traffic.data["warehouse"]["fetched_days"] == 3
+        assert traffic.data["warehouse"]["stored_days"] == 8
+        assert traffic.data["traffic"]["sessions"] == 80
+
+    async def test_users_are_window_distinct_counts_not_daily_sums(
+        self, fake_ga4: FakeGa4AsyncClient, warehouse: MetricsWarehouse
+    ) -> None:
+        live = await collect_ga4_traffic(7)
+        await collect_ga4_traffic(7, warehouse)
+        stored = await collect_ga4_traffic(7, warehouse)
+
+        user_calls = [r for r in fake_ga4.batch_calls if len(r.requests) == 2]
+        assert len(user_calls) == 2       # fetched on every warehouse run
+        assert fetched_range(user_calls[1]) == fetched_range(fake_ga4.batch_calls[0])
+        assert stored.data["traffic"]["users"] == 12
+        assert stored.data["traffic"]["new_users"] == 4
+        assert stored.data["countries"] == [
+            {"country": "United States", "users": 9, "user_share_pct": 75.0},
+            {"country": "Germany", "users": 3, "user_share_pct": 25.0},
+        ]
+        assert live.data["traffic"]["users"] == 80
+
+    async def test_longer_lookback_fetches_only_older_days(
+        self, fake_ga4: FakeGa4AsyncClient, warehouse: MetricsWarehouse
+    ) -> None:
+        await collect_ga4_traffic(7, warehouse)
+        traffic = await collect_ga4_traffic(30, warehouse)
+
+        start, _ = fetched_range(daily_calls(fake_ga4)[1])
+        assert date.fromisoformat(start) == datetime.now(UTC).date() - timedelta(days=30)
+        assert traffic.data["traffic"]["sessions"] == 310
+
+
+class FakeAdsService:
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self.rows = rows
+        self.queries: list[str] = []
+
+    def search_stream(self, customer_id: str, query: str) -> list[SimpleNamespace]:
+        self.queries.append(query)
+        start, end = re.search(r"BETWEEN '([\d-]+)' AND '([\d-]+)'", query).groups()
+        rows = [r for r in self.rows if start <= r.segments.date <= end]
+        return [SimpleNamespace(results=rows)]
+
+
+def ads_row(day: date, name: str, clicks: int, cost_usd: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        campaign=SimpleNamespace(name=name),
+        segments=SimpleNamespace(date=str(day)),
+        metrics=SimpleNamespace(
+            clicks=clicks, impressions=clicks * 10,
+            cost_micros=int(cost_usd * 1_000_000), conversions=0.5,
+        ),
+    )
+
+
+@pytest.fixture
+def fake_ads(monkeypatch: pytest.MonkeyPatch) -> FakeAdsService:
+    today = datetime.now(UTC).date()
+    service = FakeAdsService([
+        ads_row(today - timedelta(days=i), name, 4, 2.0)
+        for i in range(30)
+        for name in ("Brand", "Generic")
+    ])
+    client = SimpleNamespace(get_service=lambda _name: service)
+    monkeypatch.setattr(credentials, "google_ads_client", lambda _cls: client)
+    monkeypatch.setattr(metrics_collectors, "_load_env", lambda: None)
+    monkeypatch.setenv("GOOGLE_ADS_CUSTOMER_ID", "123-456-7890")
+    return service
+
+
+class TestGoogleAds:
+    async def test_live_aggregation(self, fake_ads: FakeAdsService) -> None:
+        result = await collect_google_ads(7)
+        assert result.success, result.error
+        assert result.data["total_clicks"] == 56
+        assert result.data["total_impressions"] == 560
+        assert result.data["total_spend_usd"] == 28.0
+        assert len(result.data["daily_spend"]) == 7
+        brand = next(c for c in result.data["campaigns"] if c["campaign"] == "Brand")
+        assert brand["ctr"] == 10.0
+        assert brand["avg_cpc_usd"] == 0.5
+
+    async def test_warehouse_matches_live_and_fetches_incrementally(
+        self, fake_ads: FakeAdsService, warehouse: MetricsWarehouse
+    ) -> None:
+        live = await collect_google_ads(7)
+        stored = await collect_google_ads(7, warehouse)
+        again = await collect_google_ads(7, warehouse)
+
+        for key in ("total_clicks", "total_spend_usd", "daily_spend", "campaigns"):
+            assert stored.data[key] == live.data[key] == again.data[key]
+        assert stored.data["warehouse"]["fetched_days"] == 7
+        assert again.data["warehouse"]["fetched_days"] == 3
+
+
+def stream_of(rows: list[SimpleNamespace], batch_size: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(results=rows[i:i + batch_size])
+        for i in range(0, len(rows), batch_size)
+    ]
+
+
+class TestAdsStream:
+    async def test_consumed_in_worker_thread(self) -> None:
+        day = date(2026, 3, 1)
+        rows = [ads_row(day, f"C{i % 3}", 1, 0.5) for i in range(300)]
+        threads: list[int] = []
+
+        def open_stream() -> list[SimpleNamespace]:
+            threads.append(threading.get_ident())
+            return stream_of(rows, 7)
+
+        totals = await stream_ads_totals(open_stream, queue_batches=2)
+
+        assert threads and threads[0] != threading.get_ident()
+        assert totals[(str(day), "C0")] == [100, 1000, 50.0, 50.0]
+        assert sum(acc[0] for acc in totals.values()) == 300
+
+    async def test_event_loop_stays_responsive(self) -> None:
+        def slow_stream() -> Iterator[SimpleNamespace]:
+            for _ in range(10):
+                time.sleep(0.02)  # blocking gRPC read
+                yield SimpleNamespace(results=[ads_row(date(2026, 3, 1), "A", 1, 1.0)])
+
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        totals = await stream_ads_totals(slow_stream)
+        task.cancel()
+
+        assert totals[("2026-03-01", "A")][0] == 10
+        assert ticks >= 10
+
+    async def test_stream_error_raised_on_loop(self) -> None:
+        def failing_stream() -> Iterator[SimpleNamespace]:
+            yield SimpleNamespace(results=[ads_row(date(2026, 3, 1), "A", 1, 1.0)])
+            raise RuntimeError("stream reset")
+
+        with pytest.raises(RuntimeError, match="stream reset"):
+            await stream_ads_totals(failing_stream)
+
+    async def test_timeout_stops_worker(self) -> None:
+        produced: list[int] = []
+        finished = threading.Event()
+
+        def endless_stream() -> Iterator[SimpleNamespace]:
+            try:
+                while True:
+                    produced.append(1)
+                    time.sleep(0.005)
+                    yield SimpleNamespace(results=[])
+            finally:
+                finished.set()
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(stream_ads_totals(endless_stream), timeout=0.05)
+        assert await asyncio.to_thread(finished.wait, 2)
+
+
+@pytest.fixture
+def scripted_sources(monkeypatch: pytest.MonkeyPatch) -> dict[str, float]:
+    """Replace every registered collector with one that succeeds after a per-source delay."""
+    delays = {name: 0.0 for name in metrics_collectors.COLLECTOR_SOURCES}
+    for spec in collector_registry.registered_collectors():
+        async def collector(source: str = spec.source_id) -> metrics_collectors.CollectorResult:
+            await asyncio.sleep(delays[source])
+            return metrics_collectors.CollectorResult(source=source, data={"ok": True})
+
+        monkeypatch.setitem(
+            collector_registry._REGISTRY, spec.source_id, replace(spec, collect=collector)
+        )
+    return delays
+
+
+class TestCollectDeadline:
+    async def test_stragglers_cancelled_and_marked(self, scripted_sources: dict[str, float]) -> None:
+        scripted_sources["clarity"] = 5.0
+        start = time.perf_counter()
+        results = await metrics_collectors.collect_all(1, deadline_s=0.1)
+
+        assert time.perf_counter() - start < 1.0
+        assert results["clarity"].timed_out and not results["clarity"].success
+        assert "0.1s collection deadline" in results["clarity"].error
+        assert all(results[s].success for s in results if s != "clarity")
+        assert list(results) == list(metrics_collectors.COLLECTOR_SOURCES)
+
+    async def test_no_deadline_waits_for_all(self, scripted_sources: dict[str, float]) -> None:
+        scripted_sources["cws"] = 0.05
+        results = await metrics_collectors.collect_all(1)
+        assert all(r.success and not r.timed_out for r in results.values())
+
+    async def test_late_results_back_filled(self, scripted_sources: dict[str, float]) -> None:
+        scripted_sources["monetization"] = 0.2
+        late: list[metrics_collectors.CollectorResult] = []
+
+        results = await metrics_collectors.collect_all(1, deadline_s=0.05, on_late=late.append)
+        assert results["monetization"].timed_out
+        assert late == []
+
+        assert await metrics_collectors.wait_for_stragglers() == 1
+        assert [r.source for r in late] == ["monetization"]
+        assert late[0].success and late[0].attempts == 1
+
+    async def test_wait_for_stragglers_timeout_cancels(
+        self, scripted_sources: dict[str, float]
+    ) -> None:
+        scripted_sources["google_ads"] = 5.0
+        late: list[metrics_collectors.CollectorResult] = []
+        await metrics_collectors.collect_all(1, deadline_s=0.05, on_late=late.append)
+
+        assert await metrics_collectors.wait_for_stragglers(timeout=0.05) == 0
+        assert late == []
+        assert await metrics_collectors.wait_for_stragglers() == 0
+
+
+class TestCollectorSelection:
+    async def test_subset_keeps_registration_order(
+        self, scripted_sources: dict[str, float]
+    ) -> None:
+        results = await metrics_collectors.collect_all(1, sources=["cws", "ga4_traffic"])
+        assert list(results) == ["ga4_traffic", "cws"]
+
+        with pytest.raises(ValueError, match="Unknown collector 'stripe'"):
+            await metrics_collectors.collect_all(1, sources=["stripe"])
+
+    async def test_missing_credentials_skipped(
+        self, scripted_sources: dict[str, float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        available = {"ga4": True, "cws": True, "google_ads": False, "clarity": False}
+        monkeypatch.setattr(credentials, "validate_credentials", lambda: available)
+
+        results = await metrics_collectors.collect_all(1, skip_missing_credentials=True)
+
+        assert results["google_ads"].skipped and not results["google_ads"].success
+        assert "credentials not configured (google_ads)" in results["google_ads"].error
+        assert results["clarity"].skipped
+        assert results["monetization"].success  # no credential gate
+        assert list(results) == list(metrics_collectors.COLLECTOR_SOURCES)
+
+    async def test_overlapping_runs_respect_source_concurrency(
+        self, scripted_sources: dict[str, float]
+    ) -> None:
+        spec = collector_registry.get_collector("clarity")
+        active: list[int] = [0, 0]  # current, peak
+
+        async def collector() -> metrics_collectors.CollectorResult:
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            return metrics_collectors.CollectorResult(source="clarity")
+
+        collector_registry._REGISTRY["clarity"] = replace(spec, collect=collector)
+        await asyncio.gather(*(
+            metrics_collectors.collect_all(1, sources=["clarity"]) for _ in range(3)
+        ))
+        assert active[1] == spec.config.max_concurrency == 1
+
+    async def test_max_parallel_starts_client_groups_together(
+        self, scripted_sources: dict[str, float]
+    ) -> None:
+        started: list[tuple[str, float]] = []
+        for spec in collector_registry.registered_collectors():
+            async def collector(source: str = spec.source_id) -> metrics_collectors.CollectorResult:
+                started.append((source, time.perf_counter()))
+                await asyncio.sleep(0.03)
+                return metrics_collectors.CollectorResult(source=source)
+
+            collector_registry._REGISTRY[spec.source_id] = replace(spec, collect=collector)
+
+        results = await metrics_collectors.collect_all(
+            1, sources=["ga4_traffic", "ga4_funnel", "google_ads"], max_parallel=1
+        )
+        assert all(r.success for r in results.values())
+        at = dict(started)
+        # Both GA4 collectors share one slot; Ads waits for it
+        assert abs(at["ga4_traffic"] - at["ga4_funnel"]) < 0.02
+        assert at["google_ads"] - at["ga4_traffic"] >= 0.025
@@ -0,0 +1,280 @@
+"""Tests for the scheduled metrics daemon (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, time, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from adws.adw_modules import metrics_collectors
+from adws.adw_modules.metrics_collectors import COLLECTOR_SOURCES, CollectorResult
+from adws.adw_modules.metrics_daemon import (
+    MetricsDaemon,
+    ResultCache,
+    ScheduleEntry,
+    current_period,
+    next_run,
+    parse_schedule,
+)
+
+LOCAL = timezone(timedelta(hours=-5))
+
+
+def at(hour: int, minute: int = 0, day: int = 10) -> datetime:
+    return datetime(2026, 3, day, hour, minute, tzinfo=LOCAL)
+
+
+def ok_results(**overrides: CollectorResult) -> dict[str, CollectorResult]:
+    results = {
+        name: CollectorResult(source=name, data={}) for name in COLLECTOR_SOURCES
+    }
+    results["monetization"] = CollectorResult(
+        source="monetization",
+        data={
+            "totals": {"total_revenue_usd": 42.0, "checkout_completed": 3},
+            "channels": [],
+        },
+    )
+    results.update(overrides)
+    return results
+
+
+@pytest.fixture
+def fake_collect(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+
+    async def collect_all(
+        days: int, warehouse: object = None, breakers: object = None, *_: object,
+        **__: object,
+    ) -> dict[str, CollectorResult]:
+        calls.append(days)
+        await asyncio.sleep(0.01)
+        return ok_results()
+
+    monkeypatch.setattr(metrics_collectors, "collect_all", collect_all)
+    return calls
+
+
+class TestSchedule:
+    def test_parse_sorts_entries(self) -> None:
+        entries = parse_schedule("19:00=evening, 07:30=Morning")
+        assert entries == [
+            ScheduleEntry(time(7, 30), "morning"),
+            ScheduleEntry(time(19, 0), "evening"),
+        ]
+
+    @pytest.mark.parametrize(
+        "spec", ["", "07:00", "07:00=night", "7pm=evening", "07:00=morning,07:00=evening"]
+    )
+    def test_parse_rejects_invalid(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            parse_schedule(spec)
+
+    def test_next_run_same_day_and_wraparound(self) -> None:
+        entries = parse_schedule("07:00=morning,19:00=evening")
+        assert next_run(entries, at(6, 59)) == (at(7), entries[0])
+        assert next_run(entries, at(7)) == (at(19), entries[1])
+        assert next_run(entries, at(20)) == (at(7, day=11), entries[0])
+
+    def test_current_period(self) -> None:
+        entries = parse_schedule("07:00=morning,13:00=afternoon,19:00=evening")
+        assert current_period(entries, at(14)) == "afternoon"
+        assert current_period(entries, at(19)) == "evening"
+        # Before the first run of the day, yesterday's last run still applies
+        assert current_period(entries, at(3)) == "evening"
+
+
+class TestResultCache:
+    def test_freshness_follows_ttl(self) -> None:
+        cache = ResultCache(ttl=timedelta(minutes=30))
+        cached_at = datetime.now(UTC)
+        cache.put(CollectorResult(source="clarity"), at=cached_at)
+
+        assert cache.is_fresh("clarity", cached_at + timedelta(minutes=29))
+        assert not cache.is_fresh("clarity", cached_at + timedelta(minutes=30))
+        assert not cache.is_fresh("cws")
+        assert "cws" in cache.stale_sources()
+        assert "clarity" not in cache.stale_sources()
+
+    def test_snapshot_in_collector_order(self) -> None:
+        cache = ResultCache()
+        for name in reversed(COLLECTOR_SOURCES):
+            cache.put(CollectorResult(source=name))
+        assert tuple(cache.snapshot()) == COLLECTOR_SOURCES
+
+
+class TestMetricsDaemon:
+    async def test_collect_reuses_fresh_results(
+        self, fake_collect: list[int], temp_workspace: Path
+    ) -> None:
+        daemon = MetricsDaemon(days=7, output_dir=temp_workspace)
+        first = await daemon.collect()
+        second = await daemon.collect()
+
+        assert fake_collect == [7]
+        assert first == second
+        await daemon.collect(force=True)
+        assert len(fake_collect) == 2
+
+    async def test_concurrent_callers_share_one_collection(
+        self, fake_collect: list[int], temp_workspace: Path
+    ) -> None:
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+        await asyncio.gather(*(daemon.collect() for _ in range(5)))
+        assert len(fake_collect) == 1
+
+    async def test_stale_cache_recollects(
+        self, fake_collect: list[int], temp_workspace: Path
+    ) -> None:
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace, ttl=timedelta(0))
+        await daemon.collect()
+        await daemon.collect()
+        assert len(fake_collect) == 2
+
+    async def test_collect_forwards_source_options(
+        self, monkeypatch: pytest.MonkeyPatch, temp_workspace: Path
+    ) -> None:
+        seen: list[dict[str, object]] = []
+
+        async def collect_all(
+            days: int, *_: object, **kwargs: object
+        ) -> dict[str, CollectorResult]:
+            seen.append(kwargs)
+            return {"clarity": CollectorResult(source="clarity", data={})}
+
+        monkeypatch.setattr(metrics_collectors, "collect_all", collect_all)
+        daemon = MetricsDaemon(
+            days=1, output_dir=temp_workspace, sources=["clarity"],
+            skip_missing_credentials=True, max_parallel=1,
+        )
+        results = await daemon.collect()
+
+        assert len(seen) == 1
+        assert tuple(seen[0].pop("sources")) == ("clarity",)
+        assert seen[0] == {"skip_missing_credentials": True, "max_parallel": 1}
+        assert list(results) == ["clarity"]
+        assert list(daemon.status()["sources"]) == ["clarity"]
+        await daemon.collect()
+        assert len(seen) == 1
+
+    async def test_only_stale_sources_recollected(
+        self, monkeypatch: pytest.MonkeyPatch, temp_workspace: Path
+    ) -> None:
+        requested: list[tuple[str, ...]] = []
+
+        async def collect_all(
+            days: int, *_: object, sources: tuple[str, ...] = (), **__: object
+        ) -> dict[str, CollectorResult]:
+            requested.append(tuple(sources))
+            return {name: CollectorResult(source=name, data={}) for name in sources}
+
+        monkeypatch.setattr(metrics_collectors, "collect_all", collect_all)
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+        await daemon.collect()
+        fresh = daemon.cache.get("ga4_traffic")
+        old = datetime.now(UTC) - timedelta(hours=1)
+        daemon.cache.put(CollectorResult(source="clarity", data={}), at=old)
+
+        results = await daemon.collect()
+
+        assert requested == [COLLECTOR_SOURCES, ("clarity",)]
+        assert results["ga4_traffic"] is fresh
+        assert daemon.cache.is_fresh("clarity")
+        await daemon.collect(force=True)
+        assert requested[-1] == COLLECTOR_SOURCES
+
+    def test_unknown_source_rejected(self, temp_workspace: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown collector"):
+            MetricsDaemon(days=1, output_dir=temp_workspace, sources=["nope"])
+
+    async def test_run_report_writes_files(
+        self, fake_collect: list[int], temp_workspace: Path
+    ) -> None:
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+        paths = await daemon.run_report("evening")
+
+        assert paths is not None
+        md_path, html_path = paths
+        assert md_path.name.endswith("-evening.md") and md_path.exists()
+        assert html_path.read_text().lstrip().lower().startswith("<!doctype html")
+        assert daemon.last_reports == {"evening": str(md_path)}
+
+    async def test_run_report_skipped_when_all_sources_fail(
+        self, monkeypatch: pytest.MonkeyPatch, temp_workspace: Path
+    ) -> None:
+        async def collect_all(
+            days: int, warehouse: object = None, breakers: object = None, *_: object,
+            **__: object,
+        ) -> dict[str, CollectorResult]:
+            return {
+                name: CollectorResult(source=name, success=False, error="down")
+                for name in COLLECTOR_SOURCES
+            }
+
+        monkeypatch.setattr(metrics_collectors, "collect_all", collect_all)
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+
+        assert await daemon.run_report("morning") is None
+        assert list(temp_workspace.glob("daily-metrics-*")) == []
+        assert list((temp_workspace / "failures").glob("*.json"))
+
+    async def test_scheduler_stops_on_event(self, temp_workspace: Path) -> None:
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+        stop = asyncio.Event()
+        task = asyncio.create_task(daemon.run_schedule(stop))
+        await asyncio.sleep(0)
+        stop.set()
+        await asyncio.wait_for(task, timeout=1)
+
+
+class TestHttpEndpoint:
+    @pytest.fixture
+    def daemon(self, temp_workspace: Path) -> MetricsDaemon:
+        daemon = MetricsDaemon(days=1, output_dir=temp_workspace)
+        for result in ok_results().values():
+            daemon.cache.put(result)
+        return daemon
+
+    def test_reports_served_from_cache(self, daemon: MetricsDaemon) -> None:
+        client = TestClient(daemon.create_app())
+
+        md = client.get("/report.md", params={"period": "afternoon"})
+        html = client.get("/report.html")
+
+        assert md.status_code == 200
+        assert md.headers["content-type"].startswith("text/plain")
+        assert "afternoon" in md.text.lower()
+        assert html.status_code == 200
+        assert "<html" in html.text.lower()
+        assert daemon.collections == 0
+
+    def test_results_and_health(self, daemon: MetricsDaemon) -> None:
+        client = TestClient(daemon.create_app())
+
+        results = client.get("/results").json()
+        health = client.get("/health").json()
+
+        assert set(results) == set(COLLECTOR_SOURCES)
+        assert results["monetization"]["data"]["totals"]["total_revenue_usd"] == 42.0
+        assert all(s["fresh"] for s in health["sources"].values())
+        assert health["next_run"]["period"] in ("morning", "afternoon", "evening")
+
+    def test_invalid_period_rejected(self, daemon: MetricsDaemon) -> None:
+        client = TestClient(daemon.create_app())
+        assert client.get("/report.md", params={"period": "noon"}).status_code == 400
+
+    def test_empty_cache_is_unavailable(self, temp_workspace: Path) -> None:
+        client = TestClient(MetricsDaemon(days=1, output_dir=temp_workspace).create_app())
+        assert client.get("/report.md").status_code == 503
+
+    def test_refresh_forces_collection(
+        self, daemon: MetricsDaemon, fake_collect: list[int]
+    ) -> None:
+        client = TestClient(daemon.create_app())
+        response = client.post("/refresh")
+        assert response.status_code == 200
+        assert response.json()["collections"] == 1
+        assert fake_collect == [1]
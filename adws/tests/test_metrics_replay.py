@@ -0,0 +1,121 @@
+"""Tests for offline collector record/replay and synthetic fixtures."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from adws.adw_modules import collector_registry, fault_tolerant, metrics_collectors
+from adws.adw_modules.metrics_collectors import COLLECTOR_SOURCES, CollectorResult
+from adws.adw_modules.metrics_replay import (
+    ReplayProfile,
+    SourceBehavior,
+    load_fixtures,
+    record_fixtures,
+    replay_collectors,
+    synthetic_fixtures,
+)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(fault_tolerant.asyncio, "sleep", fake_sleep)
+
+
+class TestRecording:
+    def test_round_trip_is_sanitized(
+        self, temp_workspace: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("CLARITY_API_TOKEN", "tok-123456")
+        result = CollectorResult(
+            source="clarity",
+            data={"vitals": {"lcp_ms": 1800.0}, "url": "https://x.test/?t=tok-123456"},
+            traceback="Traceback ... tok-123456",
+            artifacts=["/home/me/.kapture/run.json"],
+        )
+
+        paths = record_fixtures({"clarity": result}, temp_workspace)
+        raw = paths[0].read_text()
+        loaded = load_fixtures(temp_workspace)["clarity"]
+
+        assert "tok-123456" not in raw
+        assert loaded.data["url"] == "https://x.test/?t=[REDACTED]"
+        assert loaded.traceback is None and loaded.artifacts == []
+        assert loaded.data["vitals"] == {"lcp_ms": 1800.0}
+
+    def test_unknown_version_rejected(self, temp_workspace: Path) -> None:
+        (temp_workspace / "cws.json").write_text(json.dumps({"version": 99, "result": {}}))
+        with pytest.raises(ValueError, match="Unsupported fixture version"):
+            load_fixtures(temp_workspace)
+
+
+class TestReplay:
+    async def test_replays_every_source_with_latency(self) -> None:
+        fixtures = synthetic_fixtures(days=7, rows=20)
+        profile = ReplayProfile(default=SourceBehavior(latency_ms=30))
+
+        with replay_collectors(fixtures, profile) as stats:
+            start = time.perf_counter()
+            results = await metrics_collectors.collect_all(7)
+            elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in results.values())
+        assert results["google_ads"].data == fixtures["google_ads"].data
+        assert stats.calls == {source: 1 for source in COLLECTOR_SOURCES}
+        assert 0.03 <= elapsed < 0.5  # collectors ran concurrently
+
+    async def test_registry_restored_after_replay(self) -> None:
+        before = collector_registry.get_collector("clarity").collect
+        with replay_collectors({}):
+            assert collector_registry.get_collector("clarity").collect is not before
+        assert collector_registry.get_collector("clarity").collect is before
+
+    async def test_missing_fixture_fails_without_network(self) -> None:
+        with replay_collectors({}):
+            results = await metrics_collectors.collect_all(1, sources=["monetization"])
+        assert results["monetization"].error == "No replay fixture for monetization"
+
+    async def test_transient_failures_are_retried(self, no_backoff: None) -> None:
+        fixtures = synthetic_fixtures(days=1, rows=5)
+        profile = ReplayProfile(
+            sources={"cws": SourceBehavior(failure_rate=1.0, failure="http_503")},
+        )
+        with replay_collectors(fixtures, profile) as stats:
+            results = await metrics_collectors.collect_all(1, sources=["cws", "clarity"])
+
+        max_retries = collector_registry.get_collector("cws").config.max_retries
+        assert not results["cws"].success and "503" in results["cws"].error
+        assert stats.calls["cws"] == stats.failures["cws"] == max_retries + 1
+        assert results["clarity"].success
+
+    async def test_fatal_failures_not_retried(self) -> None:
+        profile = ReplayProfile(default=SourceBehavior(failure_rate=1.0, failure="http_401"))
+        with replay_collectors(synthetic_fixtures(1, 5), profile) as stats:
+            results = await metrics_collectors.collect_all(1, sources=["ga4_traffic"])
+        assert not results["ga4_traffic"].success
+        assert stats.calls == {"ga4_traffic": 1}
+
+    def test_unknown_failure_mode_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown failure mode"):
+            SourceBehavior(failure="http_418")
+
+
+class TestSyntheticFixtures:
+    def test_sizes_follow_rows_and_days(self) -> None:
+        fixtures = synthetic_fixtures(days=30, rows=250)
+
+        assert set(fixtures) == set(COLLECTOR_SOURCES)
+        assert len(fixtures["google_ads"].data["campaigns"]) == 250
+        assert len(fixtures["google_ads"].data["daily_spend"]) == 30
+        assert len(fixtures["ga4_traffic"].data["channels"]) == 250
+        assert len(fixtures["monetization"].data["channels"]) == 250
+
+    def test_deterministic_for_seed(self) -> None:
+        first, second = synthetic_fixtures(7, 10, seed=3), synthetic_fixtures(7, 10, seed=3)
+        assert all(first[s].data == second[s].data for s in first)
@@ -0,0 +1,132 @@
+"""Tests for the local metrics warehouse."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from adws.adw_modules.metrics_warehouse import (
+    MetricsWarehouse,
+    aggregate_facts,
+    daily_totals,
+)
+
+END = date(2026, 3, 31)
+
+
+def days_before(n: int) -> date:
+    return END - timedelta(days=n)
+
+
+@pytest.fixture
+def warehouse(temp_workspace: Path) -> MetricsWarehouse:
+    store = MetricsWarehouse(temp_workspace / "warehouse" / "metrics.sqlite", restatement_days=3)
+    yield store
+    store.close()
+
+
+class TestFetchRange:
+    def test_empty_store_fetches_whole_window(self, warehouse: MetricsWarehouse) -> None:
+        assert warehouse.fetch_range(["s"], days_before(29), END) == (days_before(29), END)
+
+    def test_full_store_fetches_only_restatement_window(
+        self, warehouse: MetricsWarehouse
+    ) -> None:
+        warehouse.replace("s", days_before(29), END, [])
+        assert warehouse.fetch_range(["s"], days_before(29), END) == (days_before(2), END)
+
+    def test_longer_window_fetches_from_first_gap(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("s", days_before(6), END, [])
+        assert warehouse.fetch_range(["s"], days_before(29), END) == (days_before(29), END)
+
+    def test_gap_in_middle(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("s", days_before(29), days_before(20), [])
+        warehouse.replace("s", days_before(10), END, [])
+        assert warehouse.fetch_range(["s"], days_before(29), END) == (days_before(19), END)
+
+    def test_shared_sources_use_union_of_gaps(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("a", days_before(29), END, [])
+        warehouse.replace("b", days_before(5), END, [])
+        assert warehouse.fetch_range(["a", "b"], days_before(29), END) == (
+            days_before(29), END,
+        )
+
+    def test_window_shorter_than_restatement(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("s", days_before(1), END, [])
+        assert warehouse.fetch_range(["s"], days_before(1), END) == (days_before(1), END)
+
+    def test_current_day_always_refetched(self, temp_workspace: Path) -> None:
+        store = MetricsWarehouse(temp_workspace / "w.sqlite", restatement_days=1)
+        store.replace("s", days_before(6), END, [])
+        assert store.fetch_range(["s"], days_before(6), END) == (END, END)
+        store.close()
+
+    @pytest.mark.parametrize("days", [0, -1])
+    def test_restatement_below_one_day_rejected(self, temp_workspace: Path, days: int) -> None:
+        with pytest.raises(ValueError):
+            MetricsWarehouse(temp_workspace / "w.sqlite", restatement_days=days)
+
+
+class TestStorage:
+    def test_replace_overwrites_range_and_aggregates(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("s", days_before(2), END, [
+            (str(days_before(2)), "events", "install", "count", 5),
+            (str(days_before(1)), "events", "install", "count", 7),
+            (str(END), "events", "install", "count", 1),
+        ])
+        # Restated: END revised upward, days_before(1) unchanged on re-fetch
+        warehouse.replace("s", days_before(1), END, [
+            (str(days_before(1)), "events", "install", "count", 7),
+            (str(END), "events", "install", "count", 4),
+        ])
+
+        agg = warehouse.aggregate("s", days_before(2), END)
+        assert agg == {"events": {"install": {"count": 16}}}
+        assert warehouse.daily("s", "events", "count", days_before(2), END) == {
+            str(END): 4, str(days_before(1)): 7, str(days_before(2)): 5,
+        }
+
+    def test_duplicate_facts_are_summed(self, warehouse: MetricsWarehouse) -> None:
+        day = str(END)
+        warehouse.replace("ads", END, END, [
+            (day, "campaigns", "Brand", "clicks", 3),
+            (day, "campaigns", "Brand", "clicks", 2),
+        ])
+        assert warehouse.aggregate("ads", END, END)["campaigns"]["Brand"]["clicks"] == 5
+
+    def test_empty_days_count_as_stored(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("s", days_before(4), END, [])
+        assert warehouse.stored_days("s", days_before(9), END) == 5
+
+    def test_sources_are_isolated(self, warehouse: MetricsWarehouse) -> None:
+        warehouse.replace("a", END, END, [(str(END), "d", "k", "m", 1)])
+        assert warehouse.aggregate("b", END, END) == {}
+
+    def test_store_directory_is_git_ignored(self, warehouse: MetricsWarehouse) -> None:
+        assert (warehouse.path.parent / ".gitignore").read_text() == "*\n"
+
+    def test_persists_across_instances(self, temp_workspace: Path) -> None:
+        path = temp_workspace / "w.sqlite"
+        first = MetricsWarehouse(path)
+        first.replace("s", END, END, [(str(END), "d", "k", "m", 2)])
+        first.close()
+        second = MetricsWarehouse(path)
+        assert second.aggregate("s", END, END) == {"d": {"k": {"m": 2}}}
+        second.close()
+
+
+class TestInMemoryHelpers:
+    def test_match_warehouse_shapes(self) -> None:
+        facts = [
+            ("2026-03-30", "campaigns", "A", "spend_usd", 1.5),
+            ("2026-03-31", "campaigns", "A", "spend_usd", 2.0),
+            ("2026-03-31", "campaigns", "B", "spend_usd", 0.5),
+        ]
+        assert aggregate_facts(facts) == {
+            "campaigns": {"A": {"spend_usd": 3.5}, "B": {"spend_usd": 0.5}},
+        }
+        assert daily_totals(facts, "campaigns", "spend_usd") == {
+            "2026-03-30": 1.5, "2026-03-31": 2.5,
+        }
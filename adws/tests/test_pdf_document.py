@@ -0,0 +1,127 @@
+"""Tests for shared-style, streaming PDF generation."""
+
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from reportlab.platypus import Paragraph, Spacer
+
+from adws.adw_modules.metrics_replay import synthetic_fixtures
+from adws.adw_modules.pdf_document import (
+    CONTENT_WIDTH,
+    TEAL,
+    StreamingTable,
+    build_pdf,
+    inline_markup,
+    markdown_flowables,
+    paragraph_styles,
+    table,
+    table_style,
+)
+from adws.adw_modules.report_generator import (
+    generate_markdown_report,
+    write_pdf_report,
+    write_reports,
+)
+
+NOW = datetime(2026, 3, 2, 7, 0, tzinfo=UTC)
+
+
+def _rows(count: int, pulled: list[int]):
+    for i in range(count):
+        pulled[0] = i + 1
+        yield [f"row {i}", str(i)]
+
+
+class TestSharedStyles:
+    def test_styles_are_compiled_once(self) -> None:
+        assert paragraph_styles() is paragraph_styles()
+        assert table_style(TEAL) is table_style(TEAL)
+
+    def test_tables_share_one_style_per_combination(self) -> None:
+        extra = [("ALIGN", (0, 0), (0, -1), "CENTER")]
+        misses = table_style.cache_info().misses
+
+        table([["a"], ["b"]], [100], extra_styles=extra)
+        table([["c"], ["d"]], [100], extra_styles=list(extra))
+
+        assert table_style.cache_info().misses <= misses + 1
+
+
+class TestStreamingTable:
+    def test_pages_pull_rows_lazily_and_cover_every_row_once(self) -> None:
+        pulled = [0]
+        flowable = StreamingTable(["Name", "Value"], _rows(500, pulled), [200, 200])
+
+        first, rest = flowable.split(400, 300)
+        first_rows = [row[0] for row in first._cellvalues[1:]]
+        assert first._cellvalues[0] == ["Name", "Value"]
+        assert pulled[0] < 40          # about one page of rows, not the whole table
+
+        drawn = list(first_rows)
+        while True:
+            parts = rest.split(400, 600)
+            drawn += [row[0] for row in parts[0]._cellvalues[1:]]
+            if len(parts) == 1:
+                break
+            rest = parts[1]
+        assert drawn == [f"row {i}" for i in range(500)]
+
+    def test_build_pdf_paginates_long_table(self, temp_workspace: Path) -> None:
+        pulled = [0]
+        path = temp_workspace / "long.pdf"
+
+        pages = build_pdf(path, [StreamingTable(["Name", "Value"], _rows(300, pulled), [200, 200])])
+
+        assert pages > 5
+        assert pulled[0] == 300
+        assert path.read_bytes().startswith(b"%PDF")
+
+    def test_build_pdf_accepts_a_generator(self, temp_workspace: Path) -> None:
+        body = paragraph_styles()["body"]
+        story = (Paragraph(f"Paragraph {i}", body) for i in range(200))
+
+        assert build_pdf(temp_workspace / "story.pdf", story) > 1
+
+    def test_short_table_fits_on_one_page(self, temp_workspace: Path) -> None:
+        pulled = [0]
+        story = [Spacer(1, 10), StreamingTable(["Name", "Value"], _rows(3, pulled), [200, 200])]
+
+        assert build_pdf(temp_workspace / "short.pdf", story) == 1
+
+
+class TestMarkdown:
+    def test_inline_markup(self) -> None:
+        assert inline_markup("**Total** is `a<b` & *rough*") == (
+            '<b>Total</b> is <font face="Courier">a&lt;b</font> &amp; <i>rough</i>'
+        )
+
+    def test_report_tables_become_streaming_tables(self) -> None:
+        md = generate_markdown_report(synthetic_fixtures(days=90, rows=40), NOW, "morning", 90)
+
+        flowables = list(markdown_flowables(io.StringIO(md)))
+
+        tables = [f for f in flowables if isinstance(f, StreamingTable)]
+        assert len(tables) >= 6
+        assert all(sum(t.col_widths) == pytest.approx(CONTENT_WIDTH) for t in tables)
+
+    def test_write_pdf_report(self, temp_workspace: Path) -> None:
+        results = synthetic_fixtures(days=90, rows=200)
+        md_path, _ = write_reports(results, NOW, "morning", 90, temp_workspace)
+
+        pdf_path = write_pdf_report(md_path)
+
+        assert pdf_path == temp_workspace / "daily-metrics-2026-03-02-morning.pdf"
+        assert pdf_path.read_bytes().startswith(b"%PDF")
+        assert not list(temp_workspace.glob("*.tmp"))
+
+
+def test_api_design_doc_builds(temp_workspace: Path) -> None:
+    from adws.scripts.generate_api_design_doc import build
+
+    path = build(temp_workspace / "design.pdf")
+
+    assert path.read_bytes().startswith(b"%PDF")
@@ -0,0 +1,43 @@
+"""
+Plan Phase Tests
+
+Covers:
+- Port lease release when the worktree cannot be created
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from adws.adw_modules.port_leases import PortLeaseTable
+from adws.scripts import adw_plan_iso
+from adws.scripts.adw_plan_iso import execute_planning
+
+
+class TestWorktreeFailure:
+    """Tests for execute_planning when worktree creation fails."""
+
+    @pytest.mark.parametrize("use_pool", [False, True])
+    async def test_lease_released_when_worktree_creation_fails(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_workspace: Path,
+        use_pool: bool,
+    ) -> None:
+        monkeypatch.chdir(temp_workspace)
+        monkeypatch.setattr(adw_plan_iso, "generate_adw_id", lambda: "fa11ed00")
+        error = subprocess.CalledProcessError(128, ["git", "worktree", "add"])
+        monkeypatch.setattr(adw_plan_iso, "create_worktree", MagicMock(side_effect=error))
+        monkeypatch.setattr(
+            adw_plan_iso.WorktreePool, "acquire", MagicMock(side_effect=error)
+        )
+
+        exit_code = await execute_planning(42, "Title", "Body", use_pool=use_pool)
+
+        assert exit_code == 1
+        table = PortLeaseTable(lease_file=temp_workspace / "agents" / ".port_leases.json")
+        assert table.get("fa11ed00") is None
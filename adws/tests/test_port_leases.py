@@ -0,0 +1,207 @@
+"""
+Tests for ADWS Port Lease Module.
+
+Tests cover:
+- PortRange configuration and validation
+- Collision-free leasing and stable re-leasing
+- Release and orphan reclamation
+- Lease release on worktree removal and state archiving
+- ADWState loading independent of the configured range
+"""
+
+import threading
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from adws.adw_modules.port_leases import PortLeaseTable, PortRange
+from adws.adw_modules.state import ADWState
+from adws.adw_modules.worktree_ops import (
+    get_ports_for_adw,
+    lease_ports_for_adw,
+    release_ports_for_adw,
+)
+
+
+@pytest.fixture
+def lease_file(temp_workspace: Path) -> Path:
+    return temp_workspace / "agents" / ".port_leases.json"
+
+
+class TestPortRange:
+    """Tests for PortRange configuration."""
+
+    def test_defaults_match_legacy_range(self) -> None:
+        port_range = PortRange()
+        assert (port_range.backend_base, port_range.backend_max) == (9100, 9114)
+        assert (port_range.frontend_base, port_range.frontend_max) == (9200, 9214)
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ADWS_PORT_SLOTS", "64")
+        monkeypatch.setenv("ADWS_BACKEND_PORT_BASE", "10000")
+        monkeypatch.setenv("ADWS_FRONTEND_PORT_BASE", "11000")
+        port_range = PortRange.from_env()
+        assert port_range.slots == 64
+        assert port_range.backend_max == 10063
+        assert port_range.frontend_max == 11063
+
+    def test_overlapping_ranges_rejected(self) -> None:
+        with pytest.raises(ValueError, match="overlap"):
+            PortRange(backend_base=9100, frontend_base=9200, slots=101)
+
+    def test_zero_slots_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            PortRange(slots=0)
+
+    def test_preferred_ports_follow_configured_slots(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ADWS_PORT_SLOTS", "50")
+        backend, frontend = get_ports_for_adw("a1b2c3d4")
+        assert backend == 9100 + int("a1b2c3d4", 36) % 50
+        assert frontend == backend + 100
+
+
+class TestPortLeaseTable:
+    """Tests for PortLeaseTable leasing."""
+
+    def test_colliding_ids_get_distinct_slots(self, lease_file: Path) -> None:
+        """IDs hashing to the same preferred slot must not share ports."""
+        port_range = PortRange(slots=15)
+        table = PortLeaseTable(lease_file=lease_file, port_range=port_range)
+        # "0" and "f" differ by 15 in base 36, so both prefer slot 0
+        assert port_range.preferred_slot("0") == port_range.preferred_slot("f")
+
+        first = table.lease("0")
+        second = table.lease("f")
+        assert first != second
+        assert first == (9100, 9200)
+        assert second == (9101, 9201)
+
+    def test_lease_same_id_is_stable(self, lease_file: Path) -> None:
+        table = PortLeaseTable(lease_file=lease_file)
+        assert table.lease("a1b2c3d4") == table.lease("a1b2c3d4")
+        assert len(table.active_leases()) == 1
+
+    def test_exhausted_range_raises(self, lease_file: Path) -> None:
+        table = PortLeaseTable(lease_file=lease_file, port_range=PortRange(slots=2))
+        table.lease("aaaa0001")
+        table.lease("aaaa0002")
+        with pytest.raises(RuntimeError, match="No free port slots"):
+            table.lease("aaaa0003")
+
+    def test_release_frees_slot(self, lease_file: Path) -> None:
+        table = PortLeaseTable(lease_file=lease_file, port_range=PortRange(slots=1))
+        ports = table.lease("aaaa0001")
+        assert table.release("aaaa0001") is True
+        assert table.release("aaaa0001") is False
+        assert table.lease("aaaa0002") == ports
+
+    def test_release_without_table_creates_nothing(self, temp_workspace: Path) -> None:
+        lease_file = temp_workspace / "missing" / ".port_leases.json"
+        table = PortLeaseTable(lease_file=lease_file)
+        assert table.release("aaaa0001") is False
+        assert not lease_file.parent.exists()
+
+    def test_orphaned_leases_reclaimed_when_full(
+        self, lease_file: Path, temp_workspace: Path
+    ) -> None:
+        table = PortLeaseTable(
+            lease_file=lease_file, port_range=PortRange(slots=1), orphan_grace=timedelta(0)
+        )
+        table.lease("aaaa0001", worktree_path=temp_workspace / "trees" / "gone")
+        ports = table.lease("aaaa0002")
+        assert table.get("aaaa0001") is None
+        assert table.get("aaaa0002") == ports
+
+    def test_fresh_lease_not_reclaimed_before_worktree_exists(
+        self, lease_file: Path, temp_workspace: Path
+    ) -> None:
+        """Ports are leased before the worktree is created."""
+        table = PortLeaseTable(lease_file=lease_file, port_range=PortRange(slots=1))
+        ports = table.lease("aaaa0001", worktree_path=temp_workspace / "trees" / "aaaa0001")
+        with pytest.raises(RuntimeError, match="No free port slots"):
+            table.lease("aaaa0002")
+        assert table.get("aaaa0001") == ports
+
+    def test_live_worktree_lease_not_reclaimed(
+        self, lease_file: Path, temp_workspace: Path
+    ) -> None:
+        live = temp_workspace / "trees" / "live"
+        live.mkdir(parents=True)
+        table = PortLeaseTable(lease_file=lease_file, port_range=PortRange(slots=1))
+        table.lease("aaaa0001", worktree_path=live)
+        with pytest.raises(RuntimeError):
+            table.lease("aaaa0002")
+
+    def test_concurrent_leases_never_collide(self, lease_file: Path) -> None:
+        table = PortLeaseTable(lease_file=lease_file, port_range=PortRange(slots=40))
+        results: dict[str, tuple[int, int]] = {}
+
+        def worker(adw_id: str) -> None:
+            results[adw_id] = PortLeaseTable(
+                lease_file=lease_file, port_range=table.port_range
+            ).lease(adw_id)
+
+        threads = [
+            threading.Thread(target=worker, args=(f"{i:08x}",)) for i in range(40)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(results.values())) == 40
+
+
+class TestLeaseHelpers:
+    """Tests for worktree_ops lease helpers."""
+
+    def test_lease_and_release(self, temp_workspace: Path) -> None:
+        agents_base = temp_workspace / "agents"
+        ports = lease_ports_for_adw("a1b2c3d4", agents_base=agents_base)
+        assert ports == lease_ports_for_adw("a1b2c3d4", agents_base=agents_base)
+        assert release_ports_for_adw("a1b2c3d4", agents_base=agents_base) is True
+        assert release_ports_for_adw("a1b2c3d4", agents_base=agents_base) is False
+
+
+class TestStatePortBounds:
+    """The configured range is enforced when leasing, not when loading state."""
+
+    def _state(self, backend: int, frontend: int) -> ADWState:
+        return ADWState(
+            adw_id="a1b2c3d4",
+            issue_number=1,
+            worktree_path="trees/a1b2c3d4",
+            backend_port=backend,
+            frontend_port=frontend,
+            branch_name="feat/issue-1-a1b2c3d4",
+        )
+
+    def test_state_from_earlier_range_still_loads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ADWS_PORT_SLOTS", "60")
+        saved = self._state(9159, 9259).model_dump_json()
+        monkeypatch.setenv("ADWS_PORT_SLOTS", "15")
+        monkeypatch.setenv("ADWS_BACKEND_PORT_BASE", "10000")
+        monkeypatch.setenv("ADWS_FRONTEND_PORT_BASE", "11000")
+
+        assert ADWState.model_validate_json(saved).backend_port == 9159
+
+    def test_invalid_ports_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            self._state(0, 9200)
+        with pytest.raises(ValidationError):
+            self._state(9100, 70000)
+
+    def test_leases_follow_configured_range(
+        self, lease_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ADWS_BACKEND_PORT_BASE", "10000")
+        monkeypatch.setenv("ADWS_FRONTEND_PORT_BASE", "11000")
+        backend, frontend = PortLeaseTable(lease_file=lease_file).lease("a1b2c3d4")
+        assert 10000 <= backend <= 10014
+        assert 11000 <= frontend <= 11014
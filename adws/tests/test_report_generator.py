@@ -0,0 +1,76 @@
+"""Tests for single-pass streaming report rendering."""
+
+from __future__ import annotations
+
+import io
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from adws.adw_modules.metrics_replay import synthetic_fixtures
+from adws.adw_modules.report_generator import (
+    ReportWriter,
+    generate_html_report,
+    generate_markdown_report,
+    render_report,
+    write_reports,
+)
+
+NOW = datetime(2026, 3, 2, 7, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def results():
+    return synthetic_fixtures(days=7, rows=50)
+
+
+class TestRenderReport:
+    def test_one_pass_matches_single_format_reports(self, results) -> None:
+        md, html = io.StringIO(), io.StringIO()
+        render_report(results, NOW, "morning", 7, md, html)
+
+        assert md.getvalue() == generate_markdown_report(results, NOW, "morning", 7)
+        assert html.getvalue() == generate_html_report(results, NOW, "morning", 7)
+
+    def test_chunked_flushes_do_not_change_output(
+        self, results, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        expected = generate_markdown_report(results, NOW, "morning", 7)
+        monkeypatch.setattr(ReportWriter, "FLUSH_EVERY", 3)
+        assert generate_markdown_report(results, NOW, "morning", 7) == expected
+
+    def test_table_rows_format_both_outputs(self) -> None:
+        md, html = io.StringIO(), io.StringIO()
+        out = ReportWriter(md, html)
+        out.table_rows([("a", 1.5), ("b", 2)], md_row="| `{}` | {:.1f} |")
+        out.flush()
+
+        assert md.getvalue() == "| `a` | 1.5 |\n| `b` | 2.0 |"
+        assert html.getvalue() == "<tr><td>a</td><td>1.5</td></tr><tr><td>b</td><td>2</td></tr>"
+
+
+class TestWriteReports:
+    def test_writes_both_files_without_leftovers(self, results, temp_workspace: Path) -> None:
+        md_path, html_path = write_reports(results, NOW, "evening", 7, temp_workspace)
+
+        assert md_path.name == "daily-metrics-2026-03-02-evening.md"
+        assert md_path.read_text() == generate_markdown_report(results, NOW, "evening", 7)
+        assert html_path.read_text() == generate_html_report(results, NOW, "evening", 7)
+        assert not list(temp_workspace.glob("*.tmp"))
+
+    def test_failed_render_keeps_previous_reports(
+        self, results, temp_workspace: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        md_path, _ = write_reports(results, NOW, "evening", 7, temp_workspace)
+        previous = md_path.read_text()
+
+        def explode(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(ReportWriter, "table_rows", explode)
+        with pytest.raises(RuntimeError):
+            write_reports(results, NOW, "evening", 7, temp_workspace)
+
+        assert md_path.read_text() == previous
+        assert not list(temp_workspace.glob("*.tmp"))
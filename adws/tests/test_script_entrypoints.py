@@ -21,7 +21,11 @@ ADWS_ROOT = Path(__file__).resolve().parents[1]
         "scripts.adw_review_iso",
         "scripts.adw_document_iso",
         "scripts.adw_ship_iso",
+        "scripts.adw_pool",
         "scripts.metrics_report",
+        "scripts.benchmark_worktrees",
+        "scripts.benchmark_ads_stream",
+        "scripts.benchmark_metrics_pipeline",
     ],
 )
 def test_entrypoint_help_runs_from_adws_root(module_name: str) -> None:
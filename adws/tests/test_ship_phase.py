@@ -10,11 +10,13 @@ Covers:
 - PR body generation
 """
 
+import subprocess
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from adws.adw_modules.git_async import GitResult
 from adws.scripts.adw_ship_iso import (
     PullRequestInfo,
     ShipLog,
@@ -137,77 +139,73 @@ class TestShipLogWithPR:
         assert log.pull_request.html_url == "https://github.com/owner/repo/pull/123"
 
 
+def fake_run_git(stdout: str = "", stderr: str = "", returncode: int = 0):
+    """Build an async stand-in for git_async.run_git returning a fixed result."""
+
+    async def _run_git(*args, cwd=None, timeout=None, check=False):
+        return GitResult(["git", *args], returncode, stdout, stderr, 1.0)
+
+    return _run_git
+
+
 class TestGetRepoInfo:
     """Tests for get_repo_info function."""
 
     @pytest.mark.asyncio
     async def test_get_repo_info_https(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "https://github.com/owner/repo.git\n"
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("https://github.com/owner/repo.git\n"),
+        )
         owner, repo = await get_repo_info("fake-token")
         assert owner == "owner"
         assert repo == "repo"
 
     @pytest.mark.asyncio
     async def test_get_repo_info_https_no_git_suffix(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "https://github.com/owner/repo\n"
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("https://github.com/owner/repo\n"),
+        )
         owner, repo = await get_repo_info("fake-token")
         assert owner == "owner"
         assert repo == "repo"
 
     @pytest.mark.asyncio
     async def test_get_repo_info_ssh(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "git@github.com:owner/repo.git\n"
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("git@github.com:owner/repo.git\n"),
+        )
         owner, repo = await get_repo_info("fake-token")
         assert owner == "owner"
         assert repo == "repo"
 
     @pytest.mark.asyncio
     async def test_get_repo_info_ssh_no_git_suffix(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "git@github.com:owner/repo\n"
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("git@github.com:owner/repo\n"),
+        )
         owner, repo = await get_repo_info("fake-token")
         assert owner == "owner"
         assert repo == "repo"
 
     @pytest.mark.asyncio
     async def test_get_repo_info_failure(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = ""
-            result.stderr = "fatal: not a git repository"
-            result.returncode = 128
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git(stderr="fatal: not a git repository", returncode=128),
+        )
         with pytest.raises(ValueError, match="Failed to get git remote"):
             await get_repo_info("fake-token")
 
     @pytest.mark.asyncio
     async def test_get_repo_info_invalid_url(self, monkeypatch):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "https://gitlab.com/owner/repo.git\n"
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("https://gitlab.com/owner/repo.git\n"),
+        )
         with pytest.raises(ValueError, match="Could not parse remote URL"):
             await get_repo_info("fake-token")
 
@@ -217,13 +215,10 @@ class TestPushBranch:
 
     @pytest.mark.asyncio
     async def test_push_branch_success(self, monkeypatch, temp_workspace):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = "Everything up-to-date"
-            result.stderr = ""
-            result.returncode = 0
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git("Everything up-to-date"),
+        )
         worktree_path = temp_workspace / "trees" / "test1234"
         worktree_path.mkdir(parents=True)
 
@@ -232,13 +227,22 @@ class TestPushBranch:
 
     @pytest.mark.asyncio
     async def test_push_branch_failure(self, monkeypatch, temp_workspace):
-        def mock_run(*args, **kwargs):
-            result = MagicMock()
-            result.stdout = ""
-            result.stderr = "error: failed to push some refs"
-            result.returncode = 1
-            return result
-        monkeypatch.setattr("subprocess.run", mock_run)
+        monkeypatch.setattr(
+            "adws.scripts.adw_ship_iso.run_git",
+            fake_run_git(stderr="error: failed to push some refs", returncode=1),
+        )
+        worktree_path = temp_workspace / "trees" / "test1234"
+        worktree_path.mkdir(parents=True)
+
+        result = await push_branch(worktree_path, "feat/test-branch")
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_push_branch_timeout(self, monkeypatch, temp_workspace):
+        async def timed_out(*args, cwd=None, timeout=None, check=False):
+            raise subprocess.TimeoutExpired(["git", *args], timeout)
+
+        monkeypatch.setattr("adws.scripts.adw_ship_iso.run_git", timed_out)
         worktree_path = temp_workspace / "trees" / "test1234"
         worktree_path.mkdir(parents=True)
 
@@ -379,6 +383,21 @@ class TestCleanupWorktree:
         assert result is True
         mock_remove.assert_called_once()
 
+    def test_cleanup_worktree_recycles_into_pool(self, monkeypatch, temp_workspace):
+        trees_base = temp_workspace / "trees"
+        (trees_base / "test1234").mkdir(parents=True)
+
+        mock_remove = MagicMock()
+        mock_recycle = MagicMock()
+        monkeypatch.setattr("adws.scripts.adw_ship_iso.remove_worktree", mock_remove)
+        monkeypatch.setattr("adws.scripts.adw_ship_iso.WorktreePool.recycle", mock_recycle)
+
+        result = cleanup_worktree("test1234", trees_base=trees_base, recycle=True)
+
+        assert result is True
+        mock_recycle.assert_called_once_with("test1234", delete_branch=False)
+        mock_remove.assert_not_called()
+
 
 class TestLoadArtifacts:
     """Tests for artifact loading functions."""
@@ -68,13 +68,13 @@ class TestADWState:
         assert len(state.all_adws) == 0
 
     def test_port_validation(self) -> None:
-        """Test that port validation enforces ranges."""
+        """Test that port validation rejects invalid TCP ports."""
         with pytest.raises(ValueError):
             ADWState(
                 adw_id="a1b2c3d4",
                 issue_number=42,
                 worktree_path="/tmp/trees/a1b2c3d4",
-                backend_port=9099,  # Invalid: below 9100
+                backend_port=0,  # Invalid: not a TCP port
                 frontend_port=9203,
                 branch_name="feat/issue-42-a1b2c3d4",
             )
@@ -85,7 +85,7 @@ class TestADWState:
                 issue_number=42,
                 worktree_path="/tmp/trees/a1b2c3d4",
                 backend_port=9103,
-                frontend_port=9215,  # Invalid: above 9214
+                frontend_port=65536,  # Invalid: above 65535
                 branch_name="feat/issue-42-a1b2c3d4",
             )
 
@@ -4,11 +4,13 @@ Tests for ADWS Worktree Auto-Cleanup.
 Tests cover:
 - TTL-based cleanup of old worktrees
 - State annotation during cleanup
+- Batched cleanup against a real git repo and dry-run reports
 - Full workflow cleanup with archiving
 """
 
 import json
 import os
+import subprocess
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -16,8 +18,13 @@ from unittest.mock import patch
 import pytest
 
 from adws.adw_modules.worktree_ops import (
+    _parse_worktree_porcelain,
+    batch_cleanup_worktrees,
     cleanup_old_worktrees,
     cleanup_worktree_and_state,
+    create_worktree,
+    lease_ports_for_adw,
+    release_ports_for_adw,
 )
 
 
@@ -190,6 +197,206 @@ class TestCleanupOldWorktrees:
         assert "recent" not in cleaned
 
 
+@pytest.fixture
+def git_repo(temp_workspace: Path) -> Path:
+    """Create a temporary git repository with one commit."""
+    repo = temp_workspace / "repo"
+    repo.mkdir()
+    for cmd in (
+        ["git", "init"],
+        ["git", "config", "user.email", "test@example.com"],
+        ["git", "config", "user.name", "Test User"],
+    ):
+        subprocess.run(cmd, cwd=repo, capture_output=True, check=True)
+    (repo / "README.md").write_text("# Test\n")
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", "init"], cwd=repo, capture_output=True, check=True
+    )
+    return repo
+
+
+def _age(path: Path, hours: float) -> None:
+    past = time.time() - hours * 3600
+    os.utime(path, (past, past))
+
+
+def _branches(repo: Path) -> str:
+    return subprocess.run(
+        ["git", "branch", "--list"], cwd=repo, capture_output=True, text=True
+    ).stdout
+
+
+class TestBatchCleanupWorktrees:
+    """Tests for batched cleanup against real git worktrees."""
+
+    def test_removes_worktrees_and_branches_in_one_batch(
+        self,
+        temp_workspace: Path,
+        git_repo: Path,
+        mock_agents: Path,
+    ) -> None:
+        trees = temp_workspace / "trees"
+        for i, adw_id in enumerate(("old00001", "old00002", "new00001")):
+            path, _ = create_worktree(adw_id, i, repo_path=git_repo, trees_base=trees)
+            if adw_id.startswith("old"):
+                _age(path, 100)
+        lease_ports_for_adw("old00001", agents_base=mock_agents, trees_base=trees)
+
+        report = batch_cleanup_worktrees(
+            max_age_hours=72,
+            trees_base=trees,
+            repo_path=git_repo,
+            agents_base=mock_agents,
+        )
+
+        assert sorted(report.removed) == ["old00001", "old00002"]
+        assert report.failed == {}
+        assert sorted(report.deleted_branches) == [
+            "feat/issue-0-old00001",
+            "feat/issue-1-old00002",
+        ]
+        assert not (trees / "old00001").exists()
+        assert (trees / "new00001").exists()
+        branches = _branches(git_repo)
+        assert "old00001" not in branches
+        assert "new00001" in branches
+        assert release_ports_for_adw("old00001", agents_base=mock_agents) is False
+
+        worktrees = subprocess.run(
+            ["git", "worktree", "list", "--porcelain"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout
+        assert "old00001" not in worktrees
+
+    def test_undeletable_branch_reported_separately(
+        self,
+        temp_workspace: Path,
+        git_repo: Path,
+        mock_agents: Path,
+    ) -> None:
+        trees = temp_workspace / "trees"
+        for i, adw_id in enumerate(("old00001", "old00002")):
+            path, _ = create_worktree(adw_id, i, repo_path=git_repo, trees_base=trees)
+            _age(path, 100)
+        # A branch still checked out in another worktree can't be deleted
+        subprocess.run(
+            ["git", "worktree", "add", "--force", str(temp_workspace / "other"),
+             "feat/issue-1-old00002"],
+            cwd=git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        report = batch_cleanup_worktrees(
+            max_age_hours=72,
+            trees_base=trees,
+            repo_path=git_repo,
+            agents_base=mock_agents,
+        )
+
+        assert sorted(report.removed) == ["old00001", "old00002"]
+        assert report.deleted_branches == ["feat/issue-0-old00001"]
+        assert list(report.failed_branches) == ["feat/issue-1-old00002"]
+        assert "checked out" in report.failed_branches["feat/issue-1-old00002"]
+        assert "feat/issue-1-old00002" in _branches(git_repo)
+        assert "Branch feat/issue-1-old00002 not deleted" in report.summary()
+
+    def test_dry_run_reports_without_removing(
+        self,
+        temp_workspace: Path,
+        git_repo: Path,
+    ) -> None:
+        trees = temp_workspace / "trees"
+        path, branch = create_worktree("old00001", 7, repo_path=git_repo, trees_base=trees)
+        _age(path, 100)
+
+        report = batch_cleanup_worktrees(
+            max_age_hours=72,
+            trees_base=trees,
+            repo_path=git_repo,
+            dry_run=True,
+        )
+
+        assert [c.adw_id for c in report.candidates] == ["old00001"]
+        assert report.candidates[0].branch == branch
+        assert report.removed == []
+        assert path.exists()
+        assert "discover" in report.timings_ms
+        assert "total" in report.timings_ms
+        assert "Would remove 1 worktree(s)" in report.summary()
+
+    @patch("adws.adw_modules.worktree_ops.subprocess.run")
+    def test_single_prune_and_branch_delete(
+        self,
+        mock_run: object,
+        temp_workspace: Path,
+        mock_trees: Path,
+    ) -> None:
+        porcelain = "".join(
+            f"worktree {(mock_trees / f'old{i}').resolve()}\nHEAD abc\n"
+            f"branch refs/heads/feat/issue-{i}-old{i}\n\n"
+            for i in range(5)
+        )
+        mock_run.return_value = subprocess.CompletedProcess([], 0, porcelain, "")
+        for i in range(5):
+            _create_fake_worktree(mock_trees, f"old{i}", age_hours=100)
+
+        report = batch_cleanup_worktrees(
+            max_age_hours=72,
+            trees_base=mock_trees,
+            repo_path=temp_workspace,
+            agents_base=temp_workspace / "agents",
+        )
+
+        assert len(report.removed) == 5
+        commands = [call.args[0] for call in mock_run.call_args_list]
+        assert commands.count(["git", "worktree", "prune"]) == 1
+        branch_deletes = [c for c in commands if c[:3] == ["git", "branch", "-D"]]
+        assert len(branch_deletes) == 1
+        assert len(branch_deletes[0]) == 8
+
+    def test_cleanup_old_worktrees_dry_run_keeps_dirs(
+        self,
+        temp_workspace: Path,
+        mock_trees: Path,
+    ) -> None:
+        wt = _create_fake_worktree(mock_trees, "old_one", age_hours=100)
+
+        cleaned = cleanup_old_worktrees(
+            max_age_hours=72,
+            trees_base=mock_trees,
+            repo_path=temp_workspace,
+            dry_run=True,
+        )
+
+        assert cleaned == ["old_one"]
+        assert wt.exists()
+
+
+class TestParseWorktreePorcelain:
+    """Tests for porcelain parsing."""
+
+    def test_parses_branches_and_flags(self) -> None:
+        output = (
+            "worktree /repo\nHEAD 1111\nbranch refs/heads/main\n\n"
+            "worktree /repo/trees/abc\nHEAD 2222\ndetached\n\n"
+            "worktree /repo/trees/def\nHEAD 3333\nbranch refs/heads/feat/x\nlocked\n"
+        )
+        entries = _parse_worktree_porcelain(output)
+        assert [e["worktree"] for e in entries] == [
+            "/repo",
+            "/repo/trees/abc",
+            "/repo/trees/def",
+        ]
+        assert entries[0]["branch"] == "main"
+        assert "detached" in entries[1]
+        assert entries[2]["branch"] == "feat/x"
+        assert "locked" in entries[2]
+
+
 class TestCleanupWorktreeAndState:
     """Tests for full single-workflow cleanup."""
 
@@ -7,6 +7,8 @@ Tests cover:
 - Worktree creation in temporary git repos
 - Worktree removal and cleanup
 - Active worktree listing
+- Sparse worktrees and the idle worktree pool
+- Cached worktree inventory
 """
 
 import subprocess
@@ -15,12 +17,19 @@ from pathlib import Path
 import pytest
 
 from adws.adw_modules.worktree_ops import (
+    WorktreeInventory,
+    WorktreePool,
+    add_sparse_paths,
     create_worktree,
     generate_adw_id,
     get_ports_for_adw,
     get_worktree_info,
+    get_worktree_inventory,
+    lease_ports_for_adw,
     list_active_worktrees,
+    release_ports_for_adw,
     remove_worktree,
+    sparse_paths_for_plan,
 )
 
 
@@ -280,6 +289,33 @@ class TestRemoveWorktree:
         )
         assert branch_name not in result.stdout
 
+    def test_releases_port_lease(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        """Test that removing a worktree frees its leased ports."""
+        trees_base = temp_workspace / "trees"
+        agents_base = temp_workspace / "agents"
+        adw_id = "ls123456"
+
+        lease_ports_for_adw(adw_id, agents_base=agents_base, trees_base=trees_base)
+        create_worktree(
+            adw_id=adw_id,
+            issue_number=1,
+            repo_path=temp_git_repo,
+            trees_base=trees_base,
+        )
+
+        remove_worktree(
+            adw_id=adw_id,
+            trees_base=trees_base,
+            repo_path=temp_git_repo,
+            agents_base=agents_base,
+        )
+
+        assert release_ports_for_adw(adw_id, agents_base=agents_base) is False
+
     def test_handles_nonexistent_worktree(
         self,
         temp_git_repo: Path,
@@ -472,3 +508,317 @@ class TestWorktreeIntegration:
         # Verify removal
         assert not worktree_path.exists()
         assert adw_id not in list_active_worktrees(trees_base, temp_git_repo)
+
+
+@pytest.fixture
+def nested_git_repo(temp_git_repo: Path) -> Path:
+    """Add nested directories to the temp repo so sparse mode has work to skip."""
+    for rel in ("apps/web/page.tsx", "apps/extension/popup.tsx", "adws/mod.py"):
+        path = temp_git_repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"// {rel}\n")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add nested dirs"],
+        cwd=temp_git_repo,
+        capture_output=True,
+        check=True,
+    )
+    return temp_git_repo
+
+
+class TestSparseWorktree:
+    """Tests for sparse worktree mode."""
+
+    def test_sparse_paths_for_plan(self) -> None:
+        paths = sparse_paths_for_plan(
+            ["apps/web/lib/new.ts", "README.md", "./adws/tests/test_x.py"],
+            ["apps/web/lib/db.ts", "apps/web/app/page.tsx", "/etc/passwd", "../x/y.py"],
+        )
+        assert paths == ["adws/tests", "apps/web/app", "apps/web/lib"]
+
+    def test_sparse_paths_collapse_nested(self) -> None:
+        paths = sparse_paths_for_plan(["apps/a.ts", "apps/web/b.ts"], [])
+        assert paths == ["apps"]
+
+    def test_sparse_checkout_only_root_and_paths(
+        self,
+        nested_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        worktree_path, branch_name = create_worktree(
+            adw_id="sp123456",
+            issue_number=3,
+            repo_path=nested_git_repo,
+            trees_base=temp_workspace / "trees",
+            sparse=True,
+            sparse_paths=["adws"],
+        )
+
+        assert (worktree_path / "README.md").exists()
+        assert (worktree_path / "adws" / "mod.py").exists()
+        assert not (worktree_path / "apps").exists()
+        info = get_worktree_info("sp123456", trees_base=temp_workspace / "trees")
+        assert info is not None
+        assert info["branch"] == branch_name
+
+    def test_add_sparse_paths_widens_checkout(
+        self,
+        nested_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        worktree_path, _ = create_worktree(
+            adw_id="sp654321",
+            issue_number=3,
+            repo_path=nested_git_repo,
+            trees_base=temp_workspace / "trees",
+            sparse=True,
+        )
+        assert not (worktree_path / "apps").exists()
+
+        add_sparse_paths(worktree_path, ["apps/web"])
+
+        assert (worktree_path / "apps" / "web" / "page.tsx").exists()
+        assert not (worktree_path / "apps" / "extension").exists()
+
+
+class TestWorktreePool:
+    """Tests for WorktreePool."""
+
+    def test_acquire_hands_out_idle_worktree(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        assert pool.fill(2) == 2
+        assert pool.fill(2) == 0
+
+        worktree_path, branch_name = pool.acquire("pl123456", issue_number=5)
+
+        assert worktree_path == trees_base / "pl123456"
+        assert branch_name == "feat/issue-5-pl123456"
+        assert len(pool.idle()) == 1
+        assert (worktree_path / "README.md").exists()
+        result = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == branch_name
+
+    def test_acquire_resets_to_current_head(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        pool.fill(1)
+        (pool.idle()[0] / "scratch.txt").write_text("leftover")
+
+        (temp_git_repo / "NEW.md").write_text("new\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "New file"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        worktree_path, _ = pool.acquire("pl654321", issue_number=5)
+
+        assert (worktree_path / "NEW.md").exists()
+        assert not (worktree_path / "scratch.txt").exists()
+
+    def test_acquire_falls_back_when_empty(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=temp_workspace / "trees")
+        worktree_path, _ = pool.acquire("pl000001", issue_number=5)
+        assert (worktree_path / "README.md").exists()
+
+    def test_recycle_returns_worktree_to_pool(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        _, branch_name = pool.acquire("pl000002", issue_number=5)
+
+        slot = pool.recycle("pl000002")
+
+        assert slot in pool.idle()
+        assert not (trees_base / "pl000002").exists()
+        branches = subprocess.run(
+            ["git", "branch", "--list", branch_name],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout
+        assert branch_name not in branches
+
+    def test_recycle_releases_port_lease(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        agents_base = temp_workspace / "agents"
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        pool.acquire("pl000004", issue_number=5)
+        lease_ports_for_adw("pl000004", agents_base=agents_base, trees_base=trees_base)
+
+        pool.recycle("pl000004", agents_base=agents_base)
+
+        assert release_ports_for_adw("pl000004", agents_base=agents_base) is False
+
+    def test_idle_worktrees_only_handed_out_to_matching_mode(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        (temp_git_repo / "src").mkdir()
+        (temp_git_repo / "src" / "app.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add src"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+        full_pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        sparse_pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base, sparse=True)
+        sparse_pool.fill(1)
+        assert full_pool.idle() == []
+
+        worktree_path, _ = full_pool.acquire("pl000005", issue_number=5)
+        assert len(sparse_pool.idle()) == 1
+        assert (worktree_path / "src" / "app.py").exists()
+
+        sparse_path, _ = sparse_pool.acquire("pl000006", issue_number=6, sparse_paths=["src"])
+        assert (sparse_path / "src" / "app.py").exists()
+        slot = full_pool.recycle("pl000006", agents_base=temp_workspace / "agents")
+
+        assert slot in sparse_pool.idle()
+        assert full_pool.idle() == []
+        assert not (slot / "src").exists()
+
+    def test_pool_hidden_from_active_list(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        pool = WorktreePool(repo_path=temp_git_repo, trees_base=trees_base)
+        pool.fill(1)
+        assert list_active_worktrees(trees_base, temp_git_repo) == []
+
+        pool.acquire("pl000003", issue_number=5)
+        assert list_active_worktrees(trees_base, temp_git_repo) == ["pl000003"]
+
+
+class TestWorktreeInventory:
+    """Tests for the cached worktree inventory."""
+
+    def test_single_git_call_for_many_queries(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        for i in range(3):
+            create_worktree(f"inv0000{i}", i, repo_path=temp_git_repo, trees_base=trees_base)
+
+        inventory = WorktreeInventory(temp_git_repo)
+        for _ in range(5):
+            assert sorted(inventory.adw_ids(trees_base)) == [
+                "inv00000",
+                "inv00001",
+                "inv00002",
+            ]
+            record = inventory.get(trees_base / "inv00001")
+            assert record is not None
+            assert record.branch == "feat/issue-1-inv00001"
+            assert len(record.commit) == 7
+            assert record.age_hours() is not None
+
+        assert inventory.git_calls == 1
+
+    def test_invalidated_by_worktree_add_and_remove(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        inventory = WorktreeInventory(temp_git_repo)
+        assert inventory.adw_ids(trees_base) == []
+
+        create_worktree("inv10000", 1, repo_path=temp_git_repo, trees_base=trees_base)
+        assert inventory.adw_ids(trees_base) == ["inv10000"]
+
+        remove_worktree("inv10000", trees_base=trees_base, repo_path=temp_git_repo)
+        assert inventory.adw_ids(trees_base) == []
+        assert inventory.git_calls == 3
+
+    def test_invalidated_by_commit_in_worktree(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        worktree_path, _ = create_worktree(
+            "inv20000", 1, repo_path=temp_git_repo, trees_base=trees_base
+        )
+        inventory = WorktreeInventory(temp_git_repo)
+        before = inventory.get(worktree_path)
+        assert before is not None
+
+        (worktree_path / "change.txt").write_text("x\n")
+        subprocess.run(["git", "add", "."], cwd=worktree_path, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "change"],
+            cwd=worktree_path,
+            capture_output=True,
+            check=True,
+        )
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        after = inventory.get(worktree_path)
+        assert after is not None
+        assert after.head == head
+        assert after.head != before.head
+
+    def test_shared_between_repo_and_worktree_paths(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        worktree_path, _ = create_worktree(
+            "inv30000", 1, repo_path=temp_git_repo, trees_base=temp_workspace / "trees"
+        )
+        assert get_worktree_inventory(temp_git_repo) is get_worktree_inventory(worktree_path)
+
+    def test_get_worktree_info_reports_age(
+        self,
+        temp_git_repo: Path,
+        temp_workspace: Path,
+    ) -> None:
+        trees_base = temp_workspace / "trees"
+        create_worktree("inv40000", 1, repo_path=temp_git_repo, trees_base=trees_base)
+        info = get_worktree_info("inv40000", trees_base=trees_base)
+        assert info is not None
+        assert float(info["age_hours"]) < 1.0
@@ -7,11 +7,16 @@ Uses SVG source files for pixel-perfect rendering at any resolution.
 The original sparkle is preserved intact while additional satellite sparkles
 animate around it with smooth fade in/out transparency.
 
+Frames are rendered in parallel (ASSET_JOBS threads, default one per CPU),
+quantized to one palette shared by the whole animation, and written as
+frame deltas when the animation allows it (see asset_lib/gif.py).
+
 Requirements:
-    pip install Pillow cairosvg
+    pip install Pillow cairosvg numpy
 
 Usage:
-    python create_gif.py
+    python create_gif.py            # rebuild GIFs whose SVG or settings changed
+    python create_gif.py --force    # rebuild everything
 
 Output:
     - animated-logo-512.gif  (512x512, highest quality)
@@ -22,6 +27,10 @@ import os
 import sys
 import math
 import io
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared asset helpers live in asset/asset_lib
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     from PIL import Image, ImageDraw
@@ -35,6 +44,11 @@ except ImportError:
     print("Error: cairosvg is required. Install with: pip install cairosvg")
     sys.exit(1)
 
+from asset_lib.gif import quantize_frames, save_gif
+from asset_lib.jobs import default_workers
+from asset_lib.manifest import BuildManifest, parse_build_args
+from asset_lib.raster_cache import CACHE_DIR_NAME, RasterCache
+
 
 # =============================================================================
 # Configuration
@@ -51,6 +65,7 @@ OUTPUT_SIZES = [512, 400]  # Generate these sizes
 # Colors (from ThemeGPT brand palette)
 TEAL_SPARKLE = (129, 200, 183)   # #81c8b7 - sparkle color
 CREAM_BG = (255, 250, 241)       # #fffaf1 - background color
+CREAM_TOLERANCE = 15             # RGB distance keyed out as background
 
 # Transparency flag (set to True for transparent GIFs)
 TRANSPARENT_BG = True
@@ -64,6 +79,12 @@ SPARKLE_Y_RATIO = 0.182
 LOGO_SVG = "source-logo.svg"
 MASCOT_SVG = "source-mascot.svg"
 
+# Decoded SVG renders, reused within a run and across runs (memory-mapped .npy)
+RASTER_CACHE = RasterCache(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), CACHE_DIR_NAME),
+    renderer=f"cairosvg-{getattr(cairosvg, '__version__', 'unknown')}",
+)
+
 
 # =============================================================================
 # Rendering Functions
@@ -73,16 +94,37 @@ def render_svg_to_pil(svg_path, size):
     """
     Render an SVG file to a PIL Image at the specified size.
 
+    Renders are cached by SVG content, size and background mode (see
+    RASTER_CACHE), so each is rasterized and decoded only once.
+
     Args:
         svg_path: Path to the SVG file
         size: Output size in pixels (square)
 
     Returns:
-        PIL Image in RGBA mode
+        PIL Image in RGBA mode (shared with the cache; do not modify)
     """
     if not os.path.exists(svg_path):
         raise FileNotFoundError(f"SVG file not found: {svg_path}")
 
+    background = ("keyed", CREAM_BG, CREAM_TOLERANCE) if TRANSPARENT_BG else "opaque"
+    return RASTER_CACHE.get(
+        svg_path, size, size, background, lambda: rasterize_svg(svg_path, size)
+    )
+
+
+def rasterize_svg(svg_path, size):
+    """
+    Rasterize an SVG with cairosvg, keying out the cream background in
+    transparent mode.
+
+    Args:
+        svg_path: Path to the SVG file
+        size: Output size in pixels (square)
+
+    Returns:
+        PIL Image in RGBA mode
+    """
     png_data = cairosvg.svg2png(
         url=svg_path,
         output_width=size,
@@ -109,31 +151,13 @@ def remove_cream_background(img):
         PIL Image with cream pixels made transparent
     """
     import numpy as np
+    from asset_lib.color_key import key_mask
 
-    # Convert to numpy array for efficient processing
     data = np.array(img)
 
-    # Target cream color: #fffaf1 = (255, 250, 241)
-    target_r, target_g, target_b = 255, 250, 241
-
-    # Calculate color distance from cream for each pixel
-    r, g, b, a = data[:,:,0], data[:,:,1], data[:,:,2], data[:,:,3]
-
-    # Color distance threshold (pixels within this distance are made transparent)
-    threshold = 15
-
-    # Calculate Euclidean distance from cream color
-    distance = np.sqrt(
-        (r.astype(float) - target_r)**2 +
-        (g.astype(float) - target_g)**2 +
-        (b.astype(float) - target_b)**2
-    )
-
-    # Create mask for cream-like pixels
-    cream_mask = distance < threshold
-
-    # Set alpha to 0 for cream pixels
-    data[:,:,3] = np.where(cream_mask, 0, a)
+    # Pixels within CREAM_TOLERANCE (Euclidean) of cream keep their RGB but lose alpha
+    cream_mask = key_mask(data, (CREAM_BG,), tolerance=CREAM_TOLERANCE, metric="euclidean")
+    data[cream_mask, 3] = 0
 
     return Image.fromarray(data, 'RGBA')
 
@@ -260,6 +284,29 @@ def create_animation_frame(frame_num, total_frames, base_image, size):
     return frame
 
 
+def render_animation_frames(base_image, size, num_frames, workers=None):
+    """
+    Render all RGBA animation frames from a rendered logo, in parallel.
+    
+    Frames only read ``base_image``, so they are drawn on a thread pool
+    (Pillow releases the GIL while pasting and compositing).
+    
+    Args:
+        base_image: PIL Image of the logo (rendered from SVG)
+        size: Output size in pixels
+        num_frames: Number of frames to generate
+        workers: Thread count (default: default_workers())
+    
+    Returns:
+        List of RGBA PIL Image frames in order
+    """
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+        return list(pool.map(
+            lambda i: create_animation_frame(i, num_frames, base_image, size),
+            range(num_frames),
+        ))
+
+
 def generate_animation_frames(svg_path, size, num_frames):
     """
     Generate all animation frames for a given size.
@@ -270,33 +317,13 @@ def generate_animation_frames(svg_path, size, num_frames):
         num_frames: Number of frames to generate
     
     Returns:
-        List of PIL Image frames
+        List of P mode PIL Image frames sharing one palette, with pixels at
+        alpha <= 128 mapped to the transparency index (transparent mode)
     """
     # Render SVG at target size
     base_image = render_svg_to_pil(svg_path, size)
-    
-    frames = []
-    for i in range(num_frames):
-        frame = create_animation_frame(i, num_frames, base_image, size)
-
-        if TRANSPARENT_BG:
-            # For transparent GIFs, preserve alpha channel
-            # Convert to palette mode with transparency support
-            alpha = frame.getchannel('A')
-            frame_rgb = frame.convert('RGB')
-            frame_p = frame_rgb.convert('P', palette=Image.Palette.ADAPTIVE, colors=255)
-            # Set transparency for fully transparent pixels
-            mask = Image.eval(alpha, lambda a: 255 if a <= 128 else 0)
-            frame_p.paste(255, mask)
-            frames.append((frame_p, alpha))
-        else:
-            # Convert to palette mode for GIF
-            frame_p = frame.convert('RGB').convert('P',
-                                                    palette=Image.Palette.ADAPTIVE,
-                                                    colors=128)
-            frames.append(frame_p)
-
-    return frames
+    frames = render_animation_frames(base_image, size, num_frames)
+    return quantize_frames(frames, colors=255 if TRANSPARENT_BG else 128)
 
 
 def save_animated_gif(frames, output_path, duration_ms):
@@ -304,7 +331,7 @@ def save_animated_gif(frames, output_path, duration_ms):
     Save frames as an animated GIF.
 
     Args:
-        frames: List of PIL Image frames (or tuples of (frame, alpha) for transparent)
+        frames: List of P mode frames from generate_animation_frames()
         output_path: Output file path
         duration_ms: Duration per frame in milliseconds
     """
@@ -312,40 +339,19 @@ def save_animated_gif(frames, output_path, duration_ms):
         print(f"  Warning: No frames to save for {output_path}")
         return
 
-    if TRANSPARENT_BG:
-        # Handle transparent GIF - frames are tuples (frame_p, alpha)
-        frame_images = [f[0] for f in frames]
-        frame_images[0].save(
-            output_path,
-            save_all=True,
-            append_images=frame_images[1:],
-            duration=duration_ms,
-            loop=0,
-            optimize=False,
-            disposal=2,
-            transparency=255
-        )
-    else:
-        frames[0].save(
-            output_path,
-            save_all=True,
-            append_images=frames[1:],
-            duration=duration_ms,
-            loop=0,
-            optimize=True,
-            disposal=2
-        )
+    delta = save_gif(frames, output_path, duration_ms)
     
     # Report file size
     size_kb = os.path.getsize(output_path) / 1024
-    print(f"  ✓ {os.path.basename(output_path)} ({len(frames)} frames, {size_kb:.1f} KB)")
+    encoding = "frame deltas" if delta else "full frames"
+    print(f"  ✓ {os.path.basename(output_path)} ({len(frames)} frames, {encoding}, {size_kb:.1f} KB)")
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 
-def main():
+def main(force=False):
     """Main entry point for the GIF generator."""
     print("=" * 55)
     print("  ThemeGPT Animated GIF Generator")
@@ -375,9 +381,15 @@ def main():
     
     # Generate GIFs for each size
     print(f"\n📐 Generating animated GIFs...")
+    manifest = BuildManifest(script_dir, __file__, force=force)
     
     for size in OUTPUT_SIZES:
         output_path = f"animated-logo-{size}.gif"
+        # Renderer version in the key so a cairosvg upgrade rebuilds the GIFs
+        key = manifest.key([svg_source], {"size": size, "renderer": RASTER_CACHE.renderer})
+        if manifest.is_current(output_path, key):
+            print(f"\n  {size}x{size}: up to date")
+            continue
         print(f"\n  Rendering {size}x{size}...")
         
         try:
@@ -385,7 +397,12 @@ def main():
             save_animated_gif(frames, output_path, FRAME_DURATION_MS)
         except Exception as e:
             print(f"  ✗ Error: {e}")
+            continue
+        manifest.record(output_path, key)
     
+    manifest.save()
+    manifest.print_summary()
+    print(f"  SVG renders: {RASTER_CACHE.summary()}")
     print("\n" + "=" * 55)
     print("  Generation complete!")
     print("=" * 55)
@@ -396,4 +413,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_build_args(__doc__)
+    main(force=args.force)
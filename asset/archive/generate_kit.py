@@ -6,6 +6,10 @@ Generates all standard sizes and variants for web development
 
 from PIL import Image, ImageDraw
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from asset_lib.color_key import key_variants, replace_keyed
 
 # Paths
 SOURCE = "source-512.png"
@@ -114,22 +118,16 @@ def is_cream(r, g, b, tolerance=20):
 
 def replace_background(img, old_color, new_color, tolerance=25):
     """Replace background color with a new color"""
-    img = img.convert("RGBA")
-    pixels = img.load()
-    width, height = img.size
-    
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            if (abs(r - old_color[0]) < tolerance and 
-                abs(g - old_color[1]) < tolerance and 
-                abs(b - old_color[2]) < tolerance):
-                if len(new_color) == 4:
-                    pixels[x, y] = new_color
-                else:
-                    pixels[x, y] = (*new_color, 255)
-    
-    return img
+    return replace_keyed(img, (old_color,), new_color, tolerance)
+
+def background_variants(img, tolerance=25):
+    """Transparent, white and dark variants from a single cream mask"""
+    return key_variants(
+        img,
+        {"transparent": TRANSPARENT, "white": WHITE, "dark": DARK_BG},
+        keys=(CREAM_BG,),
+        tolerance=tolerance,
+    )
 
 def make_transparent_bg(img, tolerance=25):
     """Make cream background transparent"""
@@ -226,18 +224,21 @@ def generate_social_images(img, output_dir):
 def generate_variants(img, mascot_img, output_dir):
     """Generate logo variants (transparent, dark bg, etc.)"""
     
+    logo_variants = background_variants(img)
+    mascot_variants = background_variants(mascot_img)
+
     # Full logo - transparent background
-    transparent = make_transparent_bg(img.copy())
+    transparent = logo_variants["transparent"]
     transparent.save(os.path.join(output_dir, "logo-full-transparent.png"), "PNG", optimize=True)
     print(f"  ✓ logo-full-transparent.png")
     
     # Full logo - white background
-    white_bg = make_white_bg(img.copy())
+    white_bg = logo_variants["white"]
     white_bg.save(os.path.join(output_dir, "logo-full-white.png"), "PNG", optimize=True)
     print(f"  ✓ logo-full-white.png")
     
     # Full logo - dark background
-    dark_bg = make_dark_bg(img.copy())
+    dark_bg = logo_variants["dark"]
     dark_bg.save(os.path.join(output_dir, "logo-full-dark.png"), "PNG", optimize=True)
     print(f"  ✓ logo-full-dark.png")
     
@@ -246,7 +247,7 @@ def generate_variants(img, mascot_img, output_dir):
     print(f"  ✓ logo-full-cream.png")
     
     # Mascot only - transparent
-    mascot_trans = make_transparent_bg(mascot_img.copy())
+    mascot_trans = mascot_variants["transparent"]
     mascot_trans.save(os.path.join(output_dir, "mascot-transparent.png"), "PNG", optimize=True)
     print(f"  ✓ mascot-transparent.png")
     
@@ -255,12 +256,12 @@ def generate_variants(img, mascot_img, output_dir):
     print(f"  ✓ mascot-cream.png")
     
     # Mascot only - dark
-    mascot_dark = make_dark_bg(mascot_img.copy())
+    mascot_dark = mascot_variants["dark"]
     mascot_dark.save(os.path.join(output_dir, "mascot-dark.png"), "PNG", optimize=True)
     print(f"  ✓ mascot-dark.png")
     
     # Mascot only - white
-    mascot_white = make_white_bg(mascot_img.copy())
+    mascot_white = mascot_variants["white"]
     mascot_white.save(os.path.join(output_dir, "mascot-white.png"), "PNG", optimize=True)
     print(f"  ✓ mascot-white.png")
 
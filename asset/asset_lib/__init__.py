@@ -0,0 +1,8 @@
+"""
+Shared helpers for the ThemeGPT asset scripts.
+
+Scripts outside asset/ put the asset directory on sys.path first:
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from asset_lib.color_key import key_variants
+"""
@@ -0,0 +1,124 @@
+"""
+Vectorized color keying for background replacement.
+
+A key mask marks every pixel close to one of several key colors (e.g. both
+brand creams). The mask is computed once per source image with NumPy and
+then reused for every output variant (transparent, white, dark, ...), so a
+full-resolution source is scanned a single time however many variants are
+written.
+
+Two distance metrics are supported:
+    "box"       - every channel strictly within ``tolerance`` of the key
+                  (the per-channel test the kit generators always used)
+    "euclidean" - RGB distance strictly below ``tolerance``
+                  (the test used by the GIF generator)
+
+Usage:
+    from asset_lib.color_key import key_variants
+
+    variants = key_variants(
+        logo, {"transparent": (0, 0, 0, 0), "white": (255, 255, 255)},
+        keys=[CREAM_BG, CREAM_ALT], tolerance=25,
+    )
+    variants["white"].save("logo-full-white.png")
+"""
+
+import numpy as np
+from PIL import Image
+
+METRICS = ("box", "euclidean")
+
+# Box keys are matched with one bit per key, so a uint8 table holds 8 keys
+_MAX_BOX_KEYS = 8
+
+
+def _as_rgba_array(img):
+    if isinstance(img, np.ndarray):
+        return img
+    return np.asarray(img.convert("RGBA"))
+
+
+def key_mask(img, keys, tolerance=25, metric="box"):
+    """
+    Boolean mask of pixels matching any of ``keys``.
+
+    For the box metric each channel is looked up in a 256-entry table of
+    per-key bits, so all keys are tested in one pass: a pixel matches when
+    the AND of its three channel entries is non-zero.
+
+    Args:
+        img: PIL Image or HxWx3/HxWx4 uint8 array
+        keys: Iterable of (r, g, b) key colors
+        tolerance: Match threshold (exclusive)
+        metric: "box" or "euclidean"
+
+    Returns:
+        HxW bool array
+    """
+    keys = np.asarray(list(keys), dtype=np.int16).reshape(-1, 3)
+    rgb = _as_rgba_array(img)[..., :3]
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Use: {', '.join(METRICS)}")
+    if len(keys) == 0:
+        return np.zeros(rgb.shape[:2], dtype=bool)
+
+    if metric == "euclidean":
+        mask = np.zeros(rgb.shape[:2], dtype=bool)
+        rgb = rgb.astype(np.int32)
+        for key in keys:
+            diff = rgb - key
+            mask |= np.einsum("ijk,ijk->ij", diff, diff) < tolerance * tolerance
+        return mask
+
+    if len(keys) > _MAX_BOX_KEYS:
+        raise ValueError(f"At most {_MAX_BOX_KEYS} keys are supported with the box metric")
+    values = np.arange(256, dtype=np.int16)[:, None]
+    bits = (1 << np.arange(len(keys), dtype=np.uint8)).astype(np.uint8)
+    # tables[c][v] has bit k set when |v - keys[k][c]| < tolerance
+    tables = [
+        np.bitwise_or.reduce(np.where(np.abs(values - keys[:, c]) < tolerance, bits, 0), axis=1)
+        .astype(np.uint8)
+        for c in range(3)
+    ]
+    return (tables[0][rgb[..., 0]] & tables[1][rgb[..., 1]] & tables[2][rgb[..., 2]]) != 0
+
+
+def fill_masked(img, mask, color):
+    """
+    Copy of ``img`` with masked pixels set to ``color``.
+
+    Args:
+        img: PIL Image or HxWx4 uint8 array
+        mask: HxW bool array from key_mask()
+        color: (r, g, b) (made opaque) or (r, g, b, a)
+
+    Returns:
+        PIL Image in RGBA mode
+    """
+    data = np.array(_as_rgba_array(img), dtype=np.uint8)
+    data[mask] = color if len(color) == 4 else (*color, 255)
+    return Image.fromarray(data, "RGBA")
+
+
+def key_variants(img, fills, keys, tolerance=25, metric="box"):
+    """
+    Build several background variants from a single key mask.
+
+    Args:
+        img: Source PIL Image
+        fills: Mapping of variant name to replacement color
+        keys: Iterable of (r, g, b) key colors
+        tolerance: Match threshold (exclusive)
+        metric: "box" or "euclidean"
+
+    Returns:
+        Dict of variant name to PIL Image (RGBA)
+    """
+    data = _as_rgba_array(img)
+    mask = key_mask(data, keys, tolerance, metric)
+    return {name: fill_masked(data, mask, color) for name, color in fills.items()}
+
+
+def replace_keyed(img, keys, color, tolerance=25, metric="box"):
+    """Replace pixels matching any of ``keys`` with ``color``."""
+    return key_variants(img, {"out": color}, keys, tolerance, metric)["out"]
@@ -0,0 +1,237 @@
+"""
+Declarative canvas compositor for gallery images and social assets.
+
+A Canvas is a size, a background and a tuple of layers drawn in order:
+
+- Rect: filled and/or outlined rectangle, rounded when ``radius`` > 0
+- Text: text at a position, optionally centered within a width
+- Picture: an image file, a named source image (Source) or a nested
+  Canvas, optionally resized, pasted at a position
+
+Specs are frozen dataclasses, so they are hashable, picklable and have a
+stable repr (the build manifest hashes it as the task parameters).
+Rendering shares per-process caches across every spec it draws:
+
+- fonts, by (path, size)
+- decoded and resized image files, by (path, mode, size)
+- rendered (and resized) nested canvases, so a logo used by several
+  assets is drawn once
+- resized Source images, through asset_lib.pyramid, since the same source
+  is usually drawn at many sizes
+
+canvas_task() wraps a spec as a jobs.Task, so a script's specs render as
+one batch through run_tasks(): all in this process with one worker, or
+spread across worker processes that each keep their caches between tasks.
+
+Usage:
+    from asset_lib.compose import Canvas, Picture, Rect, Source, Text, canvas_task
+
+    spec = Canvas((240, 240), CREAM, (
+        Picture(Source("mascot"), (20, 20), size=(200, 200)),
+        Text("ThemeGPT", (0, 210), (FONT_BOLD, 18), CHOCOLATE, width=240),
+    ))
+    tasks = [canvas_task("ph-thumbnail.png", spec, source="mascot")]
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .jobs import Task
+from .pyramid import resize
+
+TRANSPARENT = (0, 0, 0, 0)
+
+# Rendered nested canvases: (spec, source ids) -> Image
+_canvases = {}
+
+
+@lru_cache(maxsize=None)
+def font(path, size):
+    """TrueType font at ``size``; Pillow's default font when ``path`` is None."""
+    if path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
+def load_image(path, mode="RGB", size=None):
+    """Decoded image file in ``mode``, LANCZOS-resized to ``size`` (shared; read-only)."""
+    if size is not None:
+        return load_image(path, mode).resize(size, Image.Resampling.LANCZOS)
+    with Image.open(path) as img:
+        return img.convert(mode)
+
+
+_measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+def text_bbox(text, font_spec):
+    """textbbox() of ``text`` drawn at (0, 0) with a (path, size) font."""
+    return _measure.textbbox((0, 0), text, font=font(*font_spec))
+
+
+def clear_caches():
+    """Drop every cached font, decoded image and rendered canvas."""
+    font.cache_clear()
+    load_image.cache_clear()
+    _canvases.clear()
+
+
+@dataclass(frozen=True)
+class Source:
+    """A source image passed in at render time (e.g. a jobs.Task source)."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Rect:
+    """Rectangle ``box`` = (x0, y0, x1, y1), inclusive as in ImageDraw."""
+
+    box: tuple
+    fill: tuple | None = None
+    radius: int = 0
+    outline: tuple | None = None
+    width: int = 1
+
+    def draw(self, canvas, draw, sources):
+        if self.radius:
+            draw.rounded_rectangle(self.box, radius=self.radius, fill=self.fill,
+                                   outline=self.outline, width=self.width)
+        else:
+            draw.rectangle(self.box, fill=self.fill, outline=self.outline, width=self.width)
+
+
+@dataclass(frozen=True)
+class Text:
+    """
+    Text with its (0, 0) bbox origin at ``xy``, in a (path, size) font.
+
+    With ``width`` set, the text is centered horizontally between x and
+    x + width.
+    """
+
+    text: str
+    xy: tuple
+    font: tuple
+    fill: tuple
+    width: int | None = None
+
+    def draw(self, canvas, draw, sources):
+        x, y = self.xy
+        if self.width is not None:
+            bbox = text_bbox(self.text, self.font)
+            x += (self.width - (bbox[2] - bbox[0])) // 2
+        draw.text((x, y), self.text, font=font(*self.font), fill=self.fill)
+
+
+@dataclass(frozen=True)
+class Picture:
+    """
+    An image pasted with its top-left corner at ``xy``.
+
+    ``image`` is a file path, a Source or a nested Canvas. Images with an
+    alpha channel are pasted through it unless ``mask`` is False, which
+    copies their pixels (alpha included) as they are.
+    """
+
+    image: object
+    xy: tuple
+    size: tuple | None = None
+    mode: str = "RGB"    # decode mode for file paths
+    mask: bool = True
+
+    def resolve(self, sources):
+        size = tuple(self.size) if self.size else None
+        if isinstance(self.image, Source):
+            img = sources[self.image.name]
+            return resize(img, size) if size and size != img.size else img
+        if isinstance(self.image, Canvas):
+            return _render_nested(self.image, sources, size)
+        return load_image(self.image, self.mode, size)
+
+    def draw(self, canvas, draw, sources):
+        img = self.resolve(sources)
+        if self.mask and "A" in img.getbands():
+            canvas.paste(img, self.xy, img)
+        else:
+            canvas.paste(img, self.xy)
+
+
+@dataclass(frozen=True)
+class Canvas:
+    """A ``size`` image filled with ``background`` and drawn layer by layer."""
+
+    size: tuple
+    background: tuple | None = None   # None: transparent
+    layers: tuple = ()
+    mode: str = "RGB"
+
+    def files(self):
+        """Image files read by this spec, nested canvases included."""
+        paths = []
+        for layer in self.layers:
+            if isinstance(layer, Picture):
+                if isinstance(layer.image, Canvas):
+                    paths += layer.image.files()
+                elif isinstance(layer.image, str):
+                    paths.append(layer.image)
+        return tuple(dict.fromkeys(paths))
+
+
+def render(spec, sources=None):
+    """
+    Draw ``spec`` into a new image.
+
+    Args:
+        spec: Canvas
+        sources: Mapping of Source name to PIL Image
+
+    Returns:
+        PIL Image in ``spec.mode``
+    """
+    sources = sources or {}
+    background = TRANSPARENT if spec.background is None else spec.background
+    img = Image.new(spec.mode, spec.size, background)
+    draw = ImageDraw.Draw(img)
+    for layer in spec.layers:
+        layer.draw(img, draw, sources)
+    return img
+
+
+def _render_nested(spec, sources, size=None):
+    key = (spec, tuple(sorted((name, id(img)) for name, img in sources.items())), size)
+    if key not in _canvases:
+        if size is None or size == spec.size:
+            _canvases[key] = render(spec, sources)
+        else:
+            _canvases[key] = _render_nested(spec, sources).resize(size, Image.Resampling.LANCZOS)
+    return _canvases[key]
+
+
+def _render_task(spec):
+    return render(spec)
+
+
+def _render_source_task(source, spec, name):
+    return render(spec, {name: source})
+
+
+def canvas_task(dest, spec, source=None, save=None):
+    """
+    jobs.Task rendering ``spec`` to ``dest``.
+
+    Args:
+        dest: Output path
+        spec: Canvas
+        source: Name of the run_tasks() source that ``Source(name)`` layers use
+        save: Image.save() keyword arguments
+
+    The spec's image files become the task's manifest inputs.
+    """
+    if source is None:
+        return Task(dest, _render_task, args=(spec,), save=save or {}, inputs=spec.files())
+    return Task(dest, _render_source_task, source=source, args=(spec, source),
+                save=save or {}, inputs=spec.files())
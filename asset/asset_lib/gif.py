@@ -0,0 +1,259 @@
+"""
+Animated GIF encoding with one shared palette and frame deltas.
+
+quantize_frames() builds a single adaptive palette for a whole animation
+from a sample of the opaque pixels of every frame, then maps all frames
+to it at once, instead of quantizing each frame separately. Mapping goes
+through a 24-bit color lookup table (palette_lut()): the exact nearest
+palette entry is computed once per distinct color, then every pixel of
+every frame is a table lookup. Pixels at or below the alpha threshold get
+a dedicated transparency index, found with NumPy masks rather than
+per-pixel callbacks.
+
+Because every frame then shares one palette, save_gif() can compare frames
+by index. When no pixel ever turns from opaque to transparent between
+consecutive frames (so frames can be drawn over the previous one), each
+frame after the first only stores what changed: unchanged pixels become
+transparent and Pillow crops the frame to the changed area. Otherwise
+frames are written whole over a cleared background (disposal 2), as
+before, but still share a single global color table.
+
+Usage:
+    from asset_lib.gif import adaptive_palette, map_frames, quantize_frames, save_gif
+
+    frames = quantize_frames(rgba_frames, colors=255)
+    save_gif(frames, "animated-logo-512.gif", duration=70)
+
+    # Palette from keyframes only, applied to every in-between frame
+    palette = adaptive_palette([before, after], colors=128)
+    save_gif(map_frames(blends, palette), "crossfade.gif", duration=durations)
+"""
+
+import numpy as np
+from PIL import Image
+
+# Median cut runs on at most this many sampled pixels; animation frames are
+# near-duplicates, so a strided sample finds the same colors
+PALETTE_SAMPLE = 1 << 18
+
+# Distinct colors matched against the palette per chunk in palette_lut()
+_LUT_CHUNK = 1 << 14
+
+# Disposal methods (GIF89a): keep the frame, or restore its area to background
+KEEP = 1
+RESTORE_BACKGROUND = 2
+
+
+def pack_rgb(rgb):
+    """24-bit 0xRRGGBB codes of an (..., 3) uint8 array."""
+    rgb = rgb.astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def palette_lut(codes, palette):
+    """
+    Lookup table from 24-bit color code to nearest palette index.
+
+    Only the colors present in ``codes`` are matched (exact squared RGB
+    distance); other entries are left at 0.
+
+    Args:
+        codes: Array of pack_rgb() codes
+        palette: (N, 3) uint8 palette colors, N <= 256
+
+    Returns:
+        uint8 array of 2**24 entries; index it with pack_rgb() codes
+    """
+    present = np.zeros(1 << 24, dtype=bool)
+    present[codes.ravel()] = True
+    colors = np.flatnonzero(present)
+    pal = palette.astype(np.float32)
+    pal_norm = (pal * pal).sum(axis=1)
+    lut = np.zeros(1 << 24, dtype=np.uint8)
+    for start in range(0, len(colors), _LUT_CHUNK):
+        chunk = colors[start:start + _LUT_CHUNK]
+        rgb = np.stack([chunk >> 16, (chunk >> 8) & 255, chunk & 255], axis=1).astype(np.float32)
+        # |c - p|^2 without the |c|^2 term, which does not change the argmin
+        lut[chunk] = np.argmin(pal_norm - 2 * rgb @ pal.T, axis=1)
+    return lut
+
+
+def _stack(images):
+    return np.stack([np.asarray(img.convert("RGBA")) for img in images])
+
+
+def _palette_of(stack, colors, alpha_threshold):
+    """Median-cut palette from a strided sample of the stack's opaque pixels."""
+    flat = stack.reshape(-1, 4)
+    sample = flat[::max(1, len(flat) // PALETTE_SAMPLE)]
+    sample = np.ascontiguousarray(sample[sample[:, 3] > alpha_threshold, :3])
+    if not len(sample):
+        return np.zeros((0, 3), dtype=np.uint8)
+    palette_img = Image.fromarray(sample.reshape(-1, 1, 3), "RGB").quantize(
+        colors=min(colors, 255), method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE
+    )
+    return np.asarray(palette_img.getpalette("RGB"), dtype=np.uint8).reshape(-1, 3)
+
+
+def _map_stack(stack, palette, alpha_threshold):
+    """P frames for an (N, H, W, 4) stack through palette_lut()."""
+    opaque = stack[..., 3] > alpha_threshold
+    if len(palette):
+        codes = pack_rgb(stack[..., :3])
+        indices = palette_lut(codes, palette)[codes]
+    else:
+        indices = np.zeros(opaque.shape, dtype=np.uint8)
+    transparent = len(palette)
+    indices[~opaque] = transparent
+
+    # The transparency index gets a color not used by any opaque entry, so
+    # palette lookups by color stay unambiguous
+    used = {tuple(c) for c in palette.tolist()}
+    spare = next((c, 0, 255) for c in range(256) if (c, 0, 255) not in used)
+    palette_bytes = bytes(palette.tobytes()) + bytes(spare)
+
+    out = []
+    for frame_indices in indices:
+        frame = Image.fromarray(frame_indices, "P")
+        frame.putpalette(palette_bytes)
+        frame.info["transparency"] = transparent
+        out.append(frame)
+    return out
+
+
+def adaptive_palette(images, colors=255, alpha_threshold=128):
+    """
+    One median-cut palette for several images (e.g. an animation's keyframes).
+
+    Args:
+        images: Same-size PIL Images
+        colors: Palette size (at most 255; one index is kept for transparency)
+        alpha_threshold: Pixels with alpha at or below this are ignored
+
+    Returns:
+        (N, 3) uint8 array of palette colors
+    """
+    return _palette_of(_stack(images), colors, alpha_threshold)
+
+
+def map_frames(frames, palette, alpha_threshold=128):
+    """
+    Map frames to a fixed palette by exact nearest color.
+
+    Args:
+        frames: List of same-size PIL Images (RGBA, or RGB for fully opaque)
+        palette: (N, 3) uint8 array from adaptive_palette(), N <= 255
+        alpha_threshold: Pixels with alpha at or below this are transparent
+
+    Returns:
+        List of P mode Images sharing the palette, with
+        ``info["transparency"]`` set to the transparency index (N)
+    """
+    if not frames:
+        return []
+    return _map_stack(_stack(frames), palette, alpha_threshold)
+
+
+def quantize_frames(frames, colors=255, alpha_threshold=128):
+    """
+    Map RGBA frames to one shared adaptive palette built from all of them.
+
+    Args:
+        frames: List of same-size PIL Images (RGBA, or RGB for fully opaque)
+        colors: Palette size for opaque pixels (at most 255; one index is
+            kept for transparency)
+        alpha_threshold: Pixels with alpha at or below this are transparent
+
+    Returns:
+        List of P mode Images sharing one palette, with
+        ``info["transparency"]`` set to the transparency index
+    """
+    if not frames:
+        return []
+    stack = _stack(frames)
+    return _map_stack(stack, _palette_of(stack, colors, alpha_threshold), alpha_threshold)
+
+
+def can_delta(frames):
+    """
+    True when every frame can be drawn over the previous one.
+
+    That requires that no pixel goes from opaque to transparent between
+    consecutive frames, including from the last frame back to the first.
+    """
+    if len(frames) < 2:
+        return False
+    transparent = frames[0].info["transparency"]
+    opaque = np.stack([np.asarray(f) != transparent for f in frames])
+    return not (opaque & ~np.roll(opaque, -1, axis=0)).any()
+
+
+def delta_frames(frames):
+    """Frames after the first with unchanged pixels set to transparency."""
+    transparent = frames[0].info["transparency"]
+    indices = np.stack([np.asarray(f) for f in frames])
+    deltas = np.where(indices[1:] == indices[:-1], transparent, indices[1:]).astype(np.uint8)
+    out = [frames[0]]
+    for frame, delta in zip(frames[1:], deltas):
+        img = Image.fromarray(delta, "P")
+        img.putpalette(frame.getpalette())
+        img.info["transparency"] = transparent
+        out.append(img)
+    return out
+
+
+def merge_duplicates(frames, duration):
+    """
+    Collapse runs of identical consecutive frames, adding up their durations.
+
+    Returns:
+        (frames, durations) lists
+    """
+    durations = list(duration) if isinstance(duration, (list, tuple)) else [duration] * len(frames)
+    kept, kept_durations = [frames[0]], [durations[0]]
+    previous = np.asarray(frames[0])
+    for frame, ms in zip(frames[1:], durations[1:]):
+        current = np.asarray(frame)
+        if np.array_equal(current, previous):
+            kept_durations[-1] += ms
+            continue
+        kept.append(frame)
+        kept_durations.append(ms)
+        previous = current
+    return kept, kept_durations
+
+
+def save_gif(frames, path, duration, loop=0, delta=None):
+    """
+    Save quantize_frames() output as a looping GIF with a global color table.
+
+    Consecutive identical frames are written once with their durations
+    added up.
+
+    Args:
+        frames: P mode Images from quantize_frames() or map_frames()
+        path: Output file path
+        duration: Milliseconds per frame, or a list with one value per frame
+        loop: Loop count (0 = forever)
+        delta: Force frame deltas on or off (default: can_delta(frames))
+
+    Returns:
+        True if frame deltas were used
+    """
+    frames, durations = merge_duplicates(frames, duration)
+    if delta is None:
+        delta = can_delta(frames)
+    transparent = frames[0].info["transparency"]
+    written = delta_frames(frames) if delta else frames
+    written[0].save(
+        path,
+        save_all=True,
+        append_images=written[1:],
+        duration=durations,
+        loop=loop,
+        optimize=False,
+        disposal=KEEP if delta else RESTORE_BACKGROUND,
+        transparency=transparent,
+        palette=frames[0].getpalette(),
+    )
+    return delta
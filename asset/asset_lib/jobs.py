@@ -0,0 +1,214 @@
+"""
+Parallel asset job runner.
+
+Each output file is declared as a Task: which decoded source image it
+reads, the transform that builds it, the target size and the destination.
+run_tasks() executes the tasks across a ProcessPoolExecutor, so the
+CPU-bound resizing and PNG compression of independent outputs run in
+parallel.
+
+Source images are decoded once in the parent and copied into
+multiprocessing shared memory. Workers attach to those segments when they
+start and wrap them as read-only PIL images, so a task only pickles its
+source name, never the pixels. Transforms must treat the source as
+read-only (resize, copy or paste it onto a new canvas).
+
+Transforms and their arguments must be picklable: module-level functions
+(or functools.partial of them) in the calling script, whose main() runs
+under ``if __name__ == "__main__":``.
+
+Usage:
+    from asset_lib.jobs import Task, run_tasks
+
+    tasks = [
+        Task("icons/logo-16.png", resize_with_quality, source="logo", size=16),
+        Task("variants/mascot-dark.png", keep, source="mascot_dark"),
+    ]
+    run_tasks(tasks, {"logo": logo, "mascot_dark": mascot_dark})
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class Task:
+    """
+    One output file: ``transform(source_image, size, *args)`` saved to ``dest``.
+
+    The image is omitted when ``source`` is None and the size when ``size``
+    is None.
+    """
+
+    dest: str
+    transform: Callable[..., Image.Image]
+    source: str | None = None        # key into the run_tasks() sources
+    size: Any = None                 # int or (width, height)
+    args: tuple = ()
+    save: dict = field(default_factory=dict)   # Image.save() keyword arguments
+    inputs: tuple = ()               # other files the transform reads (for the build manifest)
+
+
+@dataclass
+class TaskResult:
+    dest: str
+    render_s: float
+    save_s: float
+    bytes_written: int
+    image_size: tuple[int, int]
+    pid: int
+
+
+# Worker-side view of the shared sources: name -> (SharedMemory, Image)
+_shared_sources: dict[str, tuple[Any, Image.Image]] = {}
+
+
+def _attach_sources(specs):
+    """Pool initializer: map each shared memory segment as a read-only image."""
+    for name, (shm_name, mode, size) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        img = Image.frombuffer(mode, size, shm.buf, "raw", mode, 0, 1)
+        _shared_sources[name] = (shm, img)
+
+
+def _share_sources(sources):
+    """Copy each source's pixels into a new shared memory segment."""
+    segments, specs = [], {}
+    try:
+        for name, img in sources.items():
+            data = img.tobytes()
+            shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            segments.append(shm)
+            shm.buf[:len(data)] = data
+            specs[name] = (shm.name, img.mode, img.size)
+    except BaseException:
+        _release(segments)
+        raise
+    return segments, specs
+
+
+def _release(segments):
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+def _run_task(task, sources=None):
+    """Render and save one task; runs in a worker (or inline with ``sources``)."""
+    call_args = []
+    if task.source is not None:
+        shared = sources[task.source] if sources is not None else _shared_sources[task.source][1]
+        call_args.append(shared)
+    if task.size is not None:
+        call_args.append(task.size)
+
+    start = time.perf_counter()
+    out = task.transform(*call_args, *task.args)
+    rendered = time.perf_counter()
+
+    parent = os.path.dirname(task.dest)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    out.save(task.dest, **task.save)
+    saved = time.perf_counter()
+
+    return TaskResult(
+        dest=task.dest,
+        render_s=rendered - start,
+        save_s=saved - rendered,
+        bytes_written=os.path.getsize(task.dest),
+        image_size=out.size,
+        pid=os.getpid(),
+    )
+
+
+def _print_result(result):
+    name = os.path.basename(result.dest)
+    dims = "x".join(map(str, result.image_size))
+    print(
+        f"  {name:<44} {dims:>10}  render {result.render_s * 1000:7.1f}ms  "
+        f"save {result.save_s * 1000:7.1f}ms  {result.bytes_written / 1024:8.1f} KiB"
+    )
+
+
+def default_workers():
+    """Worker count: ``ASSET_JOBS`` if set, else the CPU count."""
+    return int(os.environ.get("ASSET_JOBS", 0)) or os.cpu_count() or 1
+
+
+def run_tasks(tasks, sources=None, workers=None, on_result=None):
+    """
+    Execute ``tasks`` in parallel and print per-task timings.
+
+    With one worker the tasks run in this process in order, which is easier
+    to debug and avoids process start-up for tiny kits.
+
+    Args:
+        tasks: List of Task
+        sources: Mapping of source name to decoded PIL Image
+        workers: Process count (default: default_workers())
+        on_result: Called in this process with each successful TaskResult
+
+    Returns:
+        List of TaskResult in task order
+
+    Raises:
+        RuntimeError: If any task failed (after all others have finished)
+    """
+    sources = dict(sources or {})
+    workers = max(1, min(workers or default_workers(), len(tasks) or 1))
+    unknown = {t.source for t in tasks if t.source is not None} - set(sources)
+    if unknown:
+        raise ValueError(f"Tasks reference unknown sources: {', '.join(sorted(unknown))}")
+
+    results: dict[int, TaskResult] = {}
+    failures: list[str] = []
+    start = time.perf_counter()
+
+    if workers == 1:
+        for i, task in enumerate(tasks):
+            try:
+                results[i] = _run_task(task, sources)
+            except Exception as e:
+                failures.append(f"{task.dest}: {e}")
+                print(f"  FAILED {task.dest}: {e}")
+                continue
+            _print_result(results[i])
+            if on_result:
+                on_result(results[i])
+    else:
+        segments, specs = _share_sources(sources)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach_sources, initargs=(specs,)
+            ) as pool:
+                futures = {pool.submit(_run_task, task): i for i, task in enumerate(tasks)}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        failures.append(f"{tasks[i].dest}: {e}")
+                        print(f"  FAILED {tasks[i].dest}: {e}")
+                        continue
+                    _print_result(results[i])
+                    if on_result:
+                        on_result(results[i])
+        finally:
+            _release(segments)
+
+    wall = time.perf_counter() - start
+    busy = sum(r.render_s + r.save_s for r in results.values())
+    print(
+        f"\n  {len(results)}/{len(tasks)} outputs in {wall:.2f}s wall "
+        f"({busy:.2f}s of task time across {workers} worker{'s' if workers != 1 else ''})"
+    )
+    if failures:
+        raise RuntimeError(f"{len(failures)} asset task(s) failed: " + "; ".join(failures))
+    return [results[i] for i in range(len(tasks))]
@@ -0,0 +1,216 @@
+"""
+Content-hashed build manifest for incremental asset builds.
+
+Each output is keyed by a hash of its input files' bytes, its transform
+parameters and the script version (the bytes of the generating script and
+of asset_lib). The manifest (``.build-manifest.json`` next to the outputs)
+stores that key and the output's own hash, so an output is skipped only
+when its inputs, parameters and code are unchanged and the file on disk is
+still the one that was built.
+
+Usage:
+    manifest = BuildManifest(OUTPUT_DIR, __file__, force=args.force)
+    key = manifest.key([before_path, after_path], {"size": (1280, 880)})
+    if not manifest.is_current(output_path, key):
+        build(output_path)
+        manifest.record(output_path, key)
+    manifest.save()
+    manifest.print_summary()
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+ASSET_LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def file_digest(path):
+    """sha256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _canonical(value):
+    """JSON-able, order-stable form of transform parameters."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def add_force_argument(parser):
+    """Add the shared ``--force`` flag to a script's argument parser."""
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rebuild every output, ignoring the build manifest",
+    )
+    return parser
+
+
+def parse_build_args(description):
+    """Parse the standard asset script arguments (currently just --force)."""
+    return add_force_argument(argparse.ArgumentParser(description=description)).parse_args()
+
+
+class BuildManifest:
+    """Tracks which outputs are up to date and what this run rebuilt or skipped."""
+
+    def __init__(self, directory, script_path, force=False):
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, MANIFEST_NAME)
+        self.force = force
+        self.rebuilt = []
+        self.skipped = []
+        self._digests = {}
+        self._entries = self._load()
+        self.script_version = self._script_version(script_path)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("outputs", {})
+
+    def _script_version(self, script_path):
+        digest = hashlib.sha256(self.digest(script_path).encode())
+        for name in sorted(os.listdir(ASSET_LIB_DIR)):
+            if name.endswith(".py"):
+                digest.update(self.digest(os.path.join(ASSET_LIB_DIR, name)).encode())
+        return digest.hexdigest()
+
+    def _rel(self, output):
+        return os.path.relpath(os.path.abspath(output), self.directory)
+
+    def digest(self, path):
+        """file_digest() memoized for this run."""
+        path = os.path.abspath(path)
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def key(self, inputs, params=None):
+        """
+        Build key for an output.
+
+        Args:
+            inputs: Paths of every file the output is built from
+            params: Transform parameters (dicts, sequences, scalars, callables)
+
+        Returns:
+            sha256 hex digest of input hashes, parameters and script version
+        """
+        payload = {
+            "inputs": sorted(self.digest(p) for p in inputs),
+            "params": _canonical(params),
+            "script": self.script_version,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def is_current(self, output, key):
+        """
+        True when ``output`` was built from ``key`` and is unchanged on disk.
+
+        Counts the output as skipped when current. Always False with ``force``.
+        """
+        entry = self._entries.get(self._rel(output))
+        current = (
+            not self.force
+            and entry is not None
+            and entry.get("key") == key
+            and os.path.exists(output)
+            and file_digest(output) == entry.get("output")
+        )
+        if current:
+            self.skipped.append(output)
+        return current
+
+    def record(self, output, key):
+        """Store the key and output hash of a freshly built output."""
+        self._entries[self._rel(output)] = {
+            "key": key,
+            "output": file_digest(output),
+            "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        self.rebuilt.append(output)
+
+    def save(self):
+        """Write the manifest atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=MANIFEST_NAME, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": MANIFEST_VERSION, "outputs": dict(sorted(self._entries.items()))},
+                    f, indent=2,
+                )
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def print_summary(self):
+        total = len(self.rebuilt) + len(self.skipped)
+        note = " (--force)" if self.force else ""
+        print(f"\n  Rebuilt {len(self.rebuilt)}, skipped {len(self.skipped)} up to date, of {total} outputs{note}")
+
+    # --- asset_lib.jobs integration ---
+
+    def task_key(self, task, source_files):
+        """Key for a jobs.Task; ``source_files`` maps source names to input paths."""
+        inputs = [*source_files.get(task.source, ()), *task.inputs]
+        params = {
+            "transform": task.transform,
+            "size": task.size,
+            "args": task.args,
+            "save": task.save,
+        }
+        return self.key(inputs, params)
+
+    def run_tasks(self, tasks, sources, source_files, workers=None):
+        """
+        Run only the stale tasks with jobs.run_tasks() and record each success.
+
+        Sources no stale task needs are not shared with the workers.
+        ``sources`` may also be a callable returning the mapping, so loading
+        is skipped entirely when everything is current.
+
+        Returns:
+            List of TaskResult for the tasks that ran
+        """
+        from .jobs import run_tasks
+
+        keys = {task.dest: self.task_key(task, source_files) for task in tasks}
+        stale = [task for task in tasks if not self.is_current(task.dest, keys[task.dest])]
+        if not stale:
+            return []
+        if callable(sources):
+            sources = sources()
+        needed = {task.source for task in stale}
+        try:
+            return run_tasks(
+                stale,
+                {name: img for name, img in sources.items() if name in needed},
+                workers,
+                on_result=lambda result: self.record(result.dest, keys[result.dest]),
+            )
+        finally:
+            self.save()
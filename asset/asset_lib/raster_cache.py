@@ -0,0 +1,118 @@
+"""
+Rasterization cache for SVG sources.
+
+Rendering an SVG (and decoding the PNG the rasterizer returns) is the
+slowest step of the GIF pipeline, and it used to be repeated for every
+output size and every run. RasterCache keys decoded RGBA pixels by
+(SVG content hash, width, height, background mode, renderer version):
+
+- in memory for the run, so a size requested twice is rendered once
+- on disk as ``<key>.npy`` files, loaded memory-mapped in later runs, so
+  an unchanged SVG is never rasterized or PNG-decoded again
+
+The background mode is whatever the caller does to the raw render (e.g.
+keying out the cream background); include every parameter of that step
+in it so a change invalidates the cached pixels. Cached images are shared
+and backed by read-only maps: treat them as read-only.
+
+Usage:
+    cache = RasterCache(".raster-cache", renderer=f"cairosvg-{cairosvg.__version__}")
+    img = cache.get("source-logo.svg", 512, 512, ("keyed", CREAM_BG, 15),
+                    lambda: render(svg_path, 512))
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+CACHE_DIR_NAME = ".raster-cache"
+
+
+class RasterCache:
+    """Decoded SVG renders, memoized in memory and as .npy files on disk."""
+
+    def __init__(self, directory=None, renderer=""):
+        self.directory = directory
+        self.renderer = renderer
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.rendered = 0
+        self._images = {}
+        self._svg_hashes = {}
+
+    def _svg_hash(self, svg_path):
+        path = os.path.abspath(svg_path)
+        if path not in self._svg_hashes:
+            with open(path, "rb") as f:
+                self._svg_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+        return self._svg_hashes[path]
+
+    def key(self, svg_path, width, height, background):
+        """Cache key for one render (hex digest)."""
+        payload = [self._svg_hash(svg_path), width, height, repr(background), self.renderer]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()[:32]
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def _load(self, key, size):
+        """Memory-mapped cached pixels, or None if missing or unreadable."""
+        try:
+            data = np.load(self._path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if data.shape != (size[1], size[0], 4) or data.dtype != np.uint8:
+            return None
+        return Image.frombuffer("RGBA", size, data, "raw", "RGBA", 0, 1)
+
+    def _store(self, key, img):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(img))
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, svg_path, width, height, background, render):
+        """
+        RGBA render of ``svg_path`` at ``width`` x ``height``.
+
+        Args:
+            svg_path: SVG file (its bytes are hashed, not its path)
+            width, height: Render size in pixels
+            background: Hashable description of the background handling
+            render: Called with no arguments on a miss; returns a PIL Image
+
+        Returns:
+            PIL Image in RGBA mode (shared; read-only)
+        """
+        key = self.key(svg_path, width, height, background)
+        img = self._images.get(key)
+        if img is not None:
+            self.memory_hits += 1
+            return img
+
+        if self.directory:
+            img = self._load(key, (width, height))
+        if img is not None:
+            self.disk_hits += 1
+        else:
+            img = render().convert("RGBA")
+            if img.size != (width, height):
+                raise ValueError(f"Renderer returned {img.size[0]}x{img.size[1]}, expected {width}x{height}")
+            self.rendered += 1
+            if self.directory:
+                self._store(key, img)
+        self._images[key] = img
+        return img
+
+    def summary(self):
+        return (f"{self.rendered} rendered, {self.disk_hits} from disk cache, "
+                f"{self.memory_hits} from memory")
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Asset Pipeline Benchmark
+
+Runs every asset generator (generate_kit, brand-kit, launch gallery and
+before/after GIFs, GIFs/create_gif) against fixed synthetic sources at
+several resolutions, and records per run:
+- wall time of a cold ``--force`` build (best of --repeat; the build
+  manifest and raster cache are cleared before each repetition)
+- peak RSS of the largest process (the script or one of its workers)
+- bytes of every output file, and their total
+
+Each generator runs as a subprocess in a scratch copy of the asset tree
+(its script plus asset_lib/), with synthetic sources written at the paths
+it reads, scaled from their nominal size by each --scales factor. Output
+sizes stay whatever the scripts produce; only the source resolution varies.
+The sources are drawn deterministically, so runs on one machine are
+comparable.
+
+Every run is appended to a JSON history file and compared with a stored
+baseline: wall time, peak RSS and output bytes that grew by more than
+their tolerance are flagged, and the script exits with status 1. A
+generator whose optional dependency or font is missing is skipped.
+
+--profile runs each generator once more at the largest scale under
+cProfile with ASSET_JOBS=1 (so tasks run in the profiled process), saves
+the .prof files and prints the top functions by cumulative time.
+
+Usage:
+    python benchmarks/benchmark_asset_pipeline.py
+    python benchmarks/benchmark_asset_pipeline.py --generator kit --scales 1,4 --repeat 1
+    python benchmarks/benchmark_asset_pipeline.py --save-baseline
+    python benchmarks/benchmark_asset_pipeline.py --profile /tmp/asset-profiles
+    python benchmarks/benchmark_asset_pipeline.py --json
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import platform
+import pstats
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+
+import numpy as np
+import PIL
+from PIL import Image, ImageDraw
+
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_DIR = os.path.join(ASSET_DIR, "benchmarks")
+DEFAULT_HISTORY = os.path.join(BENCHMARK_DIR, "asset-pipeline-history.json")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "asset-pipeline-baseline.json")
+
+DEFAULT_SCALES = [0.5, 1, 2]
+
+# Allowed growth over the baseline before a metric is flagged
+TIME_TOLERANCE = 0.25
+RSS_TOLERANCE = 0.20
+BYTES_TOLERANCE = 0.05
+# Wall time changes smaller than this are timer and scheduling noise
+MIN_TIME_DELTA_S = 0.1
+
+CREAM = (250, 246, 240)
+SVG_CREAM = (255, 250, 241)
+CHOCOLATE = (75, 46, 30)
+PEACH = (244, 169, 136)
+TEAL = (126, 206, 197)
+
+SCREENSHOT = (1280, 800)
+MAC_FONTS = (
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+)
+
+# Source paths are relative to the scratch asset/ directory and mirror the
+# constants in each script: (path, kind, nominal size)
+GENERATORS = [
+    {
+        "name": "kit",
+        "script": "generate_kit.py",
+        "sources": [
+            ("source-logo-512.png", "logo", (512, 512)),
+            ("source-mascot-512.png", "mascot", (512, 512)),
+        ],
+    },
+    {
+        "name": "brand-kit",
+        "script": "brand-kit/generate_brand_kit.py",
+        "sources": [("GIFs/mascot-clean-400.png", "mascot-rgba", (400, 400))],
+    },
+    {
+        "name": "gallery",
+        "script": "launch/create_ph_gallery.py",
+        "sources": [
+            ("images/chrome-store/Before_screenshot.png", "screenshot", SCREENSHOT),
+            ("images/chrome-store/After_Aurora Borealis_screenshot.png", "screenshot", SCREENSHOT),
+            *((f"../apps/web/public/themes/{name}_1.png", "screenshot", SCREENSHOT) for name in (
+                "aurora_borealis", "synth_wave", "electric_dreams",
+                "dracula", "solarized_dark", "woodland_retreat",
+            )),
+            ("../apps/web/public/mascot-transparent.png", "mascot-rgba", (512, 512)),
+        ],
+        "files": MAC_FONTS,
+    },
+    {
+        "name": "crossfade-gifs",
+        "script": "launch/create_before_after_gifs.py",
+        "sources": [
+            (f"images/chrome-store/{name}_screenshot.png", "screenshot", SCREENSHOT) for name in (
+                "Before", "After_Aurora Borealis", "After_Synth_Wave",
+                "After_Woodland_Retreat", "After_ThemeGPT_Dark",
+            )
+        ],
+    },
+    {
+        "name": "animated-logo",
+        "script": "GIFs/create_gif.py",
+        "sources": [("GIFs/source-logo.svg", "svg", (512, 512))],
+        "modules": ("cairosvg",),
+    },
+]
+GENERATOR_NAMES = [g["name"] for g in GENERATORS]
+
+
+# =============================================================================
+# Synthetic sources
+# =============================================================================
+
+def _rng(path):
+    return np.random.default_rng(zlib.crc32(path.encode()))
+
+
+def _shade(img, rng, background=None):
+    """
+    Soft diagonal light falloff on the artwork, so sources have gradients
+    like real artwork; ``background`` pixels stay flat so they key out.
+    """
+    w, h = img.size
+    y, x = np.mgrid[0:h, 0:w]
+    light = 1.0 - 0.12 * (x / w + y / h) + rng.uniform(-0.02, 0.02)
+    data = np.asarray(img).astype(np.float32)
+    if background is not None:
+        light[(data[..., :3] == background).all(axis=-1)] = 1.0
+    data[..., :3] *= light[..., None]
+    return Image.fromarray(np.clip(data, 0, 255).astype(np.uint8), img.mode)
+
+
+def draw_mascot(draw, box):
+    """Round mascot with eyes and a sparkle inside ``box``."""
+    x0, y0, x1, y1 = box
+    w, h = x1 - x0, y1 - y0
+    draw.ellipse((x0 + w * 0.1, y0 + h * 0.15, x1 - w * 0.1, y1 - h * 0.05), fill=PEACH,
+                 outline=CHOCOLATE, width=max(1, round(w * 0.02)))
+    for ex in (0.35, 0.6):
+        draw.ellipse((x0 + w * ex, y0 + h * 0.45, x0 + w * (ex + 0.07), y0 + h * 0.55), fill=CHOCOLATE)
+    draw.ellipse((x0 + w * 0.66, y0 + h * 0.12, x0 + w * 0.74, y0 + h * 0.2), fill=TEAL)
+
+
+def synthetic_image(path, kind, size):
+    """Deterministic source image of ``kind`` at ``size``."""
+    w, h = size
+    rng = _rng(path)
+    if kind in ("logo", "mascot"):
+        img = Image.new("RGB", size, SVG_CREAM)
+        draw = ImageDraw.Draw(img)
+        if kind == "logo":
+            draw_mascot(draw, (w * 0.3, h * 0.05, w * 0.7, h * 0.6))
+            for i, width in enumerate((0.7, 0.5)):
+                top = h * (0.68 + 0.12 * i)
+                draw.rounded_rectangle((w * (1 - width) / 2, top, w * (1 + width) / 2, top + h * 0.07),
+                                       radius=h * 0.03, fill=CHOCOLATE)
+        else:
+            draw_mascot(draw, (0, 0, w, h))
+        return _shade(img, rng, SVG_CREAM)
+    if kind == "mascot-rgba":
+        img = Image.new("RGBA", size, (0, 0, 0, 0))
+        draw_mascot(ImageDraw.Draw(img), (0, 0, w, h))
+        return _shade(img, rng)
+    if kind == "screenshot":
+        accent = tuple(int(c) for c in rng.integers(40, 230, 3))
+        base = tuple(int(c) for c in rng.integers(10, 250, 3))
+        y = np.linspace(0, 1, h)[:, None, None]
+        data = np.asarray(base, np.float32) * (1 - 0.3 * y) + np.asarray(accent, np.float32) * 0.3 * y
+        img = Image.fromarray(np.broadcast_to(data, (h, w, 3)).astype(np.uint8), "RGB")
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((0, 0, w * 0.2, h), fill=tuple(c // 2 for c in base))
+        draw.rectangle((w * 0.2, 0, w, h * 0.07), fill=accent)
+        row = h * 0.12
+        while row < h * 0.85:
+            lines = int(rng.integers(1, 5))
+            indent = w * (0.45 if rng.random() < 0.5 else 0.25)
+            draw.rounded_rectangle((indent, row, w * 0.95, row + lines * h * 0.03 + h * 0.02),
+                                   radius=h * 0.015, fill=tuple(min(255, c + 40) for c in base))
+            for line in range(lines):
+                top = row + h * 0.015 + line * h * 0.03
+                length = rng.uniform(0.3, 0.95) * (w * 0.93 - indent)
+                draw.rectangle((indent + w * 0.01, top, indent + w * 0.01 + length, top + h * 0.012),
+                               fill=accent)
+            row += lines * h * 0.03 + h * 0.05
+        draw.rounded_rectangle((w * 0.25, h * 0.9, w * 0.95, h * 0.96), radius=h * 0.02,
+                               outline=accent, width=max(1, round(h * 0.003)))
+        return img
+    raise ValueError(f"Unknown source kind: {kind}")
+
+
+def synthetic_svg(size):
+    """Mascot logo SVG on the cream background create_gif.py keys out."""
+    w, h = size
+    cream, peach, chocolate, teal = ("#%02x%02x%02x" % c for c in (SVG_CREAM, PEACH, CHOCOLATE, TEAL))
+    return f"""<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">
+  <defs><radialGradient id="shade"><stop offset="0" stop-color="{peach}"/><stop offset="1" stop-color="#d98a66"/></radialGradient></defs>
+  <rect width="{w}" height="{h}" fill="{cream}"/>
+  <ellipse cx="{w * 0.5}" cy="{h * 0.5}" rx="{w * 0.32}" ry="{h * 0.3}" fill="url(#shade)" stroke="{chocolate}" stroke-width="{w * 0.02}"/>
+  <circle cx="{w * 0.4}" cy="{h * 0.48}" r="{w * 0.035}" fill="{chocolate}"/>
+  <circle cx="{w * 0.6}" cy="{h * 0.48}" r="{w * 0.035}" fill="{chocolate}"/>
+  <path d="M {w * 0.4} {h * 0.6} Q {w * 0.5} {h * 0.68} {w * 0.6} {h * 0.6}" fill="none" stroke="{chocolate}" stroke-width="{w * 0.015}"/>
+  <circle cx="{w * 0.694}" cy="{h * 0.182}" r="{w * 0.03}" fill="{teal}"/>
+</svg>
+"""
+
+
+def write_source(asset_root, path, kind, size):
+    dest = os.path.normpath(os.path.join(asset_root, path))
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    if kind == "svg":
+        with open(dest, "w") as f:
+            f.write(synthetic_svg(size))
+    else:
+        synthetic_image(path, kind, size).save(dest, compress_level=1)
+
+
+def scaled(size, scale):
+    return tuple(max(1, round(n * scale)) for n in size)
+
+
+# =============================================================================
+# Running generators
+# =============================================================================
+
+def missing_requirements(generator):
+    """Names of the generator's optional modules and files that are not available."""
+    missing = [m for m in generator.get("modules", ()) if importlib.util.find_spec(m) is None]
+    return missing + [f for f in generator.get("files", ()) if not os.path.exists(f)]
+
+
+def prepare_tree(root, generator, scale):
+    """Scratch asset tree for one generator with its sources at ``scale``."""
+    if os.path.exists(root):
+        shutil.rmtree(root)
+    asset_root = os.path.join(root, "asset")
+    shutil.copytree(os.path.join(ASSET_DIR, "asset_lib"), os.path.join(asset_root, "asset_lib"),
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    script = os.path.join(asset_root, generator["script"])
+    os.makedirs(os.path.dirname(script), exist_ok=True)
+    shutil.copy2(os.path.join(ASSET_DIR, generator["script"]), script)
+    for path, kind, size in generator["sources"]:
+        write_source(asset_root, path, kind, scaled(size, scale))
+    return asset_root, script
+
+
+def _is_build_state(name):
+    # .build-manifest.json, .raster-cache/ and Python bytecode
+    return name.startswith(".") or name == "__pycache__"
+
+
+def clear_build_state(asset_root):
+    """Remove manifests and caches so the next run is a cold build."""
+    for dirpath, dirnames, filenames in os.walk(asset_root):
+        for name in [d for d in dirnames if _is_build_state(d)]:
+            shutil.rmtree(os.path.join(dirpath, name))
+            dirnames.remove(name)
+        for name in filenames:
+            if _is_build_state(name):
+                os.remove(os.path.join(dirpath, name))
+
+
+def list_files(asset_root):
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(asset_root):
+        dirnames[:] = [d for d in dirnames if not _is_build_state(d)]
+        for name in filenames:
+            if not _is_build_state(name):
+                path = os.path.join(dirpath, name)
+                files[os.path.relpath(path, asset_root)] = os.path.getsize(path)
+    return files
+
+
+def run_script(script, cwd, env, log_path, profile_path=None):
+    """
+    Run ``script --force`` and wait for it with os.wait4().
+
+    Returns:
+        (exit code, wall seconds, peak RSS in bytes). The RSS is the largest
+        of the script and its waited-for children, as the kernel reports it.
+    """
+    cmd = [sys.executable]
+    if profile_path:
+        cmd += ["-m", "cProfile", "-o", profile_path]
+    cmd += [script, "--force"]
+    with open(log_path, "wb") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    return proc.returncode, wall, rss
+
+
+def _log_tail(log_path, lines=15):
+    with open(log_path, errors="replace") as f:
+        return "".join(f.readlines()[-lines:])
+
+
+def benchmark_generator(generator, scale, repeat, env, workdir, profile_dir=None):
+    """Best-of-``repeat`` cold builds of one generator at one source scale."""
+    result = {
+        "generator": generator["name"],
+        "scale": scale,
+        "sources": {path: list(scaled(size, scale)) for path, _, size in generator["sources"]},
+    }
+    root = os.path.join(workdir, f"{generator['name']}-{scale:g}x")
+    asset_root, script = prepare_tree(root, generator, scale)
+    inputs = set(list_files(asset_root))
+    log_path = os.path.join(root, "run.log")
+
+    walls, rsss = [], []
+    for _ in range(repeat):
+        clear_build_state(asset_root)
+        code, wall, rss = run_script(script, asset_root, env, log_path)
+        if code != 0:
+            result["error"] = f"exit status {code}\n{_log_tail(log_path)}"
+            return result
+        walls.append(wall)
+        rsss.append(rss)
+
+    outputs = {path: size for path, size in list_files(asset_root).items() if path not in inputs}
+    result.update({
+        "wall_s": min(walls),
+        "peak_rss_mb": min(rsss) / 2 ** 20,
+        "output_bytes": sum(outputs.values()),
+        "outputs": dict(sorted(outputs.items())),
+    })
+
+    if profile_dir:
+        profile_env = dict(env, ASSET_JOBS="1")
+        profile_path = os.path.join(profile_dir, f"{generator['name']}-{scale:g}x.prof")
+        clear_build_state(asset_root)
+        if run_script(script, asset_root, profile_env, log_path, profile_path)[0] == 0:
+            result["profile"] = profile_path
+    return result
+
+
+def print_profile(path, top):
+    out = io.StringIO()
+    stats = pstats.Stats(path, stream=out)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    # Skip pstats' header lines up to the column titles
+    text = out.getvalue()
+    print(text[text.index("   ncalls"):].rstrip())
+
+
+# =============================================================================
+# History and baseline
+# =============================================================================
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ASSET_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def _change(current, base):
+    return (current - base) / base if base else (float("inf") if current > base else 0.0)
+
+
+def compare(results, baseline, tolerances):
+    """
+    Regressions of ``results`` against a baseline run.
+
+    Wall time, peak RSS and total output bytes are compared per generator
+    and scale, and so are the bytes of each output file. Runs missing from
+    either side are not compared.
+
+    Returns:
+        List of {generator, scale, metric, baseline, current, change}
+    """
+    base = {(r["generator"], r["scale"]): r for r in baseline.get("results", []) if "error" not in r}
+    regressions = []
+    for result in results:
+        ref = base.get((result["generator"], result["scale"]))
+        if ref is None or "wall_s" not in result:
+            continue
+        checks = [
+            ("wall_s", result["wall_s"], ref["wall_s"], tolerances["wall_s"], MIN_TIME_DELTA_S),
+            ("peak_rss_mb", result["peak_rss_mb"], ref["peak_rss_mb"], tolerances["peak_rss_mb"], 0),
+            ("output_bytes", result["output_bytes"], ref["output_bytes"], tolerances["bytes"], 0),
+        ]
+        checks += [
+            (f"bytes:{path}", size, ref["outputs"][path], tolerances["bytes"], 0)
+            for path, size in result["outputs"].items() if path in ref["outputs"]
+        ]
+        for metric, current, previous, tolerance, min_delta in checks:
+            change = _change(current, previous)
+            if change > tolerance and current - previous > min_delta:
+                regressions.append({
+                    "generator": result["generator"], "scale": result["scale"], "metric": metric,
+                    "baseline": previous, "current": current, "change": change,
+                })
+    return regressions
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def _delta(result, ref, key):
+    if ref is None or key not in ref:
+        return ""
+    return f" ({_change(result[key], ref[key]):+.0%})"
+
+
+def print_results(run, baseline, saved=False):
+    base = {(r["generator"], r["scale"]): r for r in (baseline or {}).get("results", [])}
+    print(f"Asset pipeline (best of {run['repeat']}, ASSET_JOBS={run['jobs']}, commit {run['commit'] or '?'})")
+    print(f"  {'generator':<16} {'scale':>5}  {'time s':>14}  {'peak RSS MB':>14}  {'output KB':>16}  files")
+    for result in run["results"]:
+        label = f"  {result['generator']:<16} {result['scale']:>5g}"
+        if "skipped" in result:
+            print(f"{label}  skipped: missing {', '.join(result['skipped'])}")
+            continue
+        if "error" in result:
+            print(f"{label}  FAILED: {result['error'].splitlines()[0]}")
+            print("    " + result["error"].rstrip().replace("\n", "\n    "))
+            continue
+        ref = base.get((result["generator"], result["scale"]))
+        time_s = f"{result['wall_s']:.2f}{_delta(result, ref, 'wall_s')}"
+        rss = f"{result['peak_rss_mb']:.0f}{_delta(result, ref, 'peak_rss_mb')}"
+        kb = f"{result['output_bytes'] / 1024:.0f}{_delta(result, ref, 'output_bytes')}"
+        print(f"{label}  {time_s:>14}  {rss:>14}  {kb:>16}  {len(result['outputs'])}")
+
+    if baseline is None:
+        print("\nNo baseline to compare with" if saved else
+              "\nNo baseline yet; run with --save-baseline to store this run as one")
+    elif run["regressions"]:
+        print(f"\n{len(run['regressions'])} regression(s) against the baseline from {baseline['timestamp']}:")
+        for reg in run["regressions"]:
+            print(f"  {reg['generator']} @ {reg['scale']:g}x  {reg['metric']}: "
+                  f"{reg['baseline']:.6g} -> {reg['current']:.6g} ({reg['change']:+.0%})")
+    else:
+        print(f"\nNo regressions against the baseline from {baseline['timestamp']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the asset generators on synthetic sources")
+    parser.add_argument("--generator", action="append", choices=GENERATOR_NAMES,
+                        help="Generator to run (repeatable; default: all)")
+    parser.add_argument("--scales", default=",".join(f"{s:g}" for s in DEFAULT_SCALES),
+                        help="Comma-separated source resolution factors")
+    parser.add_argument("--repeat", type=int, default=3, help="Cold builds per run (best is reported)")
+    parser.add_argument("--jobs", type=int, help="ASSET_JOBS for the generators (default: inherited)")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file to append to")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline run to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE)
+    parser.add_argument("--rss-tolerance", type=float, default=RSS_TOLERANCE)
+    parser.add_argument("--bytes-tolerance", type=float, default=BYTES_TOLERANCE)
+    parser.add_argument("--profile", metavar="DIR", help="Also profile each generator at the largest scale")
+    parser.add_argument("--profile-top", type=int, default=15, help="Functions listed per profile")
+    parser.add_argument("--workdir", help="Keep the scratch trees here instead of a temporary directory")
+    parser.add_argument("--json", action="store_true", help="Print the run as JSON")
+    args = parser.parse_args()
+
+    scales = sorted({float(s) for s in args.scales.split(",") if s.strip()})
+    generators = [g for g in GENERATORS if not args.generator or g["name"] in args.generator]
+    env = dict(os.environ)
+    if args.jobs:
+        env["ASSET_JOBS"] = str(args.jobs)
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="asset-bench-") as tmp:
+        workdir = args.workdir or tmp
+        for generator in generators:
+            missing = missing_requirements(generator)
+            for scale in scales:
+                if missing:
+                    results.append({"generator": generator["name"], "scale": scale, "skipped": missing})
+                    continue
+                if not args.json:
+                    print(f"  {generator['name']} @ {scale:g}x...", file=sys.stderr)
+                profile_dir = args.profile if scale == scales[-1] else None
+                results.append(benchmark_generator(generator, scale, max(1, args.repeat), env,
+                                                   workdir, profile_dir))
+
+    baseline = load_json(args.baseline, None)
+    tolerances = {"wall_s": args.time_tolerance, "peak_rss_mb": args.rss_tolerance,
+                  "bytes": args.bytes_tolerance}
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "numpy": np.__version__,
+        "cpus": os.cpu_count(),
+        "jobs": env.get("ASSET_JOBS") or os.cpu_count(),
+        "repeat": max(1, args.repeat),
+        "scales": scales,
+        "results": results,
+        "regressions": compare(results, baseline, tolerances) if baseline else [],
+    }
+
+    if not args.no_history:
+        history = load_json(args.history, [])
+        history.append(run)
+        save_json(args.history, history)
+    if args.save_baseline:
+        save_json(args.baseline, run)
+        if not args.json:
+            print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(run, indent=2))
+    else:
+        print_results(run, baseline, args.save_baseline)
+        for result in results:
+            if "profile" in result:
+                print(f"\n{result['generator']} @ {result['scale']:g}x: {result['profile']}")
+                print_profile(result["profile"], args.profile_top)
+
+    failed = [r for r in results if "error" in r]
+    sys.exit(1 if failed or run["regressions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
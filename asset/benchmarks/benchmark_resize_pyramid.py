@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Resize Pyramid Benchmark
+
+Resizes each source to every size the asset scripts produce, once straight
+from the source (one LANCZOS pass per size, as the scripts used to) and
+once through asset_lib.pyramid, and reports:
+- wall time and resample work (source pixels read) for both paths
+- per-size quality of the pyramid output against the direct resize:
+  PSNR and SSIM of the image composited on the brand cream (what viewers
+  see), and PSNR of the alpha channel
+
+Usage:
+    python benchmarks/benchmark_resize_pyramid.py
+    python benchmarks/benchmark_resize_pyramid.py --source GIFs/mascot-clean-400.png --repeat 5
+    python benchmarks/benchmark_resize_pyramid.py --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSET_DIR)
+from asset_lib.pyramid import ResizePyramid
+
+DEFAULT_SOURCES = [
+    os.path.join(ASSET_DIR, "google-ads-logo-1200.png"),
+    os.path.join(ASSET_DIR, "variants", "mascot-transparent.png"),
+]
+
+# Icon, favicon and brand kit sizes from generate_kit.py / generate_brand_kit.py
+DEFAULT_SIZES = [16, 32, 48, 64, 72, 96, 128, 144, 150, 180, 192, 256, 384, 512]
+
+CREAM = (250, 246, 240)
+
+
+def flatten(img):
+    """RGBA image composited on cream, as float RGB."""
+    bg = Image.new("RGBA", img.size, CREAM + (255,))
+    bg.alpha_composite(img.convert("RGBA"))
+    return np.asarray(bg.convert("RGB"), dtype=np.float64)
+
+
+def psnr(a, b):
+    """Peak signal-to-noise ratio in dB (None when identical)."""
+    mse = np.mean((np.asarray(a, dtype=np.float64) - np.asarray(b, dtype=np.float64)) ** 2)
+    return None if mse == 0 else float(10 * np.log10(255.0 ** 2 / mse))
+
+
+def _db(value):
+    return "identical" if value is None else f"{value:.1f}"
+
+
+def _gaussian_filter(x, sigma=1.5, radius=5):
+    """Separable Gaussian blur (valid region only)."""
+    taps = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    taps /= taps.sum()
+    windows = np.lib.stride_tricks.sliding_window_view(x, len(taps), axis=0)
+    x = windows @ taps
+    windows = np.lib.stride_tricks.sliding_window_view(x, len(taps), axis=1)
+    return windows @ taps
+
+
+def ssim(a, b):
+    """
+    Mean SSIM of two RGB float images on luma (Wang et al., 11x11 Gaussian).
+
+    Images smaller than the window fall back to a window of their size.
+    """
+    weights = np.array([0.299, 0.587, 0.114])
+    x, y = a @ weights, b @ weights
+    radius = max(0, min(5, (min(x.shape) - 1) // 2))
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mu_x, mu_y = _gaussian_filter(x, radius=radius), _gaussian_filter(y, radius=radius)
+    var_x = _gaussian_filter(x * x, radius=radius) - mu_x ** 2
+    var_y = _gaussian_filter(y * y, radius=radius) - mu_y ** 2
+    cov = _gaussian_filter(x * y, radius=radius) - mu_x * mu_y
+    num = (2 * mu_x * mu_y + c1) * (2 * cov + c2)
+    den = (mu_x ** 2 + mu_y ** 2 + c1) * (var_x + var_y + c2)
+    return float(np.mean(num / den))
+
+
+def run_direct(src, sizes):
+    return {size: src.resize((size, size), Image.Resampling.LANCZOS) for size in sizes}
+
+
+def run_pyramid(src, sizes):
+    pyr = ResizePyramid(src)
+    return {size: pyr.resize(size) for size in sizes}, pyr
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_source(path, sizes, repeat):
+    src = Image.open(path).convert("RGBA")
+    sizes = [s for s in sizes if s <= min(src.size)]
+    direct_s, direct = best_of(repeat, lambda: run_direct(src, sizes))
+    pyramid_s, (pyramid, pyr) = best_of(repeat, lambda: run_pyramid(src, sizes))
+
+    quality = []
+    for size in sizes:
+        a, b = direct[size], pyramid[size]
+        fa, fb = flatten(a), flatten(b)
+        quality.append({
+            "size": size,
+            "psnr_db": psnr(fa, fb),
+            "ssim": ssim(fa, fb),
+            "alpha_psnr_db": psnr(np.asarray(a)[..., 3], np.asarray(b)[..., 3]),
+        })
+
+    return {
+        "source": os.path.relpath(path, ASSET_DIR),
+        "source_size": list(src.size),
+        "sizes": sizes,
+        "direct_ms": direct_s * 1000,
+        "pyramid_ms": pyramid_s * 1000,
+        "direct_resample_pixels": src.width * src.height * len(sizes),
+        "pyramid_resample_pixels": pyr.resample_pixels,
+        "levels": [list(level.size) for level in pyr.levels],
+        "quality": quality,
+    }
+
+
+def print_result(result):
+    print(f"\n{result['source']} ({result['source_size'][0]}x{result['source_size'][1]}), "
+          f"{len(result['sizes'])} sizes, levels {', '.join('x'.join(map(str, l)) for l in result['levels'])}")
+    speedup = result["direct_ms"] / result["pyramid_ms"] if result["pyramid_ms"] else float("inf")
+    work = result["pyramid_resample_pixels"] / result["direct_resample_pixels"]
+    print(f"  direct  {result['direct_ms']:8.1f} ms  {result['direct_resample_pixels'] / 1e6:7.2f} Mpx read")
+    print(f"  pyramid {result['pyramid_ms']:8.1f} ms  {result['pyramid_resample_pixels'] / 1e6:7.2f} Mpx read"
+          f"  ({speedup:.1f}x faster, {work:.0%} of the resample work)")
+    print(f"  {'size':>6}  {'PSNR dB':>8}  {'SSIM':>7}  {'alpha PSNR':>10}")
+    for q in result["quality"]:
+        print(f"  {q['size']:>6}  {_db(q['psnr_db']):>8}  {q['ssim']:7.4f}  {_db(q['alpha_psnr_db']):>10}")
+    differing = [q for q in result["quality"] if q["psnr_db"] is not None]
+    if differing:
+        worst = min(differing, key=lambda q: q["psnr_db"])
+        print(f"  worst: {worst['size']}px at {worst['psnr_db']:.1f} dB, "
+              f"min SSIM {min(q['ssim'] for q in result['quality']):.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark asset_lib.pyramid against direct LANCZOS resizing")
+    parser.add_argument("--source", action="append", help="Source image (repeatable; default: ads logo and mascot)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated square sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    sizes = sorted({int(s) for s in args.sizes.split(",") if s.strip()})
+    results = [benchmark_source(path, sizes, max(1, args.repeat)) for path in args.source or DEFAULT_SOURCES]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print("Resize pyramid vs direct LANCZOS (best of %d)" % max(1, args.repeat))
+    for result in results:
+        print_result(result)
+
+
+if __name__ == "__main__":
+    main()
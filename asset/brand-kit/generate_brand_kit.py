@@ -4,8 +4,14 @@ ThemeGPT Brand Kit Generator
 Generates comprehensive brand assets from source mascot and logo.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from asset_lib.compose import Canvas, Picture, Source, Text, canvas_task, text_bbox
+from asset_lib.jobs import default_workers
+from asset_lib.manifest import BuildManifest, parse_build_args
 
 # =============================================================================
 # Brand Colors
@@ -23,6 +29,7 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(BASE_DIR))
 GIF_PATH = os.path.join(PROJECT_ROOT, 'asset/GIFs/animated-mascot-400-transparent.gif')
 CLEAN_MASCOT_PATH = os.path.join(PROJECT_ROOT, 'asset/GIFs/mascot-clean-400.png')
+LOGO_FONT = '/System/Library/Fonts/Helvetica.ttc'
 
 # =============================================================================
 # Helper Functions
@@ -38,197 +45,146 @@ def load_mascot():
         img.seek(0)
         return img.convert('RGBA')
 
-def add_background(img, bg_color, padding=0):
-    """Add solid background to transparent image."""
-    if padding > 0:
-        new_size = (img.width + padding * 2, img.height + padding * 2)
-        bg = Image.new('RGBA', new_size, bg_color + (255,))
-        bg.paste(img, (padding, padding), img)
-        return bg
-    else:
-        bg = Image.new('RGBA', img.size, bg_color + (255,))
-        bg.paste(img, (0, 0), img)
-        return bg
-
-def create_logo(mascot, size, with_text=True):
-    """Create logo with mascot and optional text."""
+def logo_font(size):
+    """(path, size) of the logo font; Pillow's default font where Helvetica is missing."""
+    return (LOGO_FONT if os.path.exists(LOGO_FONT) else None, size)
+
+def on_background(spec, bg_color, padding=0):
+    """``spec`` pasted onto a solid background, with optional padding."""
+    width, height = spec.size
+    size = (width + padding * 2, height + padding * 2)
+    return Canvas(size, bg_color + (255,), (Picture(spec, (padding, padding)),), mode='RGBA')
+
+def logo_spec(size, with_text=True):
+    """Logo with mascot and optional text."""
+    mascot = Source('mascot')
     if not with_text:
-        return mascot.resize((size, size), Image.Resampling.LANCZOS)
+        return Canvas((size, size), None, (Picture(mascot, (0, 0), size=(size, size), mask=False),), mode='RGBA')
 
     # Logo with text: mascot on left, text on right
     mascot_size = size
     spacing = int(size * 0.15)
 
-    mascot_resized = mascot.resize((mascot_size, mascot_size), Image.Resampling.LANCZOS)
-
-    # Calculate text dimensions
-    font_size = int(size * 0.35)
-    try:
-        font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', font_size)
-    except:
-        font = ImageFont.load_default()
-
     # Measure text
-    temp_img = Image.new('RGBA', (1, 1))
-    temp_draw = ImageDraw.Draw(temp_img)
-    bbox = temp_draw.textbbox((0, 0), 'ThemeGPT', font=font)
+    font = logo_font(int(size * 0.35))
+    bbox = text_bbox('ThemeGPT', font)
     text_w = bbox[2] - bbox[0]
     text_h = bbox[3] - bbox[1]
 
-    # Create canvas
     logo_width = mascot_size + spacing + text_w + spacing
-    logo = Image.new('RGBA', (logo_width, mascot_size), (0, 0, 0, 0))
-
-    # Paste mascot
-    logo.paste(mascot_resized, (0, 0), mascot_resized)
-
-    # Draw text
-    draw = ImageDraw.Draw(logo)
     text_x = mascot_size + spacing
     text_y = (mascot_size - text_h) // 2 - bbox[1]
-    draw.text((text_x, text_y), 'ThemeGPT', fill=CHOCOLATE, font=font)
-
-    return logo
+    return Canvas((logo_width, mascot_size), None, (
+        Picture(mascot, (0, 0), size=(mascot_size, mascot_size)),
+        Text('ThemeGPT', (text_x, text_y), font, CHOCOLATE),
+    ), mode='RGBA')
 
-def create_social_asset(mascot, width, height, bg_color, mascot_scale=0.6, center=True):
-    """Create a social media asset with mascot centered on background."""
-    canvas = Image.new('RGBA', (width, height), bg_color + (255,))
+def social_spec(size, bg_color, mascot_scale=0.6, center=True):
+    """Social media asset with mascot centered on background."""
+    width, height = size
 
     # Scale mascot to fit
-    max_dim = min(width, height) * mascot_scale
-    mascot_resized = mascot.resize((int(max_dim), int(max_dim)), Image.Resampling.LANCZOS)
+    mascot_size = int(min(width, height) * mascot_scale)
 
-    # Center position
-    if center:
-        x = (width - mascot_resized.width) // 2
-        y = (height - mascot_resized.height) // 2
-    else:
-        x = (width - mascot_resized.width) // 2
-        y = int(height * 0.1)  # Top-aligned with padding
+    # Center position, or top-aligned with padding
+    x = (width - mascot_size) // 2
+    y = (height - mascot_size) // 2 if center else int(height * 0.1)
 
-    canvas.paste(mascot_resized, (x, y), mascot_resized)
-    return canvas
+    return Canvas(size, bg_color + (255,), (
+        Picture(Source('mascot'), (x, y), size=(mascot_size, mascot_size)),
+    ), mode='RGBA')
 
-def create_banner(mascot, width, height, bg_color, include_text=True):
-    """Create a banner with logo positioned appropriately."""
-    canvas = Image.new('RGBA', (width, height), bg_color + (255,))
+def banner_spec(size, bg_color, include_text=True):
+    """Banner with logo positioned appropriately."""
+    width, height = size
 
     # For wide banners, put logo on left side
-    logo_height = int(height * 0.7)
-    logo = create_logo(mascot, logo_height, with_text=include_text)
+    logo = logo_spec(int(height * 0.7), with_text=include_text)
+    logo_w, logo_h = logo.size
 
     # Scale if too wide
-    if logo.width > width * 0.8:
-        scale = (width * 0.8) / logo.width
-        logo = logo.resize((int(logo.width * scale), int(logo.height * scale)), Image.Resampling.LANCZOS)
+    if logo_w > width * 0.8:
+        scale = (width * 0.8) / logo_w
+        logo_w, logo_h = int(logo_w * scale), int(logo_h * scale)
+
+    x = (width - logo_w) // 2
+    y = (height - logo_h) // 2
+    return Canvas(size, bg_color + (255,), (Picture(logo, (x, y), size=(logo_w, logo_h)),), mode='RGBA')
 
-    x = (width - logo.width) // 2
-    y = (height - logo.height) // 2
+def mascot_spec(size, bg_color=None):
+    """Square mascot, optionally on a solid background."""
+    spec = logo_spec(size, with_text=False)
+    return on_background(spec, bg_color) if bg_color else spec
 
-    canvas.paste(logo, (x, y), logo)
-    return canvas
+def logo_asset_spec(size, bg_color=None):
+    """Logo with text, optionally on a padded solid background."""
+    spec = logo_spec(size)
+    return on_background(spec, bg_color, padding=int(size * 0.1)) if bg_color else spec
 
-def save_asset(img, path, convert_rgb=False):
-    """Save image, optionally converting to RGB for JPEG."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    if convert_rgb or path.endswith('.jpg'):
-        img = img.convert('RGB')
-    img.save(path)
-    print(f"  Created: {os.path.basename(path)} ({img.width}x{img.height})")
+def asset_task(path, spec):
+    """Task rendering ``spec`` (which reads the mascot source) to ``path``."""
+    return canvas_task(path, spec, source='mascot')
 
 # =============================================================================
 # Asset Generators
 # =============================================================================
 
-def generate_core_assets(mascot):
-    """Generate core mascot and logo variants."""
-    print("\n[Core Assets]")
-
-    sizes = [512, 256, 128, 64]
-
-    for size in sizes:
-        # Mascot - transparent
-        m = mascot.resize((size, size), Image.Resampling.LANCZOS)
-        save_asset(m, f"{BASE_DIR}/core/mascot/transparent/mascot-{size}.png")
-
-        # Mascot - cream background
-        m_cream = add_background(m, CREAM)
-        save_asset(m_cream, f"{BASE_DIR}/core/mascot/cream-bg/mascot-{size}-cream.png")
-
-        # Mascot - white background
-        m_white = add_background(m, WHITE)
-        save_asset(m_white, f"{BASE_DIR}/core/mascot/white-bg/mascot-{size}-white.png")
-
-    # Logo variants
+def core_tasks():
+    """Core mascot and logo variants."""
+    tasks = []
+    for size in [512, 256, 128, 64]:
+        tasks += [
+            asset_task(f"{BASE_DIR}/core/mascot/transparent/mascot-{size}.png", mascot_spec(size)),
+            asset_task(f"{BASE_DIR}/core/mascot/cream-bg/mascot-{size}-cream.png", mascot_spec(size, CREAM)),
+            asset_task(f"{BASE_DIR}/core/mascot/white-bg/mascot-{size}-white.png", mascot_spec(size, WHITE)),
+        ]
+
+    # Logo variants (backgrounds add padding)
     for size in [512, 256, 128]:
-        logo = create_logo(mascot, size)
-
-        # Transparent
-        save_asset(logo, f"{BASE_DIR}/core/logo/transparent/logo-{size}.png")
-
-        # With backgrounds (add padding)
-        logo_cream = add_background(logo, CREAM, padding=int(size * 0.1))
-        save_asset(logo_cream, f"{BASE_DIR}/core/logo/cream-bg/logo-{size}-cream.png")
-
-        logo_white = add_background(logo, WHITE, padding=int(size * 0.1))
-        save_asset(logo_white, f"{BASE_DIR}/core/logo/white-bg/logo-{size}-white.png")
-
-def generate_instagram_assets(mascot):
-    """Generate Instagram assets."""
-    print("\n[Instagram]")
-
-    # Profile picture (320x320, displays at 110x110)
-    profile = create_social_asset(mascot, 320, 320, CREAM, mascot_scale=0.85)
-    save_asset(profile, f"{BASE_DIR}/social/instagram/ig-profile-320x320.png")
-
-    # Post - Square (1080x1080)
-    post_square = create_social_asset(mascot, 1080, 1080, CREAM, mascot_scale=0.5)
-    save_asset(post_square, f"{BASE_DIR}/social/instagram/ig-post-square-1080x1080.png")
-
-    # Post - Portrait (1080x1350)
-    post_portrait = create_social_asset(mascot, 1080, 1350, CREAM, mascot_scale=0.45)
-    save_asset(post_portrait, f"{BASE_DIR}/social/instagram/ig-post-portrait-1080x1350.png")
-
-    # Story (1080x1920)
-    story = create_social_asset(mascot, 1080, 1920, CREAM, mascot_scale=0.4, center=False)
-    save_asset(story, f"{BASE_DIR}/social/instagram/ig-story-1080x1920.png")
-
-def generate_facebook_assets(mascot):
-    """Generate Facebook assets."""
-    print("\n[Facebook]")
-
-    # Profile picture (320x320)
-    profile = create_social_asset(mascot, 320, 320, CREAM, mascot_scale=0.85)
-    save_asset(profile, f"{BASE_DIR}/social/facebook/fb-profile-320x320.png")
-
-    # Cover photo (820x312 desktop)
-    cover = create_banner(mascot, 820, 312, CREAM)
-    save_asset(cover, f"{BASE_DIR}/social/facebook/fb-cover-820x312.png")
-
-    # Cover photo mobile-safe (640x360)
-    cover_mobile = create_banner(mascot, 640, 360, CREAM)
-    save_asset(cover_mobile, f"{BASE_DIR}/social/facebook/fb-cover-mobile-640x360.png")
-
-def generate_youtube_assets(mascot):
-    """Generate YouTube assets."""
-    print("\n[YouTube]")
-
-    # Channel art (2560x1440 full, safe area 1546x423)
-    channel_art = create_banner(mascot, 2560, 1440, CREAM)
-    save_asset(channel_art, f"{BASE_DIR}/social/youtube/yt-channel-art-2560x1440.png")
-
-    # Channel icon (800x800)
-    icon = create_social_asset(mascot, 800, 800, CREAM, mascot_scale=0.85)
-    save_asset(icon, f"{BASE_DIR}/social/youtube/yt-icon-800x800.png")
+        tasks += [
+            asset_task(f"{BASE_DIR}/core/logo/transparent/logo-{size}.png", logo_asset_spec(size)),
+            asset_task(f"{BASE_DIR}/core/logo/cream-bg/logo-{size}-cream.png", logo_asset_spec(size, CREAM)),
+            asset_task(f"{BASE_DIR}/core/logo/white-bg/logo-{size}-white.png", logo_asset_spec(size, WHITE)),
+        ]
+    return tasks
+
+def instagram_tasks():
+    """Instagram assets."""
+    return [
+        # Profile picture (320x320, displays at 110x110)
+        asset_task(f"{BASE_DIR}/social/instagram/ig-profile-320x320.png", social_spec((320, 320), CREAM, 0.85)),
+        # Post - Square (1080x1080)
+        asset_task(f"{BASE_DIR}/social/instagram/ig-post-square-1080x1080.png", social_spec((1080, 1080), CREAM, 0.5)),
+        # Post - Portrait (1080x1350)
+        asset_task(f"{BASE_DIR}/social/instagram/ig-post-portrait-1080x1350.png", social_spec((1080, 1350), CREAM, 0.45)),
+        # Story (1080x1920)
+        asset_task(f"{BASE_DIR}/social/instagram/ig-story-1080x1920.png", social_spec((1080, 1920), CREAM, 0.4, False)),
+    ]
 
-    # Thumbnail (1280x720)
-    thumb = create_banner(mascot, 1280, 720, CREAM)
-    save_asset(thumb, f"{BASE_DIR}/social/youtube/yt-thumbnail-1280x720.png")
+def facebook_tasks():
+    """Facebook assets."""
+    return [
+        # Profile picture (320x320)
+        asset_task(f"{BASE_DIR}/social/facebook/fb-profile-320x320.png", social_spec((320, 320), CREAM, 0.85)),
+        # Cover photo (820x312 desktop)
+        asset_task(f"{BASE_DIR}/social/facebook/fb-cover-820x312.png", banner_spec((820, 312), CREAM)),
+        # Cover photo mobile-safe (640x360)
+        asset_task(f"{BASE_DIR}/social/facebook/fb-cover-mobile-640x360.png", banner_spec((640, 360), CREAM)),
+    ]
 
-def generate_banner_assets(mascot):
-    """Generate web banner assets."""
-    print("\n[Banners]")
+def youtube_tasks():
+    """YouTube assets."""
+    return [
+        # Channel art (2560x1440 full, safe area 1546x423)
+        asset_task(f"{BASE_DIR}/social/youtube/yt-channel-art-2560x1440.png", banner_spec((2560, 1440), CREAM)),
+        # Channel icon (800x800)
+        asset_task(f"{BASE_DIR}/social/youtube/yt-icon-800x800.png", social_spec((800, 800), CREAM, 0.85)),
+        # Thumbnail (1280x720)
+        asset_task(f"{BASE_DIR}/social/youtube/yt-thumbnail-1280x720.png", banner_spec((1280, 720), CREAM)),
+    ]
 
+def banner_tasks():
+    """Web banner assets."""
     banner_specs = [
         (728, 90, "leaderboard"),      # Leaderboard
         (300, 250, "medium-rectangle"), # Medium Rectangle
@@ -237,58 +193,64 @@ def generate_banner_assets(mascot):
         (970, 250, "billboard"),        # Billboard
     ]
 
-    for width, height, name in banner_specs:
-        # Determine if text fits
-        include_text = width > 200
-        banner = create_banner(mascot, width, height, CREAM, include_text=include_text)
-        save_asset(banner, f"{BASE_DIR}/marketing/banners/banner-{name}-{width}x{height}.png")
-
-def generate_ad_assets(mascot):
-    """Generate advertisement format assets."""
-    print("\n[Advertisements]")
-
-    # Square (1:1)
-    ad_square = create_social_asset(mascot, 1200, 1200, CREAM, mascot_scale=0.5)
-    save_asset(ad_square, f"{BASE_DIR}/marketing/ads/ad-square-1200x1200.png")
-
-    # Landscape (16:9)
-    ad_landscape = create_banner(mascot, 1920, 1080, CREAM)
-    save_asset(ad_landscape, f"{BASE_DIR}/marketing/ads/ad-landscape-1920x1080.png")
-
-    # Portrait (4:5)
-    ad_portrait = create_social_asset(mascot, 1080, 1350, CREAM, mascot_scale=0.45)
-    save_asset(ad_portrait, f"{BASE_DIR}/marketing/ads/ad-portrait-1080x1350.png")
+    # Text only fits banners wider than 200px
+    return [
+        asset_task(f"{BASE_DIR}/marketing/banners/banner-{name}-{width}x{height}.png",
+                   banner_spec((width, height), CREAM, width > 200))
+        for width, height, name in banner_specs
+    ]
 
-    # Vertical (9:16)
-    ad_vertical = create_social_asset(mascot, 1080, 1920, CREAM, mascot_scale=0.35)
-    save_asset(ad_vertical, f"{BASE_DIR}/marketing/ads/ad-vertical-1080x1920.png")
+def ad_tasks():
+    """Advertisement format assets."""
+    return [
+        # Square (1:1)
+        asset_task(f"{BASE_DIR}/marketing/ads/ad-square-1200x1200.png", social_spec((1200, 1200), CREAM, 0.5)),
+        # Landscape (16:9)
+        asset_task(f"{BASE_DIR}/marketing/ads/ad-landscape-1920x1080.png", banner_spec((1920, 1080), CREAM)),
+        # Portrait (4:5)
+        asset_task(f"{BASE_DIR}/marketing/ads/ad-portrait-1080x1350.png", social_spec((1080, 1350), CREAM, 0.45)),
+        # Vertical (9:16)
+        asset_task(f"{BASE_DIR}/marketing/ads/ad-vertical-1080x1920.png", social_spec((1080, 1920), CREAM, 0.35)),
+    ]
 
 # =============================================================================
 # Main
 # =============================================================================
 
-def main():
+def load_sources():
+    """Decoded mascot, loaded only when some asset needs rebuilding."""
+    mascot = load_mascot()
+    print(f"  Source size: {mascot.size}")
+    return {"mascot": mascot}
+
+def main(force=False):
     print("=" * 60)
     print("  ThemeGPT Brand Kit Generator")
     print("=" * 60)
 
-    # Load source mascot
+    # Source mascot
     source_path = CLEAN_MASCOT_PATH if os.path.exists(CLEAN_MASCOT_PATH) else GIF_PATH
-    print(f"\nLoading mascot from: {source_path}")
-    mascot = load_mascot()
-    print(f"  Source size: {mascot.size}")
+    print(f"\nMascot source: {source_path}")
 
     # Generate all assets
-    generate_core_assets(mascot)
-    generate_instagram_assets(mascot)
-    generate_facebook_assets(mascot)
-    generate_youtube_assets(mascot)
-    generate_banner_assets(mascot)
-    generate_ad_assets(mascot)
+    tasks = [
+        *core_tasks(),
+        *instagram_tasks(),
+        *facebook_tasks(),
+        *youtube_tasks(),
+        *banner_tasks(),
+        *ad_tasks(),
+    ]
+    workers = default_workers()
+    manifest = BuildManifest(BASE_DIR, __file__, force=force)
+    print(f"\nGenerating {len(tasks)} assets with {workers} workers...")
+    manifest.run_tasks(tasks, load_sources, {"mascot": [source_path]}, workers)
+    manifest.print_summary()
 
     print("\n" + "=" * 60)
     print("  Brand kit generation complete!")
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    args = parse_build_args(__doc__)
+    main(force=args.force)
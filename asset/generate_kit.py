@@ -7,6 +7,11 @@ Generates all standard sizes and variants for web development
 from PIL import Image
 import os
 
+from asset_lib.color_key import key_variants, replace_keyed
+from asset_lib.jobs import Task, default_workers
+from asset_lib.manifest import BuildManifest, parse_build_args
+from asset_lib.pyramid import resize
+
 # Paths - two separate sources: logo (with wordmark) and mascot (icon only)
 SOURCE_LOGO = "source-logo-512.png"
 SOURCE_MASCOT = "source-mascot-512.png"
@@ -35,39 +40,25 @@ def load_mascot():
 
 
 def resize_with_quality(img, size, resample=Image.Resampling.LANCZOS):
-    """Resize image maintaining quality"""
+    """Resize image maintaining quality (LANCZOS goes through the shared pyramid)"""
+    if resample == Image.Resampling.LANCZOS:
+        return resize(img, size)
     return img.resize((size, size), resample=resample)
 
 
-def is_cream(r, g, b, tolerance=20):
-    """Check if a color is close to cream background (supports both cream variants)"""
-    # Check canonical cream #FAF6F0
-    canonical_match = (abs(r - CREAM_BG[0]) < tolerance and
-                       abs(g - CREAM_BG[1]) < tolerance and
-                       abs(b - CREAM_BG[2]) < tolerance)
-    # Check alt cream #FFFAF1
-    alt_match = (abs(r - CREAM_ALT[0]) < tolerance and
-                 abs(g - CREAM_ALT[1]) < tolerance and
-                 abs(b - CREAM_ALT[2]) < tolerance)
-    return canonical_match or alt_match
-
-
 def replace_cream_background(img, new_color, tolerance=25):
     """Replace cream background (both variants) with a new color"""
-    img = img.convert("RGBA")
-    pixels = img.load()
-    width, height = img.size
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            if is_cream(r, g, b, tolerance):
-                if len(new_color) == 4:
-                    pixels[x, y] = new_color
-                else:
-                    pixels[x, y] = (*new_color, 255)
+    return replace_keyed(img, (CREAM_BG, CREAM_ALT), new_color, tolerance)
 
-    return img
+
+def background_variants(img, tolerance=25):
+    """Transparent, white and dark variants from a single cream mask"""
+    return key_variants(
+        img,
+        {"transparent": TRANSPARENT, "white": WHITE, "dark": DARK_BG},
+        keys=(CREAM_BG, CREAM_ALT),
+        tolerance=tolerance,
+    )
 
 
 def make_transparent_bg(img, tolerance=25):
@@ -85,145 +76,89 @@ def make_white_bg(img, tolerance=25):
     return replace_cream_background(img, WHITE, tolerance)
 
 
-def generate_icon_sizes(img, output_dir, prefix="icon"):
-    """Generate standard icon sizes"""
-    sizes = [16, 32, 48, 64, 72, 96, 128, 144, 192, 256, 384, 512]
+def keep(img):
+    """Save a source as-is"""
+    return img
 
-    for size in sizes:
-        resized = resize_with_quality(img, size)
-        resized.save(os.path.join(output_dir, f"{prefix}-{size}.png"), "PNG", optimize=True)
-        print(f"  {prefix}-{size}.png")
-
-
-def generate_favicons(logo_img, mascot_img, output_dir):
-    """Generate favicon variants"""
-    # Standard favicon sizes (using mascot only for small sizes)
-    favicon_sizes = [16, 32, 48]
-
-    for size in favicon_sizes:
-        resized = resize_with_quality(mascot_img, size)
-        resized.save(os.path.join(output_dir, f"favicon-{size}x{size}.png"), "PNG", optimize=True)
-        print(f"  favicon-{size}x{size}.png")
-
-    # Apple touch icon (180x180)
-    apple_icon = resize_with_quality(mascot_img, 180)
-    apple_icon.save(os.path.join(output_dir, "apple-touch-icon.png"), "PNG", optimize=True)
-    print(f"  apple-touch-icon.png")
-
-    # Android Chrome icons
-    for size in [192, 512]:
-        resized = resize_with_quality(mascot_img, size)
-        resized.save(os.path.join(output_dir, f"android-chrome-{size}x{size}.png"), "PNG", optimize=True)
-        print(f"  android-chrome-{size}x{size}.png")
-
-    # MS Tile
-    ms_tile = resize_with_quality(mascot_img, 150)
-    ms_tile.save(os.path.join(output_dir, "mstile-150x150.png"), "PNG", optimize=True)
-    print(f"  mstile-150x150.png")
-
-    # Safari pinned tab (high-res PNG fallback)
-    safari = resize_with_quality(mascot_img, 512)
-    safari.save(os.path.join(output_dir, "safari-pinned-tab.png"), "PNG", optimize=True)
-    print(f"  safari-pinned-tab.png")
-
-
-def generate_social_images(img, output_dir):
-    """Generate social media sized images"""
-    # Open Graph / Facebook (1200x630)
-    og = Image.new("RGBA", (1200, 630), CREAM_BG + (255,))
-    logo_height = 450
-    ratio = logo_height / img.height
-    logo_width = int(img.width * ratio)
-    resized_logo = img.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-    x = (1200 - logo_width) // 2
-    y = (630 - logo_height) // 2
-    og.paste(resized_logo, (x, y), resized_logo)
-    og.convert("RGB").save(os.path.join(output_dir, "og-image.png"), "PNG", optimize=True)
-    print(f"  og-image.png (1200x630)")
-
-    # Twitter Card (1200x600)
-    twitter = Image.new("RGBA", (1200, 600), CREAM_BG + (255,))
-    logo_height = 420
-    ratio = logo_height / img.height
-    logo_width = int(img.width * ratio)
-    resized_logo = img.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-    x = (1200 - logo_width) // 2
-    y = (600 - logo_height) // 2
-    twitter.paste(resized_logo, (x, y), resized_logo)
-    twitter.convert("RGB").save(os.path.join(output_dir, "twitter-card.png"), "PNG", optimize=True)
-    print(f"  twitter-card.png (1200x600)")
-
-    # LinkedIn Banner (1584x396)
-    linkedin = Image.new("RGBA", (1584, 396), CREAM_BG + (255,))
-    logo_height = 300
+
+def social_image(img, size, logo_height):
+    """Logo centered on a cream canvas of ``size`` (width, height)"""
+    width, height = size
+    canvas = Image.new("RGBA", size, CREAM_BG + (255,))
     ratio = logo_height / img.height
     logo_width = int(img.width * ratio)
-    resized_logo = img.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-    x = (1584 - logo_width) // 2
-    y = (396 - logo_height) // 2
-    linkedin.paste(resized_logo, (x, y), resized_logo)
-    linkedin.convert("RGB").save(os.path.join(output_dir, "linkedin-banner.png"), "PNG", optimize=True)
-    print(f"  linkedin-banner.png (1584x396)")
-
-
-def generate_variants(logo_img, mascot_img, output_dir):
-    """Generate logo variants (transparent, dark bg, etc.)"""
-
-    # Full logo - transparent background
-    transparent = make_transparent_bg(logo_img.copy())
-    transparent.save(os.path.join(output_dir, "logo-full-transparent.png"), "PNG", optimize=True)
-    print(f"  logo-full-transparent.png")
-
-    # Full logo - white background
-    white_bg = make_white_bg(logo_img.copy())
-    white_bg.save(os.path.join(output_dir, "logo-full-white.png"), "PNG", optimize=True)
-    print(f"  logo-full-white.png")
-
-    # Full logo - dark background
-    dark_bg = make_dark_bg(logo_img.copy())
-    dark_bg.save(os.path.join(output_dir, "logo-full-dark.png"), "PNG", optimize=True)
-    print(f"  logo-full-dark.png")
-
-    # Full logo - original cream
-    logo_img.save(os.path.join(output_dir, "logo-full-cream.png"), "PNG", optimize=True)
-    print(f"  logo-full-cream.png")
-
-    # Mascot only - transparent
-    mascot_trans = make_transparent_bg(mascot_img.copy())
-    mascot_trans.save(os.path.join(output_dir, "mascot-transparent.png"), "PNG", optimize=True)
-    print(f"  mascot-transparent.png")
-
-    # Mascot only - cream
-    mascot_img.save(os.path.join(output_dir, "mascot-cream.png"), "PNG", optimize=True)
-    print(f"  mascot-cream.png")
-
-    # Mascot only - dark
-    mascot_dark = make_dark_bg(mascot_img.copy())
-    mascot_dark.save(os.path.join(output_dir, "mascot-dark.png"), "PNG", optimize=True)
-    print(f"  mascot-dark.png")
-
-    # Mascot only - white
-    mascot_white = make_white_bg(mascot_img.copy())
-    mascot_white.save(os.path.join(output_dir, "mascot-white.png"), "PNG", optimize=True)
-    print(f"  mascot-white.png")
-
-
-def create_ico_file(mascot_img, output_dir):
-    """Create .ico file with multiple sizes"""
-    sizes = [(16, 16), (32, 32), (48, 48)]
-    icons = []
-
-    for size in sizes:
-        resized = mascot_img.resize(size, Image.Resampling.LANCZOS)
-        icons.append(resized)
-
-    icons[0].save(
-        os.path.join(output_dir, "favicon.ico"),
-        format="ICO",
-        sizes=sizes,
-        append_images=icons[1:]
-    )
-    print(f"  favicon.ico (16x16, 32x32, 48x48)")
+    resized_logo = resize(img, (logo_width, logo_height))
+    x = (width - logo_width) // 2
+    y = (height - logo_height) // 2
+    canvas.paste(resized_logo, (x, y), resized_logo)
+    return canvas.convert("RGB")
+
+
+PNG = {"format": "PNG", "optimize": True}
+
+
+def icon_tasks(source, output_dir, prefix="icon"):
+    """Standard icon sizes"""
+    sizes = [16, 32, 48, 64, 72, 96, 128, 144, 192, 256, 384, 512]
+    return [
+        Task(os.path.join(output_dir, f"{prefix}-{size}.png"), resize_with_quality,
+             source=source, size=size, save=PNG)
+        for size in sizes
+    ]
+
+
+def favicon_tasks(output_dir):
+    """Favicon variants (mascot only)"""
+    sized = [
+        *((f"favicon-{size}x{size}.png", size) for size in [16, 32, 48]),
+        ("apple-touch-icon.png", 180),
+        *((f"android-chrome-{size}x{size}.png", size) for size in [192, 512]),
+        ("mstile-150x150.png", 150),
+        ("safari-pinned-tab.png", 512),   # high-res PNG fallback
+    ]
+    tasks = [
+        Task(os.path.join(output_dir, name), resize_with_quality,
+             source="mascot", size=size, save=PNG)
+        for name, size in sized
+    ]
+    # ICO sizes are downscaled from the full-resolution mascot by Pillow
+    tasks.append(Task(
+        os.path.join(output_dir, "favicon.ico"), keep, source="mascot",
+        save={"format": "ICO", "sizes": [(16, 16), (32, 32), (48, 48)]},
+    ))
+    return tasks
+
+
+def social_tasks(output_dir):
+    """Social media sized images"""
+    specs = [
+        ("og-image.png", (1200, 630), 450),          # Open Graph / Facebook
+        ("twitter-card.png", (1200, 600), 420),      # Twitter Card
+        ("linkedin-banner.png", (1584, 396), 300),   # LinkedIn Banner
+    ]
+    return [
+        Task(os.path.join(output_dir, name), social_image,
+             source="logo", size=size, args=(logo_height,), save=PNG)
+        for name, size, logo_height in specs
+    ]
+
+
+def variant_tasks(output_dir):
+    """Logo variants (transparent, dark bg, etc.), one shared source each"""
+    names = {
+        "logo_transparent": "logo-full-transparent.png",
+        "logo_white": "logo-full-white.png",
+        "logo_dark": "logo-full-dark.png",
+        "logo": "logo-full-cream.png",
+        "mascot_transparent": "mascot-transparent.png",
+        "mascot": "mascot-cream.png",
+        "mascot_dark": "mascot-dark.png",
+        "mascot_white": "mascot-white.png",
+    }
+    return [
+        Task(os.path.join(output_dir, name), keep, source=source, save=PNG)
+        for source, name in names.items()
+    ]
 
 
 def create_webmanifest(output_dir):
@@ -258,39 +193,50 @@ def create_webmanifest(output_dir):
     print(f"  site.webmanifest")
 
 
-def main():
-    print("=" * 50)
-    print("ThemeGPT Logo Kit Generator")
-    print("=" * 50)
-
-    # Load sources
+def load_sources():
+    """Decoded sources plus their keyed background variants"""
     print("\nLoading source images...")
     logo = load_logo()
     mascot = load_mascot()
     print(f"  Logo size: {logo.size[0]}x{logo.size[1]}")
     print(f"  Mascot size: {mascot.size[0]}x{mascot.size[1]}")
 
-    # Generate logo icons
-    print("\nGenerating logo icon sizes...")
-    generate_icon_sizes(logo, ICONS_DIR, "logo")
+    # Background variants share one cream mask per source
+    print("\nKeying background variants...")
+    sources = {"logo": logo, "mascot": mascot}
+    for name, img in (("logo", logo), ("mascot", mascot)):
+        for variant, variant_img in background_variants(img).items():
+            sources[f"{name}_{variant}"] = variant_img
+    return sources
 
-    # Generate mascot-only icons
-    print("\nGenerating mascot-only icons...")
-    generate_icon_sizes(mascot, ICONS_DIR, "mascot")
 
-    # Generate favicons
-    print("\nGenerating favicons...")
-    generate_favicons(logo, mascot, FAVICONS_DIR)
-    create_ico_file(mascot, FAVICONS_DIR)
-    create_webmanifest(FAVICONS_DIR)
+def source_files():
+    """Source file behind each task source name, for the build manifest"""
+    files = {"logo": [SOURCE_LOGO], "mascot": [SOURCE_MASCOT]}
+    for name in ("logo", "mascot"):
+        for variant in ("transparent", "white", "dark"):
+            files[f"{name}_{variant}"] = files[name]
+    return files
 
-    # Generate social images
-    print("\nGenerating social media images...")
-    generate_social_images(logo, SOCIAL_DIR)
 
-    # Generate variants
-    print("\nGenerating logo variants...")
-    generate_variants(logo, mascot, VARIANTS_DIR)
+def main(force=False):
+    print("=" * 50)
+    print("ThemeGPT Logo Kit Generator")
+    print("=" * 50)
+
+    tasks = [
+        *icon_tasks("logo", ICONS_DIR, "logo"),
+        *icon_tasks("mascot", ICONS_DIR, "mascot"),
+        *favicon_tasks(FAVICONS_DIR),
+        *social_tasks(SOCIAL_DIR),
+        *variant_tasks(VARIANTS_DIR),
+    ]
+    workers = default_workers()
+    manifest = BuildManifest(".", __file__, force=force)
+    print(f"\nGenerating {len(tasks)} outputs with {workers} workers...")
+    manifest.run_tasks(tasks, load_sources, source_files(), workers)
+    create_webmanifest(FAVICONS_DIR)
+    manifest.print_summary()
 
     print("\n" + "=" * 50)
     print("Logo kit generation complete!")
@@ -298,5 +244,6 @@ def main():
 
 
 if __name__ == "__main__":
+    args = parse_build_args(__doc__)
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    main()
+    main(force=args.force)
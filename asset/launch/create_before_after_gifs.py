@@ -3,10 +3,23 @@ Generate before/after GIFs for ThemeGPT launch assets.
 
 Creates crossfade animations from default ChatGPT → themed screenshots.
 Output: 1280x880 GIFs at 15fps, optimized for web (<5MB each).
+
+Each GIF uses one palette computed from its two keyframes; every blended
+frame is mapped to it through a color lookup table (asset_lib/gif.py).
+Themes are built in parallel worker processes (ASSET_JOBS, default one
+per CPU).
 """
 
 from PIL import Image
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from asset_lib.gif import adaptive_palette, map_frames, save_gif
+from asset_lib.jobs import default_workers
+from asset_lib.manifest import BuildManifest, parse_build_args
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 SOURCE_DIR = os.path.join(SCRIPT_DIR, "..", "images", "chrome-store")
@@ -58,55 +71,76 @@ def load_and_resize(path):
     return img
 
 
-def create_crossfade_gif(before_img, after_img, output_path, label):
-    """Create a looping before→after crossfade GIF."""
-    frames = []
-    durations = []
+def crossfade_sequence():
+    """
+    Frames of one loop as (blend step, duration ms) pairs.
+
+    Step 0 is the "before" screenshot and step CROSSFADE_STEPS the "after"
+    one; the after → before crossfade walks the same steps backwards.
+    """
+    sequence = [(0, HOLD_BEFORE_MS)]
+    sequence += [(i, CROSSFADE_FRAME_MS) for i in range(1, CROSSFADE_STEPS + 1)]
+    sequence.append((CROSSFADE_STEPS, HOLD_AFTER_MS))
+    sequence += [(CROSSFADE_STEPS - i, CROSSFADE_FRAME_MS) for i in range(1, CROSSFADE_STEPS + 1)]
+    return sequence
+
+
+def create_crossfade_gif(before_img, after_img, output_path):
+    """Create a looping before→after crossfade GIF; returns its size in MB."""
+    # Each distinct blend is computed and mapped once; both directions share them
+    blends = [
+        Image.blend(before_img, after_img, step / CROSSFADE_STEPS)
+        for step in range(CROSSFADE_STEPS + 1)
+    ]
+    palette = adaptive_palette([before_img, after_img], colors=PALETTE_COLORS)
+    mapped = map_frames(blends, palette)
+
+    sequence = crossfade_sequence()
+    save_gif(
+        [mapped[step] for step, _ in sequence],
+        output_path,
+        duration=[ms for _, ms in sequence],
+    )
+    return os.path.getsize(output_path) / (1024 * 1024)
 
-    # Convert to palette-friendly format
-    before_p = before_img.quantize(colors=PALETTE_COLORS, method=Image.MEDIANCUT, dither=Image.Dither.NONE)
-    after_p = after_img.quantize(colors=PALETTE_COLORS, method=Image.MEDIANCUT, dither=Image.Dither.NONE)
 
-    # Frame 1: Hold on "before"
-    frames.append(before_p)
-    durations.append(HOLD_BEFORE_MS)
+def theme_output_path(theme):
+    return os.path.join(OUTPUT_DIR, f"default-to-{theme['name']}.gif")
 
-    # Crossfade frames: before → after
-    for i in range(1, CROSSFADE_STEPS + 1):
-        alpha = i / CROSSFADE_STEPS
-        blended = Image.blend(before_img, after_img, alpha)
-        frames.append(blended.quantize(colors=PALETTE_COLORS, method=Image.MEDIANCUT, dither=Image.Dither.NONE))
-        durations.append(CROSSFADE_FRAME_MS)
 
-    # Frame N: Hold on "after"
-    frames.append(after_p)
-    durations.append(HOLD_AFTER_MS)
+def build_theme(before_img, theme):
+    """Load one theme's screenshot and write its GIF (runs in a worker)."""
+    start = time.perf_counter()
+    after_img = load_and_resize(os.path.join(SOURCE_DIR, theme["after"]))
+    size_mb = create_crossfade_gif(before_img, after_img, theme_output_path(theme))
+    return size_mb, time.perf_counter() - start
 
-    # Crossfade frames: after → before (for smooth loop)
-    for i in range(1, CROSSFADE_STEPS + 1):
-        alpha = i / CROSSFADE_STEPS
-        blended = Image.blend(after_img, before_img, alpha)
-        frames.append(blended.quantize(colors=PALETTE_COLORS, method=Image.MEDIANCUT, dither=Image.Dither.NONE))
-        durations.append(CROSSFADE_FRAME_MS)
 
-    # Save GIF
-    frames[0].save(
-        output_path,
-        save_all=True,
-        append_images=frames[1:],
-        duration=durations,
-        loop=0,
-        optimize=True,
-    )
+def build_themes(before_img, themes, workers):
+    """
+    Yield (theme, (size_mb, seconds) or None, error) as each theme finishes.
 
-    size_mb = os.path.getsize(output_path) / (1024 * 1024)
-    print(f"  {label}: {output_path} ({size_mb:.1f} MB)")
-    return size_mb
+    One worker builds the themes in order in this process.
+    """
+    if workers == 1:
+        for theme in themes:
+            try:
+                yield theme, build_theme(before_img, theme), None
+            except Exception as e:
+                yield theme, None, e
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_theme, before_img, theme): theme for theme in themes}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
 
 
-def main():
+def main(force=False):
     before_path = os.path.join(SOURCE_DIR, BEFORE_FILE)
-    before_img = load_and_resize(before_path)
+    manifest = BuildManifest(OUTPUT_DIR, __file__, force=force)
 
     print("Generating before/after GIFs...")
     print(f"  Source: {SOURCE_DIR}")
@@ -114,19 +148,48 @@ def main():
     print(f"  Size: {TARGET_W}x{TARGET_H}")
     print()
 
-    total_size = 0
+    stale = []
+    keys = {}
+    failures = []
     for theme in THEMES:
         after_path = os.path.join(SOURCE_DIR, theme["after"])
-        after_img = load_and_resize(after_path)
-
-        output_name = f"default-to-{theme['name']}.gif"
-        output_path = os.path.join(OUTPUT_DIR, output_name)
+        output_path = theme_output_path(theme)
+        if not os.path.exists(after_path):
+            failures.append(f"{theme['label']}: missing {after_path}")
+            print(f"  FAILED {theme['label']}: missing {after_path}")
+            continue
+        key = manifest.key([before_path, after_path], {"output": os.path.basename(output_path)})
+        if manifest.is_current(output_path, key):
+            print(f"  {theme['label']}: up to date")
+            continue
+        keys[theme["name"]] = key
+        stale.append(theme)
 
-        size = create_crossfade_gif(before_img, after_img, output_path, theme["label"])
-        total_size += size
-
-    print(f"\nTotal: {total_size:.1f} MB across {len(THEMES)} GIFs")
+    total_size = 0
+    start = time.perf_counter()
+    if stale:
+        before_img = load_and_resize(before_path)
+        workers = max(1, min(default_workers(), len(stale)))
+        print(f"  Building {len(stale)} GIFs with {workers} worker{'s' if workers != 1 else ''}...")
+        for theme, result, error in build_themes(before_img, stale, workers):
+            if error is not None:
+                failures.append(f"{theme['label']}: {error}")
+                print(f"  FAILED {theme['label']}: {error}")
+                continue
+            size_mb, seconds = result
+            output_path = theme_output_path(theme)
+            print(f"  {theme['label']}: {output_path} ({size_mb:.1f} MB, {seconds:.1f}s)")
+            manifest.record(output_path, keys[theme["name"]])
+            manifest.save()
+            total_size += size_mb
+
+    print(f"\nTotal: {total_size:.1f} MB across {len(manifest.rebuilt)} rebuilt GIFs "
+          f"in {time.perf_counter() - start:.1f}s")
+    manifest.print_summary()
+    if failures:
+        raise RuntimeError(f"{len(failures)} GIF(s) failed: " + "; ".join(failures))
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_build_args(__doc__)
+    main(force=args.force)